@@ -1,21 +1,160 @@
-from smart_contracts.artifacts.ff.proposal_contract_client import (ProposalContractClient)
-from algokit_utils import AlgorandClient
-from algosdk.atomic_transaction_composer import EmptySigner
-from rich.pretty import pprint
-app_id = 1006
+"""
+Decodes ProposalContract boxes to newline-delimited JSON.
 
-proposal_id = 0
+Boxes are selected by map and ID (`proposals:0-99`, `milestoneVotes:3`,
+`donations:3` for every donation to proposal 3, `statusIndex:2` for every page of
+status 2, `futureFunds` for the whole map), by raw name (`b64:...` or `hex:...`), or
+read from files of raw box dumps (one algod box response, `{"name": <b64>, "value":
+<b64>, "round": <n>}`, per line; `-` for stdin). Boxes are fetched in parallel and written as soon as they arrive, so the
+output can be piped straight into `jq`.
 
-algorand = AlgorandClient.default_localnet()
+    python decode_box.py --app-id 1006 proposals:0-9 milestoneVotes:0-9
+    python decode_box.py --network testnet --app-id 7345 donations:12 | jq .value
+    python decode_box.py --file boxes.ndjson
+"""
 
-read_account = "A7NMWS3NT3IUDMLVO26ULGXGIIOUQ3ND2TXSER6EBGRZNOBOUIQXHIBGDE"
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import typing
 
-proposal_contract_client = ProposalContractClient(algorand=algorand,app_id=app_id,default_sender=read_account, default_signer=EmptySigner())
+# Only read_only at import, so decoding dumps doesn't load algosdk; fetching imports the clients it needs
+from smart_contracts.ff.read_only import (
+    BOX_MAPS,
+    app_spec,
+    decode_box,
+    eligible_weight_box_name,
+    future_fund_box_name,
+    milestone_votes_box_name,
+    proposal_box_name,
+)
 
-proposal_box = proposal_contract_client.state.box.proposals.get_value(proposal_id)
+if typing.TYPE_CHECKING:
+    import algokit_utils
 
-pprint(proposal_box)
+    from smart_contracts.ff.async_client import AsyncAlgod
 
-milestone_votes = proposal_contract_client.state.box.milestone_votes.get_value(proposal_id)
+_BOX_NAME_BUILDERS: dict[str, typing.Callable[[int], bytes]] = {
+    "proposals": proposal_box_name,
+    "milestoneVotes": milestone_votes_box_name,
+    "futureFunds": future_fund_box_name,
+    "eligibleWeight": eligible_weight_box_name,
+}
+_MAP_PREFIXES = {map_name: prefix for prefix, map_name in BOX_MAPS}
 
-pprint(milestone_votes)
+# AlgorandClient constructors by network
+_NETWORKS = {
+    "localnet": "default_localnet",
+    "testnet": "testnet",
+    "mainnet": "mainnet",
+    "env": "from_environment",
+}
+
+
+def _id_range(value: str) -> range:
+    start, _, end = value.partition("-")
+    return range(int(start), int(end or start) + 1)
+
+
+class _Selection:
+    """Box names for the selectors, listing the app's boxes only when a selector needs it."""
+
+    def __init__(self, selectors: list[str]) -> None:
+        self.names: list[bytes] = []
+        # Prefixes to match against the app's full box list
+        self.prefixes: list[bytes] = []
+        for selector in selectors:
+            kind, _, value = selector.partition(":")
+            if kind == "b64":
+                self.names.append(base64.b64decode(value))
+            elif kind == "hex":
+                self.names.append(bytes.fromhex(value))
+            elif kind not in _MAP_PREFIXES:
+                raise argparse.ArgumentTypeError(f"Unknown box map or name encoding: {kind}")
+            elif not value:
+                self.prefixes.append(_MAP_PREFIXES[kind])
+            elif kind in _BOX_NAME_BUILDERS:
+                self.names.extend(_BOX_NAME_BUILDERS[kind](i) for i in _id_range(value))
+            else:
+                # Struct keys start with a uint64 (the proposal for donations, the status or
+                # category hash for the indexes); select every box under it
+                self.prefixes.extend(_MAP_PREFIXES[kind] + i.to_bytes(8, "big") for i in _id_range(value))
+
+    async def resolve(self, algod: "AsyncAlgod", app_id: int) -> typing.Iterator[bytes]:
+        if not self.prefixes:
+            return iter(self.names)
+        listed = await algod.application_boxes(app_id)
+        prefixes = tuple(self.prefixes)
+        return iter([*self.names, *(name for name in listed if name.startswith(prefixes))])
+
+
+def _record(spec: dict, name: bytes, value: bytes, round_num: int | None) -> dict:
+    decoded = decode_box(name, value, spec)
+    if decoded is None:
+        return {"name": base64.b64encode(name).decode(), "value": base64.b64encode(value).decode(), "round": round_num}
+    return {"map": decoded.map_name, "key": decoded.key, "value": decoded.value, "round": round_num}
+
+
+def _emit(record: dict) -> None:
+    sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    sys.stdout.flush()
+
+
+def decode_files(spec: dict, paths: list[str]) -> None:
+    for path in paths:
+        with sys.stdin if path == "-" else open(path) as dump:
+            for line in dump:
+                if not line.strip():
+                    continue
+                box = json.loads(line)
+                _emit(_record(spec, base64.b64decode(box["name"]), base64.b64decode(box["value"]), box.get("round")))
+
+
+async def decode_app_boxes(
+    algorand: "algokit_utils.AlgorandClient",
+    spec: dict,
+    app_id: int,
+    selection: _Selection,
+    concurrency: int,
+) -> None:
+    from smart_contracts.ff.async_client import AsyncAlgod, fetch_boxes
+
+    algod = AsyncAlgod.from_algorand(algorand)
+    try:
+        names = await selection.resolve(algod, app_id)
+        async for box in fetch_boxes(algod, app_id, names, concurrency=concurrency):
+            _emit(_record(spec, box["name"], box["value"], box.get("round")))
+    finally:
+        await algod.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("selectors", nargs="*", help="MAP[:ID[-ID]], b64:NAME or hex:NAME")
+    parser.add_argument("--app-id", type=int)
+    parser.add_argument("--network", choices=_NETWORKS, default="localnet")
+    parser.add_argument("--file", action="append", default=[], help="raw box dump to decode ('-' for stdin)")
+    parser.add_argument("--concurrency", type=int, default=32, help="box requests in flight")
+    args = parser.parse_args()
+
+    spec = app_spec()
+    if args.file:
+        decode_files(spec, args.file)
+    if args.selectors:
+        if args.app_id is None:
+            parser.error("--app-id is required to fetch boxes")
+        selection = _Selection(args.selectors)
+        import algokit_utils
+
+        algorand = getattr(algokit_utils.AlgorandClient, _NETWORKS[args.network])()
+        asyncio.run(decode_app_boxes(algorand, spec, args.app_id, selection, args.concurrency))
+    elif not args.file:
+        parser.error("give box selectors or --file")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,15 @@ from shutil import rmtree
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from smart_contracts._helpers.build_variants import (
+    cheapest,
+    explore_variants,
+    load_compile_options,
+    print_variants,
+    save_compile_options,
+)
+from smart_contracts._helpers.lazy_app_spec import make_app_spec_lazy
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -34,6 +43,8 @@ class SmartContract:
     path: Path
     name: str
     deploy: Callable[[], None] | None = None
+    variant_costs: Callable[[Path], dict[str, int]] | None = None
+    variant_lifecycle: Callable[[Path], object] | None = None
 
 
 def import_contract(folder: Path) -> Path:
@@ -55,6 +66,26 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
         return None
 
 
+def import_variant_costs_if_exists(folder: Path) -> Callable[[Path], dict[str, int]] | None:
+    """Imports the per-method cost measure used to compare compile variants, if the contract has one."""
+    try:
+        module_name = f"{folder.parent.name}.{folder.name}.cost_analysis"
+        cost_module = importlib.import_module(module_name)
+        return cost_module.variant_costs  # type: ignore[no-any-return]
+    except (ImportError, AttributeError):
+        return None
+
+
+def import_variant_lifecycle_if_exists(folder: Path) -> Callable[[Path], object] | None:
+    """Imports the lifecycle run compile variants must agree on, if the contract has one."""
+    try:
+        module_name = f"{folder.parent.name}.{folder.name}.variant_check"
+        check_module = importlib.import_module(module_name)
+        return check_module.variant_lifecycle  # type: ignore[no-any-return]
+    except (ImportError, AttributeError):
+        return None
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
@@ -67,6 +98,8 @@ contracts: list[SmartContract] = [
         path=import_contract(folder),
         name=folder.name,
         deploy=import_deploy_if_exists(folder),
+        variant_costs=import_variant_costs_if_exists(folder),
+        variant_lifecycle=import_variant_lifecycle_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -108,6 +141,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "--no-output-arc32",
             "--output-arc56",
             "--output-source-map",
+            *load_compile_options(contract_path),
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -152,6 +186,10 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+        # Parse the embedded app spec on first use rather than at import
+        if deployment_extension == "py":
+            for generated in output_dir.glob("*_client.py"):
+                make_app_spec_lazy(generated)
     if client_file:
         return output_dir / client_file
     return output_dir
@@ -175,6 +213,24 @@ def main(action: str, contract_name: str | None = None) -> None:
             for contract in filtered_contracts:
                 logger.info(f"Building app at {contract.path}")
                 build(artifact_path / contract.name, contract.path)
+        case "build-variants":
+            # Compile each contract with several option sets, keep the cheapest and build with it
+            for contract in filtered_contracts:
+                if contract.variant_costs is None:
+                    logger.warning(f"No cost_analysis.variant_costs for {contract.name}, skipping")
+                    continue
+                if contract.variant_lifecycle is None:
+                    logger.warning(
+                        f"No variant_check.variant_lifecycle for {contract.name}, only the default build can be chosen"
+                    )
+                results = explore_variants(
+                    contract.path, contract.variant_costs, lifecycle=contract.variant_lifecycle
+                )
+                chosen = cheapest(results)
+                print_variants(results, chosen)
+                save_compile_options(contract.path, chosen)
+                logger.info(f"Building app at {contract.path} with {' '.join(chosen.options)}")
+                build(artifact_path / contract.name, contract.path)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -0,0 +1,180 @@
+import dataclasses
+import json
+import logging
+import subprocess
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+logger = logging.getLogger(__name__)
+
+# Compiler option sets tried by `python -m smart_contracts build-variants`. The first is
+# the default build and the baseline the others are compared against.
+VARIANTS: list[tuple[str, ...]] = [
+    (f"--optimization-level={level}", f"--locals-coalescing-strategy={strategy}")
+    for level in (1, 0, 2)
+    for strategy in ("root_operand", "root_operand_excluding_args", "aggressive")
+]
+
+# Written next to contract.py; `build` compiles with these options when present
+OPTIONS_FILE_NAME = "compile_options.json"
+
+
+@dataclasses.dataclass(frozen=True)
+class VariantResult:
+    options: tuple[str, ...]
+    program_size: int
+    method_costs: dict[str, int]
+    mismatches: list[str]
+
+    @property
+    def total_cost(self) -> int:
+        return sum(self.method_costs.values())
+
+
+def load_compile_options(contract_path: Path) -> list[str]:
+    options_file = contract_path.parent / OPTIONS_FILE_NAME
+    if not options_file.exists():
+        return []
+    return list(json.loads(options_file.read_text()))
+
+
+def _compile(contract_path: Path, output_dir: Path, options: tuple[str, ...]) -> None:
+    result = subprocess.run(
+        [
+            "algokit",
+            "--no-color",
+            "compile",
+            "python",
+            str(contract_path.resolve()),
+            f"--out-dir={output_dir}",
+            "--no-output-arc32",
+            "--output-arc56",
+            "--output-bytecode",
+            *options,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if result.returncode:
+        raise Exception(f"Could not build contract with {' '.join(options)}:\n{result.stdout}")
+
+
+def _program_size(output_dir: Path) -> int:
+    return sum(path.stat().st_size for path in output_dir.glob("*.bin"))
+
+
+def _behaviour(app_spec: dict) -> dict[str, object]:
+    """The parts of an ARC-56 spec every variant must agree on: interface, state layout and assert messages."""
+    source_info = app_spec.get("sourceInfo", {})
+    return {
+        "methods": app_spec["methods"],
+        "state": app_spec["state"],
+        "structs": app_spec["structs"],
+        "errors": {
+            info["errorMessage"]
+            for program in source_info.values()
+            for info in program.get("sourceInfo", [])
+            if "errorMessage" in info
+        },
+    }
+
+
+def _mismatches(baseline: dict[str, object], behaviour: dict[str, object]) -> list[str]:
+    # Lower optimisation levels keep extra compiler-inserted checks, so only missing
+    # failure messages count as a difference
+    return [
+        key
+        for key, value in behaviour.items()
+        if (not baseline[key] <= value if key == "errors" else baseline[key] != value)  # type: ignore[operator]
+    ]
+
+
+def explore_variants(
+    contract_path: Path,
+    measure: Callable[[Path], dict[str, int]],
+    variants: list[tuple[str, ...]] | None = None,
+    lifecycle: Callable[[Path], object] | None = None,
+) -> list[VariantResult]:
+    """
+    Compiles `contract_path` with each option set and measures it with `measure`,
+    which gets the output directory and returns a cost per ABI method. Variants whose
+    ARC-56 interface, state layout or assert messages differ from the first are
+    reported as mismatches.
+
+    `lifecycle` runs the compiled programs (it also gets the output directory) and
+    returns an outcome that has to equal the first variant's. Without it, nothing
+    shows the other variants run the same, so they are all reported as unchecked.
+    """
+    results = []
+    baseline: dict[str, object] | None = None
+    baseline_outcome: object = None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for index, options in enumerate(variants or VARIANTS):
+            output_dir = Path(temp_dir) / str(index)
+            logger.info(f"Compiling {contract_path.parent.name} with {' '.join(options)}")
+            _compile(contract_path, output_dir, options)
+            app_spec_file = next(output_dir.glob("*.arc56.json"))
+            behaviour = _behaviour(json.loads(app_spec_file.read_text()))
+            baseline = baseline or behaviour
+            mismatches = _mismatches(baseline, behaviour)
+            if lifecycle is not None:
+                outcome = lifecycle(output_dir)
+                if index == 0:
+                    baseline_outcome = outcome
+                elif outcome != baseline_outcome:
+                    mismatches.append("lifecycle")
+            elif index:
+                mismatches.append("lifecycle unchecked")
+            results.append(
+                VariantResult(
+                    options=options,
+                    program_size=_program_size(output_dir),
+                    method_costs=measure(output_dir),
+                    mismatches=mismatches,
+                )
+            )
+    return results
+
+
+def cheapest(results: list[VariantResult]) -> VariantResult:
+    """The matching variant with the lowest total cost, preferring smaller programs on ties."""
+    return min(
+        (result for result in results if not result.mismatches),
+        key=lambda result: (result.total_cost, result.program_size),
+    )
+
+
+def save_compile_options(contract_path: Path, result: VariantResult) -> None:
+    (contract_path.parent / OPTIONS_FILE_NAME).write_text(json.dumps(list(result.options), indent=2) + "\n")
+
+
+def print_variants(results: list[VariantResult], chosen: VariantResult, console: Console | None = None) -> None:
+    console = console or Console()
+    baseline = results[0]
+    methods = list(baseline.method_costs)
+    table = Table(title="Compile variants (cost deltas against the default build)")
+    table.add_column("options")
+    table.add_column("size", justify="right")
+    for method in methods:
+        table.add_column(method, justify="right")
+    table.add_column("total", justify="right")
+    table.add_column("matches")
+
+    def delta(value: int, base: int) -> str:
+        return str(value) if value == base else f"{value} ({value - base:+d})"
+
+    for result in results:
+        table.add_row(
+            " ".join(option.split("=", 1)[1] for option in result.options),
+            delta(result.program_size, baseline.program_size),
+            *(delta(result.method_costs[m], baseline.method_costs[m]) for m in methods),
+            delta(result.total_cost, baseline.total_cost),
+            "yes" if not result.mismatches else ", ".join(result.mismatches),
+            style="bold green" if result is chosen else None,
+        )
+    console.print(table)
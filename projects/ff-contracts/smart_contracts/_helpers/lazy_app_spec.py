@@ -0,0 +1,50 @@
+"""
+Rewrites a generated typed client to parse its embedded ARC-56 spec on first use.
+
+The generator parses `_APP_SPEC_JSON` into an `Arc56Contract` at import; after this
+rewrite `APP_SPEC` is still importable from the client (a module `__getattr__`),
+but the parse only happens when a factory or client is built or `APP_SPEC` read.
+Run as part of `build`, or by hand on a client generated elsewhere:
+
+    python -m smart_contracts._helpers.lazy_app_spec smart_contracts/artifacts/ff/proposal_contract_client.py
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_EAGER = "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+_LAZY = '''
+
+@functools.cache
+def _app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+'''
+_FIRST_IMPORT = "import dataclasses\n"
+
+
+def make_app_spec_lazy(client_path: Path) -> bool:
+    """Rewrites the client in place. Returns False if it doesn't parse its spec the way the rewrite expects."""
+    source = client_path.read_text()
+    if _EAGER not in source or _FIRST_IMPORT not in source:
+        logger.warning(f"{client_path} doesn't parse APP_SPEC as expected, leaving it as generated")
+        return False
+    source = source.replace(_EAGER, _LAZY, 1)
+    source = source.replace("app_spec=APP_SPEC,", "app_spec=_app_spec(),")
+    source = source.replace(_FIRST_IMPORT, "import dataclasses\nimport functools\n", 1)
+    client_path.write_text(source)
+    return True
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    sys.exit(0 if all(make_app_spec_lazy(Path(path)) for path in sys.argv[1:]) else 1)
@@ -0,0 +1,67 @@
+import dataclasses
+import json
+from pathlib import Path
+
+_BASE64_DIGITS = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64_DIGITS[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+@dataclasses.dataclass(frozen=True)
+class SourceLocation:
+    path: Path
+    line: int
+
+    def __str__(self) -> str:
+        return f"{self.path.name}:{self.line}"
+
+
+class PuyaSourceMap:
+    """
+    A `*.puya.map` emitted by `--output-source-map`. Each "line" of the mappings is a
+    program counter, so `location(pc)` is the contract source line an opcode was
+    compiled from, and `op(pc)` the TEAL op at that pc.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        data = json.loads(path.read_text())
+        sources = [(path.parent / source).resolve() for source in data["sources"]]
+        offset = data.get("op_pc_offset", 0)
+        self._locations: dict[int, SourceLocation] = {}
+        source = line = 0
+        for pc, segments in enumerate(data["mappings"].split(";")):
+            for segment in filter(None, segments.split(",")):
+                fields = _decode_vlq(segment)
+                if len(fields) < 4:
+                    continue
+                source += fields[1]
+                line += fields[2]
+                # Lines are 0-based in source maps
+                self._locations.setdefault(pc + offset, SourceLocation(sources[source], line + 1))
+        self._ops = {
+            int(pc) + offset: event["op"] for pc, event in data["pc_events"].items() if "op" in event
+        }
+
+    def location(self, pc: int) -> SourceLocation | None:
+        return self._locations.get(pc)
+
+    def op(self, pc: int) -> str | None:
+        return self._ops.get(pc)
+
+    def opcode(self, pc: int) -> str | None:
+        """The op name at `pc` without immediates, e.g. `box_get`."""
+        op = self._ops.get(pc)
+        return op.split(maxsplit=1)[0] if op else None
@@ -0,0 +1,66 @@
+import dataclasses
+import random
+import time
+
+# Upper bound on samples kept per stage; beyond this a uniform reservoir is kept
+_RESERVOIR_SIZE = 10_000
+
+
+@dataclasses.dataclass
+class StageStats:
+    """Latency samples for one stage, kept as a bounded uniform reservoir."""
+
+    count: int = 0
+    total: float = 0.0
+    samples: list[float] = dataclasses.field(default_factory=list)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if len(self.samples) < _RESERVOIR_SIZE:
+            self.samples.append(seconds)
+        else:
+            slot = random.randrange(self.count)
+            if slot < _RESERVOIR_SIZE:
+                self.samples[slot] = seconds
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the recorded samples, in seconds."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+class LatencyRecorder:
+    """Collects per-stage latencies and event counts and reports throughput."""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}
+        self.counters: dict[str, int] = {}
+        self.started_at = time.monotonic()
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.stages.setdefault(stage, StageStats()).add(seconds)
+
+    def increment(self, counter: str, by: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + by
+
+    def throughput(self, stage: str) -> float:
+        """Completions of `stage` per second since the recorder was created."""
+        elapsed = time.monotonic() - self.started_at
+        stats = self.stages.get(stage)
+        return stats.count / elapsed if stats and elapsed > 0 else 0.0
+
+    def summary(self, percentiles: tuple[float, ...] = (50, 90, 99)) -> dict[str, dict[str, float]]:
+        """Per-stage count, throughput and latency percentiles (in milliseconds)."""
+        return {
+            stage: {
+                "count": stats.count,
+                "per_second": self.throughput(stage),
+                "mean_ms": stats.total / stats.count * 1000 if stats.count else 0.0,
+                **{f"p{pct:g}_ms": stats.percentile(pct) * 1000 for pct in percentiles},
+            }
+            for stage, stats in self.stages.items()
+        }
@@ -0,0 +1,344 @@
+import dataclasses
+import re
+import typing
+from pathlib import Path
+
+# Opcode costs that differ from 1 (AVM v10). Ops with a length-dependent cost use their base cost.
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "sqrt": 4,
+    "bsqrt": 40,
+    "divmodw": 20,
+    "divw": 1,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "base64_decode": 1,
+    "json_ref": 25,
+}
+
+_BRANCHES = {"b", "bz", "bnz"}
+_MULTI_BRANCHES = {"match", "switch"}
+_TERMINATORS = {"retsub", "return", "err"}
+_SOURCE_COMMENT = re.compile(r"^// (\S+\.py):(\d+)(?:-\d+)?$")
+
+
+@dataclasses.dataclass(frozen=True)
+class Instruction:
+    op: str
+    immediates: tuple[str, ...]
+    # Contract source text of the statement this instruction was compiled from
+    source: str | None = None
+    source_line: int | None = None
+
+    @property
+    def cost(self) -> int:
+        return OPCODE_COSTS.get(self.op, 1)
+
+
+@dataclasses.dataclass
+class Block:
+    label: str
+    subroutine: str
+    instructions: list[Instruction] = dataclasses.field(default_factory=list)
+    successors: list[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def calls(self) -> list[str]:
+        return [i.immediates[0] for i in self.instructions if i.op == "callsub"]
+
+
+def _split_line(line: str) -> tuple[list[str], str | None]:
+    """Splits a TEAL line into tokens and its trailing comment, keeping quoted strings whole."""
+    tokens: list[str] = []
+    token = ""
+    in_string = False
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if in_string:
+            token += char
+            if char == "\\":
+                index += 1
+                token += line[index : index + 1]
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            token += char
+        elif line.startswith("//", index):
+            if token:
+                tokens.append(token)
+            return tokens, line[index + 2 :].strip()
+        elif char.isspace():
+            if token:
+                tokens.append(token)
+            token = ""
+        else:
+            token += char
+        index += 1
+    if token:
+        tokens.append(token)
+    return tokens, None
+
+
+class TealProgram:
+    """
+    Control-flow graph of a TEAL program split into basic blocks, with each
+    instruction tagged with the contract source statement puya compiled it from
+    (taken from the `// file.py:line` comments in the emitted TEAL).
+    """
+
+    def __init__(self, teal: str) -> None:
+        self.blocks: dict[str, Block] = {}
+        self.entry = ""
+        order: list[Block] = []
+        subroutine = ""
+        source: str | None = None
+        source_line: int | None = None
+        awaiting_source_text = False
+        block: Block | None = None
+        # Set by the unindented signature comment puya writes before each subroutine
+        pending_subroutine = True
+
+        for raw in teal.splitlines():
+            line = raw.strip()
+            if not line or line.startswith("#pragma"):
+                continue
+            if line.startswith("//"):
+                match = _SOURCE_COMMENT.match(line)
+                if match:
+                    source_line = int(match.group(2))
+                    awaiting_source_text = True
+                elif awaiting_source_text:
+                    source = line[2:].strip()
+                    if not source.startswith("#"):
+                        awaiting_source_text = False
+                elif raw.startswith("//"):
+                    # Subroutine signature comments are unindented
+                    pending_subroutine = True
+                    source = source_line = None
+                continue
+            if line.endswith(":") and " " not in line:
+                label = line[:-1]
+                if pending_subroutine and not raw.startswith(" "):
+                    subroutine = label
+                    pending_subroutine = False
+                if block is not None and not block.successors and not self._ends(block):
+                    block.successors.append(label)
+                block = Block(label, subroutine)
+                order.append(block)
+                self.blocks[label] = block
+                if not self.entry:
+                    self.entry = label
+                continue
+
+            tokens, _ = _split_line(line)
+            if not tokens:
+                continue
+            if block is None or self._ends(block):
+                label = f"{subroutine}+{len(order)}"
+                if block is not None and block.instructions[-1].op in ("bz", "bnz", "match", "switch"):
+                    block.successors.append(label)
+                block = Block(label, subroutine)
+                order.append(block)
+                self.blocks[label] = block
+            instruction = Instruction(tokens[0], tuple(tokens[1:]), source, source_line)
+            block.instructions.append(instruction)
+            if instruction.op in _BRANCHES:
+                block.successors.append(instruction.immediates[0])
+            elif instruction.op in _MULTI_BRANCHES:
+                block.successors.extend(instruction.immediates)
+
+        # Conditional branches and switches also fall through to the next block
+        for current, following in zip(order, order[1:]):
+            last = current.instructions[-1].op if current.instructions else None
+            if last in ("bz", "bnz", "match", "switch") and following.label not in current.successors:
+                current.successors.append(following.label)
+
+    @staticmethod
+    def _ends(block: Block) -> bool:
+        return bool(block.instructions) and (
+            block.instructions[-1].op in _BRANCHES
+            or block.instructions[-1].op in _MULTI_BRANCHES
+            or block.instructions[-1].op in _TERMINATORS
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TealProgram":
+        return cls(path.read_text())
+
+    def method_entries(self) -> dict[str, str]:
+        """Maps ARC-4 method selectors (hex) to the label the router dispatches them to."""
+        entries = {}
+        for block in self.blocks.values():
+            selectors: list[str] = []
+            for instruction in block.instructions:
+                if instruction.op == "pushbytess":
+                    selectors = list(instruction.immediates)
+                elif instruction.op == "pushbytes":
+                    # Unoptimised builds push each selector separately
+                    selectors.append(instruction.immediates[0])
+                elif instruction.op == "match" and selectors:
+                    labels = instruction.immediates
+                    for selector, label in zip(selectors[-len(labels) :], labels, strict=False):
+                        entries[selector.removeprefix("0x")] = label
+        return entries
+
+    def loops(self, subroutine: str) -> dict[str, set[str]]:
+        """Natural loops of `subroutine`, as loop header label -> labels of the blocks in its body."""
+        blocks = {label: block for label, block in self.blocks.items() if block.subroutine == subroutine}
+        predecessors: dict[str, set[str]] = {label: set() for label in blocks}
+        for label, block in blocks.items():
+            for successor in block.successors:
+                if successor in predecessors:
+                    predecessors[successor].add(label)
+
+        loops: dict[str, set[str]] = {}
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(label: str) -> None:
+            visiting.add(label)
+            for successor in blocks[label].successors:
+                if successor not in blocks:
+                    continue
+                if successor in visiting:
+                    body = loops.setdefault(successor, {successor})
+                    stack = [label]
+                    while stack:
+                        node = stack.pop()
+                        if node not in body:
+                            body.add(node)
+                            stack.extend(predecessors[node])
+                elif successor not in visited:
+                    visit(successor)
+            visiting.discard(label)
+            visited.add(label)
+
+        entry = next(iter(blocks))
+        visit(entry)
+        return loops
+
+    def worst_case(
+        self,
+        label: str,
+        block_cost: typing.Callable[[Block], int],
+        loop_bound: typing.Callable[[str], int],
+    ) -> int:
+        """
+        Worst-case total of `block_cost` over any execution path starting at `label`
+        until its subroutine returns, with each loop running `loop_bound(header)`
+        times and each `callsub` adding the callee's own worst case.
+        """
+        return _WorstCase(self, block_cost, loop_bound).from_label(label)
+
+
+class _WorstCase:
+    def __init__(
+        self,
+        program: TealProgram,
+        block_cost: typing.Callable[[Block], int],
+        loop_bound: typing.Callable[[str], int],
+    ) -> None:
+        self.program = program
+        self.block_cost = block_cost
+        self.loop_bound = loop_bound
+        self._subroutines: dict[str, int] = {}
+        self._loops: dict[str, dict[str, set[str]]] = {}
+
+    def cost(self, block: Block) -> int:
+        return self.block_cost(block) + sum(self.subroutine(callee) for callee in block.calls)
+
+    def subroutine(self, label: str) -> int:
+        if label not in self._subroutines:
+            self._subroutines[label] = self.from_label(label)
+        return self._subroutines[label]
+
+    def from_label(self, label: str) -> int:
+        subroutine = self.program.blocks[label].subroutine
+        if subroutine not in self._loops:
+            self._loops[subroutine] = self.program.loops(subroutine)
+        return self._longest(label, self._loops[subroutine], frozenset(), {})
+
+    def _longest(
+        self,
+        label: str,
+        loops: dict[str, set[str]],
+        inside: frozenset[str],
+        memo: dict[tuple[str, frozenset[str]], int],
+    ) -> int:
+        key = (label, inside)
+        if key in memo:
+            return memo[key]
+        block = self.program.blocks[label]
+        if label in loops and label not in inside:
+            # Cost of one trip round the loop, times its bound, then leave through the header
+            body = loops[label]
+            trip = self._trip(label, body, loops, inside | {label})
+            exits = [
+                self._longest(successor, loops, inside, memo)
+                for member in body
+                for successor in self.program.blocks[member].successors
+                if successor not in body
+            ]
+            result = self.loop_bound(label) * trip + self.cost(block) + max(exits, default=0)
+        else:
+            result = self.cost(block) + max(
+                (
+                    self._longest(successor, loops, inside, memo)
+                    for successor in block.successors
+                    if successor in self.program.blocks and successor not in inside
+                ),
+                default=0,
+            )
+        memo[key] = result
+        return result
+
+    def _trip(self, header: str, body: set[str], loops: dict[str, set[str]], inside: frozenset[str]) -> int:
+        """Longest path from `header` back to itself within `body`."""
+        memo: dict[str, int] = {}
+
+        def longest(label: str) -> int:
+            if label in memo:
+                return memo[label]
+            block = self.program.blocks[label]
+            if label in loops and label != header and label not in inside:
+                inner = loops[label]
+                trip = self._trip(label, inner, loops, inside | {label})
+                onward = [
+                    longest(successor)
+                    for member in inner
+                    for successor in self.program.blocks[member].successors
+                    if successor not in inner and successor in body
+                ]
+                result = self.loop_bound(label) * trip + self.cost(block) + max(onward, default=0)
+            else:
+                result = self.cost(block) + max(
+                    (
+                        0 if successor == header else longest(successor)
+                        for successor in block.successors
+                        if successor in body
+                    ),
+                    default=0,
+                )
+            memo[label] = result
+            return result
+
+        return longest(header)
@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +20,19 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}, {"type": "string", "name": "title"}, {"type": "string", "name": "description"}, {"type": "string", "name": "category"}, {"type": "uint64", "name": "amount_required"}, {"type": "(string,uint64)[]", "name": "milestones"}, {"type": "pay", "name": "payment"}], "name": "create_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "pay", "name": "payment"}], "name": "donate_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "string", "name": "proof_link"}], "name": "submit_proof", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "bool", "name": "vote"}], "name": "vote_milestone", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "claim_milestone", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "refund_if_inactive", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "primary"}, {"type": "address", "name": "backup"}, {"type": "uint64", "name": "unlock_time"}, {"type": "pay", "name": "payment"}], "name": "fund_future_self", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "fund_id"}], "name": "claim_future_self", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "ProposalContract", "state": {"keys": {"box": {}, "global": {"no_of_proposals": {"key": "bm9PZlByb3Bvc2Fscw==", "keyType": "AVMString", "valueType": "uint64"}, "no_of_future_funds": {"key": "bm9PZkZ1dHVyZUZ1bmRz", "keyType": "AVMString", "valueType": "uint64"}}, "local": {}}, "maps": {"box": {"proposals": {"keyType": "uint64", "valueType": "Proposal", "prefix": "cHJvcG9zYWxz"}, "milestoneVotes": {"keyType": "uint64", "valueType": "address[]", "prefix": "bWlsZXN0b25lVm90ZXNf"}, "donations": {"keyType": "DonationBoxKey", "valueType": "uint64", "prefix": "ZG9uYXRpb25z"}, "futureFunds": {"keyType": "uint64", "valueType": "FutureFund", "prefix": "ZnV0dXJlRnVuZF8="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"DonationBoxKey": [{"name": "proposal_id", "type": "uint64"}, {"name": "donor", "type": "address"}], "FutureFund": [{"name": "primary", "type": "address"}, {"name": "backup", "type": "address"}, {"name": "unlock_time", "type": "uint64"}, {"name": "amount", "type": "uint64"}, {"name": "claimed", "type": "bool"}], "Proposal": [{"name": "name", "type": "string"}, {"name": "title", "type": "string"}, {"name": "description", "type": "string"}, {"name": "category", "type": "string"}, {"name": "amount_required", "type": "uint64"}, {"name": "created_by", "type": "address"}, {"name": "amount_raised", "type": "uint64"}, {"name": "milestones", "type": "(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64)[]"}, {"name": "no_of_donations", "type": "uint64"}, {"name": "no_of_unique_donors", "type": "uint64"}, {"name": "current_milestone", "type": "uint64"}, {"name": "created_at", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAQACOKACJgoIAAAAAAAAAAACAAABAAlwcm9wb3NhbHMNbm9PZlByb3Bvc2Fscw9ub09mRnV0dXJlRnVuZHMCAAIPbWlsZXN0b25lVm90ZXNfCWRvbmF0aW9ucwtmdXR1cmVGdW5kXzEYQAAIJwQoZycFKGcxG0EA8oIIBGpQHlgEh2dV0ARVb4LDBIxQfxgEJ5TZYwTmQFnRBOkSgiYEJmlWdzYaAI4IAIsAcgBgAE4APwAwABEAAiNDMRkURDEYRDYaAYgHbyJDMRkURDEYRDYaATYaAjYaAzEWIglJOBAiEkSIBxQiQzEZFEQxGEQ2GgGIBloiQzEZFEQxGEQ2GgGIBXYiQzEZFEQxGEQ2GgE2GgKIBDIiQzEZFEQxGEQ2GgE2GgKIAyUiQzEZFEQxGEQ2GgExFiIJSTgQIhJEiAKWIkMxGRREMRhENhoBNhoCNhoDNhoENhoFNhoGMRYiCUk4ECISRIgBEiJDMRlA/0gxGBREIkOKBAGAAEmL/iQLi/wkCyOLBIsDDEEAHIv9iwRJTgJZiwIIFlcGAosBTFCMASQIjARC/9yL/RWMACOMBIsEiwIMQQAci/+LBElOAlmLAAgWVwYCiwFMUIwBJAiMBEL/3Iv8i/4IFlcGAosBUIv9iwOLAFJQi/8Vi/+LAk8CUlCMAImKAwGL/VEAAkkXi/1XAgCL/yQLSwFMWYv/IggkC0lOBEsCTFlLAhVLBIv/CSIJSwFPA08CTUlLAwlOBYv+FU4FSwMjTwRSi/5QTwNPAk8DUlBMJAuLAYsFDEEAIIsESYsBSU4DWYsDCIsCCRZXBgJLAkxdjAQkCIwBQv/YiwCLBFCMAImKBwCL/zgIgYCJehJEi/84BzIKEkSL/zgAMQASRCMnBGVEKSOL/iNZI4sEiwMMQQB9i/5XAgCLBElOAiQLSwFMWU8CIghJjASLA0sBCUsDFU8CJAtLBExZTwJNUkkjWUsBFUsCTgJSSwFXAghLARWBNQiAAgA1TwJQTBZXBgJQKFAoUChQKlAoUChQTFApUCcGTFCLAUkjWUxXAgAiTwOI/lmMASRbiwIIjAJC/3uLAhaL/ahEi/0opUSLAUkjWUlEgQUORIv5VwIAFUSL+lcCABVEi/tXAgAVRDEAMgcWi/kVgVoISRZXBgKAAgBaTFCL+hVPAghJFlcGAk8CTFCL+xVPAghJFlcGAk8CTFCL/BVPAghMi/1QTwNQKFBMFlcGAlAoUChQKFBMUIv5UIv6UIv7UIv8UExQK4sASU4DUEm8SEy/JwdMUEm8SCm/IycEZUQXIggWJwRMZ4mKAgAri/5QRwK9RQFEvkxJTwJESVcwCExXCAikRIv/OAiL/zgAi/5MUIv/OAcyChJEJwhMUEm9RQFAAC6LAUmBQlsiCBZcQowBiwIWv4sBSYE6WyIIFlw6SYEwW4sCCBZcMIsASbxITL+JSb5EF4sCCBa/Qv/XigIAgAAri/5QRwK9RQFEvkxJTwJESVcQIDEAEkRJVzAISwFXCAinREmBSltJTwJJJVlJTgJOA0kVTE4CUklOAiNZSU4CDEQyBykjiwmLBgxBAI2LBVcCAIsJSU4CJAtLAUxZSwIiCEmMAIsGSwEJSwMVTwIkC0sETFlPAk1STIsDEkEAQ0mBClkjTFiL/1CLB0lOAhZcJUyBtAEIFlwtIQQjVChcDChcFChcHCcGTFCLCEkjWUxXAgAiTwOI/GqMCIsAjAlC/4MnBkxQiwhJI1lMVwIAIk8DiPxOjAhC/+GLAiOLBFiLCFCLAUm8SEy/JweL/lBJvEgpv4mKAgAri/5QRwK9RQFEvkxJTwJESYFKW0lPAkklWUsBFVJJVwIASwIkC0sBTFlPAiNZTwMiCExLAQlLAxVPAiQLSwRMWU8CTVInB4v+UEm+TElPAkQjWSOLB4sGDEEAG4sFVwIAiwdJTgKBIAuBIFgxABNEIgiMB0L/3YsBVxAgMQATRIsDSYEKWUsBFUsCTgJSKRNEMgdMgS1bDESL/jEAUCcITFBJvUUBRL5ESYAIAAAAAAAPQkCnRBeBwIQ9CpKL/yoTQQBaiwNJgQxbTwIIFlwMjAOLA0mBHFsiCBZcHIsFVwIAMQBQSRWBIAoWVwYCTFCLBEm8SEy/iwBJvkRJJVlLARVLAksCTwJSTwSLAoj7nE8CI08DWExQSwG8SL+JiwNJgRRbTwIIFlwUjANC/6OKAQAri/9QSb1FAURJvkRJgUpbSwElWUsCFUsDTgJSSVcCAEsCJAtLAUxZTwIjWUsDIghMSwEJSwMVSwIkC0sFTFlPAk1PA08DTwJSMgdLAYEKWUsCFUsDTgJSKRNESwGBJVtESwGBLVsNREmBDFtLAYEUWw1ESSEEUyojTwJUKhJETwNXECCxMgpLAiRbsgiyALIHIrIQI7IBsyEEIlRLA75ESSVZSwEVSwJLAk8CUk8DTwWI+sZPAiNPA1hMUEsCvEhLAky/FksBvkRMXEpLAbxIv4mKAQCAAEkri/9QSb1FAUS+TElPAkRJgUpbSwElWUsCFU8DTgJSSVcCAEsCJAtLAUxZTwIjWU8DIghMSwEJSwMVTwIkC0sETFlPAk1SMgdMgSVbCYv/MQBQJwhMUElOAkm9RQFEvkxOAkSB8AENQQA6iwJJgQhbTIEwW0mMAQmMAIsEKKVBACOLBBeLAAuLAQoWsTIKMQBPAheyCLIHsgAishAjsgGziwMov4mKBACL/zgHMgoSRIv/OAhJRIv/OAAxABJEIycFZURMFov8i/1Qi/5QTFAqUCcJSwJQTL8XIggWJwVMZ4mKAQAnCYv/UEcCvUUBRL5MSU8CREmBgAVTKiNPAlQqEkQyB0sBgUBbD0RXACAxABJAAAuLAVcgIDEAEkEAJiJEsTIKMQCLAUlOA4FIW7IIsgeyACKyECOyAbOBgAUiVIsATL+JI0L/1w==", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMiA1NiAyODgKICAgIGJ5dGVjYmxvY2sgMHgwMDAwMDAwMDAwMDAwMDAwIDB4MDAwMCAweDAwICJwcm9wb3NhbHMiICJub09mUHJvcG9zYWxzIiAibm9PZkZ1dHVyZUZ1bmRzIiAweDAwMDIgIm1pbGVzdG9uZVZvdGVzXyIgImRvbmF0aW9ucyIgImZ1dHVyZUZ1bmRfIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU1LTU2CiAgICAvLyAjIENyb3dkZnVuZGluZyBzdGF0ZQogICAgLy8gc2VsZi5ub19vZl9wcm9wb3NhbHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0ibm9PZlByb3Bvc2FscyIpCiAgICBieXRlYyA0IC8vICJub09mUHJvcG9zYWxzIgogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjEtNjIKICAgIC8vICMgRnV0dXJlIHNlbGYgc3RhdGUKICAgIC8vIHNlbGYubm9fb2ZfZnV0dXJlX2Z1bmRzID0gR2xvYmFsU3RhdGUoVUludDY0KDApLCBrZXk9Im5vT2ZGdXR1cmVGdW5kcyIpCiAgICBieXRlYyA1IC8vICJub09mRnV0dXJlRnVuZHMiCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyLTUzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMwogICAgcHVzaGJ5dGVzcyAweDZhNTAxZTU4IDB4ODc2NzU1ZDAgMHg1NTZmODJjMyAweDhjNTA3ZjE4IDB4Mjc5NGQ5NjMgMHhlNjQwNTlkMSAweGU5MTI4MjI2IDB4MjY2OTU2NzcgLy8gbWV0aG9kICJjcmVhdGVfcHJvcG9zYWwoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCwoc3RyaW5nLHVpbnQ2NClbXSxwYXkpdm9pZCIsIG1ldGhvZCAiZG9uYXRlX3Byb3Bvc2FsKHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAic3VibWl0X3Byb29mKHVpbnQ2NCxzdHJpbmcpdm9pZCIsIG1ldGhvZCAidm90ZV9taWxlc3RvbmUodWludDY0LGJvb2wpdm9pZCIsIG1ldGhvZCAiY2xhaW1fbWlsZXN0b25lKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWZ1bmRfaWZfaW5hY3RpdmUodWludDY0KXZvaWQiLCBtZXRob2QgImZ1bmRfZnV0dXJlX3NlbGYoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAiY2xhaW1fZnV0dXJlX3NlbGYodWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUA1IG1haW5fZG9uYXRlX3Byb3Bvc2FsX3JvdXRlQDYgbWFpbl9zdWJtaXRfcHJvb2Zfcm91dGVANyBtYWluX3ZvdGVfbWlsZXN0b25lX3JvdXRlQDggbWFpbl9jbGFpbV9taWxlc3RvbmVfcm91dGVAOSBtYWluX3JlZnVuZF9pZl9pbmFjdGl2ZV9yb3V0ZUAxMCBtYWluX2Z1bmRfZnV0dXJlX3NlbGZfcm91dGVAMTEgbWFpbl9jbGFpbV9mdXR1cmVfc2VsZl9yb3V0ZUAxMgoKbWFpbl9hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyLTUzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIGludGNfMSAvLyAwCiAgICByZXR1cm4KCm1haW5fY2xhaW1fZnV0dXJlX3NlbGZfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjg2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyLTUzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGFpbV9mdXR1cmVfc2VsZgogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9mdW5kX2Z1dHVyZV9zZWxmX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI2Mi0yNjMKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIEZ1dHVyZSBTZWxmIE1ldGhvZHMgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyLTUzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI2Mi0yNjMKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIEZ1dHVyZSBTZWxmIE1ldGhvZHMgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZnVuZF9mdXR1cmVfc2VsZgogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWZ1bmRfaWZfaW5hY3RpdmVfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjM4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyLTUzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWZ1bmRfaWZfaW5hY3RpdmUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xhaW1fbWlsZXN0b25lX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjEzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyLTUzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMTMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGFpbV9taWxlc3RvbmUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdm90ZV9taWxlc3RvbmVfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTItNTMKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgUHJvcG9zYWxDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE4MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHZvdGVfbWlsZXN0b25lCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3N1Ym1pdF9wcm9vZl9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1Mi01MwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTUxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc3VibWl0X3Byb29mCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2RvbmF0ZV9wcm9wb3NhbF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1Mi01MwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMjkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBkb25hdGVfcHJvcG9zYWwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3Byb3Bvc2FsX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjYtNjcKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENyb3dkZnVuZGluZyBNZXRob2RzIC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1Mi01MwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2Ni02NwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ3Jvd2RmdW5kaW5nIE1ldGhvZHMgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX3Byb3Bvc2FsCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1Mi01MwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDE1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudChhcnJheV9pdGVtc19jb3VudDogdWludDY0LCBhcnJheV9oZWFkX2FuZF90YWlsOiBieXRlcywgbmV3X2l0ZW1zX2NvdW50OiB1aW50NjQsIG5ld19oZWFkX2FuZF90YWlsOiBieXRlcykgLT4gYnl0ZXM6CmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudDoKICAgIHByb3RvIDQgMQogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGZyYW1lX2RpZyAtNAogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGludGNfMSAvLyAwCgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckAxOgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBieiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDEKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JANDoKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBmcmFtZV9idXJ5IDAKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDU6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JAOAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJANQoKZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA4OgogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgMAogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgMgogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gX3B1eWFfbGliLmFyYzQuZHluYW1pY19hcnJheV9yZXBsYWNlX2R5bmFtaWNfZWxlbWVudChzb3VyY2U6IGJ5dGVzLCBuZXdfaXRlbTogYnl0ZXMsIGluZGV4OiB1aW50NjQpIC0+IGJ5dGVzOgpkeW5hbWljX2FycmF5X3JlcGxhY2VfZHluYW1pY19lbGVtZW50OgogICAgcHJvdG8gMyAxCiAgICBmcmFtZV9kaWcgLTMKICAgIHN1YnN0cmluZyAwIDIKICAgIGR1cAogICAgYnRvaQogICAgZnJhbWVfZGlnIC0zCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBkaWcgMgogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBsZW4KICAgIGRpZyA0CiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkaWcgMQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZHVwCiAgICBkaWcgMwogICAgLQogICAgY292ZXIgNQogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGNvdmVyIDUKICAgIGRpZyAzCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciA0CiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBpbnRjXzIgLy8gMgogICAgKgoKZHluYW1pY19hcnJheV9yZXBsYWNlX2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDI6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDUKICAgIDwKICAgIGJ6IGR5bmFtaWNfYXJyYXlfcmVwbGFjZV9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDUKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgMwogICAgKwogICAgZnJhbWVfZGlnIDIKICAgIC0KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBkaWcgMgogICAgc3dhcAogICAgcmVwbGFjZTMKICAgIGZyYW1lX2J1cnkgNAogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBkeW5hbWljX2FycmF5X3JlcGxhY2VfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJAMgoKZHluYW1pY19hcnJheV9yZXBsYWNlX2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JANToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgNAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LmNyZWF0ZV9wcm9wb3NhbChuYW1lOiBieXRlcywgdGl0bGU6IGJ5dGVzLCBkZXNjcmlwdGlvbjogYnl0ZXMsIGNhdGVnb3J5OiBieXRlcywgYW1vdW50X3JlcXVpcmVkOiBieXRlcywgbWlsZXN0b25lczogYnl0ZXMsIHBheW1lbnQ6IHVpbnQ2NCkgLT4gdm9pZDoKY3JlYXRlX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY2LTc3CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDcm93ZGZ1bmRpbmcgTWV0aG9kcyAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9wcm9wb3NhbCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG5hbWU6IFN0cmluZywKICAgIC8vICAgICB0aXRsZTogU3RyaW5nLAogICAgLy8gICAgIGRlc2NyaXB0aW9uOiBTdHJpbmcsCiAgICAvLyAgICAgY2F0ZWdvcnk6IFN0cmluZywKICAgIC8vICAgICBhbW91bnRfcmVxdWlyZWQ6IFVJbnQ2NCwKICAgIC8vICAgICBtaWxlc3RvbmVzOiBEeW5hbWljQXJyYXlbTWlsZXN0b25lSW5wdXRdLAogICAgLy8gICAgIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA3IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo3OAogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IDJfMDAwXzAwMCwgIk11c3QgcGF5IGV4YWN0bHkgMiBBbGdvcyB0byBjcmVhdGUgYSBwcm9wb3NhbCIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDIwMDAwMDAgLy8gMjAwMDAwMAogICAgPT0KICAgIGFzc2VydCAvLyBNdXN0IHBheSBleGFjdGx5IDIgQWxnb3MgdG8gY3JlYXRlIGEgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo3OQogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSBzZW50IHRvIHRoZSBjb250cmFjdCBhZGRyZXNzIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIHNlbnQgdG8gdGhlIGNvbnRyYWN0IGFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIsICJQYXltZW50IG11c3QgYmUgZnJvbSB0aGUgcHJvcG9zYWwgY3JlYXRvciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSBmcm9tIHRoZSBwcm9wb3NhbCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6ODIKICAgIC8vIGlkeCA9IHNlbGYubm9fb2ZfcHJvcG9zYWxzLnZhbHVlCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNCAvLyAibm9PZlByb3Bvc2FscyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ub19vZl9wcm9wb3NhbHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6ODMKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMgPSBEeW5hbWljQXJyYXlbTWlsZXN0b25lXSgpCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBtaWxlc3RvbmVzX3RvdGFsID0gTmF0aXZlVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKG1pbGVzdG9uZXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKY3JlYXRlX3Byb3Bvc2FsX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo4NgogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShtaWxlc3RvbmVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIDwKICAgIGJ6IGNyZWF0ZV9wcm9wb3NhbF9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBtaWxlc3RvbmUgPSBtaWxlc3RvbmVzW2luZGV4XS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMwogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgNAogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6ODkKICAgIC8vIG5hbWU9bWlsZXN0b25lLm5hbWUsCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGxlbgogICAgZGlnIDIKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo5MAogICAgLy8gYW1vdW50PW1pbGVzdG9uZS5hbW91bnQsCiAgICBkaWcgMQogICAgZXh0cmFjdCAyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6ODgtOTgKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMuYXBwZW5kKE1pbGVzdG9uZSgKICAgIC8vICAgICBuYW1lPW1pbGVzdG9uZS5uYW1lLAogICAgLy8gICAgIGFtb3VudD1taWxlc3RvbmUuYW1vdW50LAogICAgLy8gICAgIHByb29mX2xpbms9U3RyaW5nKCIiKSwKICAgIC8vICAgICB2b3Rlc19mb3I9VUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2FnYWluc3Q9VUludDY0KDApLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1VSW50NjQoMCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKSwKICAgIC8vICAgICBwcm9vZl9zdWJtaXR0ZWRfdGltZT1VSW50NjQoMCksCiAgICAvLyAgICAgdm90aW5nX2VuZF90aW1lPVVJbnQ2NCgwKQogICAgLy8gKSkKICAgIGRpZyAxCiAgICBsZW4KICAgIHB1c2hpbnQgNTMgLy8gNTMKICAgICsKICAgIHB1c2hieXRlcyAweDAwMzUKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6OTIKICAgIC8vIHZvdGVzX2Zvcj1VSW50NjQoMCksCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojg4LTk4CiAgICAvLyBmaW5hbF9taWxlc3RvbmVzLmFwcGVuZChNaWxlc3RvbmUoCiAgICAvLyAgICAgbmFtZT1taWxlc3RvbmUubmFtZSwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIC8vICAgICBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICAvLyAgICAgdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIC8vICAgICB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICAvLyAgICAgcHJvb2Zfc3VibWl0dGVkX3RpbWU9VUludDY0KDApLAogICAgLy8gICAgIHZvdGluZ19lbmRfdGltZT1VSW50NjQoMCkKICAgIC8vICkpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo5MwogICAgLy8gdm90ZXNfYWdhaW5zdD1VSW50NjQoMCksCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojg4LTk4CiAgICAvLyBmaW5hbF9taWxlc3RvbmVzLmFwcGVuZChNaWxlc3RvbmUoCiAgICAvLyAgICAgbmFtZT1taWxlc3RvbmUubmFtZSwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIC8vICAgICBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICAvLyAgICAgdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIC8vICAgICB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICAvLyAgICAgcHJvb2Zfc3VibWl0dGVkX3RpbWU9VUludDY0KDApLAogICAgLy8gICAgIHZvdGluZ19lbmRfdGltZT1VSW50NjQoMCkKICAgIC8vICkpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo5NAogICAgLy8gdG90YWxfdm90ZXJzPVVJbnQ2NCgwKSwKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6ODgtOTgKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMuYXBwZW5kKE1pbGVzdG9uZSgKICAgIC8vICAgICBuYW1lPW1pbGVzdG9uZS5uYW1lLAogICAgLy8gICAgIGFtb3VudD1taWxlc3RvbmUuYW1vdW50LAogICAgLy8gICAgIHByb29mX2xpbms9U3RyaW5nKCIiKSwKICAgIC8vICAgICB2b3Rlc19mb3I9VUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2FnYWluc3Q9VUludDY0KDApLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1VSW50NjQoMCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKSwKICAgIC8vICAgICBwcm9vZl9zdWJtaXR0ZWRfdGltZT1VSW50NjQoMCksCiAgICAvLyAgICAgdm90aW5nX2VuZF90aW1lPVVJbnQ2NCgwKQogICAgLy8gKSkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBjbGFpbWVkPUJvb2woRmFsc2UpLAogICAgYnl0ZWNfMiAvLyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6ODgtOTgKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMuYXBwZW5kKE1pbGVzdG9uZSgKICAgIC8vICAgICBuYW1lPW1pbGVzdG9uZS5uYW1lLAogICAgLy8gICAgIGFtb3VudD1taWxlc3RvbmUuYW1vdW50LAogICAgLy8gICAgIHByb29mX2xpbms9U3RyaW5nKCIiKSwKICAgIC8vICAgICB2b3Rlc19mb3I9VUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2FnYWluc3Q9VUludDY0KDApLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1VSW50NjQoMCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKSwKICAgIC8vICAgICBwcm9vZl9zdWJtaXR0ZWRfdGltZT1VSW50NjQoMCksCiAgICAvLyAgICAgdm90aW5nX2VuZF90aW1lPVVJbnQ2NCgwKQogICAgLy8gKSkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBwcm9vZl9zdWJtaXR0ZWRfdGltZT1VSW50NjQoMCksCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5Ojg4LTk4CiAgICAvLyBmaW5hbF9taWxlc3RvbmVzLmFwcGVuZChNaWxlc3RvbmUoCiAgICAvLyAgICAgbmFtZT1taWxlc3RvbmUubmFtZSwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIC8vICAgICBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICAvLyAgICAgdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIC8vICAgICB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICAvLyAgICAgcHJvb2Zfc3VibWl0dGVkX3RpbWU9VUludDY0KDApLAogICAgLy8gICAgIHZvdGluZ19lbmRfdGltZT1VSW50NjQoMCkKICAgIC8vICkpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo5NwogICAgLy8gdm90aW5nX2VuZF90aW1lPVVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo4OC05OAogICAgLy8gZmluYWxfbWlsZXN0b25lcy5hcHBlbmQoTWlsZXN0b25lKAogICAgLy8gICAgIG5hbWU9bWlsZXN0b25lLm5hbWUsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQsCiAgICAvLyAgICAgcHJvb2ZfbGluaz1TdHJpbmcoIiIpLAogICAgLy8gICAgIHZvdGVzX2Zvcj1VSW50NjQoMCksCiAgICAvLyAgICAgdm90ZXNfYWdhaW5zdD1VSW50NjQoMCksCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbGFpbWVkPUJvb2woRmFsc2UpLAogICAgLy8gICAgIHByb29mX3N1Ym1pdHRlZF90aW1lPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3RpbmdfZW5kX3RpbWU9VUludDY0KDApCiAgICAvLyApKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo5MQogICAgLy8gcHJvb2ZfbGluaz1TdHJpbmcoIiIpLAogICAgYnl0ZWNfMSAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo4OC05OAogICAgLy8gZmluYWxfbWlsZXN0b25lcy5hcHBlbmQoTWlsZXN0b25lKAogICAgLy8gICAgIG5hbWU9bWlsZXN0b25lLm5hbWUsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQsCiAgICAvLyAgICAgcHJvb2ZfbGluaz1TdHJpbmcoIiIpLAogICAgLy8gICAgIHZvdGVzX2Zvcj1VSW50NjQoMCksCiAgICAvLyAgICAgdm90ZXNfYWdhaW5zdD1VSW50NjQoMCksCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbGFpbWVkPUJvb2woRmFsc2UpLAogICAgLy8gICAgIHByb29mX3N1Ym1pdHRlZF90aW1lPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3RpbmdfZW5kX3RpbWU9VUludDY0KDApCiAgICAvLyApKQogICAgY29uY2F0CiAgICBieXRlYyA2IC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzAgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6OTkKICAgIC8vIG1pbGVzdG9uZXNfdG90YWwgPSBtaWxlc3RvbmVzX3RvdGFsICsgbWlsZXN0b25lLmFtb3VudC5uYXRpdmUKICAgIGludGNfMiAvLyAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBjcmVhdGVfcHJvcG9zYWxfZm9yX2hlYWRlckAxCgpjcmVhdGVfcHJvcG9zYWxfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTAxCiAgICAvLyBhc3NlcnQgYW1vdW50X3JlcXVpcmVkID09IG1pbGVzdG9uZXNfdG90YWwsICJUb3RhbCBtaWxlc3RvbmUgYW1vdW50IG11c3QgZXF1YWwgdGhlIHJlcXVpcmVkIGFtb3VudCIKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTMKICAgIGI9PQogICAgYXNzZXJ0IC8vIFRvdGFsIG1pbGVzdG9uZSBhbW91bnQgbXVzdCBlcXVhbCB0aGUgcmVxdWlyZWQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTAyCiAgICAvLyBhc3NlcnQgYW1vdW50X3JlcXVpcmVkID4gMCwgIkFtb3VudCByZXF1aXJlZCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwIgogICAgZnJhbWVfZGlnIC0zCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBBbW91bnQgcmVxdWlyZWQgbXVzdCBiZSBncmVhdGVyIHRoYW4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gYXNzZXJ0IGZpbmFsX21pbGVzdG9uZXMubGVuZ3RoID4gMCwgIkF0IGxlYXN0IG9uZSBtaWxlc3RvbmUgaXMgcmVxdWlyZWQiCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgYXNzZXJ0IC8vIEF0IGxlYXN0IG9uZSBtaWxlc3RvbmUgaXMgcmVxdWlyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMDQKICAgIC8vIGFzc2VydCBmaW5hbF9taWxlc3RvbmVzLmxlbmd0aCA8PSA1LCAiTWF4aW11bSBvZiA1IG1pbGVzdG9uZXMgYWxsb3dlZCIKICAgIHB1c2hpbnQgNSAvLyA1CiAgICA8PQogICAgYXNzZXJ0IC8vIE1heGltdW0gb2YgNSBtaWxlc3RvbmVzIGFsbG93ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMDUKICAgIC8vIGFzc2VydCBuYW1lLm5hdGl2ZS5ieXRlcy5sZW5ndGggPiAwLCAiUHJvcG9zYWwgbmFtZSBjYW5ub3QgYmUgZW1wdHkiCiAgICBmcmFtZV9kaWcgLTcKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIGFzc2VydCAvLyBQcm9wb3NhbCBuYW1lIGNhbm5vdCBiZSBlbXB0eQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEwNgogICAgLy8gYXNzZXJ0IHRpdGxlLm5hdGl2ZS5ieXRlcy5sZW5ndGggPiAwLCAiUHJvcG9zYWwgdGl0bGUgY2Fubm90IGJlIGVtcHR5IgogICAgZnJhbWVfZGlnIC02CiAgICBleHRyYWN0IDIgMAogICAgbGVuCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgdGl0bGUgY2Fubm90IGJlIGVtcHR5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTA3CiAgICAvLyBhc3NlcnQgZGVzY3JpcHRpb24ubmF0aXZlLmJ5dGVzLmxlbmd0aCA+IDAsICJQcm9wb3NhbCBkZXNjcmlwdGlvbiBjYW5ub3QgYmUgZW1wdHkiCiAgICBmcmFtZV9kaWcgLTUKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIGFzc2VydCAvLyBQcm9wb3NhbCBkZXNjcmlwdGlvbiBjYW5ub3QgYmUgZW1wdHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMTUKICAgIC8vIGNyZWF0ZWRfYnk9QWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMjEKICAgIC8vIGNyZWF0ZWRfYXQ9VUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEwOS0xMjIKICAgIC8vIG5ld19wcm9wb3NhbCA9IFByb3Bvc2FsKAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1kZXNjcmlwdGlvbiwKICAgIC8vICAgICBjYXRlZ29yeT1jYXRlZ29yeSwKICAgIC8vICAgICBhbW91bnRfcmVxdWlyZWQ9YW1vdW50X3JlcXVpcmVkLAogICAgLy8gICAgIGNyZWF0ZWRfYnk9QWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnRfcmFpc2VkPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl9kb25hdGlvbnM9VUludDY0KDApLAogICAgLy8gICAgIG5vX29mX3VuaXF1ZV9kb25vcnM9VUludDY0KDApLAogICAgLy8gICAgIG1pbGVzdG9uZXM9ZmluYWxfbWlsZXN0b25lcy5jb3B5KCksCiAgICAvLyAgICAgY3VycmVudF9taWxlc3RvbmU9VUludDY0KDApLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9VUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKQogICAgLy8gKQogICAgZnJhbWVfZGlnIC03CiAgICBsZW4KICAgIHB1c2hpbnQgOTAgLy8gOTAKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHB1c2hieXRlcyAweDAwNWEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC02CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNQogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMTYKICAgIC8vIGFtb3VudF9yYWlzZWQ9VUludDY0KDApLAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMDktMTIyCiAgICAvLyBuZXdfcHJvcG9zYWwgPSBQcm9wb3NhbCgKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgZGVzY3JpcHRpb249ZGVzY3JpcHRpb24sCiAgICAvLyAgICAgY2F0ZWdvcnk9Y2F0ZWdvcnksCiAgICAvLyAgICAgYW1vdW50X3JlcXVpcmVkPWFtb3VudF9yZXF1aXJlZCwKICAgIC8vICAgICBjcmVhdGVkX2J5PUFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50X3JhaXNlZD1VSW50NjQoMCksCiAgICAvLyAgICAgbm9fb2ZfZG9uYXRpb25zPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl91bmlxdWVfZG9ub3JzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBtaWxlc3RvbmVzPWZpbmFsX21pbGVzdG9uZXMuY29weSgpLAogICAgLy8gICAgIGN1cnJlbnRfbWlsZXN0b25lPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PVVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjExNwogICAgLy8gbm9fb2ZfZG9uYXRpb25zPVVJbnQ2NCgwKSwKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTA5LTEyMgogICAgLy8gbmV3X3Byb3Bvc2FsID0gUHJvcG9zYWwoCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPWRlc2NyaXB0aW9uLAogICAgLy8gICAgIGNhdGVnb3J5PWNhdGVnb3J5LAogICAgLy8gICAgIGFtb3VudF9yZXF1aXJlZD1hbW91bnRfcmVxdWlyZWQsCiAgICAvLyAgICAgY3JlYXRlZF9ieT1BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudF9yYWlzZWQ9VUludDY0KDApLAogICAgLy8gICAgIG5vX29mX2RvbmF0aW9ucz1VSW50NjQoMCksCiAgICAvLyAgICAgbm9fb2ZfdW5pcXVlX2Rvbm9ycz1VSW50NjQoMCksCiAgICAvLyAgICAgbWlsZXN0b25lcz1maW5hbF9taWxlc3RvbmVzLmNvcHkoKSwKICAgIC8vICAgICBjdXJyZW50X21pbGVzdG9uZT1VSW50NjQoMCksCiAgICAvLyAgICAgY3JlYXRlZF9hdD1VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMTgKICAgIC8vIG5vX29mX3VuaXF1ZV9kb25vcnM9VUludDY0KDApLAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMDktMTIyCiAgICAvLyBuZXdfcHJvcG9zYWwgPSBQcm9wb3NhbCgKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgZGVzY3JpcHRpb249ZGVzY3JpcHRpb24sCiAgICAvLyAgICAgY2F0ZWdvcnk9Y2F0ZWdvcnksCiAgICAvLyAgICAgYW1vdW50X3JlcXVpcmVkPWFtb3VudF9yZXF1aXJlZCwKICAgIC8vICAgICBjcmVhdGVkX2J5PUFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50X3JhaXNlZD1VSW50NjQoMCksCiAgICAvLyAgICAgbm9fb2ZfZG9uYXRpb25zPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl91bmlxdWVfZG9ub3JzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBtaWxlc3RvbmVzPWZpbmFsX21pbGVzdG9uZXMuY29weSgpLAogICAgLy8gICAgIGN1cnJlbnRfbWlsZXN0b25lPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PVVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gY3VycmVudF9taWxlc3RvbmU9VUludDY0KDApLAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMDktMTIyCiAgICAvLyBuZXdfcHJvcG9zYWwgPSBQcm9wb3NhbCgKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgZGVzY3JpcHRpb249ZGVzY3JpcHRpb24sCiAgICAvLyAgICAgY2F0ZWdvcnk9Y2F0ZWdvcnksCiAgICAvLyAgICAgYW1vdW50X3JlcXVpcmVkPWFtb3VudF9yZXF1aXJlZCwKICAgIC8vICAgICBjcmVhdGVkX2J5PUFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50X3JhaXNlZD1VSW50NjQoMCksCiAgICAvLyAgICAgbm9fb2ZfZG9uYXRpb25zPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl91bmlxdWVfZG9ub3JzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBtaWxlc3RvbmVzPWZpbmFsX21pbGVzdG9uZXMuY29weSgpLAogICAgLy8gICAgIGN1cnJlbnRfbWlsZXN0b25lPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PVVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTcKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC02CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTI0CiAgICAvLyBzZWxmLnByb3Bvc2Fsc1tpZHhdID0gbmV3X3Byb3Bvc2FsLmNvcHkoKQogICAgYnl0ZWNfMyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gc2VsZi5taWxlc3RvbmVWb3Rlc1tpZHhdID0gRHluYW1pY0FycmF5W0FkZHJlc3NdKCkKICAgIGJ5dGVjIDcgLy8gIm1pbGVzdG9uZVZvdGVzXyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjXzEgLy8gMHgwMDAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTI2CiAgICAvLyBzZWxmLm5vX29mX3Byb3Bvc2Fscy52YWx1ZSA9IFVJbnQ2NChzZWxmLm5vX29mX3Byb3Bvc2Fscy52YWx1ZS5uYXRpdmUgKyAxKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm5vT2ZQcm9wb3NhbHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubm9fb2ZfcHJvcG9zYWxzIGV4aXN0cwogICAgYnRvaQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gIm5vT2ZQcm9wb3NhbHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuZG9uYXRlX3Byb3Bvc2FsKHByb3Bvc2FsX2lkOiBieXRlcywgcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpkb25hdGVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTI5LTEzMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZG9uYXRlX3Byb3Bvc2FsKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTMxCiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2Vzbid0IGV4aXN0IgogICAgYnl0ZWNfMyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lc24ndCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gcHJvcCA9IHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTMzCiAgICAvLyBhc3NlcnQgcHJvcC5hbW91bnRfcmFpc2VkIDwgcHJvcC5hbW91bnRfcmVxdWlyZWQsICJHb2FsIGFscmVhZHkgcmVhY2hlZCIKICAgIGR1cAogICAgZXh0cmFjdCA0OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBiPAogICAgYXNzZXJ0IC8vIEdvYWwgYWxyZWFkeSByZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTM1CiAgICAvLyBhbW91bnQgPSBwYXltZW50LmFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMzYKICAgIC8vIGRvbm9yID0gcGF5bWVudC5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTM3CiAgICAvLyBkb25hdGlvbl9ib3hfa2V5ID0gRG9uYXRpb25Cb3hLZXkocHJvcG9zYWxfaWQ9cHJvcG9zYWxfaWQsIGRvbm9yPUFkZHJlc3MoZG9ub3IpKQogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMzgKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJQYXltZW50IG11c3QgYmUgc2VudCB0byB0aGUgY29udHJhY3QgYWRkcmVzcyIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSBzZW50IHRvIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQwCiAgICAvLyBpZiBkb25hdGlvbl9ib3hfa2V5IG5vdCBpbiBzZWxmLmRvbmF0aW9uczoKICAgIGJ5dGVjIDggLy8gImRvbmF0aW9ucyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBkb25hdGVfcHJvcG9zYWxfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEKICAgIC8vIHByb3Aubm9fb2ZfdW5pcXVlX2Rvbm9ycyA9IFVJbnQ2NChwcm9wLm5vX29mX3VuaXF1ZV9kb25vcnMubmF0aXZlICsgMSkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIHB1c2hpbnQgNjYgLy8gNjYKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNjYKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gc2VsZi5kb25hdGlvbnNbZG9uYXRpb25fYm94X2tleV0gPSBVSW50NjQoYW1vdW50KQogICAgZnJhbWVfZGlnIDIKICAgIGl0b2IKICAgIGJveF9wdXQKCmRvbmF0ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQ2CiAgICAvLyBwcm9wLm5vX29mX2RvbmF0aW9ucyA9IFVJbnQ2NChwcm9wLm5vX29mX2RvbmF0aW9ucy5uYXRpdmUgKyAxKQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgcHVzaGludCA1OCAvLyA1OAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiA1OAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gcHJvcC5hbW91bnRfcmFpc2VkID0gVUludDY0KHByb3AuYW1vdW50X3JhaXNlZC5uYXRpdmUgKyBhbW91bnQpCiAgICBkdXAKICAgIHB1c2hpbnQgNDggLy8gNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDgKICAgIC8vIHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXSA9IHByb3AuY29weSgpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKZG9uYXRlX3Byb3Bvc2FsX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0NAogICAgLy8gc2VsZi5kb25hdGlvbnNbZG9uYXRpb25fYm94X2tleV0gPSBVSW50NjQoc2VsZi5kb25hdGlvbnNbZG9uYXRpb25fYm94X2tleV0ubmF0aXZlICsgYW1vdW50KQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kb25hdGlvbnMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgYiBkb25hdGVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3Quc3VibWl0X3Byb29mKHByb3Bvc2FsX2lkOiBieXRlcywgcHJvb2ZfbGluazogYnl0ZXMpIC0+IHZvaWQ6CnN1Ym1pdF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNTEtMTUyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzdWJtaXRfcHJvb2Yoc2VsZiwgcHJvcG9zYWxfaWQ6IFVJbnQ2NCwgcHJvb2ZfbGluazogU3RyaW5nKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNTMKICAgIC8vIGFzc2VydCBwcm9wb3NhbF9pZCBpbiBzZWxmLnByb3Bvc2FscywgIlByb3Bvc2FsIGRvZXNuJ3QgZXhpc3QiCiAgICBieXRlY18zIC8vICJwcm9wb3NhbHMiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwbiAyCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBkb2Vzbid0IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTU0CiAgICAvLyBwcm9wID0gc2VsZi5wcm9wb3NhbHNbcHJvcG9zYWxfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2FscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNTUKICAgIC8vIGFzc2VydCBwcm9wLmNyZWF0ZWRfYnkgPT0gQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk9ubHkgY3JlYXRvciBjYW4gc3VibWl0IHByb29mIgogICAgZHVwCiAgICBleHRyYWN0IDE2IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIHN1Ym1pdCBwcm9vZgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE1NgogICAgLy8gYXNzZXJ0IHByb3AuYW1vdW50X3JhaXNlZCA+PSBwcm9wLmFtb3VudF9yZXF1aXJlZCwgIkdvYWwgbm90IHJlYWNoZWQgeWV0IgogICAgZHVwCiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMQogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBiPj0KICAgIGFzc2VydCAvLyBHb2FsIG5vdCByZWFjaGVkIHlldAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gYXNzZXJ0IHByb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlIDwgcHJvcC5taWxlc3RvbmVzLmxlbmd0aCwgIkFsbCBtaWxlc3RvbmVzIGFscmVhZHkgY29tcGxldGVkIgogICAgZHVwCiAgICBwdXNoaW50IDc0IC8vIDc0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgaW50Y18zIC8vIDU2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciAzCiAgICBkdXAKICAgIGxlbgogICAgc3dhcAogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY292ZXIgMgogICAgPAogICAgYXNzZXJ0IC8vIEFsbCBtaWxlc3RvbmVzIGFscmVhZHkgY29tcGxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTU5CiAgICAvLyBjdXJyZW50X3RpbWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE2MAogICAgLy8gbmV3X21pbGVzdG9uZXMgPSBEeW5hbWljQXJyYXlbTWlsZXN0b25lXSgpCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UocHJvcC5taWxlc3RvbmVzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMAoKc3VibWl0X3Byb29mX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNjEKICAgIC8vIGZvciBpZHggaW4gdXJhbmdlKHByb3AubWlsZXN0b25lcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA2CiAgICA8CiAgICBieiBzdWJtaXRfcHJvb2ZfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNjIKICAgIC8vIG1pbGVzdG9uZSA9IHByb3AubWlsZXN0b25lc1tpZHhdLmNvcHkoKQogICAgZnJhbWVfZGlnIDUKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgOQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBmcmFtZV9kaWcgNgogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgNAogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTYzCiAgICAvLyBpZiBpZHggPT0gcHJvcC5jdXJyZW50X21pbGVzdG9uZS5uYXRpdmU6CiAgICBmcmFtZV9kaWcgMwogICAgPT0KICAgIGJ6IHN1Ym1pdF9wcm9vZl9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gbWlsZXN0b25lLnByb29mX2xpbmsgPSBwcm9vZl9saW5rCiAgICBkdXAKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAogICAgc3dhcAogICAgZXh0cmFjdDMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTY1CiAgICAvLyBtaWxlc3RvbmUucHJvb2Zfc3VibWl0dGVkX3RpbWUgPSBVSW50NjQoY3VycmVudF90aW1lKQogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgaXRvYgogICAgcmVwbGFjZTIgMzcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNjYKICAgIC8vIG1pbGVzdG9uZS52b3RpbmdfZW5kX3RpbWUgPSBVSW50NjQoY3VycmVudF90aW1lICsgdm90aW5nX3RpbWUpCiAgICBzd2FwCiAgICBwdXNoaW50IDE4MCAvLyAxODAKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDQ1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTY3CiAgICAvLyBtaWxlc3RvbmUuY2xhaW1lZCA9IEJvb2woRmFsc2UpCiAgICBpbnRjIDQgLy8gMjg4CiAgICBpbnRjXzEgLy8gMAogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTY4CiAgICAvLyBtaWxlc3RvbmUudm90ZXNfZm9yID0gVUludDY0KDApCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgcmVwbGFjZTIgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNjkKICAgIC8vIG1pbGVzdG9uZS52b3Rlc19hZ2FpbnN0ID0gVUludDY0KDApCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgcmVwbGFjZTIgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNzAKICAgIC8vIG1pbGVzdG9uZS50b3RhbF92b3RlcnMgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiAyOAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE3MQogICAgLy8gbmV3X21pbGVzdG9uZXMuYXBwZW5kKG1pbGVzdG9uZS5jb3B5KCkpCiAgICBieXRlYyA2IC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzAgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgZnJhbWVfYnVyeSA4CgpzdWJtaXRfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA1OgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgOQogICAgYiBzdWJtaXRfcHJvb2ZfZm9yX2hlYWRlckAxCgpzdWJtaXRfcHJvb2ZfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTczCiAgICAvLyBuZXdfbWlsZXN0b25lcy5hcHBlbmQobWlsZXN0b25lLmNvcHkoKSkKICAgIGJ5dGVjIDYgLy8gMHgwMDAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyA4CiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGludGNfMCAvLyAxCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50CiAgICBmcmFtZV9idXJ5IDgKICAgIGIgc3VibWl0X3Byb29mX2FmdGVyX2lmX2Vsc2VANQoKc3VibWl0X3Byb29mX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gcHJvcC5taWxlc3RvbmVzID0gbmV3X21pbGVzdG9uZXMuY29weSgpCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2RpZyA0CiAgICBleHRyYWN0MwogICAgZnJhbWVfZGlnIDgKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gc2VsZi5wcm9wb3NhbHNbcHJvcG9zYWxfaWRdID0gcHJvcC5jb3B5KCkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gc2VsZi5taWxlc3RvbmVWb3Rlc1twcm9wb3NhbF9pZF0gPSBEeW5hbWljQXJyYXlbQWRkcmVzc10oKQogICAgYnl0ZWMgNyAvLyAibWlsZXN0b25lVm90ZXNfIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3Qudm90ZV9taWxlc3RvbmUocHJvcG9zYWxfaWQ6IGJ5dGVzLCB2b3RlOiBieXRlcykgLT4gdm9pZDoKdm90ZV9taWxlc3RvbmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTgwLTE4MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdm90ZV9taWxlc3RvbmUoc2VsZiwgcHJvcG9zYWxfaWQ6IFVJbnQ2NCwgdm90ZTogQm9vbCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gYXNzZXJ0IHByb3Bvc2FsX2lkIGluIHNlbGYucHJvcG9zYWxzLCAiUHJvcG9zYWwgZG9lc24ndCBleGlzdCIKICAgIGJ5dGVjXzMgLy8gInByb3Bvc2FscyIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGRvZXNuJ3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODMKICAgIC8vIHByb3AgPSBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gbWlsZXN0b25lID0gcHJvcC5taWxlc3RvbmVzW3Byb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlXS5jb3B5KCkKICAgIGR1cAogICAgcHVzaGludCA3NCAvLyA3NAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIGludGNfMyAvLyA1NgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAzCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgc3dhcAogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgNAogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTg2CiAgICAvLyBtaWxlc3RvbmVfdm90ZXMgPSBzZWxmLm1pbGVzdG9uZVZvdGVzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJ5dGVjIDcgLy8gIm1pbGVzdG9uZVZvdGVzXyIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVWb3RlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODcKICAgIC8vIGZvciBhZGRyIGluIG1pbGVzdG9uZV92b3RlczoKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCnZvdGVfbWlsZXN0b25lX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODcKICAgIC8vIGZvciBhZGRyIGluIG1pbGVzdG9uZV92b3RlczoKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgNgogICAgPAogICAgYnogdm90ZV9taWxlc3RvbmVfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyA1CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAzMiAvLyAzMgogICAgKgogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTg4CiAgICAvLyBhc3NlcnQgYWRkci5uYXRpdmUgIT0gVHhuLnNlbmRlciwgIllvdSBoYXZlIGFscmVhZHkgdm90ZWQgZm9yIHRoaXMgbWlsZXN0b25lIgogICAgdHhuIFNlbmRlcgogICAgIT0KICAgIGFzc2VydCAvLyBZb3UgaGF2ZSBhbHJlYWR5IHZvdGVkIGZvciB0aGlzIG1pbGVzdG9uZQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNwogICAgYiB2b3RlX21pbGVzdG9uZV9mb3JfaGVhZGVyQDEKCnZvdGVfbWlsZXN0b25lX2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gYXNzZXJ0IHByb3AuY3JlYXRlZF9ieS5uYXRpdmUgIT0gVHhuLnNlbmRlciwgIkNyZWF0b3IgY2Fubm90IHZvdGUiCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCAxNiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgICE9CiAgICBhc3NlcnQgLy8gQ3JlYXRvciBjYW5ub3Qgdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE5MQogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZS5wcm9vZl9saW5rICE9ICIiLCAiUHJvb2YgaXMgbm90IHN1Ym1pdHRlZCB5ZXQiCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGxlbgogICAgZGlnIDIKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGJ5dGVjXzEgLy8gMHgwMDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFByb29mIGlzIG5vdCBzdWJtaXR0ZWQgeWV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTkzCiAgICAvLyBjdXJyZW50X3RpbWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZS52b3RpbmdfZW5kX3RpbWUubmF0aXZlID4gY3VycmVudF90aW1lLCAiVm90aW5nIHBlcmlvZCBoYXMgZW5kZWQiCiAgICBzd2FwCiAgICBwdXNoaW50IDQ1IC8vIDQ1CiAgICBleHRyYWN0X3VpbnQ2NAogICAgPAogICAgYXNzZXJ0IC8vIFZvdGluZyBwZXJpb2QgaGFzIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTk2CiAgICAvLyBkb25hdG9yX2JveF9rZXkgPSBEb25hdGlvbkJveEtleShwcm9wb3NhbF9pZD1wcm9wb3NhbF9pZCwgZG9ub3I9QWRkcmVzcyhUeG4uc2VuZGVyKSkKICAgIGZyYW1lX2RpZyAtMgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTk3CiAgICAvLyBhc3NlcnQgZG9uYXRvcl9ib3hfa2V5IGluIHNlbGYuZG9uYXRpb25zLCAiWW91IGhhdmUgbm90IGRvbmF0ZWQgdG8gdGhpcyBwcm9wb3NhbCIKICAgIGJ5dGVjIDggLy8gImRvbmF0aW9ucyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBZb3UgaGF2ZSBub3QgZG9uYXRlZCB0byB0aGlzIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTk4CiAgICAvLyBhbW91bnRfZG9uYXRlZCA9IHNlbGYuZG9uYXRpb25zW2RvbmF0b3JfYm94X2tleV0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRvbmF0aW9ucyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxOTkKICAgIC8vIGFzc2VydCBhbW91bnRfZG9uYXRlZCA+PSAxXzAwMF8wMDAsICJTaG91bGQgaGF2ZSBkb25hdGVkIG1vcmUgdGhhbiAxIEFsZ28gdG8gdm90ZSIKICAgIGR1cAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDBmNDI0MAogICAgYj49CiAgICBhc3NlcnQgLy8gU2hvdWxkIGhhdmUgZG9uYXRlZCBtb3JlIHRoYW4gMSBBbGdvIHRvIHZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDEKICAgIC8vIHdlaWdodCA9IG9wLnNxcnQoYW1vdW50X2RvbmF0ZWQubmF0aXZlIC8vIE5hdGl2ZVVJbnQ2NCgxXzAwMF8wMDApKQogICAgYnRvaQogICAgcHVzaGludCAxMDAwMDAwIC8vIDEwMDAwMDAKICAgIC8KICAgIHNxcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDIKICAgIC8vIGlmIHZvdGU6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGVjXzIgLy8gMHgwMAogICAgIT0KICAgIGJ6IHZvdGVfbWlsZXN0b25lX2Vsc2VfYm9keUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjAzCiAgICAvLyBtaWxlc3RvbmUudm90ZXNfZm9yID0gVUludDY0KG1pbGVzdG9uZS52b3Rlc19mb3IubmF0aXZlICsgd2VpZ2h0KQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgcHVzaGludCAxMiAvLyAxMgogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgMTIKICAgIGZyYW1lX2J1cnkgMwoKdm90ZV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gbWlsZXN0b25lLnRvdGFsX3ZvdGVycyA9IFVJbnQ2NChtaWxlc3RvbmUudG90YWxfdm90ZXJzLm5hdGl2ZSArIDEpCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBwdXNoaW50IDI4IC8vIDI4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDI4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjA4CiAgICAvLyBtaWxlc3RvbmVfdm90ZXMuYXBwZW5kKEFkZHJlc3MoVHhuLnNlbmRlcikpCiAgICBmcmFtZV9kaWcgNQogICAgZXh0cmFjdCAyIDAKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDkKICAgIC8vIHNlbGYubWlsZXN0b25lVm90ZXNbcHJvcG9zYWxfaWRdID0gbWlsZXN0b25lX3ZvdGVzLmNvcHkoKQogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjEwCiAgICAvLyBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0ubWlsZXN0b25lc1twcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZV0gPSBtaWxlc3RvbmUuY29weSgpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICBkdXAKICAgIGludGNfMyAvLyA1NgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIGRpZyAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICB1bmNvdmVyIDQKICAgIGZyYW1lX2RpZyAyCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfcmVwbGFjZV9keW5hbWljX2VsZW1lbnQKICAgIHVuY292ZXIgMgogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAogICAgcmV0c3ViCgp2b3RlX21pbGVzdG9uZV9lbHNlX2JvZHlANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDUKICAgIC8vIG1pbGVzdG9uZS52b3Rlc19hZ2FpbnN0ID0gVUludDY0KG1pbGVzdG9uZS52b3Rlc19hZ2FpbnN0Lm5hdGl2ZSArIHdlaWdodCkKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgIGV4dHJhY3RfdWludDY0CiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDIwCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgdm90ZV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUA3CgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuY2xhaW1fbWlsZXN0b25lKHByb3Bvc2FsX2lkOiBieXRlcykgLT4gdm9pZDoKY2xhaW1fbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIxMy0yMTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNsYWltX21pbGVzdG9uZShzZWxmLCBwcm9wb3NhbF9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjE1CiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2Vzbid0IGV4aXN0IgogICAgYnl0ZWNfMyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lc24ndCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gcHJvcCA9IHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gbWlsZXN0b25lID0gcHJvcC5taWxlc3RvbmVzW3Byb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlXS5jb3B5KCkKICAgIGR1cAogICAgcHVzaGludCA3NCAvLyA3NAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxCiAgICBpbnRjXzMgLy8gNTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMgogICAgbGVuCiAgICBkaWcgMwogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIGxlbgogICAgZGlnIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgNQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjE5CiAgICAvLyBjdXJyZW50X3RpbWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIyMAogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZS5wcm9vZl9saW5rICE9ICIiLCAiUHJvb2YgaXMgbm90IHN1Ym1pdHRlZCB5ZXQiCiAgICBkaWcgMQogICAgcHVzaGludCAxMCAvLyAxMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBsZW4KICAgIGRpZyAzCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgIT0KICAgIGFzc2VydCAvLyBQcm9vZiBpcyBub3Qgc3VibWl0dGVkIHlldAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZS5wcm9vZl9zdWJtaXR0ZWRfdGltZS5uYXRpdmUgIT0gMCwgIlByb29mIG5vdCBzdWJtaXR0ZWQgeWV0IgogICAgZGlnIDEKICAgIHB1c2hpbnQgMzcgLy8gMzcKICAgIGV4dHJhY3RfdWludDY0CiAgICBhc3NlcnQgLy8gUHJvb2Ygbm90IHN1Ym1pdHRlZCB5ZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjIKICAgIC8vIGFzc2VydCBjdXJyZW50X3RpbWUgPiBtaWxlc3RvbmUudm90aW5nX2VuZF90aW1lLm5hdGl2ZSwgIlZvdGluZyBwZXJpb2Qgbm90IGVuZGVkIHlldCIKICAgIGRpZyAxCiAgICBwdXNoaW50IDQ1IC8vIDQ1CiAgICBleHRyYWN0X3VpbnQ2NAogICAgPgogICAgYXNzZXJ0IC8vIFZvdGluZyBwZXJpb2Qgbm90IGVuZGVkIHlldAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZS52b3Rlc19mb3IubmF0aXZlID4gbWlsZXN0b25lLnZvdGVzX2FnYWluc3QubmF0aXZlLCAiTWlsZXN0b25lIG5vdCBhcHByb3ZlZCIKICAgIGR1cAogICAgcHVzaGludCAxMiAvLyAxMgogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxCiAgICBwdXNoaW50IDIwIC8vIDIwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgPgogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBub3QgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjQKICAgIC8vIGFzc2VydCBub3QgbWlsZXN0b25lLmNsYWltZWQsICJNaWxlc3RvbmUgYWxyZWFkeSBjbGFpbWVkIgogICAgZHVwCiAgICBpbnRjIDQgLy8gMjg4CiAgICBnZXRiaXQKICAgIGJ5dGVjXzIgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18yIC8vIDB4MDAKICAgID09CiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIGFscmVhZHkgY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gY3JlYXRvciA9IHByb3AuY3JlYXRlZF9ieS5uYXRpdmUKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdCAxNiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjctMjMxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9Y3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudC5uYXRpdmUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjgKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzAKICAgIC8vIGFtb3VudD1taWxlc3RvbmUuYW1vdW50Lm5hdGl2ZQogICAgZGlnIDIKICAgIGludGNfMiAvLyAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjI3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjctMjMxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9Y3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudC5uYXRpdmUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMzCiAgICAvLyBtaWxlc3RvbmUuY2xhaW1lZCA9IEJvb2woVHJ1ZSkKICAgIGludGMgNCAvLyAyODgKICAgIGludGNfMCAvLyAxCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzQKICAgIC8vIHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5taWxlc3RvbmVzW3Byb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlXSA9IG1pbGVzdG9uZS5jb3B5KCkKICAgIGRpZyAzCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICBkdXAKICAgIGludGNfMyAvLyA1NgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIGRpZyAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgNQogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X3JlcGxhY2VfZHluYW1pY19lbGVtZW50CiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDMKICAgIGV4dHJhY3QzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGRpZyAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjM1CiAgICAvLyBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0uY3VycmVudF9taWxlc3RvbmUgPSBVSW50NjQocHJvcC5jdXJyZW50X21pbGVzdG9uZS5uYXRpdmUgKyAxKQogICAgaXRvYgogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2FscyBlbnRyeSBleGlzdHMKICAgIHN3YXAKICAgIHJlcGxhY2UyIDc0CiAgICBkaWcgMQogICAgYm94X2RlbAogICAgcG9wCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5yZWZ1bmRfaWZfaW5hY3RpdmUocHJvcG9zYWxfaWQ6IGJ5dGVzKSAtPiB2b2lkOgpyZWZ1bmRfaWZfaW5hY3RpdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjM4LTIzOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVmdW5kX2lmX2luYWN0aXZlKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjQwCiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2Vzbid0IGV4aXN0IgogICAgYnl0ZWNfMyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lc24ndCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gcHJvcCA9IHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjQyCiAgICAvLyBjdXJyZW50X21pbGVzdG9uZSA9IHByb3AubWlsZXN0b25lc1twcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZV0uY29weSgpCiAgICBkdXAKICAgIHB1c2hpbnQgNzQgLy8gNzQKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgaW50Y18zIC8vIDU2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGxlbgogICAgdW5jb3ZlciAzCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI0MwogICAgLy8gY3VycmVudF90aW1lID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDQKICAgIC8vIHRpbWVfZGlmZmVyZW5jZSA9IGN1cnJlbnRfdGltZSAtIGN1cnJlbnRfbWlsZXN0b25lLnByb29mX3N1Ym1pdHRlZF90aW1lLm5hdGl2ZQogICAgc3dhcAogICAgcHVzaGludCAzNyAvLyAzNwogICAgZXh0cmFjdF91aW50NjQKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDYKICAgIC8vIGRvbmF0b3JfYm94X2tleSA9IERvbmF0aW9uQm94S2V5KHByb3Bvc2FsX2lkPXByb3Bvc2FsX2lkLCBkb25vcj1BZGRyZXNzKFR4bi5zZW5kZXIpKQogICAgZnJhbWVfZGlnIC0xCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDcKICAgIC8vIGFzc2VydCBkb25hdG9yX2JveF9rZXkgaW4gc2VsZi5kb25hdGlvbnMsICJZb3UgaGF2ZSBub3QgZG9uYXRlZCB0byB0aGlzIHByb3Bvc2FsIgogICAgYnl0ZWMgOCAvLyAiZG9uYXRpb25zIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gWW91IGhhdmUgbm90IGRvbmF0ZWQgdG8gdGhpcyBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gYW1vdW50X2RvbmF0ZWQgPSBzZWxmLmRvbmF0aW9uc1tkb25hdG9yX2JveF9rZXldCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kb25hdGlvbnMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjUwCiAgICAvLyBpZiB0aW1lX2RpZmZlcmVuY2UgPiBleHBpcmF0aW9uX3RpbWU6CiAgICBwdXNoaW50IDI0MCAvLyAyNDAKICAgID4KICAgIGJ6IHJlZnVuZF9pZl9pbmFjdGl2ZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNTEKICAgIC8vIHJlbWFpbmluZ19hbW91bnQgPSBwcm9wLmFtb3VudF9yZXF1aXJlZC5uYXRpdmUgLSBwcm9wLmFtb3VudF9yYWlzZWQubmF0aXZlCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIHB1c2hpbnQgNDggLy8gNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLQogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjUyCiAgICAvLyBpZiBhbW91bnRfZG9uYXRlZCA+IDA6CiAgICBmcmFtZV9kaWcgNAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBieiByZWZ1bmRfaWZfaW5hY3RpdmVfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjUzCiAgICAvLyByZWZ1bmRfYW1vdW50ID0gVUludDY0KHJlbWFpbmluZ19hbW91bnQgKiBhbW91bnRfZG9uYXRlZC5uYXRpdmUgLy8gcHJvcC5hbW91bnRfcmFpc2VkLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyA0CiAgICBidG9pCiAgICBmcmFtZV9kaWcgMAogICAgKgogICAgZnJhbWVfZGlnIDEKICAgIC8KICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNTQtMjU4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9cmVmdW5kX2Ftb3VudC5uYXRpdmUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNTUKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNTYKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjU3CiAgICAvLyBhbW91bnQ9cmVmdW5kX2Ftb3VudC5uYXRpdmUKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjU0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNTQtMjU4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9cmVmdW5kX2Ftb3VudC5uYXRpdmUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjU5CiAgICAvLyBzZWxmLmRvbmF0aW9uc1tkb25hdG9yX2JveF9rZXldID0gVUludDY0KDApCiAgICBmcmFtZV9kaWcgMwogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGJveF9wdXQKCnJlZnVuZF9pZl9pbmFjdGl2ZV9hZnRlcl9pZl9lbHNlQDU6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5mdW5kX2Z1dHVyZV9zZWxmKHByaW1hcnk6IGJ5dGVzLCBiYWNrdXA6IGJ5dGVzLCB1bmxvY2tfdGltZTogYnl0ZXMsIHBheW1lbnQ6IHVpbnQ2NCkgLT4gdm9pZDoKZnVuZF9mdXR1cmVfc2VsZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNjItMjcwCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBGdXR1cmUgU2VsZiBNZXRob2RzIC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZnVuZF9mdXR1cmVfc2VsZigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHByaW1hcnk6IEFkZHJlc3MsCiAgICAvLyAgICAgYmFja3VwOiBBZGRyZXNzLAogICAgLy8gICAgIHVubG9ja190aW1lOiBVSW50NjQsCiAgICAvLyAgICAgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBnbyB0byBjb250cmFjdCIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBnbyB0byBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID4gMCwgIk11c3QgZnVuZCB3aXRoIHBvc2l0aXZlIGFtb3VudCIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGFzc2VydCAvLyBNdXN0IGZ1bmQgd2l0aCBwb3NpdGl2ZSBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNzMKICAgIC8vIGFzc2VydCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyLCAiRnVuZGluZyBtdXN0IGJlIGZyb20gY2FsbGVyIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gRnVuZGluZyBtdXN0IGJlIGZyb20gY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc1CiAgICAvLyBpZHggPSBzZWxmLm5vX29mX2Z1dHVyZV9mdW5kcy52YWx1ZQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDUgLy8gIm5vT2ZGdXR1cmVGdW5kcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ub19vZl9mdXR1cmVfZnVuZHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjgwCiAgICAvLyBhbW91bnQ9VUludDY0KHBheW1lbnQuYW1vdW50KSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNzYtMjgyCiAgICAvLyBzZWxmLmZ1dHVyZUZ1bmRzW2lkeF0gPSBGdXR1cmVGdW5kKAogICAgLy8gICAgIHByaW1hcnk9cHJpbWFyeSwKICAgIC8vICAgICBiYWNrdXA9YmFja3VwLAogICAgLy8gICAgIHVubG9ja190aW1lPXVubG9ja190aW1lLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQocGF5bWVudC5hbW91bnQpLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODEKICAgIC8vIGNsYWltZWQ9Qm9vbChGYWxzZSkKICAgIGJ5dGVjXzIgLy8gMHgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI3Ni0yODIKICAgIC8vIHNlbGYuZnV0dXJlRnVuZHNbaWR4XSA9IEZ1dHVyZUZ1bmQoCiAgICAvLyAgICAgcHJpbWFyeT1wcmltYXJ5LAogICAgLy8gICAgIGJhY2t1cD1iYWNrdXAsCiAgICAvLyAgICAgdW5sb2NrX3RpbWU9dW5sb2NrX3RpbWUsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NChwYXltZW50LmFtb3VudCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc2CiAgICAvLyBzZWxmLmZ1dHVyZUZ1bmRzW2lkeF0gPSBGdXR1cmVGdW5kKAogICAgYnl0ZWMgOSAvLyAiZnV0dXJlRnVuZF8iCiAgICBkaWcgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc2LTI4MgogICAgLy8gc2VsZi5mdXR1cmVGdW5kc1tpZHhdID0gRnV0dXJlRnVuZCgKICAgIC8vICAgICBwcmltYXJ5PXByaW1hcnksCiAgICAvLyAgICAgYmFja3VwPWJhY2t1cCwKICAgIC8vICAgICB1bmxvY2tfdGltZT11bmxvY2tfdGltZSwKICAgIC8vICAgICBhbW91bnQ9VUludDY0KHBheW1lbnQuYW1vdW50KSwKICAgIC8vICAgICBjbGFpbWVkPUJvb2woRmFsc2UpCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjgzCiAgICAvLyBzZWxmLm5vX29mX2Z1dHVyZV9mdW5kcy52YWx1ZSA9IFVJbnQ2NChpZHgubmF0aXZlICsgMSkKICAgIGJ0b2kKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBpdG9iCiAgICBieXRlYyA1IC8vICJub09mRnV0dXJlRnVuZHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuY2xhaW1fZnV0dXJlX3NlbGYoZnVuZF9pZDogYnl0ZXMpIC0+IHZvaWQ6CmNsYWltX2Z1dHVyZV9zZWxmOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI4Ni0yODcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNsYWltX2Z1dHVyZV9zZWxmKHNlbGYsIGZ1bmRfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gYXNzZXJ0IGZ1bmRfaWQgaW4gc2VsZi5mdXR1cmVGdW5kcywgIkZ1bmQgZG9lcyBub3QgZXhpc3QiCiAgICBieXRlYyA5IC8vICJmdXR1cmVGdW5kXyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEZ1bmQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODkKICAgIC8vIGZ1bmQgPSBzZWxmLmZ1dHVyZUZ1bmRzW2Z1bmRfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1dHVyZUZ1bmRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gYXNzZXJ0IG5vdCBmdW5kLmNsYWltZWQsICJBbHJlYWR5IGNsYWltZWQiCiAgICBkdXAKICAgIHB1c2hpbnQgNjQwIC8vIDY0MAogICAgZ2V0Yml0CiAgICBieXRlY18yIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMiAvLyAweDAwCiAgICA9PQogICAgYXNzZXJ0IC8vIEFscmVhZHkgY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5MgogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID49IGZ1bmQudW5sb2NrX3RpbWUubmF0aXZlLCAiVG9vIGVhcmx5IHRvIGNsYWltIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZGlnIDEKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICA+PQogICAgYXNzZXJ0IC8vIFRvbyBlYXJseSB0byBjbGFpbQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gZnVuZC5wcmltYXJ5IG9yIFR4bi5zZW5kZXIgPT0gZnVuZC5iYWNrdXAsICJOb3QgYXV0aG9yaXplZCIKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBibnogY2xhaW1fZnV0dXJlX3NlbGZfYm9vbF90cnVlQDIKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJ6IGNsYWltX2Z1dHVyZV9zZWxmX2Jvb2xfZmFsc2VAMwoKY2xhaW1fZnV0dXJlX3NlbGZfYm9vbF90cnVlQDI6CiAgICBpbnRjXzAgLy8gMQoKY2xhaW1fZnV0dXJlX3NlbGZfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gZnVuZC5wcmltYXJ5IG9yIFR4bi5zZW5kZXIgPT0gZnVuZC5iYWNrdXAsICJOb3QgYXV0aG9yaXplZCIKICAgIGFzc2VydCAvLyBOb3QgYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5NS0yOTkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1mdW5kLmFtb3VudC5uYXRpdmUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyOTYKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyOTcKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjk4CiAgICAvLyBhbW91bnQ9ZnVuZC5hbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjk1CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyOTUtMjk5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9ZnVuZC5hbW91bnQubmF0aXZlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gZnVuZC5jbGFpbWVkID0gQm9vbChUcnVlKQogICAgcHVzaGludCA2NDAgLy8gNjQwCiAgICBpbnRjXzAgLy8gMQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzAyCiAgICAvLyBzZWxmLmZ1dHVyZUZ1bmRzW2Z1bmRfaWRdID0gZnVuZC5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmNsYWltX2Z1dHVyZV9zZWxmX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCiAgICBiIGNsYWltX2Z1dHVyZV9zZWxmX2Jvb2xfbWVyZ2VANAo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1174], "errorMessage": "All milestones already completed"}, {"pc": [2137], "errorMessage": "Already claimed"}, {"pc": [823], "errorMessage": "Amount required must be greater than 0"}, {"pc": [830], "errorMessage": "At least one milestone is required"}, {"pc": [1485], "errorMessage": "Creator cannot vote"}, {"pc": [2118], "errorMessage": "Fund does not exist"}, {"pc": [2069], "errorMessage": "Funding must be from caller"}, {"pc": [1014], "errorMessage": "Goal already reached"}, {"pc": [1143], "errorMessage": "Goal not reached yet"}, {"pc": [714, 743, 1006, 1010, 1126, 1134, 1139, 1214, 1411, 1465, 1479, 1715, 1793, 1934, 2147, 2158], "errorMessage": "Index access is out of bounds"}, {"pc": [834], "errorMessage": "Maximum of 5 milestones allowed"}, {"pc": [1790], "errorMessage": "Milestone already claimed"}, {"pc": [1778], "errorMessage": "Milestone not approved"}, {"pc": [2061], "errorMessage": "Must fund with positive amount"}, {"pc": [650], "errorMessage": "Must pay exactly 2 Algos to create a proposal"}, {"pc": [2168], "errorMessage": "Not authorized"}, {"pc": [192, 207, 238, 253, 268, 286, 304, 329], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1132], "errorMessage": "Only creator can submit proof"}, {"pc": [666], "errorMessage": "Payment must be from the proposal creator"}, {"pc": [658, 1034], "errorMessage": "Payment must be sent to the contract address"}, {"pc": [2055], "errorMessage": "Payment must go to contract"}, {"pc": [1502, 1754], "errorMessage": "Proof is not submitted yet"}, {"pc": [1760], "errorMessage": "Proof not submitted yet"}, {"pc": [855], "errorMessage": "Proposal description cannot be empty"}, {"pc": [998, 1118, 1367, 1672, 1888], "errorMessage": "Proposal doesn't exist"}, {"pc": [841], "errorMessage": "Proposal name cannot be empty"}, {"pc": [848], "errorMessage": "Proposal title cannot be empty"}, {"pc": [1539], "errorMessage": "Should have donated more than 1 Algo to vote"}, {"pc": [2146], "errorMessage": "Too early to claim"}, {"pc": [818], "errorMessage": "Total milestone amount must equal the required amount"}, {"pc": [1510], "errorMessage": "Voting period has ended"}, {"pc": [1767], "errorMessage": "Voting period not ended yet"}, {"pc": [1469], "errorMessage": "You have already voted for this milestone"}, {"pc": [1524, 1973], "errorMessage": "You have not donated to this proposal"}, {"pc": [374], "errorMessage": "can only call when creating"}, {"pc": [195, 210, 241, 256, 271, 289, 307, 332], "errorMessage": "can only call when not creating"}, {"pc": [1094, 1526, 1978], "errorMessage": "check self.donations entry exists"}, {"pc": [2124], "errorMessage": "check self.futureFunds entry exists"}, {"pc": [1438], "errorMessage": "check self.milestoneVotes entry exists"}, {"pc": [2074], "errorMessage": "check self.no_of_future_funds exists"}, {"pc": [671, 976], "errorMessage": "check self.no_of_proposals exists"}, {"pc": [1004, 1124, 1373, 1609, 1675, 1823, 1864, 1894], "errorMessage": "check self.proposals entry exists"}, {"pc": [229, 320, 360], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}, {"type": "string", "name": "title"}, {"type": "string", "name": "description"}, {"type": "string", "name": "category"}, {"type": "uint64", "name": "amount_required"}, {"type": "(string,uint64)[]", "name": "milestones"}, {"type": "pay", "name": "payment"}], "name": "create_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(string,string,string,string,uint64,(string,uint64)[])[]", "name": "proposals"}, {"type": "pay", "name": "payment"}], "name": "create_proposals", "returns": {"type": "void"}, "desc": "Creates several proposals with consecutive IDs, paid for together.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "pay", "name": "payment"}], "name": "donate_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "string", "name": "proof_link"}], "name": "submit_proof", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "bool", "name": "vote"}], "name": "vote_milestone", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "milestone_index"}, {"type": "(address,bool,byte[64])[]", "name": "votes"}], "name": "vote_milestone_batch", "returns": {"type": "void"}, "desc": "Tallies votes donors signed off-chain, sent in by anyone. Voters must be in\nstrictly increasing address order; the fees of the inner calls raising the opcode budget for the signature checks are taken from the group's surplus.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "claim_milestone", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "refund_if_inactive", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "voter"}], "name": "get_current_milestone", "returns": {"type": "(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)", "struct": "CurrentMilestone"}, "desc": "The proposal's current milestone, whether `voter` has voted on it and their vote weight.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "category"}, {"type": "uint64", "name": "status"}, {"type": "uint64", "name": "cursor"}, {"type": "uint64", "name": "limit"}], "name": "list_proposals", "returns": {"type": "(uint64[],uint64,bool)", "struct": "ProposalIdPage"}, "desc": "IDs of the proposals from `cursor` on in `category` (any if empty) with `status`\n(any if 0), at most `limit` of them. Pass `next_cursor` back in until `done`. Categories are matched by the hash of their exact text.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "primary"}, {"type": "address", "name": "backup"}, {"type": "uint64", "name": "unlock_time"}, {"type": "pay", "name": "payment"}], "name": "fund_future_self", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "fund_id"}], "name": "claim_future_self", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "begin_import", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(byte[],uint64,uint64,byte[])[]", "name": "chunks"}], "name": "import_boxes", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "no_of_proposals"}, {"type": "uint64", "name": "no_of_future_funds"}], "name": "end_import", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "ProposalContract", "state": {"keys": {"box": {}, "global": {"no_of_proposals": {"key": "bm9PZlByb3Bvc2Fscw==", "keyType": "AVMString", "valueType": "uint64"}, "no_of_future_funds": {"key": "bm9PZkZ1dHVyZUZ1bmRz", "keyType": "AVMString", "valueType": "uint64"}, "import_stage": {"key": "aW1wb3J0U3RhZ2U=", "keyType": "AVMString", "valueType": "uint64"}}, "local": {}}, "maps": {"box": {"proposals": {"keyType": "uint64", "valueType": "Proposal", "prefix": "cHJvcG9zYWxz"}, "milestoneVotes": {"keyType": "uint64", "valueType": "address[]", "prefix": "bWlsZXN0b25lVm90ZXNf"}, "donations": {"keyType": "DonationBoxKey", "valueType": "uint64", "prefix": "ZG9uYXRpb25z"}, "eligibleWeight": {"keyType": "uint64", "valueType": "uint64", "prefix": "ZWxpZ2libGVXZWlnaHRf"}, "futureFunds": {"keyType": "uint64", "valueType": "FutureFund", "prefix": "ZnV0dXJlRnVuZF8="}, "statusIndex": {"keyType": "IdSetPageKey", "valueType": "AVMBytes", "prefix": "c3RhdHVzSW5kZXhf"}, "categoryIndex": {"keyType": "IdSetPageKey", "valueType": "AVMBytes", "prefix": "Y2F0ZWdvcnlJbmRleF8="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 3, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CurrentMilestone": [{"name": "index", "type": "uint64"}, {"name": "milestone", "type": "Milestone"}, {"name": "has_voted", "type": "bool"}, {"name": "vote_weight", "type": "uint64"}], "DonationBoxKey": [{"name": "proposal_id", "type": "uint64"}, {"name": "donor", "type": "address"}], "FutureFund": [{"name": "primary", "type": "address"}, {"name": "backup", "type": "address"}, {"name": "unlock_time", "type": "uint64"}, {"name": "amount", "type": "uint64"}, {"name": "claimed", "type": "bool"}], "IdSetPageKey": [{"name": "index", "type": "uint64"}, {"name": "page", "type": "uint64"}], "Milestone": [{"name": "name", "type": "string"}, {"name": "amount", "type": "uint64"}, {"name": "proof_link", "type": "string"}, {"name": "votes_for", "type": "uint64"}, {"name": "votes_against", "type": "uint64"}, {"name": "total_voters", "type": "uint64"}, {"name": "claimed", "type": "bool"}, {"name": "proof_submitted_time", "type": "uint64"}, {"name": "voting_end_time", "type": "uint64"}], "Proposal": [{"name": "name", "type": "string"}, {"name": "title", "type": "string"}, {"name": "description", "type": "string"}, {"name": "category", "type": "string"}, {"name": "amount_required", "type": "uint64"}, {"name": "created_by", "type": "address"}, {"name": "amount_raised", "type": "uint64"}, {"name": "milestones", "type": "(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64)[]"}, {"name": "no_of_donations", "type": "uint64"}, {"name": "no_of_unique_donors", "type": "uint64"}, {"name": "current_milestone", "type": "uint64"}, {"name": "created_at", "type": "uint64"}], "ProposalIdPage": [{"name": "ids", "type": "uint64[]"}, {"name": "next_cursor", "type": "uint64"}, {"name": "done", "type": "bool"}]}, "byteCode": {"approval": "CiAJAAECIIAQwIQ9gAKgAoCJeiYTCAAAAAAAAAAAC2ltcG9ydFN0YWdlCAAAAAAAAAABAgAAAQAMc3RhdHVzSW5kZXhfDW5vT2ZQcm9wb3NhbHMJcHJvcG9zYWxzD25vT2ZGdXR1cmVGdW5kcw9taWxlc3RvbmVWb3Rlc18JZG9uYXRpb25zAgACD2VsaWdpYmxlV2VpZ2h0XwgAAAAAAA9CQAQVH3x1AwaBAQ5jYXRlZ29yeUluZGV4XwIACwtmdXR1cmVGdW5kXzEYQAALJwYoZycIKGcpKGcxG0EBsoIPBGpQHlgE3fhzygSHZ1XQBFVvgsMEjFB/GATt2A/7BCeU2WME5kBZ0QSX+VFiBCJfLfkE6RKCJgQmaVZ3BGi5kNUEj3GY3ATG4nlPNhoAjg8BGgEBAOgA1gDEAK8AoACRAHoAXQA+AC8AIwAUAAIiQzEZFEQxGEQ2GgE2GgKIEMcjQzEZFEQxGEQ2GgGIED4jQzEZFEQxGESIEAcjQzEZFEQxGEQ2GgGID4cjQzEZFEQxGEQ2GgE2GgI2GgMxFiMJSTgQIxJEiA8kI0MxGRREMRhENhoBNhoCNhoDNhoEiAz7Jw5MULAjQzEZFEQxGEQ2GgE2GgKIC/8nDkxQsCNDMRkURDEYRDYaAYgLCCNDMRkURDEYRDYaAYgJ2yNDMRkURDEYRDYaATYaAjYaA4gHyCNDMRkURDEYRDYaATYaAogGWyNDMRkURDEYRDYaATYaAogFRSNDMRkURDEYRDYaATEWIwlJOBAjEkSIBDojQzEZFEQxGEQ2GgExFiMJSTgQIxJEiAHrI0MxGRREMRhENhoBNhoCNhoDNhoENhoFNhoGMRYjCUk4ECMSRIgBgSNDMRlA/rkxGBREI0OKAgCL/oEKCIsAMgwNQQAqsYEGshCBBbIZJw+yHicPsh+L/40CAAsABLNC/9syALIBQv/1IrIBQv/viYoEAYAASYv+JAuL/CQLIosEiwMMQQAci/2LBElOAlmLAggWVwYCiwFMUIwBJAiMBEL/3Iv9FYwAIowEiwSLAgxBAByL/4sESU4CWYsACBZXBgKLAUxQjAEkCIwEQv/ci/yL/ggWVwYCiwFQi/2LA4sAUlCL/xWL/4sCTwJSUIwAiYoDAYv9UQACSReL/VcCAIv/JAtLAUxZi/8jCCQLSU4ESwJMWUsCFUsEi/8JIwlLAU8DTwJNSUsDCU4Fi/4VTgVLAyJPBFKL/lBPA08CTwNSUEwkC4sBiwUMQQAgiwRJiwFJTgNZiwMIiwIJFlcGAksCTF2MBCQIjAFC/9iLAIsEUIwAiYoDAIv9vUUBQAAMi/9AAAGJi/0hBrlIi/4hBBhJgQgKi/1LASO6TwKBCBiL/1SL/U4Cu4mKBwCL/zgIIQgSRIv/OAcyChJEi/84ADEAEkQiKWVEKqlEIicGZURJi/mL+ov7i/yL/Yv+iADYjP4XIwgWJwZMZ4mKAgCL/iJZRwJEi/84CEsBIQgLEkSL/zgHMgoSRIv/OAAxABJEIillRCqpRIGkDQsiiP4WIicGZUQXIosCiwAMQQB/i/5XAgCLAklOAiQLSwFMWUsCIwiLAEsBCUsDFUsCJAtLBUxZTwJNTwNPA08CUosBTwMIFksBIllLAiRZSwNPAksCUksDgQRZSwRPA0sCUksEgQZZSwVPA0sCUksFgRBZSwZPA0sCUksGVwgISwcVTwhPBE8CUogAEUiMAkL/eYsBiwAIFicGTGeJigcBKyKL/yJZIosDiwIMQQB+i/9XAgCLA0lOAiQLSwFMWU8CIwhJjAOLAksBCUsDFU8CJAtLBExZTwJNUkkiWUsBFUsCTgJSSwFXAghLARWBNQiAAgA1TwJQTBZXBgJQKFAoUChQJwRQKFAoUExQK1AnC0xQiwBJIllMVwIAI08DiP00jAAkW4sBCIwBQv96iwEWi/6oRIv+KKVEiwBJIllJRIEFDkSL+lcCABVEi/tXAgAVRIv8VwIAFUQxADIHFov6FYFaCEkWVwYCgAIAWkxQi/sVTwIISRZXBgJPAkxQi/wVTwIISRZXBgJPAkxQi/0VTwIITIv+UE8DUChQTBZXBgJQKFAoUChQTFCL+lCL+1CL/FCL/VBMUCcHi/lQSbxITL8nCYv5UEm8SCu/JwyL+VAov4v9VwIAASJbi/kXTBZLASEEChZMSwFQJxBMUEsCI4j9ZiMWTFAnBUxQTCOI/VmL/4wAiYoCACJJgAAiKWVEKqlEJweL/lBHAr1FAUS+TElPAkRJVzAITFcICKREi/84CIv/OABJi/5MUIv/OAcyChJEIkwnCkxQSb1FAUAAmIsESYFCWyMIFlxCjASLBRa/iwRXECCLBhNBACyLB4sFCIwCJwyL/lBJjAG+TIwAQQAWiwAXiwIhBQqSCIsHIQUKkgkWiwFMv4sESYE6WyMIFlw6SYEwW4sFCBZcMIsDSbxISwG/SVcwCExXCAinQQAmi/4XIxZLASEEChZMSwFQJwVMUEsCIoj8fyQWTFAnBUxQTCOI/HKJSb5EF0mMB4sFCBa/Qv9qigIAgAAiKWVEKqlEJweL/lBHAr1FAUS+TElPAkRJVxAgMQASRElXMAhLAVcICKdESYFKW0lPAkmBOFlJTgJOA0kVTE4CUklOAiJZSU4CDEQyBysiiwmLBgxBAI2LBVcCAIsJSU4CJAtLAUxZSwIjCEmMAIsGSwEJSwMVTwIkC0sETFlPAk1STIsDEkEAQ0mBClkiTFiL/1CLB0lOAhZcJUyBtAEIFlwtIQciVChcDChcFChcHCcLTFCLCEkiWUxXAgAjTwOI+pWMCIsAjAlC/4MnC0xQiwhJIllMVwIAI08DiPp5jAhC/+GLAiKLBFiLCFCLAUm8SEy/JwmL/lBJvEgrv4mKAgAigAAiKWVEKqlEJweL/lBHAr1FAUS+TElPAkRJgUpbSU8CSYE4WUsBFVJJVwIASwIkC0sBTFlPAiJZTwMjCExLAQlLAxVPAiQLSwRMWU8CTVInCYv+UEm+TElPAkQiWSKLCYsIDEEAGYsHVwIAiwlJTgIlCyVYMQATRCMIjAlC/9+LA1cQIDEAE0SLBUmBCllLARVLAk4CUisTRDIHSYwBTIEtWwxEi/4xAFAnCkxQSb1FAUS+REknDadEFyEFCpKL/ycEE0EAf4sFSYEMW08CCBZcDIwFiwVJgRxbIwgWXBxJjAVJgQxbSwGBFFuL/k4CiAa9TIwAQQAKiwEWiwVMXC2MAIsAiwdXAgAxAFBJFSUKFlcGAkxQiwZJvEhMv4sCSb5ESYE4WUsBFUsCSwJPAlJPBIsEiPmeTwIiTwNYTFBLAbxIv4mLBUmBFFtPAggWXBSMBUL/fooDACJHAoAAIillRCqpRCcHi/1QRwK9RQFEvkxJTwJESVdKCIv+qERJgUpbSU8CSYE4WUsBFVJJVwIASwIkC0sBTFlPAiJZTwMjCExLAQlLAxVPAiQLSwRMWU8CTVJHAoEKWUsBFUsCTgJSKxNESYEtWzIHDUSL/yJZSU4CSUQnCYv9UElOA75MSU4CTgREIllJTgOBGAuBtBAIC4G8BQgiiPgfMggWgAZmZnZvdGVMUIv9UIv+UEsBVyUIUExJgQxbTIEUWyuAACKLEYsIDEEAr4v/VwIAixGBYQuBYVhJjAFXACBJjAKLEKVEIowDiwOLCwxBABmLClcCAIsDSU4CJQslWIsCE0QjCIwDQv/fiwVXECCLAklOAhNEiwFJIQZTJwQiTwJUiwxLAVBPAlchQEsDhESL/U8CUCcKTFC+REknDadEFyEFCpJMJwQTQQAniw0IjA2LD1cCAIsCSU4CUEkVJQoWVwYCTFCMD4sRIwiMEYwQQv9Riw4IjA5C/9aLDUkWiwdMXAyLDklOAhZcFEmBHFuLCAgWXBxJjAeL/U8DTwOIBLFMjABBAAoyBxaLB0xcLYwAiwCLClcCAIsPVwIAUEkVJQoWVwYCTFCLCUm8SEy/iwRJvkRJgThZSwEVSwJLAk8CUk8EiwaI949PAiJPA1hMUEsBvEi/iYoBACIpZUQqqUQnB4v/UEm9RQFESb5ESYFKW0sBgThZSwIVSwNOAlJJVwIASwIkC0sBTFlPAiJZSwMjCEoJSwQVSwIkC0sGTFlPAk1PBE8ETwJSMgdLAYEKWUsCFUsDTgJSKxNESwGBJVtESwGBLVsPREmBDFtLAYEUWw1ESSEHUycEIk8CVCcEEkRPBFcQILEyCksCJFuyCLIAsgcjshAisgGzIQcjVEsEvkRJgThZSwEVSwJLAk8CUk8DTwaI9sBPAiJPA1hMUEsDvEhLA0y/SRZLA75ETFxKSwO8SE8DTL8SQQA3i/8XJBZLASEEChZMSwFQJwVMUEsCIoj3BoEEFksBUCcFTFBLAiKI9vaBAxZMUCcFTFBMI4j26ImKAQCAAEkiKWVEKqlEJweL/1BJvUUBRL5MSU8CREmBSltLAYE4WUsCFU8DTgJSSVcCAEsCJAtLAUxZTwIiWU8DIwhMSwEJSwMVTwIkC0sETFlPAk1SMgdMgSVbSU4CCYv/MQBQJwpMUElOAkm9RQFEvkxOAkSB8AENQQBmiwNBACeL/xckFksBIQQKFkxLAVAnBUxQSwIiiPZNgQQWTFAnBUxQTCOI9j+LAkmBCFtMgTBbSYwBCYwAiwUopUEAI4sFF4sAC4sBChaxMgoxAE8CF7IIsgeyACOyECKyAbOLBCi/iYoCASKAAEknB4v+UEm9RQFEvkxJTwJESVdKCExJgUpbSwGBOFlLAhVPA04CUkkiWUsCSwEMRExXAgBLAiQLSwFMWU8DIwhPA0sBCUsDFU8CJAtLBExZTwJNUiInCYv+UL5MSU8CRCJZIosJiwgMQQAdiwdXAgCLCSULJViL/xJBAAMjjAaLCSMIjAlC/9siSYwBi/6L/1AnCkxQvkyMAEyMAkEAJIsAJw2niwGMAkEAGIsDVxAgi/8TiwGMAkEACYsAFyEFCpKMAosCJwQiiwZUTBaLBIACABNQTwJQTFCLBVCMAImKBAEigABHCYv/F0mBQA5EIicGZUQXSStMi/4XSU8CD0EAEIsMFicRTFCAAYBQK1CMAImL/FcCAEkVIg1JTgKMAQEiW0mMAosOSU4CIQQKSYwEi/0XSYwHTwRPA08CTwOIAWNJTgKMAEkhBBiBQApJjAmBCAtPAkxbTIFAGIH///////////8BTJEajAiBQIwKiw0iWYsLDEEAYYsIQACDiwojCYwKiwkjCEmMCSUSiwSMBUEACYsEIwgijAmMBYsFSYwEIQQLiwmBQAsIjA6LCkEAKIsOiwwPQAAgiwlAAA2LAYsCiweLBIgA2owAiwmBCAuLAExbjAhC/5WLDosMDUEABIsMjA6LDkkWTIsMEicEIk8CVCcRTwJQTFCLDVCMAImLCJNJjAOLBCEEC4sJgUALCIFACEwJSYwGiwwPQQAHiwyMDkL/s4sNVwIAiwZJTgIWUEkVgQgKFlcGAkxQjA0jCIwOiwMjCSNMkIsIG4wIQv8cigMBgABHAicMi/1QvkAABCKMAImL/ov/CEmMAIsDF0mMAgxBACWLAosACYwBi/6L/w1BAAuL/ov/CYsBDYwAiYv/i/4JiwEPjACJIowBQv/cigQBIQavSa5Ji/5BABaL/haL/xZQJwVMUL6LAE4CTYsBrIwCiwJJjAGMAov8QQAWi/0Wi/8WUCcQTFC+iwBOAk2LAayMAosCjACJigQAi/84BzIKEkSL/zgISUSL/zgAMQASRCIpZUQqqUQiJwhlREwWi/yL/VCL/lBMUCcEUCcSSwJQTL8XIwgWJwhMZ4mKAQAiKWVEKqlEJxKL/1BHAr1FAUS+TElPAkRJgYAFUycEIk8CVCcEEkQyB0sBgUBbD0RXACAxABJAAAuLAVcgIDEAEkEAJiNEsTIKMQCLAUlOA4FIW7IIsgeyACOyECKyAbOBgAUjVIsATL+JIkL/1zEAMgkSRCIpZUQoqEQiJwZlRCioQQAQIicIZUQoqEEABiNEKSpniSJC//eKAQAxADIJEkQiKWVEKqhEi/8iWSKLAYsADEEAXIv/VwIAiwFJTgIkC0sBTFlPAiMISYwBiwBLAQlLAxVPAiQLSwRMWU8CTVJJIllLAYESWUsCTwJLAlJXAgBLAiRbSwFMuUhLAoEKW0sDFU8ETwRPAlJXAgC7Qv+ciYoCADEAMgkSRCIpZUQqqEQnBov+ZycIi/9nKYAIAAAAAAAAAAJniQ==", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiAzMiAyMDQ4IDEwMDAwMDAgMjU2IDI4OCAyMDAwMDAwCiAgICBieXRlY2Jsb2NrIDB4MDAwMDAwMDAwMDAwMDAwMCAiaW1wb3J0U3RhZ2UiIDB4MDAwMDAwMDAwMDAwMDAwMSAweDAwMDAgMHgwMCAic3RhdHVzSW5kZXhfIiAibm9PZlByb3Bvc2FscyIgInByb3Bvc2FscyIgIm5vT2ZGdXR1cmVGdW5kcyIgIm1pbGVzdG9uZVZvdGVzXyIgImRvbmF0aW9ucyIgMHgwMDAyICJlbGlnaWJsZVdlaWdodF8iIDB4MDAwMDAwMDAwMDBmNDI0MCAweDE1MWY3Yzc1IDB4MDY4MTAxICJjYXRlZ29yeUluZGV4XyIgMHgwMDBiICJmdXR1cmVGdW5kXyIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDQtMTQ1CiAgICAvLyAjIENyb3dkZnVuZGluZyBzdGF0ZQogICAgLy8gc2VsZi5ub19vZl9wcm9wb3NhbHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0ibm9PZlByb3Bvc2FscyIpCiAgICBieXRlYyA2IC8vICJub09mUHJvcG9zYWxzIgogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTU0LTE1NQogICAgLy8gIyBGdXR1cmUgc2VsZiBzdGF0ZQogICAgLy8gc2VsZi5ub19vZl9mdXR1cmVfZnVuZHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCksIGtleT0ibm9PZkZ1dHVyZUZ1bmRzIikKICAgIGJ5dGVjIDggLy8gIm5vT2ZGdXR1cmVGdW5kcyIKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE2Mi0xNjMKICAgIC8vICMgU3RhdGUgaW1wb3J0IGZvciBtaWdyYXRpb25zCiAgICAvLyBzZWxmLmltcG9ydF9zdGFnZSA9IEdsb2JhbFN0YXRlKFVJbnQ2NChpbXBvcnRfbmV2ZXIpLCBrZXk9ImltcG9ydFN0YWdlIikKICAgIGJ5dGVjXzEgLy8gImltcG9ydFN0YWdlIgogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AyMAogICAgcHVzaGJ5dGVzcyAweDZhNTAxZTU4IDB4ZGRmODczY2EgMHg4NzY3NTVkMCAweDU1NmY4MmMzIDB4OGM1MDdmMTggMHhlZGQ4MGZmYiAweDI3OTRkOTYzIDB4ZTY0MDU5ZDEgMHg5N2Y5NTE2MiAweDIyNWYyZGY5IDB4ZTkxMjgyMjYgMHgyNjY5NTY3NyAweDY4Yjk5MGQ1IDB4OGY3MTk4ZGMgMHhjNmUyNzk0ZiAvLyBtZXRob2QgImNyZWF0ZV9wcm9wb3NhbChzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0LChzdHJpbmcsdWludDY0KVtdLHBheSl2b2lkIiwgbWV0aG9kICJjcmVhdGVfcHJvcG9zYWxzKChzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0LChzdHJpbmcsdWludDY0KVtdKVtdLHBheSl2b2lkIiwgbWV0aG9kICJkb25hdGVfcHJvcG9zYWwodWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJzdWJtaXRfcHJvb2YodWludDY0LHN0cmluZyl2b2lkIiwgbWV0aG9kICJ2b3RlX21pbGVzdG9uZSh1aW50NjQsYm9vbCl2b2lkIiwgbWV0aG9kICJ2b3RlX21pbGVzdG9uZV9iYXRjaCh1aW50NjQsdWludDY0LChhZGRyZXNzLGJvb2wsYnl0ZVs2NF0pW10pdm9pZCIsIG1ldGhvZCAiY2xhaW1fbWlsZXN0b25lKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWZ1bmRfaWZfaW5hY3RpdmUodWludDY0KXZvaWQiLCBtZXRob2QgImdldF9jdXJyZW50X21pbGVzdG9uZSh1aW50NjQsYWRkcmVzcykodWludDY0LChzdHJpbmcsdWludDY0LHN0cmluZyx1aW50NjQsdWludDY0LHVpbnQ2NCxib29sLHVpbnQ2NCx1aW50NjQpLGJvb2wsdWludDY0KSIsIG1ldGhvZCAibGlzdF9wcm9wb3NhbHMoc3RyaW5nLHVpbnQ2NCx1aW50NjQsdWludDY0KSh1aW50NjRbXSx1aW50NjQsYm9vbCkiLCBtZXRob2QgImZ1bmRfZnV0dXJlX3NlbGYoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAiY2xhaW1fZnV0dXJlX3NlbGYodWludDY0KXZvaWQiLCBtZXRob2QgImJlZ2luX2ltcG9ydCgpdm9pZCIsIG1ldGhvZCAiaW1wb3J0X2JveGVzKChieXRlW10sdWludDY0LHVpbnQ2NCxieXRlW10pW10pdm9pZCIsIG1ldGhvZCAiZW5kX2ltcG9ydCh1aW50NjQsdWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUA1IG1haW5fY3JlYXRlX3Byb3Bvc2Fsc19yb3V0ZUA2IG1haW5fZG9uYXRlX3Byb3Bvc2FsX3JvdXRlQDcgbWFpbl9zdWJtaXRfcHJvb2Zfcm91dGVAOCBtYWluX3ZvdGVfbWlsZXN0b25lX3JvdXRlQDkgbWFpbl92b3RlX21pbGVzdG9uZV9iYXRjaF9yb3V0ZUAxMCBtYWluX2NsYWltX21pbGVzdG9uZV9yb3V0ZUAxMSBtYWluX3JlZnVuZF9pZl9pbmFjdGl2ZV9yb3V0ZUAxMiBtYWluX2dldF9jdXJyZW50X21pbGVzdG9uZV9yb3V0ZUAxMyBtYWluX2xpc3RfcHJvcG9zYWxzX3JvdXRlQDE0IG1haW5fZnVuZF9mdXR1cmVfc2VsZl9yb3V0ZUAxNSBtYWluX2NsYWltX2Z1dHVyZV9zZWxmX3JvdXRlQDE2IG1haW5fYmVnaW5faW1wb3J0X3JvdXRlQDE3IG1haW5faW1wb3J0X2JveGVzX3JvdXRlQDE4IG1haW5fZW5kX2ltcG9ydF9yb3V0ZUAxOQoKbWFpbl9hZnRlcl9pZl9lbHNlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0MS0xNDIKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgUHJvcG9zYWxDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9lbmRfaW1wb3J0X3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY4MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2ODAKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBlbmRfaW1wb3J0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2ltcG9ydF9ib3hlc19yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjcxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaW1wb3J0X2JveGVzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JlZ2luX2ltcG9ydF9yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NjMtNjY0CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBNaWdyYXRpb24gTWV0aG9kcyAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGJlZ2luX2ltcG9ydAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV9mdXR1cmVfc2VsZl9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NDIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY2xhaW1fZnV0dXJlX3NlbGYKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZnVuZF9mdXR1cmVfc2VsZl9yb3V0ZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MTctNjE4CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBGdXR1cmUgU2VsZiBNZXRob2RzIC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYxNy02MTgKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIEZ1dHVyZSBTZWxmIE1ldGhvZHMgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZnVuZF9mdXR1cmVfc2VsZgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9saXN0X3Byb3Bvc2Fsc19yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MTYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0MS0xNDIKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgUHJvcG9zYWxDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUxNgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBsaXN0X3Byb3Bvc2FscwogICAgYnl0ZWMgMTQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2N1cnJlbnRfbWlsZXN0b25lX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDg4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9jdXJyZW50X21pbGVzdG9uZQogICAgYnl0ZWMgMTQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVmdW5kX2lmX2luYWN0aXZlX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ1OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWZ1bmRfaWZfaW5hY3RpdmUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xhaW1fbWlsZXN0b25lX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQyNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGFpbV9taWxlc3RvbmUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fdm90ZV9taWxlc3RvbmVfYmF0Y2hfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzcyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0MS0xNDIKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgUHJvcG9zYWxDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM3MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHZvdGVfbWlsZXN0b25lX2JhdGNoCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3ZvdGVfbWlsZXN0b25lX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzM1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0MS0xNDIKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgUHJvcG9zYWxDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMzNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHZvdGVfbWlsZXN0b25lCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3N1Ym1pdF9wcm9vZl9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMwNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMDUKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzdWJtaXRfcHJvb2YKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZG9uYXRlX3Byb3Bvc2FsX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE0MS0xNDIKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgUHJvcG9zYWxDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZG9uYXRlX3Byb3Bvc2FsCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9wcm9wb3NhbHNfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfcHJvcG9zYWxzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE2Ni0xNjcKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENyb3dkZnVuZGluZyBNZXRob2RzIC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFByb3Bvc2FsQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE2Ni0xNjcKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENyb3dkZnVuZGluZyBNZXRob2RzIC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9wcm9wb3NhbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBQcm9wb3NhbENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIyCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi51dGlsLmVuc3VyZV9idWRnZXQocmVxdWlyZWRfYnVkZ2V0OiB1aW50NjQsIGZlZV9zb3VyY2U6IHVpbnQ2NCkgLT4gdm9pZDoKZW5zdXJlX2J1ZGdldDoKICAgIHByb3RvIDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICArCgplbnN1cmVfYnVkZ2V0X3doaWxlX3RvcEAxOgogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IGVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANwogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDE1IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgMTUgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0CgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANjoKICAgIGl0eG5fc3VibWl0CiAgICBiIGVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDEKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0OgogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDYKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzOgogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBiIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA2CgplbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDc6CiAgICByZXRzdWIKCgovLyBfcHV5YV9saWIuYXJjNC5keW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnQoYXJyYXlfaXRlbXNfY291bnQ6IHVpbnQ2NCwgYXJyYXlfaGVhZF9hbmRfdGFpbDogYnl0ZXMsIG5ld19pdGVtc19jb3VudDogdWludDY0LCBuZXdfaGVhZF9hbmRfdGFpbDogYnl0ZXMpIC0+IGJ5dGVzOgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnQ6CiAgICBwcm90byA0IDEKICAgIHB1c2hieXRlcyAiIgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBpbnRjXzAgLy8gMAoKZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJAMToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckAxCgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDQ6CiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZnJhbWVfYnVyeSAwCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA0CgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckA1OgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDgKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDUKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JAODoKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDAKICAgIHN1YnN0cmluZzMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfcmVwbGFjZV9keW5hbWljX2VsZW1lbnQoc291cmNlOiBieXRlcywgbmV3X2l0ZW06IGJ5dGVzLCBpbmRleDogdWludDY0KSAtPiBieXRlczoKZHluYW1pY19hcnJheV9yZXBsYWNlX2R5bmFtaWNfZWxlbWVudDoKICAgIHByb3RvIDMgMQogICAgZnJhbWVfZGlnIC0zCiAgICBzdWJzdHJpbmcgMCAyCiAgICBkdXAKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGR1cAogICAgY292ZXIgNAogICAgZGlnIDIKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMgogICAgbGVuCiAgICBkaWcgNAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZGlnIDEKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZGlnIDMKICAgIC0KICAgIGNvdmVyIDUKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBjb3ZlciA1CiAgICBkaWcgMwogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgNAogICAgc3Vic3RyaW5nMwogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIHN1YnN0cmluZzMKICAgIGNvbmNhdAogICAgc3dhcAogICAgaW50Y18yIC8vIDIKICAgICoKCmR5bmFtaWNfYXJyYXlfcmVwbGFjZV9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckAyOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyA1CiAgICA8CiAgICBieiBkeW5hbWljX2FycmF5X3JlcGxhY2VfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA1CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIGZyYW1lX2RpZyAyCiAgICAtCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZGlnIDIKICAgIHN3YXAKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDQKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZHluYW1pY19hcnJheV9yZXBsYWNlX2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDIKCmR5bmFtaWNfYXJyYXlfcmVwbGFjZV9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDU6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDQKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3Quc2V0X2lkX3NldF9iaXQoYm94X2tleTogYnl0ZXMsIHByb3Bvc2FsX2lkOiB1aW50NjQsIG1lbWJlcjogdWludDY0KSAtPiB2b2lkOgpzZXRfaWRfc2V0X2JpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMjgtMTI5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHNldF9pZF9zZXRfYml0KGJveF9rZXk6IEJ5dGVzLCBwcm9wb3NhbF9pZDogTmF0aXZlVUludDY0LCBtZW1iZXI6IGJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMzEKICAgIC8vIF9sZW5ndGgsIGV4aXN0cyA9IG9wLkJveC5sZW5ndGgoYm94X2tleSkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTMyCiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IHNldF9pZF9zZXRfYml0X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gaWYgbm90IG1lbWJlcjoKICAgIGZyYW1lX2RpZyAtMQogICAgYm56IHNldF9pZF9zZXRfYml0X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjEzNAogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCnNldF9pZF9zZXRfYml0X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMzUKICAgIC8vIF9jcmVhdGVkID0gb3AuQm94LmNyZWF0ZShib3hfa2V5LCBpbmRleF9wYWdlX2J5dGVzKQogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjIDYgLy8gMjU2CiAgICBib3hfY3JlYXRlCiAgICBwb3AKCnNldF9pZF9zZXRfYml0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMzYKICAgIC8vIGJpdCA9IHByb3Bvc2FsX2lkICUgaW5kZXhfcGFnZV9iaXRzCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNCAvLyAyMDQ4CiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTM3CiAgICAvLyBieXRlID0gb3AuQm94LmV4dHJhY3QoYm94X2tleSwgYml0IC8vIDgsIDEpCiAgICBkdXAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAvCiAgICBmcmFtZV9kaWcgLTMKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMzgKICAgIC8vIG9wLkJveC5yZXBsYWNlKGJveF9rZXksIGJpdCAvLyA4LCBvcC5zZXRiaXRfYnl0ZXMoYnl0ZSwgYml0ICUgOCwgTmF0aXZlVUludDY0KDEpIGlmIG1lbWJlciBlbHNlIE5hdGl2ZVVJbnQ2NCgwKSkpCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAlCiAgICBmcmFtZV9kaWcgLTEKICAgIHNldGJpdAogICAgZnJhbWVfZGlnIC0zCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuY3JlYXRlX3Byb3Bvc2FsKG5hbWU6IGJ5dGVzLCB0aXRsZTogYnl0ZXMsIGRlc2NyaXB0aW9uOiBieXRlcywgY2F0ZWdvcnk6IGJ5dGVzLCBhbW91bnRfcmVxdWlyZWQ6IGJ5dGVzLCBtaWxlc3RvbmVzOiBieXRlcywgcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpjcmVhdGVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTY2LTE3NwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ3Jvd2RmdW5kaW5nIE1ldGhvZHMgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfcHJvcG9zYWwoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBuYW1lOiBTdHJpbmcsCiAgICAvLyAgICAgdGl0bGU6IFN0cmluZywKICAgIC8vICAgICBkZXNjcmlwdGlvbjogU3RyaW5nLAogICAgLy8gICAgIGNhdGVnb3J5OiBTdHJpbmcsCiAgICAvLyAgICAgYW1vdW50X3JlcXVpcmVkOiBVSW50NjQsCiAgICAvLyAgICAgbWlsZXN0b25lczogRHluYW1pY0FycmF5W01pbGVzdG9uZUlucHV0XSwKICAgIC8vICAgICBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTc4CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gcHJvcG9zYWxfZGVwb3NpdCwgIk11c3QgcGF5IGV4YWN0bHkgMiBBbGdvcyB0byBjcmVhdGUgYSBwcm9wb3NhbCIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjIDggLy8gMjAwMDAwMAogICAgPT0KICAgIGFzc2VydCAvLyBNdXN0IHBheSBleGFjdGx5IDIgQWxnb3MgdG8gY3JlYXRlIGEgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxNzkKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJQYXltZW50IG11c3QgYmUgc2VudCB0byB0aGUgY29udHJhY3QgYWRkcmVzcyIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSBzZW50IHRvIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTgwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIlBheW1lbnQgbXVzdCBiZSBmcm9tIHRoZSBwcm9wb3NhbCBjcmVhdG9yIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIGZyb20gdGhlIHByb3Bvc2FsIGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODEKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTgzCiAgICAvLyBpZHggPSBzZWxmLm5vX29mX3Byb3Bvc2Fscy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gIm5vT2ZQcm9wb3NhbHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubm9fb2ZfcHJvcG9zYWxzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gc2VsZi5fYWRkX3Byb3Bvc2FsKGlkeCwgbmFtZSwgdGl0bGUsIGRlc2NyaXB0aW9uLCBjYXRlZ29yeSwgYW1vdW50X3JlcXVpcmVkLCBtaWxlc3RvbmVzKQogICAgZHVwCiAgICBmcmFtZV9kaWcgLTcKICAgIGZyYW1lX2RpZyAtNgogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIF9hZGRfcHJvcG9zYWwKICAgIGZyYW1lX2J1cnkgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxODUKICAgIC8vIHNlbGYubm9fb2ZfcHJvcG9zYWxzLnZhbHVlID0gVUludDY0KGlkeC5uYXRpdmUgKyAxKQogICAgYnRvaQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gIm5vT2ZQcm9wb3NhbHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuY3JlYXRlX3Byb3Bvc2Fscyhwcm9wb3NhbHM6IGJ5dGVzLCBwYXltZW50OiB1aW50NjQpIC0+IHZvaWQ6CmNyZWF0ZV9wcm9wb3NhbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTg4LTE4OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX3Byb3Bvc2FscyhzZWxmLCBwcm9wb3NhbHM6IER5bmFtaWNBcnJheVtQcm9wb3NhbElucHV0XSwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxOTEKICAgIC8vIGFzc2VydCBwcm9wb3NhbHMubGVuZ3RoID4gMCwgIkF0IGxlYXN0IG9uZSBwcm9wb3NhbCBpcyByZXF1aXJlZCIKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIGFzc2VydCAvLyBBdCBsZWFzdCBvbmUgcHJvcG9zYWwgaXMgcmVxdWlyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxOTIKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBwcm9wb3NhbHMubGVuZ3RoICogcHJvcG9zYWxfZGVwb3NpdCwgIk11c3QgcGF5IGV4YWN0bHkgMiBBbGdvcyBwZXIgcHJvcG9zYWwiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDEKICAgIGludGMgOCAvLyAyMDAwMDAwCiAgICAqCiAgICA9PQogICAgYXNzZXJ0IC8vIE11c3QgcGF5IGV4YWN0bHkgMiBBbGdvcyBwZXIgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxOTMKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJQYXltZW50IG11c3QgYmUgc2VudCB0byB0aGUgY29udHJhY3QgYWRkcmVzcyIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSBzZW50IHRvIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTk0CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIlBheW1lbnQgbXVzdCBiZSBmcm9tIHRoZSBwcm9wb3NhbCBjcmVhdG9yIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIGZyb20gdGhlIHByb3Bvc2FsIGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxOTUKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTk3CiAgICAvLyBlbnN1cmVfYnVkZ2V0KHByb3Bvc2Fscy5sZW5ndGggKiBjcmVhdGVfYnVkZ2V0LCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgcHVzaGludCAxNzAwIC8vIDE3MDAKICAgICoKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxOTgKICAgIC8vIGZpcnN0ID0gc2VsZi5ub19vZl9wcm9wb3NhbHMudmFsdWUubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAibm9PZlByb3Bvc2FscyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ub19vZl9wcm9wb3NhbHMgZXhpc3RzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTk5CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHByb3Bvc2Fscy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmNyZWF0ZV9wcm9wb3NhbHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShwcm9wb3NhbHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogY3JlYXRlX3Byb3Bvc2Fsc19hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gcHJvcG9zYWwgPSBwcm9wb3NhbHNbaW5kZXhdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9kaWcgMAogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgbGVuCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyA1CiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDIKICAgIC8vIFVJbnQ2NChmaXJzdCArIGluZGV4KSwKICAgIGZyYW1lX2RpZyAxCiAgICB1bmNvdmVyIDMKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDMKICAgIC8vIHByb3Bvc2FsLm5hbWUsCiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMwogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gcHJvcG9zYWwudGl0bGUsCiAgICBkaWcgMwogICAgcHVzaGludCA0IC8vIDQKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgNAogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIwNQogICAgLy8gcHJvcG9zYWwuZGVzY3JpcHRpb24sCiAgICBkaWcgNAogICAgcHVzaGludCA2IC8vIDYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgNQogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIwNgogICAgLy8gcHJvcG9zYWwuY2F0ZWdvcnksCiAgICBkaWcgNQogICAgcHVzaGludCAxNiAvLyAxNgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyA2CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjA3CiAgICAvLyBwcm9wb3NhbC5hbW91bnRfcmVxdWlyZWQsCiAgICBkaWcgNgogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjA4CiAgICAvLyBwcm9wb3NhbC5taWxlc3RvbmVzLmNvcHkoKSwKICAgIGRpZyA3CiAgICBsZW4KICAgIHVuY292ZXIgOAogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMDEtMjA5CiAgICAvLyBzZWxmLl9hZGRfcHJvcG9zYWwoCiAgICAvLyAgICAgVUludDY0KGZpcnN0ICsgaW5kZXgpLAogICAgLy8gICAgIHByb3Bvc2FsLm5hbWUsCiAgICAvLyAgICAgcHJvcG9zYWwudGl0bGUsCiAgICAvLyAgICAgcHJvcG9zYWwuZGVzY3JpcHRpb24sCiAgICAvLyAgICAgcHJvcG9zYWwuY2F0ZWdvcnksCiAgICAvLyAgICAgcHJvcG9zYWwuYW1vdW50X3JlcXVpcmVkLAogICAgLy8gICAgIHByb3Bvc2FsLm1pbGVzdG9uZXMuY29weSgpLAogICAgLy8gKQogICAgY2FsbHN1YiBfYWRkX3Byb3Bvc2FsCiAgICBwb3AKICAgIGZyYW1lX2J1cnkgMgogICAgYiBjcmVhdGVfcHJvcG9zYWxzX2Zvcl9oZWFkZXJAMQoKY3JlYXRlX3Byb3Bvc2Fsc19hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMTAKICAgIC8vIHNlbGYubm9fb2ZfcHJvcG9zYWxzLnZhbHVlID0gVUludDY0KGZpcnN0ICsgcHJvcG9zYWxzLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgKwogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAibm9PZlByb3Bvc2FscyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5fYWRkX3Byb3Bvc2FsKGlkeDogYnl0ZXMsIG5hbWU6IGJ5dGVzLCB0aXRsZTogYnl0ZXMsIGRlc2NyaXB0aW9uOiBieXRlcywgY2F0ZWdvcnk6IGJ5dGVzLCBhbW91bnRfcmVxdWlyZWQ6IGJ5dGVzLCBtaWxlc3RvbmVzOiBieXRlcykgLT4gYnl0ZXM6Cl9hZGRfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjEzLTIyMwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYWRkX3Byb3Bvc2FsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgaWR4OiBVSW50NjQsCiAgICAvLyAgICAgbmFtZTogU3RyaW5nLAogICAgLy8gICAgIHRpdGxlOiBTdHJpbmcsCiAgICAvLyAgICAgZGVzY3JpcHRpb246IFN0cmluZywKICAgIC8vICAgICBjYXRlZ29yeTogU3RyaW5nLAogICAgLy8gICAgIGFtb3VudF9yZXF1aXJlZDogVUludDY0LAogICAgLy8gICAgIG1pbGVzdG9uZXM6IER5bmFtaWNBcnJheVtNaWxlc3RvbmVJbnB1dF0sCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjUKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMgPSBEeW5hbWljQXJyYXlbTWlsZXN0b25lXSgpCiAgICBieXRlY18zIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gbWlsZXN0b25lc190b3RhbCA9IE5hdGl2ZVVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjgKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UobWlsZXN0b25lcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCgpfYWRkX3Byb3Bvc2FsX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMjgKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UobWlsZXN0b25lcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBfYWRkX3Byb3Bvc2FsX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjI5CiAgICAvLyBtaWxlc3RvbmUgPSBtaWxlc3RvbmVzW2luZGV4XS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBmcmFtZV9kaWcgMgogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgNAogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMxCiAgICAvLyBuYW1lPW1pbGVzdG9uZS5uYW1lLAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIGRpZyAyCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMyCiAgICAvLyBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIGRpZyAxCiAgICBleHRyYWN0IDIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzAtMjQwCiAgICAvLyBmaW5hbF9taWxlc3RvbmVzLmFwcGVuZChNaWxlc3RvbmUoCiAgICAvLyAgICAgbmFtZT1taWxlc3RvbmUubmFtZSwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIC8vICAgICBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICAvLyAgICAgdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIC8vICAgICB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICAvLyAgICAgcHJvb2Zfc3VibWl0dGVkX3RpbWU9VUludDY0KDApLAogICAgLy8gICAgIHZvdGluZ19lbmRfdGltZT1VSW50NjQoMCkKICAgIC8vICkpCiAgICBkaWcgMQogICAgbGVuCiAgICBwdXNoaW50IDUzIC8vIDUzCiAgICArCiAgICBwdXNoYnl0ZXMgMHgwMDM1CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMwLTI0MAogICAgLy8gZmluYWxfbWlsZXN0b25lcy5hcHBlbmQoTWlsZXN0b25lKAogICAgLy8gICAgIG5hbWU9bWlsZXN0b25lLm5hbWUsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQsCiAgICAvLyAgICAgcHJvb2ZfbGluaz1TdHJpbmcoIiIpLAogICAgLy8gICAgIHZvdGVzX2Zvcj1VSW50NjQoMCksCiAgICAvLyAgICAgdm90ZXNfYWdhaW5zdD1VSW50NjQoMCksCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbGFpbWVkPUJvb2woRmFsc2UpLAogICAgLy8gICAgIHByb29mX3N1Ym1pdHRlZF90aW1lPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3RpbmdfZW5kX3RpbWU9VUludDY0KDApCiAgICAvLyApKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjM1CiAgICAvLyB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMwLTI0MAogICAgLy8gZmluYWxfbWlsZXN0b25lcy5hcHBlbmQoTWlsZXN0b25lKAogICAgLy8gICAgIG5hbWU9bWlsZXN0b25lLm5hbWUsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQsCiAgICAvLyAgICAgcHJvb2ZfbGluaz1TdHJpbmcoIiIpLAogICAgLy8gICAgIHZvdGVzX2Zvcj1VSW50NjQoMCksCiAgICAvLyAgICAgdm90ZXNfYWdhaW5zdD1VSW50NjQoMCksCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbGFpbWVkPUJvb2woRmFsc2UpLAogICAgLy8gICAgIHByb29mX3N1Ym1pdHRlZF90aW1lPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3RpbmdfZW5kX3RpbWU9VUludDY0KDApCiAgICAvLyApKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjM2CiAgICAvLyB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzAtMjQwCiAgICAvLyBmaW5hbF9taWxlc3RvbmVzLmFwcGVuZChNaWxlc3RvbmUoCiAgICAvLyAgICAgbmFtZT1taWxlc3RvbmUubmFtZSwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIC8vICAgICBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICAvLyAgICAgdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIC8vICAgICB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICAvLyAgICAgcHJvb2Zfc3VibWl0dGVkX3RpbWU9VUludDY0KDApLAogICAgLy8gICAgIHZvdGluZ19lbmRfdGltZT1VSW50NjQoMCkKICAgIC8vICkpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzcKICAgIC8vIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICBieXRlYyA0IC8vIDB4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzAtMjQwCiAgICAvLyBmaW5hbF9taWxlc3RvbmVzLmFwcGVuZChNaWxlc3RvbmUoCiAgICAvLyAgICAgbmFtZT1taWxlc3RvbmUubmFtZSwKICAgIC8vICAgICBhbW91bnQ9bWlsZXN0b25lLmFtb3VudCwKICAgIC8vICAgICBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICAvLyAgICAgdm90ZXNfZm9yPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3Rlc19hZ2FpbnN0PVVJbnQ2NCgwKSwKICAgIC8vICAgICB0b3RhbF92b3RlcnM9VUludDY0KDApLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSksCiAgICAvLyAgICAgcHJvb2Zfc3VibWl0dGVkX3RpbWU9VUludDY0KDApLAogICAgLy8gICAgIHZvdGluZ19lbmRfdGltZT1VSW50NjQoMCkKICAgIC8vICkpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyMzgKICAgIC8vIHByb29mX3N1Ym1pdHRlZF90aW1lPVVJbnQ2NCgwKSwKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMwLTI0MAogICAgLy8gZmluYWxfbWlsZXN0b25lcy5hcHBlbmQoTWlsZXN0b25lKAogICAgLy8gICAgIG5hbWU9bWlsZXN0b25lLm5hbWUsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQsCiAgICAvLyAgICAgcHJvb2ZfbGluaz1TdHJpbmcoIiIpLAogICAgLy8gICAgIHZvdGVzX2Zvcj1VSW50NjQoMCksCiAgICAvLyAgICAgdm90ZXNfYWdhaW5zdD1VSW50NjQoMCksCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbGFpbWVkPUJvb2woRmFsc2UpLAogICAgLy8gICAgIHByb29mX3N1Ym1pdHRlZF90aW1lPVVJbnQ2NCgwKSwKICAgIC8vICAgICB2b3RpbmdfZW5kX3RpbWU9VUludDY0KDApCiAgICAvLyApKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjM5CiAgICAvLyB2b3RpbmdfZW5kX3RpbWU9VUludDY0KDApCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIzMC0yNDAKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMuYXBwZW5kKE1pbGVzdG9uZSgKICAgIC8vICAgICBuYW1lPW1pbGVzdG9uZS5uYW1lLAogICAgLy8gICAgIGFtb3VudD1taWxlc3RvbmUuYW1vdW50LAogICAgLy8gICAgIHByb29mX2xpbms9U3RyaW5nKCIiKSwKICAgIC8vICAgICB2b3Rlc19mb3I9VUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2FnYWluc3Q9VUludDY0KDApLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1VSW50NjQoMCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKSwKICAgIC8vICAgICBwcm9vZl9zdWJtaXR0ZWRfdGltZT1VSW50NjQoMCksCiAgICAvLyAgICAgdm90aW5nX2VuZF90aW1lPVVJbnQ2NCgwKQogICAgLy8gKSkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjMzCiAgICAvLyBwcm9vZl9saW5rPVN0cmluZygiIiksCiAgICBieXRlY18zIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjIzMC0yNDAKICAgIC8vIGZpbmFsX21pbGVzdG9uZXMuYXBwZW5kKE1pbGVzdG9uZSgKICAgIC8vICAgICBuYW1lPW1pbGVzdG9uZS5uYW1lLAogICAgLy8gICAgIGFtb3VudD1taWxlc3RvbmUuYW1vdW50LAogICAgLy8gICAgIHByb29mX2xpbms9U3RyaW5nKCIiKSwKICAgIC8vICAgICB2b3Rlc19mb3I9VUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2FnYWluc3Q9VUludDY0KDApLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1VSW50NjQoMCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKSwKICAgIC8vICAgICBwcm9vZl9zdWJtaXR0ZWRfdGltZT1VSW50NjQoMCksCiAgICAvLyAgICAgdm90aW5nX2VuZF90aW1lPVVJbnQ2NCgwKQogICAgLy8gKSkKICAgIGNvbmNhdAogICAgYnl0ZWMgMTEgLy8gMHgwMDAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGludGNfMSAvLyAxCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDEKICAgIC8vIG1pbGVzdG9uZXNfdG90YWwgPSBtaWxlc3RvbmVzX3RvdGFsICsgbWlsZXN0b25lLmFtb3VudC5uYXRpdmUKICAgIGludGNfMiAvLyAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBfYWRkX3Byb3Bvc2FsX2Zvcl9oZWFkZXJAMQoKX2FkZF9wcm9wb3NhbF9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDMKICAgIC8vIGFzc2VydCBhbW91bnRfcmVxdWlyZWQgPT0gbWlsZXN0b25lc190b3RhbCwgIlRvdGFsIG1pbGVzdG9uZSBhbW91bnQgbXVzdCBlcXVhbCB0aGUgcmVxdWlyZWQgYW1vdW50IgogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgYj09CiAgICBhc3NlcnQgLy8gVG90YWwgbWlsZXN0b25lIGFtb3VudCBtdXN0IGVxdWFsIHRoZSByZXF1aXJlZCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDQKICAgIC8vIGFzc2VydCBhbW91bnRfcmVxdWlyZWQgPiAwLCAiQW1vdW50IHJlcXVpcmVkIG11c3QgYmUgZ3JlYXRlciB0aGFuIDAiCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYXNzZXJ0IC8vIEFtb3VudCByZXF1aXJlZCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjQ1CiAgICAvLyBhc3NlcnQgZmluYWxfbWlsZXN0b25lcy5sZW5ndGggPiAwLCAiQXQgbGVhc3Qgb25lIG1pbGVzdG9uZSBpcyByZXF1aXJlZCIKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBhc3NlcnQgLy8gQXQgbGVhc3Qgb25lIG1pbGVzdG9uZSBpcyByZXF1aXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI0NgogICAgLy8gYXNzZXJ0IGZpbmFsX21pbGVzdG9uZXMubGVuZ3RoIDw9IDUsICJNYXhpbXVtIG9mIDUgbWlsZXN0b25lcyBhbGxvd2VkIgogICAgcHVzaGludCA1IC8vIDUKICAgIDw9CiAgICBhc3NlcnQgLy8gTWF4aW11bSBvZiA1IG1pbGVzdG9uZXMgYWxsb3dlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gYXNzZXJ0IG5hbWUubmF0aXZlLmJ5dGVzLmxlbmd0aCA+IDAsICJQcm9wb3NhbCBuYW1lIGNhbm5vdCBiZSBlbXB0eSIKICAgIGZyYW1lX2RpZyAtNgogICAgZXh0cmFjdCAyIDAKICAgIGxlbgogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIG5hbWUgY2Fubm90IGJlIGVtcHR5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjQ4CiAgICAvLyBhc3NlcnQgdGl0bGUubmF0aXZlLmJ5dGVzLmxlbmd0aCA+IDAsICJQcm9wb3NhbCB0aXRsZSBjYW5ub3QgYmUgZW1wdHkiCiAgICBmcmFtZV9kaWcgLTUKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIGFzc2VydCAvLyBQcm9wb3NhbCB0aXRsZSBjYW5ub3QgYmUgZW1wdHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNDkKICAgIC8vIGFzc2VydCBkZXNjcmlwdGlvbi5uYXRpdmUuYnl0ZXMubGVuZ3RoID4gMCwgIlByb3Bvc2FsIGRlc2NyaXB0aW9uIGNhbm5vdCBiZSBlbXB0eSIKICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAyIDAKICAgIGxlbgogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGRlc2NyaXB0aW9uIGNhbm5vdCBiZSBlbXB0eQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gY3JlYXRlZF9ieT1BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI2MwogICAgLy8gY3JlYXRlZF9hdD1VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjUxLTI2NAogICAgLy8gbmV3X3Byb3Bvc2FsID0gUHJvcG9zYWwoCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPWRlc2NyaXB0aW9uLAogICAgLy8gICAgIGNhdGVnb3J5PWNhdGVnb3J5LAogICAgLy8gICAgIGFtb3VudF9yZXF1aXJlZD1hbW91bnRfcmVxdWlyZWQsCiAgICAvLyAgICAgY3JlYXRlZF9ieT1BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudF9yYWlzZWQ9VUludDY0KDApLAogICAgLy8gICAgIG5vX29mX2RvbmF0aW9ucz1VSW50NjQoMCksCiAgICAvLyAgICAgbm9fb2ZfdW5pcXVlX2Rvbm9ycz1VSW50NjQoMCksCiAgICAvLyAgICAgbWlsZXN0b25lcz1maW5hbF9taWxlc3RvbmVzLmNvcHkoKSwKICAgIC8vICAgICBjdXJyZW50X21pbGVzdG9uZT1VSW50NjQoMCksCiAgICAvLyAgICAgY3JlYXRlZF9hdD1VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTYKICAgIGxlbgogICAgcHVzaGludCA5MCAvLyA5MAogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDA1YQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTUKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gYW1vdW50X3JhaXNlZD1VSW50NjQoMCksCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI1MS0yNjQKICAgIC8vIG5ld19wcm9wb3NhbCA9IFByb3Bvc2FsKAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1kZXNjcmlwdGlvbiwKICAgIC8vICAgICBjYXRlZ29yeT1jYXRlZ29yeSwKICAgIC8vICAgICBhbW91bnRfcmVxdWlyZWQ9YW1vdW50X3JlcXVpcmVkLAogICAgLy8gICAgIGNyZWF0ZWRfYnk9QWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnRfcmFpc2VkPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl9kb25hdGlvbnM9VUludDY0KDApLAogICAgLy8gICAgIG5vX29mX3VuaXF1ZV9kb25vcnM9VUludDY0KDApLAogICAgLy8gICAgIG1pbGVzdG9uZXM9ZmluYWxfbWlsZXN0b25lcy5jb3B5KCksCiAgICAvLyAgICAgY3VycmVudF9taWxlc3RvbmU9VUludDY0KDApLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9VUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKQogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjU5CiAgICAvLyBub19vZl9kb25hdGlvbnM9VUludDY0KDApLAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNTEtMjY0CiAgICAvLyBuZXdfcHJvcG9zYWwgPSBQcm9wb3NhbCgKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgZGVzY3JpcHRpb249ZGVzY3JpcHRpb24sCiAgICAvLyAgICAgY2F0ZWdvcnk9Y2F0ZWdvcnksCiAgICAvLyAgICAgYW1vdW50X3JlcXVpcmVkPWFtb3VudF9yZXF1aXJlZCwKICAgIC8vICAgICBjcmVhdGVkX2J5PUFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50X3JhaXNlZD1VSW50NjQoMCksCiAgICAvLyAgICAgbm9fb2ZfZG9uYXRpb25zPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl91bmlxdWVfZG9ub3JzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBtaWxlc3RvbmVzPWZpbmFsX21pbGVzdG9uZXMuY29weSgpLAogICAgLy8gICAgIGN1cnJlbnRfbWlsZXN0b25lPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PVVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI2MAogICAgLy8gbm9fb2ZfdW5pcXVlX2Rvbm9ycz1VSW50NjQoMCksCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI1MS0yNjQKICAgIC8vIG5ld19wcm9wb3NhbCA9IFByb3Bvc2FsKAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1kZXNjcmlwdGlvbiwKICAgIC8vICAgICBjYXRlZ29yeT1jYXRlZ29yeSwKICAgIC8vICAgICBhbW91bnRfcmVxdWlyZWQ9YW1vdW50X3JlcXVpcmVkLAogICAgLy8gICAgIGNyZWF0ZWRfYnk9QWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnRfcmFpc2VkPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl9kb25hdGlvbnM9VUludDY0KDApLAogICAgLy8gICAgIG5vX29mX3VuaXF1ZV9kb25vcnM9VUludDY0KDApLAogICAgLy8gICAgIG1pbGVzdG9uZXM9ZmluYWxfbWlsZXN0b25lcy5jb3B5KCksCiAgICAvLyAgICAgY3VycmVudF9taWxlc3RvbmU9VUludDY0KDApLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9VUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjYyCiAgICAvLyBjdXJyZW50X21pbGVzdG9uZT1VSW50NjQoMCksCiAgICBieXRlY18wIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI1MS0yNjQKICAgIC8vIG5ld19wcm9wb3NhbCA9IFByb3Bvc2FsKAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1kZXNjcmlwdGlvbiwKICAgIC8vICAgICBjYXRlZ29yeT1jYXRlZ29yeSwKICAgIC8vICAgICBhbW91bnRfcmVxdWlyZWQ9YW1vdW50X3JlcXVpcmVkLAogICAgLy8gICAgIGNyZWF0ZWRfYnk9QWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnRfcmFpc2VkPVVJbnQ2NCgwKSwKICAgIC8vICAgICBub19vZl9kb25hdGlvbnM9VUludDY0KDApLAogICAgLy8gICAgIG5vX29mX3VuaXF1ZV9kb25vcnM9VUludDY0KDApLAogICAgLy8gICAgIG1pbGVzdG9uZXM9ZmluYWxfbWlsZXN0b25lcy5jb3B5KCksCiAgICAvLyAgICAgY3VycmVudF9taWxlc3RvbmU9VUludDY0KDApLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9VUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKQogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTUKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNjYKICAgIC8vIHNlbGYucHJvcG9zYWxzW2lkeF0gPSBuZXdfcHJvcG9zYWwuY29weSgpCiAgICBieXRlYyA3IC8vICJwcm9wb3NhbHMiCiAgICBmcmFtZV9kaWcgLTcKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNjcKICAgIC8vIHNlbGYubWlsZXN0b25lVm90ZXNbaWR4XSA9IER5bmFtaWNBcnJheVtBZGRyZXNzXSgpCiAgICBieXRlYyA5IC8vICJtaWxlc3RvbmVWb3Rlc18iCiAgICBmcmFtZV9kaWcgLTcKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjXzMgLy8gMHgwMDAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjY4CiAgICAvLyBzZWxmLmVsaWdpYmxlV2VpZ2h0W2lkeF0gPSBVSW50NjQoMCkKICAgIGJ5dGVjIDEyIC8vICJlbGlnaWJsZVdlaWdodF8iCiAgICBmcmFtZV9kaWcgLTcKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToxMjUKICAgIC8vIHJldHVybiBvcC5leHRyYWN0X3VpbnQ2NChvcC5zaGEyNTYoY2F0ZWdvcnkubmF0aXZlLmJ5dGVzKSwgMCkKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDAKICAgIHNoYTI1NgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjcwCiAgICAvLyBzZXRfaWRfc2V0X2JpdChzZWxmLmNhdGVnb3J5SW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KGNhdGVnb3J5X2hhc2goY2F0ZWdvcnkpLCBpZHgubmF0aXZlKSwgaWR4Lm5hdGl2ZSwgVHJ1ZSkKICAgIGZyYW1lX2RpZyAtNwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU5NgogICAgLy8gcmV0dXJuIElkU2V0UGFnZUtleShpbmRleD1VSW50NjQoaW5kZXgpLCBwYWdlPVVJbnQ2NChwcm9wb3NhbF9pZCAvLyBpbmRleF9wYWdlX2JpdHMpKS5ieXRlcwogICAgc3dhcAogICAgaXRvYgogICAgZGlnIDEKICAgIGludGMgNCAvLyAyMDQ4CiAgICAvCiAgICBpdG9iCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjcwCiAgICAvLyBzZXRfaWRfc2V0X2JpdChzZWxmLmNhdGVnb3J5SW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KGNhdGVnb3J5X2hhc2goY2F0ZWdvcnkpLCBpZHgubmF0aXZlKSwgaWR4Lm5hdGl2ZSwgVHJ1ZSkKICAgIGJ5dGVjIDE2IC8vICJjYXRlZ29yeUluZGV4XyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIHNldF9pZF9zZXRfYml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjcxCiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKGlkeC5uYXRpdmUsIE5hdGl2ZVVJbnQ2NChzdGF0dXNfZnVuZHJhaXNpbmcpLCBUcnVlKQogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1OTYKICAgIC8vIHJldHVybiBJZFNldFBhZ2VLZXkoaW5kZXg9VUludDY0KGluZGV4KSwgcGFnZT1VSW50NjQocHJvcG9zYWxfaWQgLy8gaW5kZXhfcGFnZV9iaXRzKSkuYnl0ZXMKICAgIGl0b2IKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBieXRlYyA1IC8vICJzdGF0dXNJbmRleF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNzEKICAgIC8vIHNlbGYuX3NldF9zdGF0dXMoaWR4Lm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19mdW5kcmFpc2luZyksIFRydWUpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBjYWxsc3ViIHNldF9pZF9zZXRfYml0CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuZG9uYXRlX3Byb3Bvc2FsKHByb3Bvc2FsX2lkOiBieXRlcywgcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpkb25hdGVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc0LTI3NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZG9uYXRlX3Byb3Bvc2FsKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyNzYKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc3CiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2Vzbid0IGV4aXN0IgogICAgYnl0ZWMgNyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lc24ndCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gcHJvcCA9IHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjc5CiAgICAvLyBhc3NlcnQgcHJvcC5hbW91bnRfcmFpc2VkIDwgcHJvcC5hbW91bnRfcmVxdWlyZWQsICJHb2FsIGFscmVhZHkgcmVhY2hlZCIKICAgIGR1cAogICAgZXh0cmFjdCA0OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBiPAogICAgYXNzZXJ0IC8vIEdvYWwgYWxyZWFkeSByZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjgxCiAgICAvLyBhbW91bnQgPSBwYXltZW50LmFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODIKICAgIC8vIGRvbm9yID0gcGF5bWVudC5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODMKICAgIC8vIGRvbmF0aW9uX2JveF9rZXkgPSBEb25hdGlvbkJveEtleShwcm9wb3NhbF9pZD1wcm9wb3NhbF9pZCwgZG9ub3I9QWRkcmVzcyhkb25vcikpCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSBzZW50IHRvIHRoZSBjb250cmFjdCBhZGRyZXNzIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIHNlbnQgdG8gdGhlIGNvbnRyYWN0IGFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODYKICAgIC8vIHByZXZpb3VzX2Ftb3VudCA9IE5hdGl2ZVVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODcKICAgIC8vIGlmIGRvbmF0aW9uX2JveF9rZXkgbm90IGluIHNlbGYuZG9uYXRpb25zOgogICAgYnl0ZWMgMTAgLy8gImRvbmF0aW9ucyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBkb25hdGVfcHJvcG9zYWxfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyODgKICAgIC8vIHByb3Aubm9fb2ZfdW5pcXVlX2Rvbm9ycyA9IFVJbnQ2NChwcm9wLm5vX29mX3VuaXF1ZV9kb25vcnMubmF0aXZlICsgMSkKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIHB1c2hpbnQgNjYgLy8gNjYKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNjYKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI4OQogICAgLy8gc2VsZi5kb25hdGlvbnNbZG9uYXRpb25fYm94X2tleV0gPSBVSW50NjQoYW1vdW50KQogICAgZnJhbWVfZGlnIDUKICAgIGl0b2IKICAgIGJveF9wdXQKCmRvbmF0ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjkzCiAgICAvLyBpZiBkb25vciAhPSBwcm9wLmNyZWF0ZWRfYnkubmF0aXZlOgogICAgZnJhbWVfZGlnIDQKICAgIGV4dHJhY3QgMTYgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgNgogICAgIT0KICAgIGJ6IGRvbmF0ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyOTQKICAgIC8vIHNlbGYuX2FkZF9lbGlnaWJsZV93ZWlnaHQocHJvcG9zYWxfaWQsIHByZXZpb3VzX2Ftb3VudCwgcHJldmlvdXNfYW1vdW50ICsgYW1vdW50KQogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2RpZyA1CiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NzEKICAgIC8vIGVsaWdpYmxlLCB0cmFja2VkID0gc2VsZi5lbGlnaWJsZVdlaWdodC5tYXliZShwcm9wb3NhbF9pZCkKICAgIGJ5dGVjIDEyIC8vICJlbGlnaWJsZVdlaWdodF8iCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU3Mi01NzMKICAgIC8vICMgUHJvcG9zYWxzIGNyZWF0ZWQgYmVmb3JlIHRoZSB3ZWlnaHQgd2FzIHRyYWNrZWQgbmV2ZXIgZ2V0IGl0LCByYXRoZXIgdGhhbiBhbiB1bmRlcmNvdW50CiAgICAvLyBpZiB0cmFja2VkOgogICAgYnogZG9uYXRlX3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU3NQogICAgLy8gZWxpZ2libGUubmF0aXZlCiAgICBmcmFtZV9kaWcgMAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU3NgogICAgLy8gKyBvcC5zcXJ0KGFtb3VudCAvLyBOYXRpdmVVSW50NjQoMV8wMDBfMDAwKSkKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjIDUgLy8gMTAwMDAwMAogICAgLwogICAgc3FydAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU3NS01NzYKICAgIC8vIGVsaWdpYmxlLm5hdGl2ZQogICAgLy8gKyBvcC5zcXJ0KGFtb3VudCAvLyBOYXRpdmVVSW50NjQoMV8wMDBfMDAwKSkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NzcKICAgIC8vIC0gb3Auc3FydChwcmV2aW91c19hbW91bnQgLy8gTmF0aXZlVUludDY0KDFfMDAwXzAwMCkpCiAgICBmcmFtZV9kaWcgNwogICAgaW50YyA1IC8vIDEwMDAwMDAKICAgIC8KICAgIHNxcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NzUtNTc3CiAgICAvLyBlbGlnaWJsZS5uYXRpdmUKICAgIC8vICsgb3Auc3FydChhbW91bnQgLy8gTmF0aXZlVUludDY0KDFfMDAwXzAwMCkpCiAgICAvLyAtIG9wLnNxcnQocHJldmlvdXNfYW1vdW50IC8vIE5hdGl2ZVVJbnQ2NCgxXzAwMF8wMDApKQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU3NC01NzgKICAgIC8vIHNlbGYuZWxpZ2libGVXZWlnaHRbcHJvcG9zYWxfaWRdID0gVUludDY0KAogICAgLy8gICAgIGVsaWdpYmxlLm5hdGl2ZQogICAgLy8gICAgICsgb3Auc3FydChhbW91bnQgLy8gTmF0aXZlVUludDY0KDFfMDAwXzAwMCkpCiAgICAvLyAgICAgLSBvcC5zcXJ0KHByZXZpb3VzX2Ftb3VudCAvLyBOYXRpdmVVSW50NjQoMV8wMDBfMDAwKSkKICAgIC8vICkKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0Cgpkb25hdGVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5NgogICAgLy8gcHJvcC5ub19vZl9kb25hdGlvbnMgPSBVSW50NjQocHJvcC5ub19vZl9kb25hdGlvbnMubmF0aXZlICsgMSkKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIHB1c2hpbnQgNTggLy8gNTgKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weToyOTcKICAgIC8vIHByb3AuYW1vdW50X3JhaXNlZCA9IFVJbnQ2NChwcm9wLmFtb3VudF9yYWlzZWQubmF0aXZlICsgYW1vdW50KQogICAgZHVwCiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDUKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mjk4CiAgICAvLyBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0gPSBwcm9wLmNvcHkoKQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBkaWcgMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMwMAogICAgLy8gaWYgcHJvcC5hbW91bnRfcmFpc2VkID49IHByb3AuYW1vdW50X3JlcXVpcmVkOgogICAgZHVwCiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGI+PQogICAgYnogZG9uYXRlX3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gc2VsZi5fc2V0X3N0YXR1cyhwcm9wb3NhbF9pZC5uYXRpdmUsIE5hdGl2ZVVJbnQ2NChzdGF0dXNfZnVuZHJhaXNpbmcpLCBGYWxzZSkKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1OTYKICAgIC8vIHJldHVybiBJZFNldFBhZ2VLZXkoaW5kZXg9VUludDY0KGluZGV4KSwgcGFnZT1VSW50NjQocHJvcG9zYWxfaWQgLy8gaW5kZXhfcGFnZV9iaXRzKSkuYnl0ZXMKICAgIGl0b2IKICAgIGRpZyAxCiAgICBpbnRjIDQgLy8gMjA0OAogICAgLwogICAgaXRvYgogICAgc3dhcAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBieXRlYyA1IC8vICJzdGF0dXNJbmRleF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzAxCiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19mdW5kcmFpc2luZyksIEZhbHNlKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDAKICAgIC8vIHNldF9pZF9zZXRfYml0KHNlbGYuc3RhdHVzSW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KHN0YXR1cywgcHJvcG9zYWxfaWQpLCBwcm9wb3NhbF9pZCwgbWVtYmVyKQogICAgY2FsbHN1YiBzZXRfaWRfc2V0X2JpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gc2VsZi5fc2V0X3N0YXR1cyhwcm9wb3NhbF9pZC5uYXRpdmUsIE5hdGl2ZVVJbnQ2NChzdGF0dXNfaW5fdm90aW5nKSwgVHJ1ZSkKICAgIGludGNfMiAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTk2CiAgICAvLyByZXR1cm4gSWRTZXRQYWdlS2V5KGluZGV4PVVJbnQ2NChpbmRleCksIHBhZ2U9VUludDY0KHByb3Bvc2FsX2lkIC8vIGluZGV4X3BhZ2VfYml0cykpLmJ5dGVzCiAgICBpdG9iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDAKICAgIC8vIHNldF9pZF9zZXRfYml0KHNlbGYuc3RhdHVzSW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KHN0YXR1cywgcHJvcG9zYWxfaWQpLCBwcm9wb3NhbF9pZCwgbWVtYmVyKQogICAgYnl0ZWMgNSAvLyAic3RhdHVzSW5kZXhfIgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzAyCiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19pbl92b3RpbmcpLCBUcnVlKQogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDAKICAgIC8vIHNldF9pZF9zZXRfYml0KHNlbGYuc3RhdHVzSW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KHN0YXR1cywgcHJvcG9zYWxfaWQpLCBwcm9wb3NhbF9pZCwgbWVtYmVyKQogICAgY2FsbHN1YiBzZXRfaWRfc2V0X2JpdAoKZG9uYXRlX3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VANzoKICAgIHJldHN1YgoKZG9uYXRlX3Byb3Bvc2FsX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gcHJldmlvdXNfYW1vdW50ID0gc2VsZi5kb25hdGlvbnNbZG9uYXRpb25fYm94X2tleV0ubmF0aXZlCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRvbmF0aW9ucyBlbnRyeSBleGlzdHMKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MjkyCiAgICAvLyBzZWxmLmRvbmF0aW9uc1tkb25hdGlvbl9ib3hfa2V5XSA9IFVJbnQ2NChwcmV2aW91c19hbW91bnQgKyBhbW91bnQpCiAgICBmcmFtZV9kaWcgNQogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgYiBkb25hdGVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3Quc3VibWl0X3Byb29mKHByb3Bvc2FsX2lkOiBieXRlcywgcHJvb2ZfbGluazogYnl0ZXMpIC0+IHZvaWQ6CnN1Ym1pdF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMDUtMzA2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzdWJtaXRfcHJvb2Yoc2VsZiwgcHJvcG9zYWxfaWQ6IFVJbnQ2NCwgcHJvb2ZfbGluazogU3RyaW5nKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMDcKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzA4CiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2Vzbid0IGV4aXN0IgogICAgYnl0ZWMgNyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lc24ndCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gcHJvcCA9IHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzEwCiAgICAvLyBhc3NlcnQgcHJvcC5jcmVhdGVkX2J5ID09IEFkZHJlc3MoVHhuLnNlbmRlciksICJPbmx5IGNyZWF0b3IgY2FuIHN1Ym1pdCBwcm9vZiIKICAgIGR1cAogICAgZXh0cmFjdCAxNiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBzdWJtaXQgcHJvb2YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMTEKICAgIC8vIGFzc2VydCBwcm9wLmFtb3VudF9yYWlzZWQgPj0gcHJvcC5hbW91bnRfcmVxdWlyZWQsICJHb2FsIG5vdCByZWFjaGVkIHlldCIKICAgIGR1cAogICAgZXh0cmFjdCA0OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDEKICAgIGV4dHJhY3QgOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYj49CiAgICBhc3NlcnQgLy8gR29hbCBub3QgcmVhY2hlZCB5ZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMTIKICAgIC8vIGFzc2VydCBwcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZSA8IHByb3AubWlsZXN0b25lcy5sZW5ndGgsICJBbGwgbWlsZXN0b25lcyBhbHJlYWR5IGNvbXBsZXRlZCIKICAgIGR1cAogICAgcHVzaGludCA3NCAvLyA3NAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIGR1cAogICAgbGVuCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICA8CiAgICBhc3NlcnQgLy8gQWxsIG1pbGVzdG9uZXMgYWxyZWFkeSBjb21wbGV0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMTQKICAgIC8vIGN1cnJlbnRfdGltZSA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzE1CiAgICAvLyBuZXdfbWlsZXN0b25lcyA9IER5bmFtaWNBcnJheVtNaWxlc3RvbmVdKCkKICAgIGJ5dGVjXzMgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzE2CiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShwcm9wLm1pbGVzdG9uZXMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCgpzdWJtaXRfcHJvb2ZfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMxNgogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UocHJvcC5taWxlc3RvbmVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfZGlnIDYKICAgIDwKICAgIGJ6IHN1Ym1pdF9wcm9vZl9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMxNwogICAgLy8gbWlsZXN0b25lID0gcHJvcC5taWxlc3RvbmVzW2lkeF0uY29weSgpCiAgICBmcmFtZV9kaWcgNQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2RpZyA2CiAgICBkaWcgMQogICAgLSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyA0CiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN1YnN0cmluZzMKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMTgKICAgIC8vIGlmIGlkeCA9PSBwcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZToKICAgIGZyYW1lX2RpZyAzCiAgICA9PQogICAgYnogc3VibWl0X3Byb29mX2Vsc2VfYm9keUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzE5CiAgICAvLyBtaWxlc3RvbmUucHJvb2ZfbGluayA9IHByb29mX2xpbmsKICAgIGR1cAogICAgcHVzaGludCAxMCAvLyAxMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBleHRyYWN0MwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMjAKICAgIC8vIG1pbGVzdG9uZS5wcm9vZl9zdWJtaXR0ZWRfdGltZSA9IFVJbnQ2NChjdXJyZW50X3RpbWUpCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdG9iCiAgICByZXBsYWNlMiAzNwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMyMQogICAgLy8gbWlsZXN0b25lLnZvdGluZ19lbmRfdGltZSA9IFVJbnQ2NChjdXJyZW50X3RpbWUgKyB2b3RpbmdfdGltZSkKICAgIHN3YXAKICAgIHB1c2hpbnQgMTgwIC8vIDE4MAogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMjIKICAgIC8vIG1pbGVzdG9uZS5jbGFpbWVkID0gQm9vbChGYWxzZSkKICAgIGludGMgNyAvLyAyODgKICAgIGludGNfMCAvLyAwCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMjMKICAgIC8vIG1pbGVzdG9uZS52b3Rlc19mb3IgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMyNAogICAgLy8gbWlsZXN0b25lLnZvdGVzX2FnYWluc3QgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiAyMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMyNQogICAgLy8gbWlsZXN0b25lLnRvdGFsX3ZvdGVycyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDI4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzI2CiAgICAvLyBuZXdfbWlsZXN0b25lcy5hcHBlbmQobWlsZXN0b25lLmNvcHkoKSkKICAgIGJ5dGVjIDExIC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgZnJhbWVfYnVyeSA4CgpzdWJtaXRfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA1OgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgOQogICAgYiBzdWJtaXRfcHJvb2ZfZm9yX2hlYWRlckAxCgpzdWJtaXRfcHJvb2ZfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzI4CiAgICAvLyBuZXdfbWlsZXN0b25lcy5hcHBlbmQobWlsZXN0b25lLmNvcHkoKSkKICAgIGJ5dGVjIDExIC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgZnJhbWVfYnVyeSA4CiAgICBiIHN1Ym1pdF9wcm9vZl9hZnRlcl9pZl9lbHNlQDUKCnN1Ym1pdF9wcm9vZl9hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMzAKICAgIC8vIHByb3AubWlsZXN0b25lcyA9IG5ld19taWxlc3RvbmVzLmNvcHkoKQogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgNAogICAgZXh0cmFjdDMKICAgIGZyYW1lX2RpZyA4CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMzEKICAgIC8vIHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXSA9IHByb3AuY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMzIKICAgIC8vIHNlbGYubWlsZXN0b25lVm90ZXNbcHJvcG9zYWxfaWRdID0gRHluYW1pY0FycmF5W0FkZHJlc3NdKCkKICAgIGJ5dGVjIDkgLy8gIm1pbGVzdG9uZVZvdGVzXyIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMyAvLyAweDAwMDAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LnZvdGVfbWlsZXN0b25lKHByb3Bvc2FsX2lkOiBieXRlcywgdm90ZTogYnl0ZXMpIC0+IHZvaWQ6CnZvdGVfbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMzNS0zMzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHZvdGVfbWlsZXN0b25lKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQsIHZvdGU6IEJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozMzcKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzM4CiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2Vzbid0IGV4aXN0IgogICAgYnl0ZWMgNyAvLyAicHJvcG9zYWxzIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lc24ndCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjMzOQogICAgLy8gcHJvcCA9IHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzQwCiAgICAvLyBtaWxlc3RvbmUgPSBwcm9wLm1pbGVzdG9uZXNbcHJvcC5jdXJyZW50X21pbGVzdG9uZS5uYXRpdmVdLmNvcHkoKQogICAgZHVwCiAgICBwdXNoaW50IDc0IC8vIDc0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgcHVzaGludCA1NiAvLyA1NgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgc3dhcAogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgNAogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzQyCiAgICAvLyBtaWxlc3RvbmVfdm90ZXMgPSBzZWxmLm1pbGVzdG9uZVZvdGVzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJ5dGVjIDkgLy8gIm1pbGVzdG9uZVZvdGVzXyIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVWb3RlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNDMKICAgIC8vIGZvciBhZGRyIGluIG1pbGVzdG9uZV92b3RlczoKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKCnZvdGVfbWlsZXN0b25lX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNDMKICAgIC8vIGZvciBhZGRyIGluIG1pbGVzdG9uZV92b3RlczoKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgOAogICAgPAogICAgYnogdm90ZV9taWxlc3RvbmVfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyA3CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gYXNzZXJ0IGFkZHIubmF0aXZlICE9IFR4bi5zZW5kZXIsICJZb3UgaGF2ZSBhbHJlYWR5IHZvdGVkIGZvciB0aGlzIG1pbGVzdG9uZSIKICAgIHR4biBTZW5kZXIKICAgICE9CiAgICBhc3NlcnQgLy8gWW91IGhhdmUgYWxyZWFkeSB2b3RlZCBmb3IgdGhpcyBtaWxlc3RvbmUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDkKICAgIGIgdm90ZV9taWxlc3RvbmVfZm9yX2hlYWRlckAxCgp2b3RlX21pbGVzdG9uZV9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNDYKICAgIC8vIGFzc2VydCBwcm9wLmNyZWF0ZWRfYnkubmF0aXZlICE9IFR4bi5zZW5kZXIsICJDcmVhdG9yIGNhbm5vdCB2b3RlIgogICAgZnJhbWVfZGlnIDMKICAgIGV4dHJhY3QgMTYgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICB0eG4gU2VuZGVyCiAgICAhPQogICAgYXNzZXJ0IC8vIENyZWF0b3IgY2Fubm90IHZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNDcKICAgIC8vIGFzc2VydCBtaWxlc3RvbmUucHJvb2ZfbGluayAhPSAiIiwgIlByb29mIGlzIG5vdCBzdWJtaXR0ZWQgeWV0IgogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgcHVzaGludCAxMCAvLyAxMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIGRpZyAyCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBieXRlY18zIC8vIDB4MDAwMAogICAgIT0KICAgIGFzc2VydCAvLyBQcm9vZiBpcyBub3Qgc3VibWl0dGVkIHlldAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM0OQogICAgLy8gY3VycmVudF90aW1lID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzUwCiAgICAvLyBhc3NlcnQgbWlsZXN0b25lLnZvdGluZ19lbmRfdGltZS5uYXRpdmUgPiBjdXJyZW50X3RpbWUsICJWb3RpbmcgcGVyaW9kIGhhcyBlbmRlZCIKICAgIHN3YXAKICAgIHB1c2hpbnQgNDUgLy8gNDUKICAgIGV4dHJhY3RfdWludDY0CiAgICA8CiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBoYXMgZW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNTIKICAgIC8vIGRvbmF0b3JfYm94X2tleSA9IERvbmF0aW9uQm94S2V5KHByb3Bvc2FsX2lkPXByb3Bvc2FsX2lkLCBkb25vcj1BZGRyZXNzKFR4bi5zZW5kZXIpKQogICAgZnJhbWVfZGlnIC0yCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNTMKICAgIC8vIGFzc2VydCBkb25hdG9yX2JveF9rZXkgaW4gc2VsZi5kb25hdGlvbnMsICJZb3UgaGF2ZSBub3QgZG9uYXRlZCB0byB0aGlzIHByb3Bvc2FsIgogICAgYnl0ZWMgMTAgLy8gImRvbmF0aW9ucyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBZb3UgaGF2ZSBub3QgZG9uYXRlZCB0byB0aGlzIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzU0CiAgICAvLyBhbW91bnRfZG9uYXRlZCA9IHNlbGYuZG9uYXRpb25zW2RvbmF0b3JfYm94X2tleV0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRvbmF0aW9ucyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNTUKICAgIC8vIGFzc2VydCBhbW91bnRfZG9uYXRlZCA+PSAxXzAwMF8wMDAsICJTaG91bGQgaGF2ZSBkb25hdGVkIG1vcmUgdGhhbiAxIEFsZ28gdG8gdm90ZSIKICAgIGR1cAogICAgYnl0ZWMgMTMgLy8gMHgwMDAwMDAwMDAwMGY0MjQwCiAgICBiPj0KICAgIGFzc2VydCAvLyBTaG91bGQgaGF2ZSBkb25hdGVkIG1vcmUgdGhhbiAxIEFsZ28gdG8gdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM1NwogICAgLy8gd2VpZ2h0ID0gb3Auc3FydChhbW91bnRfZG9uYXRlZC5uYXRpdmUgLy8gTmF0aXZlVUludDY0KDFfMDAwXzAwMCkpCiAgICBidG9pCiAgICBpbnRjIDUgLy8gMTAwMDAwMAogICAgLwogICAgc3FydAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM1OAogICAgLy8gaWYgdm90ZToKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZWMgNCAvLyAweDAwCiAgICAhPQogICAgYnogdm90ZV9taWxlc3RvbmVfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNTkKICAgIC8vIG1pbGVzdG9uZS52b3Rlc19mb3IgPSBVSW50NjQobWlsZXN0b25lLnZvdGVzX2Zvci5uYXRpdmUgKyB3ZWlnaHQpCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAxMgogICAgZnJhbWVfYnVyeSA1Cgp2b3RlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzYzCiAgICAvLyBtaWxlc3RvbmUudG90YWxfdm90ZXJzID0gVUludDY0KG1pbGVzdG9uZS50b3RhbF92b3RlcnMubmF0aXZlICsgMSkKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIHB1c2hpbnQgMjggLy8gMjgKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgMjgKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzY0CiAgICAvLyBpZiBzZWxmLl9vdXRjb21lX2RlY2lkZWQocHJvcG9zYWxfaWQsIG1pbGVzdG9uZS52b3Rlc19mb3IubmF0aXZlLCBtaWxlc3RvbmUudm90ZXNfYWdhaW5zdC5uYXRpdmUpOgogICAgZHVwCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgX291dGNvbWVfZGVjaWRlZAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICBieiB2b3RlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNjUtMzY2CiAgICAvLyAjIFZvdGluZyBjbG9zZXMgbm93LCBhbmQgYW4gYXBwcm92ZWQgbWlsZXN0b25lIGNhbiBiZSBjbGFpbWVkIHN0cmFpZ2h0IGF3YXkKICAgIC8vIG1pbGVzdG9uZS52b3RpbmdfZW5kX3RpbWUgPSBVSW50NjQoY3VycmVudF90aW1lKQogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA1CiAgICBzd2FwCiAgICByZXBsYWNlMiA0NQogICAgZnJhbWVfYnVyeSAwCgp2b3RlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDk6CiAgICBmcmFtZV9kaWcgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM2NwogICAgLy8gbWlsZXN0b25lX3ZvdGVzLmFwcGVuZChBZGRyZXNzKFR4bi5zZW5kZXIpKQogICAgZnJhbWVfZGlnIDcKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNjgKICAgIC8vIHNlbGYubWlsZXN0b25lVm90ZXNbcHJvcG9zYWxfaWRdID0gbWlsZXN0b25lX3ZvdGVzLmNvcHkoKQogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzY5CiAgICAvLyBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0ubWlsZXN0b25lc1twcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZV0gPSBtaWxlc3RvbmUuY29weSgpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICBkdXAKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBkaWcgMgogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgdW5jb3ZlciA0CiAgICBmcmFtZV9kaWcgNAogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X3JlcGxhY2VfZHluYW1pY19lbGVtZW50CiAgICB1bmNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIGV4dHJhY3QzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIHJldHN1YgoKdm90ZV9taWxlc3RvbmVfZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzYxCiAgICAvLyBtaWxlc3RvbmUudm90ZXNfYWdhaW5zdCA9IFVJbnQ2NChtaWxlc3RvbmUudm90ZXNfYWdhaW5zdC5uYXRpdmUgKyB3ZWlnaHQpCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBwdXNoaW50IDIwIC8vIDIwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAyMAogICAgZnJhbWVfYnVyeSA1CiAgICBiIHZvdGVfbWlsZXN0b25lX2FmdGVyX2lmX2Vsc2VANwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LnZvdGVfbWlsZXN0b25lX2JhdGNoKHByb3Bvc2FsX2lkOiBieXRlcywgbWlsZXN0b25lX2luZGV4OiBieXRlcywgdm90ZXM6IGJ5dGVzKSAtPiB2b2lkOgp2b3RlX21pbGVzdG9uZV9iYXRjaDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozNzItMzczCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB2b3RlX21pbGVzdG9uZV9iYXRjaChzZWxmLCBwcm9wb3NhbF9pZDogVUludDY0LCBtaWxlc3RvbmVfaW5kZXg6IFVJbnQ2NCwgdm90ZXM6IER5bmFtaWNBcnJheVtTaWduZWRWb3RlXSkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMgogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mzc5CiAgICAvLyBhc3NlcnQgc2VsZi5pbXBvcnRfc3RhZ2UudmFsdWUgIT0gaW1wb3J0X29wZW4sICJTdGF0ZSBpbXBvcnQgaW4gcHJvZ3Jlc3MiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaW1wb3J0U3RhZ2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaW1wb3J0X3N0YWdlIGV4aXN0cwogICAgYnl0ZWNfMiAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIGIhPQogICAgYXNzZXJ0IC8vIFN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM4MAogICAgLy8gYXNzZXJ0IHByb3Bvc2FsX2lkIGluIHNlbGYucHJvcG9zYWxzLCAiUHJvcG9zYWwgZG9lc24ndCBleGlzdCIKICAgIGJ5dGVjIDcgLy8gInByb3Bvc2FscyIKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGRvZXNuJ3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozODEKICAgIC8vIHByb3AgPSBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM4MgogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZV9pbmRleCA9PSBwcm9wLmN1cnJlbnRfbWlsZXN0b25lLCAiVm90ZXMgYXJlIG5vdCBmb3IgdGhlIGN1cnJlbnQgbWlsZXN0b25lIgogICAgZHVwCiAgICBleHRyYWN0IDc0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgIGI9PQogICAgYXNzZXJ0IC8vIFZvdGVzIGFyZSBub3QgZm9yIHRoZSBjdXJyZW50IG1pbGVzdG9uZQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM4MwogICAgLy8gbWlsZXN0b25lID0gcHJvcC5taWxlc3RvbmVzW3Byb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlXS5jb3B5KCkKICAgIGR1cAogICAgcHVzaGludCA3NCAvLyA3NAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3Vic3RyaW5nMwogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mzg0CiAgICAvLyBhc3NlcnQgbWlsZXN0b25lLnByb29mX2xpbmsgIT0gIiIsICJQcm9vZiBpcyBub3Qgc3VibWl0dGVkIHlldCIKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBkaWcgMgogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgYnl0ZWNfMyAvLyAweDAwMDAKICAgICE9CiAgICBhc3NlcnQgLy8gUHJvb2YgaXMgbm90IHN1Ym1pdHRlZCB5ZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozODUKICAgIC8vIGFzc2VydCBtaWxlc3RvbmUudm90aW5nX2VuZF90aW1lLm5hdGl2ZSA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAiVm90aW5nIHBlcmlvZCBoYXMgZW5kZWQiCiAgICBkdXAKICAgIHB1c2hpbnQgNDUgLy8gNDUKICAgIGV4dHJhY3RfdWludDY0CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICA+CiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBoYXMgZW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozODYKICAgIC8vIGFzc2VydCB2b3Rlcy5sZW5ndGggPiAwLCAiTm8gdm90ZXMgdG8gdGFsbHkiCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGFzc2VydCAvLyBObyB2b3RlcyB0byB0YWxseQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gbWlsZXN0b25lX3ZvdGVzID0gc2VsZi5taWxlc3RvbmVWb3Rlc1twcm9wb3NhbF9pZF0uY29weSgpCiAgICBieXRlYyA5IC8vICJtaWxlc3RvbmVWb3Rlc18iCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZVZvdGVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gZW5zdXJlX2J1ZGdldCh2b3RlX2JhdGNoX2J1ZGdldCArIHZvdGVzLmxlbmd0aCAqICh2b3RlX2J1ZGdldCArIG1pbGVzdG9uZV92b3Rlcy5sZW5ndGggKiB2b3RlX3NjYW5fYnVkZ2V0KSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCkKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBwdXNoaW50IDI0IC8vIDI0CiAgICAqCiAgICBwdXNoaW50IDIxMDAgLy8gMjEwMAogICAgKwogICAgKgogICAgcHVzaGludCA3MDAgLy8gNzAwCiAgICArCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzkxCiAgICAvLyBtZXNzYWdlID0gQnl0ZXModm90ZV9tZXNzYWdlX3ByZWZpeCkgKyBvcC5pdG9iKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSArIHByb3Bvc2FsX2lkLmJ5dGVzICsgbWlsZXN0b25lX2luZGV4LmJ5dGVzICsgbWlsZXN0b25lLnByb29mX3N1Ym1pdHRlZF90aW1lLmJ5dGVzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDY2NjY3NjZmNzQ2NQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBleHRyYWN0IDM3IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozOTIKICAgIC8vIHZvdGVzX2ZvciA9IG1pbGVzdG9uZS52b3Rlc19mb3IubmF0aXZlCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MzkzCiAgICAvLyB2b3Rlc19hZ2FpbnN0ID0gbWlsZXN0b25lLnZvdGVzX2FnYWluc3QubmF0aXZlCiAgICBwdXNoaW50IDIwIC8vIDIwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM5NAogICAgLy8gbmV3X3ZvdGVycyA9IER5bmFtaWNBcnJheVtBZGRyZXNzXSgpCiAgICBieXRlY18zIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM5NQogICAgLy8gcHJldmlvdXMgPSBCaWdVSW50KDApCiAgICBwdXNoYnl0ZXMgMHgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozOTYKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2Uodm90ZXMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCgp2b3RlX21pbGVzdG9uZV9iYXRjaF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mzk2CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHZvdGVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMTcKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBieiB2b3RlX21pbGVzdG9uZV9iYXRjaF9hZnRlcl9mb3JAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTozOTcKICAgIC8vIHNpZ25lZCA9IHZvdGVzW2luZGV4XS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxNwogICAgcHVzaGludCA5NyAvLyA5NwogICAgKgogICAgcHVzaGludCA5NyAvLyA5NwogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjM5OAogICAgLy8gdm90ZXIgPSBzaWduZWQudm90ZXIKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mzk5CiAgICAvLyBhc3NlcnQgQmlnVUludC5mcm9tX2J5dGVzKHZvdGVyLmJ5dGVzKSA+IHByZXZpb3VzLCAiVm90ZXJzIG11c3QgYmUgaW4gaW5jcmVhc2luZyBvcmRlciIKICAgIGZyYW1lX2RpZyAxNgogICAgYj4KICAgIGFzc2VydCAvLyBWb3RlcnMgbXVzdCBiZSBpbiBpbmNyZWFzaW5nIG9yZGVyCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzCgp2b3RlX21pbGVzdG9uZV9iYXRjaF9mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDAxCiAgICAvLyBmb3IgYWRkciBpbiBtaWxlc3RvbmVfdm90ZXM6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDExCiAgICA8CiAgICBieiB2b3RlX21pbGVzdG9uZV9iYXRjaF9hZnRlcl9mb3JANgogICAgZnJhbWVfZGlnIDEwCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQwMgogICAgLy8gYXNzZXJ0IGFkZHIgIT0gdm90ZXIsICJWb3RlciBoYXMgYWxyZWFkeSB2b3RlZCBmb3IgdGhpcyBtaWxlc3RvbmUiCiAgICBmcmFtZV9kaWcgMgogICAgIT0KICAgIGFzc2VydCAvLyBWb3RlciBoYXMgYWxyZWFkeSB2b3RlZCBmb3IgdGhpcyBtaWxlc3RvbmUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgdm90ZV9taWxlc3RvbmVfYmF0Y2hfZm9yX2hlYWRlckAzCgp2b3RlX21pbGVzdG9uZV9iYXRjaF9hZnRlcl9mb3JANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MDMKICAgIC8vIGFzc2VydCBwcm9wLmNyZWF0ZWRfYnkgIT0gdm90ZXIsICJDcmVhdG9yIGNhbm5vdCB2b3RlIgogICAgZnJhbWVfZGlnIDUKICAgIGV4dHJhY3QgMTYgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAhPQogICAgYXNzZXJ0IC8vIENyZWF0b3IgY2Fubm90IHZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MDQKICAgIC8vIGFzc2VydCBvcC5lZDI1NTE5dmVyaWZ5X2JhcmUobWVzc2FnZSArIHNpZ25lZC52b3RlLmJ5dGVzLCBzaWduZWQuc2lnbmF0dXJlLmJ5dGVzLCB2b3Rlci5ieXRlcyksICJJbnZhbGlkIHZvdGUgc2lnbmF0dXJlIgogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgaW50YyA2IC8vIDI1NgogICAgZ2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgZnJhbWVfZGlnIDEyCiAgICBkaWcgMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QgMzMgNjQgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgZWQyNTUxOXZlcmlmeV9iYXJlCiAgICBhc3NlcnQgLy8gSW52YWxpZCB2b3RlIHNpZ25hdHVyZQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gYW1vdW50X2RvbmF0ZWQsIGRvbmF0ZWQgPSBzZWxmLmRvbmF0aW9ucy5tYXliZShEb25hdGlvbkJveEtleShwcm9wb3NhbF9pZD1wcm9wb3NhbF9pZCwgZG9ub3I9dm90ZXIpKQogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgYnl0ZWMgMTAgLy8gImRvbmF0aW9ucyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gYXNzZXJ0IGRvbmF0ZWQsICJWb3RlciBoYXMgbm90IGRvbmF0ZWQgdG8gdGhpcyBwcm9wb3NhbCIKICAgIGFzc2VydCAvLyBWb3RlciBoYXMgbm90IGRvbmF0ZWQgdG8gdGhpcyBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gYXNzZXJ0IGFtb3VudF9kb25hdGVkID49IDFfMDAwXzAwMCwgIlNob3VsZCBoYXZlIGRvbmF0ZWQgbW9yZSB0aGFuIDEgQWxnbyB0byB2b3RlIgogICAgZHVwCiAgICBieXRlYyAxMyAvLyAweDAwMDAwMDAwMDAwZjQyNDAKICAgIGI+PQogICAgYXNzZXJ0IC8vIFNob3VsZCBoYXZlIGRvbmF0ZWQgbW9yZSB0aGFuIDEgQWxnbyB0byB2b3RlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDA5CiAgICAvLyB3ZWlnaHQgPSBvcC5zcXJ0KGFtb3VudF9kb25hdGVkLm5hdGl2ZSAvLyBOYXRpdmVVSW50NjQoMV8wMDBfMDAwKSkKICAgIGJ0b2kKICAgIGludGMgNSAvLyAxMDAwMDAwCiAgICAvCiAgICBzcXJ0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDEwCiAgICAvLyBpZiBzaWduZWQudm90ZToKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgIT0KICAgIGJ6IHZvdGVfbWlsZXN0b25lX2JhdGNoX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDExCiAgICAvLyB2b3Rlc19mb3IgKz0gd2VpZ2h0CiAgICBmcmFtZV9kaWcgMTMKICAgICsKICAgIGZyYW1lX2J1cnkgMTMKCnZvdGVfbWlsZXN0b25lX2JhdGNoX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MTQKICAgIC8vIG5ld192b3RlcnMuYXBwZW5kKHZvdGVyKQogICAgZnJhbWVfZGlnIDE1CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Mzk2CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHZvdGVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMTcKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDE3CiAgICBmcmFtZV9idXJ5IDE2CiAgICBiIHZvdGVfbWlsZXN0b25lX2JhdGNoX2Zvcl9oZWFkZXJAMQoKdm90ZV9taWxlc3RvbmVfYmF0Y2hfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDEzCiAgICAvLyB2b3Rlc19hZ2FpbnN0ICs9IHdlaWdodAogICAgZnJhbWVfZGlnIDE0CiAgICArCiAgICBmcmFtZV9idXJ5IDE0CiAgICBiIHZvdGVfbWlsZXN0b25lX2JhdGNoX2FmdGVyX2lmX2Vsc2VAOQoKdm90ZV9taWxlc3RvbmVfYmF0Y2hfYWZ0ZXJfZm9yQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQxNgogICAgLy8gbWlsZXN0b25lLnZvdGVzX2ZvciA9IFVJbnQ2NCh2b3Rlc19mb3IpCiAgICBmcmFtZV9kaWcgMTMKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIDcKICAgIHN3YXAKICAgIHJlcGxhY2UyIDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDE3CiAgICAvLyBtaWxlc3RvbmUudm90ZXNfYWdhaW5zdCA9IFVJbnQ2NCh2b3Rlc19hZ2FpbnN0KQogICAgZnJhbWVfZGlnIDE0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0b2IKICAgIHJlcGxhY2UyIDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDE4CiAgICAvLyBtaWxlc3RvbmUudG90YWxfdm90ZXJzID0gVUludDY0KG1pbGVzdG9uZS50b3RhbF92b3RlcnMubmF0aXZlICsgdm90ZXMubGVuZ3RoKQogICAgZHVwCiAgICBwdXNoaW50IDI4IC8vIDI4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDgKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDI4CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQxOQogICAgLy8gaWYgc2VsZi5fb3V0Y29tZV9kZWNpZGVkKHByb3Bvc2FsX2lkLCB2b3Rlc19mb3IsIHZvdGVzX2FnYWluc3QpOgogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBfb3V0Y29tZV9kZWNpZGVkCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IHZvdGVfbWlsZXN0b25lX2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MjAKICAgIC8vIG1pbGVzdG9uZS52b3RpbmdfZW5kX3RpbWUgPSBVSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgNwogICAgc3dhcAogICAgcmVwbGFjZTIgNDUKICAgIGZyYW1lX2J1cnkgMAoKdm90ZV9taWxlc3RvbmVfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIGZyYW1lX2RpZyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDIxCiAgICAvLyBtaWxlc3RvbmVfdm90ZXMuZXh0ZW5kKG5ld192b3RlcnMpCiAgICBmcmFtZV9kaWcgMTAKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMTUKICAgIGV4dHJhY3QgMiAwCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MjIKICAgIC8vIHNlbGYubWlsZXN0b25lVm90ZXNbcHJvcG9zYWxfaWRdID0gbWlsZXN0b25lX3ZvdGVzLmNvcHkoKQogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDIzCiAgICAvLyBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0ubWlsZXN0b25lc1twcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZV0gPSBtaWxlc3RvbmUuY29weSgpCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICBkdXAKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBkaWcgMgogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgdW5jb3ZlciA0CiAgICBmcmFtZV9kaWcgNgogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X3JlcGxhY2VfZHluYW1pY19lbGVtZW50CiAgICB1bmNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIGV4dHJhY3QzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LmNsYWltX21pbGVzdG9uZShwcm9wb3NhbF9pZDogYnl0ZXMpIC0+IHZvaWQ6CmNsYWltX21pbGVzdG9uZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MjYtNDI3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjbGFpbV9taWxlc3RvbmUoc2VsZiwgcHJvcG9zYWxfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQyOAogICAgLy8gYXNzZXJ0IHNlbGYuaW1wb3J0X3N0YWdlLnZhbHVlICE9IGltcG9ydF9vcGVuLCAiU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImltcG9ydFN0YWdlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmltcG9ydF9zdGFnZSBleGlzdHMKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAxCiAgICBiIT0KICAgIGFzc2VydCAvLyBTdGF0ZSBpbXBvcnQgaW4gcHJvZ3Jlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MjkKICAgIC8vIGFzc2VydCBwcm9wb3NhbF9pZCBpbiBzZWxmLnByb3Bvc2FscywgIlByb3Bvc2FsIGRvZXNuJ3QgZXhpc3QiCiAgICBieXRlYyA3IC8vICJwcm9wb3NhbHMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBkb2Vzbid0IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDMwCiAgICAvLyBwcm9wID0gc2VsZi5wcm9wb3NhbHNbcHJvcG9zYWxfaWRdLmNvcHkoKQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDMxCiAgICAvLyBtaWxlc3RvbmUgPSBwcm9wLm1pbGVzdG9uZXNbcHJvcC5jdXJyZW50X21pbGVzdG9uZS5uYXRpdmVdLmNvcHkoKQogICAgZHVwCiAgICBwdXNoaW50IDc0IC8vIDc0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMgogICAgbGVuCiAgICBkaWcgMwogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGR1cDIKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgNAogICAgbGVuCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyA2CiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MzMKICAgIC8vIGN1cnJlbnRfdGltZSA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDM0CiAgICAvLyBhc3NlcnQgbWlsZXN0b25lLnByb29mX2xpbmsgIT0gIiIsICJQcm9vZiBpcyBub3Qgc3VibWl0dGVkIHlldCIKICAgIGRpZyAxCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGxlbgogICAgZGlnIDMKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGJ5dGVjXzMgLy8gMHgwMDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFByb29mIGlzIG5vdCBzdWJtaXR0ZWQgeWV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDM1CiAgICAvLyBhc3NlcnQgbWlsZXN0b25lLnByb29mX3N1Ym1pdHRlZF90aW1lLm5hdGl2ZSAhPSAwLCAiUHJvb2Ygbm90IHN1Ym1pdHRlZCB5ZXQiCiAgICBkaWcgMQogICAgcHVzaGludCAzNyAvLyAzNwogICAgZXh0cmFjdF91aW50NjQKICAgIGFzc2VydCAvLyBQcm9vZiBub3Qgc3VibWl0dGVkIHlldAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQzNgogICAgLy8gYXNzZXJ0IGN1cnJlbnRfdGltZSA+PSBtaWxlc3RvbmUudm90aW5nX2VuZF90aW1lLm5hdGl2ZSwgIlZvdGluZyBwZXJpb2Qgbm90IGVuZGVkIHlldCIKICAgIGRpZyAxCiAgICBwdXNoaW50IDQ1IC8vIDQ1CiAgICBleHRyYWN0X3VpbnQ2NAogICAgPj0KICAgIGFzc2VydCAvLyBWb3RpbmcgcGVyaW9kIG5vdCBlbmRlZCB5ZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0MzcKICAgIC8vIGFzc2VydCBtaWxlc3RvbmUudm90ZXNfZm9yLm5hdGl2ZSA+IG1pbGVzdG9uZS52b3Rlc19hZ2FpbnN0Lm5hdGl2ZSwgIk1pbGVzdG9uZSBub3QgYXBwcm92ZWQiCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgcHVzaGludCAyMCAvLyAyMAogICAgZXh0cmFjdF91aW50NjQKICAgID4KICAgIGFzc2VydCAvLyBNaWxlc3RvbmUgbm90IGFwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDM4CiAgICAvLyBhc3NlcnQgbm90IG1pbGVzdG9uZS5jbGFpbWVkLCAiTWlsZXN0b25lIGFscmVhZHkgY2xhaW1lZCIKICAgIGR1cAogICAgaW50YyA3IC8vIDI4OAogICAgZ2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWMgNCAvLyAweDAwCiAgICA9PQogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBhbHJlYWR5IGNsYWltZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NDAKICAgIC8vIGNyZWF0b3IgPSBwcm9wLmNyZWF0ZWRfYnkubmF0aXZlCiAgICB1bmNvdmVyIDQKICAgIGV4dHJhY3QgMTYgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDQxLTQ0NQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPWNyZWF0b3IsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQubmF0aXZlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDQyCiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDQ0CiAgICAvLyBhbW91bnQ9bWlsZXN0b25lLmFtb3VudC5uYXRpdmUKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgZXh0cmFjdF91aW50NjQKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ0MQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDQxLTQ0NQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPWNyZWF0b3IsCiAgICAvLyAgICAgYW1vdW50PW1pbGVzdG9uZS5hbW91bnQubmF0aXZlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ0NwogICAgLy8gbWlsZXN0b25lLmNsYWltZWQgPSBCb29sKFRydWUpCiAgICBpbnRjIDcgLy8gMjg4CiAgICBpbnRjXzEgLy8gMQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDQ4CiAgICAvLyBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0ubWlsZXN0b25lc1twcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZV0gPSBtaWxlc3RvbmUuY29weSgpCiAgICBkaWcgNAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxzIGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGxlbgogICAgZGlnIDIKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciA2CiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfcmVwbGFjZV9keW5hbWljX2VsZW1lbnQKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDMKICAgIGJveF9kZWwKICAgIHBvcAogICAgZGlnIDMKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NDkKICAgIC8vIHNlbGYucHJvcG9zYWxzW3Byb3Bvc2FsX2lkXS5jdXJyZW50X21pbGVzdG9uZSA9IFVJbnQ2NChwcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZSArIDEpCiAgICBkdXAKICAgIGl0b2IKICAgIGRpZyAzCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXBsYWNlMiA3NAogICAgZGlnIDMKICAgIGJveF9kZWwKICAgIHBvcAogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDUxCiAgICAvLyBpZiBwcm9wLmN1cnJlbnRfbWlsZXN0b25lLm5hdGl2ZSArIDEgPT0gcHJvcC5taWxlc3RvbmVzLmxlbmd0aDoKICAgID09CiAgICBieiBjbGFpbV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDUyLTQ1MwogICAgLy8gIyBUaGUgbGFzdCBtaWxlc3RvbmUgY2FuIHN0aWxsIGJlIGNsYWltZWQgYWZ0ZXIgdGhlIHByb3Bvc2FsIGV4cGlyZWQKICAgIC8vIHNlbGYuX3NldF9zdGF0dXMocHJvcG9zYWxfaWQubmF0aXZlLCBOYXRpdmVVSW50NjQoc3RhdHVzX2luX3ZvdGluZyksIEZhbHNlKQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpbnRjXzIgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU5NgogICAgLy8gcmV0dXJuIElkU2V0UGFnZUtleShpbmRleD1VSW50NjQoaW5kZXgpLCBwYWdlPVVJbnQ2NChwcm9wb3NhbF9pZCAvLyBpbmRleF9wYWdlX2JpdHMpKS5ieXRlcwogICAgaXRvYgogICAgZGlnIDEKICAgIGludGMgNCAvLyAyMDQ4CiAgICAvCiAgICBpdG9iCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjAwCiAgICAvLyBzZXRfaWRfc2V0X2JpdChzZWxmLnN0YXR1c0luZGV4LmtleV9wcmVmaXggKyBzZWxmLl9wYWdlX2tleShzdGF0dXMsIHByb3Bvc2FsX2lkKSwgcHJvcG9zYWxfaWQsIG1lbWJlcikKICAgIGJ5dGVjIDUgLy8gInN0YXR1c0luZGV4XyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NTItNDUzCiAgICAvLyAjIFRoZSBsYXN0IG1pbGVzdG9uZSBjYW4gc3RpbGwgYmUgY2xhaW1lZCBhZnRlciB0aGUgcHJvcG9zYWwgZXhwaXJlZAogICAgLy8gc2VsZi5fc2V0X3N0YXR1cyhwcm9wb3NhbF9pZC5uYXRpdmUsIE5hdGl2ZVVJbnQ2NChzdGF0dXNfaW5fdm90aW5nKSwgRmFsc2UpCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBjYWxsc3ViIHNldF9pZF9zZXRfYml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDU0CiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19leHBpcmVkKSwgRmFsc2UpCiAgICBwdXNoaW50IDQgLy8gNAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU5NgogICAgLy8gcmV0dXJuIElkU2V0UGFnZUtleShpbmRleD1VSW50NjQoaW5kZXgpLCBwYWdlPVVJbnQ2NChwcm9wb3NhbF9pZCAvLyBpbmRleF9wYWdlX2JpdHMpKS5ieXRlcwogICAgaXRvYgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBieXRlYyA1IC8vICJzdGF0dXNJbmRleF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDU0CiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19leHBpcmVkKSwgRmFsc2UpCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBjYWxsc3ViIHNldF9pZF9zZXRfYml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDU1CiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19jb21wbGV0ZWQpLCBUcnVlKQogICAgcHVzaGludCAzIC8vIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1OTYKICAgIC8vIHJldHVybiBJZFNldFBhZ2VLZXkoaW5kZXg9VUludDY0KGluZGV4KSwgcGFnZT1VSW50NjQocHJvcG9zYWxfaWQgLy8gaW5kZXhfcGFnZV9iaXRzKSkuYnl0ZXMKICAgIGl0b2IKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBieXRlYyA1IC8vICJzdGF0dXNJbmRleF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NTUKICAgIC8vIHNlbGYuX3NldF9zdGF0dXMocHJvcG9zYWxfaWQubmF0aXZlLCBOYXRpdmVVSW50NjQoc3RhdHVzX2NvbXBsZXRlZCksIFRydWUpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBjYWxsc3ViIHNldF9pZF9zZXRfYml0CgpjbGFpbV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QucmVmdW5kX2lmX2luYWN0aXZlKHByb3Bvc2FsX2lkOiBieXRlcykgLT4gdm9pZDoKcmVmdW5kX2lmX2luYWN0aXZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ1OC00NTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlZnVuZF9pZl9pbmFjdGl2ZShzZWxmLCBwcm9wb3NhbF9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ2MAogICAgLy8gYXNzZXJ0IHNlbGYuaW1wb3J0X3N0YWdlLnZhbHVlICE9IGltcG9ydF9vcGVuLCAiU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImltcG9ydFN0YWdlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmltcG9ydF9zdGFnZSBleGlzdHMKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAxCiAgICBiIT0KICAgIGFzc2VydCAvLyBTdGF0ZSBpbXBvcnQgaW4gcHJvZ3Jlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NjEKICAgIC8vIGFzc2VydCBwcm9wb3NhbF9pZCBpbiBzZWxmLnByb3Bvc2FscywgIlByb3Bvc2FsIGRvZXNuJ3QgZXhpc3QiCiAgICBieXRlYyA3IC8vICJwcm9wb3NhbHMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBkb2Vzbid0IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDYyCiAgICAvLyBwcm9wID0gc2VsZi5wcm9wb3NhbHNbcHJvcG9zYWxfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2FscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NjMKICAgIC8vIGN1cnJlbnRfbWlsZXN0b25lID0gcHJvcC5taWxlc3RvbmVzW3Byb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlXS5jb3B5KCkKICAgIGR1cAogICAgcHVzaGludCA3NCAvLyA3NAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGxlbgogICAgdW5jb3ZlciAzCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gY3VycmVudF90aW1lID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NjUKICAgIC8vIHRpbWVfZGlmZmVyZW5jZSA9IGN1cnJlbnRfdGltZSAtIGN1cnJlbnRfbWlsZXN0b25lLnByb29mX3N1Ym1pdHRlZF90aW1lLm5hdGl2ZQogICAgc3dhcAogICAgcHVzaGludCAzNyAvLyAzNwogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgY292ZXIgMgogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ2NwogICAgLy8gZG9uYXRvcl9ib3hfa2V5ID0gRG9uYXRpb25Cb3hLZXkocHJvcG9zYWxfaWQ9cHJvcG9zYWxfaWQsIGRvbm9yPUFkZHJlc3MoVHhuLnNlbmRlcikpCiAgICBmcmFtZV9kaWcgLTEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ2OAogICAgLy8gYXNzZXJ0IGRvbmF0b3JfYm94X2tleSBpbiBzZWxmLmRvbmF0aW9ucywgIllvdSBoYXZlIG5vdCBkb25hdGVkIHRvIHRoaXMgcHJvcG9zYWwiCiAgICBieXRlYyAxMCAvLyAiZG9uYXRpb25zIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gWW91IGhhdmUgbm90IGRvbmF0ZWQgdG8gdGhpcyBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ2OQogICAgLy8gYW1vdW50X2RvbmF0ZWQgPSBzZWxmLmRvbmF0aW9uc1tkb25hdG9yX2JveF9rZXldCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kb25hdGlvbnMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDcxCiAgICAvLyBpZiB0aW1lX2RpZmZlcmVuY2UgPiBleHBpcmF0aW9uX3RpbWU6CiAgICBwdXNoaW50IDI0MCAvLyAyNDAKICAgID4KICAgIGJ6IHJlZnVuZF9pZl9pbmFjdGl2ZV9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0NzItNDc0CiAgICAvLyAjIE9ubHkgYSBwcm92ZW4gbWlsZXN0b25lIGxlZnQgdG9vIGxvbmcgZXhwaXJlcyB0aGUgcHJvcG9zYWw7IHdpdGhvdXQgYSBwcm9vZiB0aGUKICAgIC8vICMgdGltZSBpcyBtZWFzdXJlZCBmcm9tIDAsIGFuZCBhIHByb3Bvc2FsIHN0aWxsIHJhaXNpbmcgZnVuZHMgbXVzdCBzdGF5IGxpc3RlZCB0aGVyZQogICAgLy8gaWYgY3VycmVudF9taWxlc3RvbmUucHJvb2Zfc3VibWl0dGVkX3RpbWUubmF0aXZlICE9IDA6CiAgICBmcmFtZV9kaWcgMwogICAgYnogcmVmdW5kX2lmX2luYWN0aXZlX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gc2VsZi5fc2V0X3N0YXR1cyhwcm9wb3NhbF9pZC5uYXRpdmUsIE5hdGl2ZVVJbnQ2NChzdGF0dXNfaW5fdm90aW5nKSwgRmFsc2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGludGNfMiAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTk2CiAgICAvLyByZXR1cm4gSWRTZXRQYWdlS2V5KGluZGV4PVVJbnQ2NChpbmRleCksIHBhZ2U9VUludDY0KHByb3Bvc2FsX2lkIC8vIGluZGV4X3BhZ2VfYml0cykpLmJ5dGVzCiAgICBpdG9iCiAgICBkaWcgMQogICAgaW50YyA0IC8vIDIwNDgKICAgIC8KICAgIGl0b2IKICAgIHN3YXAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDAKICAgIC8vIHNldF9pZF9zZXRfYml0KHNlbGYuc3RhdHVzSW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KHN0YXR1cywgcHJvcG9zYWxfaWQpLCBwcm9wb3NhbF9pZCwgbWVtYmVyKQogICAgYnl0ZWMgNSAvLyAic3RhdHVzSW5kZXhfIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gc2VsZi5fc2V0X3N0YXR1cyhwcm9wb3NhbF9pZC5uYXRpdmUsIE5hdGl2ZVVJbnQ2NChzdGF0dXNfaW5fdm90aW5nKSwgRmFsc2UpCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2V0X2lkX3NldF9iaXQoc2VsZi5zdGF0dXNJbmRleC5rZXlfcHJlZml4ICsgc2VsZi5fcGFnZV9rZXkoc3RhdHVzLCBwcm9wb3NhbF9pZCksIHByb3Bvc2FsX2lkLCBtZW1iZXIpCiAgICBjYWxsc3ViIHNldF9pZF9zZXRfYml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDc2CiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19leHBpcmVkKSwgVHJ1ZSkKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTk2CiAgICAvLyByZXR1cm4gSWRTZXRQYWdlS2V5KGluZGV4PVVJbnQ2NChpbmRleCksIHBhZ2U9VUludDY0KHByb3Bvc2FsX2lkIC8vIGluZGV4X3BhZ2VfYml0cykpLmJ5dGVzCiAgICBpdG9iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDAKICAgIC8vIHNldF9pZF9zZXRfYml0KHNlbGYuc3RhdHVzSW5kZXgua2V5X3ByZWZpeCArIHNlbGYuX3BhZ2Vfa2V5KHN0YXR1cywgcHJvcG9zYWxfaWQpLCBwcm9wb3NhbF9pZCwgbWVtYmVyKQogICAgYnl0ZWMgNSAvLyAic3RhdHVzSW5kZXhfIgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDc2CiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHByb3Bvc2FsX2lkLm5hdGl2ZSwgTmF0aXZlVUludDY0KHN0YXR1c19leHBpcmVkKSwgVHJ1ZSkKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjAwCiAgICAvLyBzZXRfaWRfc2V0X2JpdChzZWxmLnN0YXR1c0luZGV4LmtleV9wcmVmaXggKyBzZWxmLl9wYWdlX2tleShzdGF0dXMsIHByb3Bvc2FsX2lkKSwgcHJvcG9zYWxfaWQsIG1lbWJlcikKICAgIGNhbGxzdWIgc2V0X2lkX3NldF9iaXQKCnJlZnVuZF9pZl9pbmFjdGl2ZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDc3CiAgICAvLyByZW1haW5pbmdfYW1vdW50ID0gcHJvcC5hbW91bnRfcmVxdWlyZWQubmF0aXZlIC0gcHJvcC5hbW91bnRfcmFpc2VkLm5hdGl2ZQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC0KICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gaWYgYW1vdW50X2RvbmF0ZWQgPiAwOgogICAgZnJhbWVfZGlnIDUKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYnogcmVmdW5kX2lmX2luYWN0aXZlX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gcmVmdW5kX2Ftb3VudCA9IFVJbnQ2NChyZW1haW5pbmdfYW1vdW50ICogYW1vdW50X2RvbmF0ZWQubmF0aXZlIC8vIHByb3AuYW1vdW50X3JhaXNlZC5uYXRpdmUpCiAgICBmcmFtZV9kaWcgNQogICAgYnRvaQogICAgZnJhbWVfZGlnIDAKICAgICoKICAgIGZyYW1lX2RpZyAxCiAgICAvCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDgwLTQ4NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PXJlZnVuZF9hbW91bnQubmF0aXZlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDgyCiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ4MwogICAgLy8gYW1vdW50PXJlZnVuZF9hbW91bnQubmF0aXZlCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDgwLTQ4NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PXJlZnVuZF9hbW91bnQubmF0aXZlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gc2VsZi5kb25hdGlvbnNbZG9uYXRvcl9ib3hfa2V5XSA9IFVJbnQ2NCgwKQogICAgZnJhbWVfZGlnIDQKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBib3hfcHV0CgpyZWZ1bmRfaWZfaW5hY3RpdmVfYWZ0ZXJfaWZfZWxzZUA3OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuZ2V0X2N1cnJlbnRfbWlsZXN0b25lKHByb3Bvc2FsX2lkOiBieXRlcywgdm90ZXI6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2N1cnJlbnRfbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ4OC00ODkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfY3VycmVudF9taWxlc3RvbmUoc2VsZiwgcHJvcG9zYWxfaWQ6IFVJbnQ2NCwgdm90ZXI6IEFkZHJlc3MpIC0+IEN1cnJlbnRNaWxlc3RvbmU6CiAgICBwcm90byAyIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gYXNzZXJ0IHByb3Bvc2FsX2lkIGluIHNlbGYucHJvcG9zYWxzLCAiUHJvcG9zYWwgZG9lc24ndCBleGlzdCIKICAgIGJ5dGVjIDcgLy8gInByb3Bvc2FscyIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGRvZXNuJ3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0OTIKICAgIC8vIHByb3AgPSBzZWxmLnByb3Bvc2Fsc1twcm9wb3NhbF9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ5MwogICAgLy8gYXNzZXJ0IHByb3AuY3VycmVudF9taWxlc3RvbmUubmF0aXZlIDwgcHJvcC5taWxlc3RvbmVzLmxlbmd0aCwgIkFsbCBtaWxlc3RvbmVzIGFscmVhZHkgY29tcGxldGVkIgogICAgZHVwCiAgICBleHRyYWN0IDc0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBkdXAKICAgIHB1c2hpbnQgNzQgLy8gNzQKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgcHVzaGludCA1NiAvLyA1NgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBsZW4KICAgIHVuY292ZXIgMwogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPAogICAgYXNzZXJ0IC8vIEFsbCBtaWxlc3RvbmVzIGFscmVhZHkgY29tcGxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDk0CiAgICAvLyBtaWxlc3RvbmUgPSBwcm9wLm1pbGVzdG9uZXNbcHJvcC5jdXJyZW50X21pbGVzdG9uZS5uYXRpdmVdLmNvcHkoKQogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICB1bmNvdmVyIDMKICAgIGRpZyAxCiAgICAtIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gaGFzX3ZvdGVkID0gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDk3CiAgICAvLyBtaWxlc3RvbmVfdm90ZXMgPSBzZWxmLm1pbGVzdG9uZVZvdGVzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGJ5dGVjIDkgLy8gIm1pbGVzdG9uZVZvdGVzXyIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lVm90ZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NDk4CiAgICAvLyBmb3IgYWRkciBpbiBtaWxlc3RvbmVfdm90ZXM6CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCgpnZXRfY3VycmVudF9taWxlc3RvbmVfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjQ5OAogICAgLy8gZm9yIGFkZHIgaW4gbWlsZXN0b25lX3ZvdGVzOgogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBieiBnZXRfY3VycmVudF9taWxlc3RvbmVfYWZ0ZXJfZm9yQDYKICAgIGZyYW1lX2RpZyA3CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDkKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgaW50Y18zIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo0OTkKICAgIC8vIGlmIGFkZHIgPT0gdm90ZXI6CiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBnZXRfY3VycmVudF9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTAwCiAgICAvLyBoYXNfdm90ZWQgPSBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSA2CgpnZXRfY3VycmVudF9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUA0OgogICAgZnJhbWVfZGlnIDkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDkKICAgIGIgZ2V0X2N1cnJlbnRfbWlsZXN0b25lX2Zvcl9oZWFkZXJAMQoKZ2V0X2N1cnJlbnRfbWlsZXN0b25lX2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUwMgogICAgLy8gd2VpZ2h0ID0gTmF0aXZlVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MDMKICAgIC8vIGRvbmF0aW9uX2JveF9rZXkgPSBEb25hdGlvbkJveEtleShwcm9wb3NhbF9pZD1wcm9wb3NhbF9pZCwgZG9ub3I9dm90ZXIpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTA0CiAgICAvLyBhbW91bnRfZG9uYXRlZCwgZG9uYXRlZCA9IHNlbGYuZG9uYXRpb25zLm1heWJlKGRvbmF0aW9uX2JveF9rZXkpCiAgICBieXRlYyAxMCAvLyAiZG9uYXRpb25zIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUwNQogICAgLy8gaWYgZG9uYXRlZCBhbmQgYW1vdW50X2RvbmF0ZWQgPj0gMV8wMDBfMDAwIGFuZCBwcm9wLmNyZWF0ZWRfYnkgIT0gdm90ZXI6CiAgICBieiBnZXRfY3VycmVudF9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAxMAogICAgZnJhbWVfZGlnIDAKICAgIGJ5dGVjIDEzIC8vIDB4MDAwMDAwMDAwMDBmNDI0MAogICAgYj49CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAyCiAgICBieiBnZXRfY3VycmVudF9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAxMAogICAgZnJhbWVfZGlnIDMKICAgIGV4dHJhY3QgMTYgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgICE9CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAyCiAgICBieiBnZXRfY3VycmVudF9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUwNgogICAgLy8gd2VpZ2h0ID0gb3Auc3FydChhbW91bnRfZG9uYXRlZC5uYXRpdmUgLy8gTmF0aXZlVUludDY0KDFfMDAwXzAwMCkpCiAgICBmcmFtZV9kaWcgMAogICAgYnRvaQogICAgaW50YyA1IC8vIDEwMDAwMDAKICAgIC8KICAgIHNxcnQKICAgIGZyYW1lX2J1cnkgMgoKZ2V0X2N1cnJlbnRfbWlsZXN0b25lX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICBmcmFtZV9kaWcgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUxMQogICAgLy8gaGFzX3ZvdGVkPUJvb2woaGFzX3ZvdGVkKSwKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2RpZyA2CiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MTIKICAgIC8vIHZvdGVfd2VpZ2h0PVVJbnQ2NCh3ZWlnaHQpLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUwOC01MTMKICAgIC8vIHJldHVybiBDdXJyZW50TWlsZXN0b25lKAogICAgLy8gICAgIGluZGV4PXByb3AuY3VycmVudF9taWxlc3RvbmUsCiAgICAvLyAgICAgbWlsZXN0b25lPW1pbGVzdG9uZS5jb3B5KCksCiAgICAvLyAgICAgaGFzX3ZvdGVkPUJvb2woaGFzX3ZvdGVkKSwKICAgIC8vICAgICB2b3RlX3dlaWdodD1VSW50NjQod2VpZ2h0KSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyA0CiAgICBwdXNoYnl0ZXMgMHgwMDEzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyA1CiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QubGlzdF9wcm9wb3NhbHMoY2F0ZWdvcnk6IGJ5dGVzLCBzdGF0dXM6IGJ5dGVzLCBjdXJzb3I6IGJ5dGVzLCBsaW1pdDogYnl0ZXMpIC0+IGJ5dGVzOgpsaXN0X3Byb3Bvc2FsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MTYtNTE3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbGlzdF9wcm9wb3NhbHMoc2VsZiwgY2F0ZWdvcnk6IFN0cmluZywgc3RhdHVzOiBVSW50NjQsIGN1cnNvcjogVUludDY0LCBsaW1pdDogVUludDY0KSAtPiBQcm9wb3NhbElkUGFnZToKICAgIHByb3RvIDQgMQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTIzCiAgICAvLyBhc3NlcnQgbGltaXQubmF0aXZlIDw9IG1heF9saXN0X2xpbWl0LCAiTGltaXQgaXMgdG9vIGxhcmdlIgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBkdXAKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIDw9CiAgICBhc3NlcnQgLy8gTGltaXQgaXMgdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTI0CiAgICAvLyBlbmQgPSBzZWxmLm5vX29mX3Byb3Bvc2Fscy52YWx1ZS5uYXRpdmUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJub09mUHJvcG9zYWxzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5vX29mX3Byb3Bvc2FscyBleGlzdHMKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyNQogICAgLy8gaWRzID0gRHluYW1pY0FycmF5W1VJbnQ2NF0oKQogICAgYnl0ZWNfMyAvLyAweDAwMDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MjYKICAgIC8vIG5leHRfY3Vyc29yID0gY3Vyc29yLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyNwogICAgLy8gaWYgbmV4dF9jdXJzb3IgPj0gZW5kOgogICAgPj0KICAgIGJ6IGxpc3RfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyOAogICAgLy8gcmV0dXJuIFByb3Bvc2FsSWRQYWdlKGlkcz1pZHMuY29weSgpLCBuZXh0X2N1cnNvcj1VSW50NjQoZW5kKSwgZG9uZT1Cb29sKFRydWUpKQogICAgZnJhbWVfZGlnIDEyCiAgICBpdG9iCiAgICBieXRlYyAxNyAvLyAweDAwMGIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4ODAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjUyNQogICAgLy8gaWRzID0gRHluYW1pY0FycmF5W1VJbnQ2NF0oKQogICAgYnl0ZWNfMyAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MjgKICAgIC8vIHJldHVybiBQcm9wb3NhbElkUGFnZShpZHM9aWRzLmNvcHkoKSwgbmV4dF9jdXJzb3I9VUludDY0KGVuZCksIGRvbmU9Qm9vbChUcnVlKSkKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmxpc3RfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MzAKICAgIC8vIGZpbHRlcl9jYXRlZ29yeSA9IGNhdGVnb3J5Lm5hdGl2ZS5ieXRlcy5sZW5ndGggPiAwCiAgICBmcmFtZV9kaWcgLTQKICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDAKICAgID4KICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6MTI1CiAgICAvLyByZXR1cm4gb3AuZXh0cmFjdF91aW50NjQob3Auc2hhMjU2KGNhdGVnb3J5Lm5hdGl2ZS5ieXRlcyksIDApCiAgICBzaGEyNTYKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MzIKICAgIC8vIHBhZ2Vfbm8gPSBuZXh0X2N1cnNvciAvLyBpbmRleF9wYWdlX2JpdHMKICAgIGZyYW1lX2RpZyAxNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjIDQgLy8gMjA0OAogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MzMKICAgIC8vIHBhZ2UgPSBzZWxmLl9pZF9zZXRfcGFnZShmaWx0ZXJfY2F0ZWdvcnksIGhhc2hlZCwgc3RhdHVzLm5hdGl2ZSwgcGFnZV9ubykKICAgIGZyYW1lX2RpZyAtMwogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBfaWRfc2V0X3BhZ2UKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTM0CiAgICAvLyB3b3JkX25vID0gKG5leHRfY3Vyc29yICUgaW5kZXhfcGFnZV9iaXRzKSAvLyA2NAogICAgZHVwCiAgICBpbnRjIDQgLy8gMjA0OAogICAgJQogICAgcHVzaGludCA2NCAvLyA2NAogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1MzUtNTM2CiAgICAvLyAjIERyb3AgdGhlIGJpdHMgb2YgdGhlIHByb3Bvc2FscyBiZWZvcmUgdGhlIGN1cnNvcgogICAgLy8gd29yZCA9IG9wLmV4dHJhY3RfdWludDY0KHBhZ2UsIHdvcmRfbm8gKiA4KSAmIChvcC5zaHIoTmF0aXZlVUludDY0KDIqKjY0IC0gMSksIG5leHRfY3Vyc29yICUgNjQpKQogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgICUKICAgIHB1c2hpbnQgMTg0NDY3NDQwNzM3MDk1NTE2MTUgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIHN3YXAKICAgIHNocgogICAgJgogICAgZnJhbWVfYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTM3CiAgICAvLyB3b3Jkc19sZWZ0ID0gTmF0aXZlVUludDY0KG1heF9saXN0X3dvcmRzKQogICAgcHVzaGludCA2NCAvLyA2NAogICAgZnJhbWVfYnVyeSAxMAoKbGlzdF9wcm9wb3NhbHNfd2hpbGVfdG9wQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTM5CiAgICAvLyB3aGlsZSBpZHMubGVuZ3RoIDwgbGltaXQubmF0aXZlOgogICAgZnJhbWVfZGlnIDEzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAxMQogICAgPAogICAgYnogbGlzdF9wcm9wb3NhbHNfYWZ0ZXJfd2hpbGVAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NDAKICAgIC8vIGlmIHdvcmQgPT0gMDoKICAgIGZyYW1lX2RpZyA4CiAgICBibnogbGlzdF9wcm9wb3NhbHNfZWxzZV9ib2R5QDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTQxCiAgICAvLyB3b3Jkc19sZWZ0IC09IDEKICAgIGZyYW1lX2RpZyAxMAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGZyYW1lX2J1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NDIKICAgIC8vIHdvcmRfbm8gKz0gMQogICAgZnJhbWVfZGlnIDkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU0MwogICAgLy8gaWYgd29yZF9ubyA9PSBpbmRleF9wYWdlX2JpdHMgLy8gNjQ6CiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfYnVyeSA1CiAgICBieiBsaXN0X3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NDQKICAgIC8vIHBhZ2Vfbm8gKz0gMQogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTQ1CiAgICAvLyB3b3JkX25vID0gTmF0aXZlVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA5CiAgICBmcmFtZV9idXJ5IDUKCmxpc3RfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VANzoKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU0NgogICAgLy8gbmV4dF9jdXJzb3IgPSBwYWdlX25vICogaW5kZXhfcGFnZV9iaXRzICsgd29yZF9ubyAqIDY0CiAgICBpbnRjIDQgLy8gMjA0OAogICAgKgogICAgZnJhbWVfZGlnIDkKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgICoKICAgICsKICAgIGZyYW1lX2J1cnkgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NDcKICAgIC8vIGlmIHdvcmRzX2xlZnQgPT0gMCBvciBuZXh0X2N1cnNvciA+PSBlbmQ6CiAgICBmcmFtZV9kaWcgMTAKICAgIGJ6IGxpc3RfcHJvcG9zYWxzX2FmdGVyX3doaWxlQDE3CiAgICBmcmFtZV9kaWcgMTQKICAgIGZyYW1lX2RpZyAxMgogICAgPj0KICAgIGJueiBsaXN0X3Byb3Bvc2Fsc19hZnRlcl93aGlsZUAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU0OQogICAgLy8gaWYgd29yZF9ubyA9PSAwOgogICAgZnJhbWVfZGlnIDkKICAgIGJueiBsaXN0X3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTUwCiAgICAvLyBwYWdlID0gc2VsZi5faWRfc2V0X3BhZ2UoZmlsdGVyX2NhdGVnb3J5LCBoYXNoZWQsIHN0YXR1cy5uYXRpdmUsIHBhZ2Vfbm8pCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgNAogICAgY2FsbHN1YiBfaWRfc2V0X3BhZ2UKICAgIGZyYW1lX2J1cnkgMAoKbGlzdF9wcm9wb3NhbHNfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NTEKICAgIC8vIHdvcmQgPSBvcC5leHRyYWN0X3VpbnQ2NChwYWdlLCB3b3JkX25vICogOCkKICAgIGZyYW1lX2RpZyA5CiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9idXJ5IDgKICAgIGIgbGlzdF9wcm9wb3NhbHNfd2hpbGVfdG9wQDMKCmxpc3RfcHJvcG9zYWxzX2FmdGVyX3doaWxlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU2MgogICAgLy8gaWYgbmV4dF9jdXJzb3IgPiBlbmQ6CiAgICBmcmFtZV9kaWcgMTQKICAgIGZyYW1lX2RpZyAxMgogICAgPgogICAgYnogbGlzdF9wcm9wb3NhbHNfYWZ0ZXJfaWZfZWxzZUAxOQogICAgZnJhbWVfZGlnIDEyCiAgICBmcmFtZV9idXJ5IDE0CgpsaXN0X3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU2NAogICAgLy8gcmV0dXJuIFByb3Bvc2FsSWRQYWdlKGlkcz1pZHMuY29weSgpLCBuZXh0X2N1cnNvcj1VSW50NjQobmV4dF9jdXJzb3IpLCBkb25lPUJvb2wobmV4dF9jdXJzb3IgPT0gZW5kKSkKICAgIGZyYW1lX2RpZyAxNAogICAgZHVwCiAgICBpdG9iCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgMTIKICAgID09CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWMgMTcgLy8gMHgwMDBiCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMTMKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmxpc3RfcHJvcG9zYWxzX2Vsc2VfYm9keUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NTMKICAgIC8vIGhpZ2ggPSBvcC5iaXRsZW4od29yZCkKICAgIGZyYW1lX2RpZyA4CiAgICBiaXRsZW4KICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTU0CiAgICAvLyBwcm9wb3NhbF9pZCA9IHBhZ2Vfbm8gKiBpbmRleF9wYWdlX2JpdHMgKyB3b3JkX25vICogNjQgKyA2NCAtIGhpZ2gKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjIDQgLy8gMjA0OAogICAgKgogICAgZnJhbWVfZGlnIDkKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgICoKICAgICsKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgICsKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTU1CiAgICAvLyBpZiBwcm9wb3NhbF9pZCA+PSBlbmQ6CiAgICBmcmFtZV9kaWcgMTIKICAgID49CiAgICBieiBsaXN0X3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDE1CiAgICBmcmFtZV9kaWcgMTIKICAgIGZyYW1lX2J1cnkgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NTcKICAgIC8vIGJyZWFrCiAgICBiIGxpc3RfcHJvcG9zYWxzX2FmdGVyX3doaWxlQDE3CgpsaXN0X3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU1OAogICAgLy8gaWRzLmFwcGVuZChVSW50NjQocHJvcG9zYWxfaWQpKQogICAgZnJhbWVfZGlnIDEzCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1NTkKICAgIC8vIG5leHRfY3Vyc29yID0gcHJvcG9zYWxfaWQgKyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU2MAogICAgLy8gd29yZCA9IHdvcmQgXiBvcC5zaGwoTmF0aXZlVUludDY0KDEpLCBoaWdoIC0gMSkKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaW50Y18xIC8vIDEKICAgIHN3YXAKICAgIHNobAogICAgZnJhbWVfZGlnIDgKICAgIF4KICAgIGZyYW1lX2J1cnkgOAogICAgYiBsaXN0X3Byb3Bvc2Fsc193aGlsZV90b3BAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0Ll9vdXRjb21lX2RlY2lkZWQocHJvcG9zYWxfaWQ6IGJ5dGVzLCB2b3Rlc19mb3I6IHVpbnQ2NCwgdm90ZXNfYWdhaW5zdDogdWludDY0KSAtPiB1aW50NjQ6Cl9vdXRjb21lX2RlY2lkZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTgwLTU4MQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfb3V0Y29tZV9kZWNpZGVkKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQsIHZvdGVzX2ZvcjogTmF0aXZlVUludDY0LCB2b3Rlc19hZ2FpbnN0OiBOYXRpdmVVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAzIDEKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTgzCiAgICAvLyBlbGlnaWJsZSwgdHJhY2tlZCA9IHNlbGYuZWxpZ2libGVXZWlnaHQubWF5YmUocHJvcG9zYWxfaWQpCiAgICBieXRlYyAxMiAvLyAiZWxpZ2libGVXZWlnaHRfIgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo1ODQKICAgIC8vIGlmIG5vdCB0cmFja2VkOgogICAgYm56IF9vdXRjb21lX2RlY2lkZWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTg1CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX291dGNvbWVfZGVjaWRlZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTg2CiAgICAvLyBjYXN0ID0gdm90ZXNfZm9yICsgdm90ZXNfYWdhaW5zdAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTg3CiAgICAvLyBvdXRzdGFuZGluZyA9IGVsaWdpYmxlLm5hdGl2ZSAtIGNhc3QgaWYgZWxpZ2libGUubmF0aXZlID4gY2FzdCBlbHNlIE5hdGl2ZVVJbnQ2NCgwKQogICAgZnJhbWVfZGlnIDMKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICA8CiAgICBieiBfb3V0Y29tZV9kZWNpZGVkX3Rlcm5hcnlfZmFsc2VANAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAwCiAgICAtCiAgICBmcmFtZV9idXJ5IDEKCl9vdXRjb21lX2RlY2lkZWRfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU4OAogICAgLy8gaWYgdm90ZXNfZm9yID4gdm90ZXNfYWdhaW5zdDoKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBieiBfb3V0Y29tZV9kZWNpZGVkX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU4OQogICAgLy8gcmV0dXJuIHZvdGVzX2ZvciAtIHZvdGVzX2FnYWluc3QgPiBvdXRzdGFuZGluZwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGZyYW1lX2RpZyAxCiAgICA+CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX291dGNvbWVfZGVjaWRlZF9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NTkwCiAgICAvLyByZXR1cm4gdm90ZXNfYWdhaW5zdCAtIHZvdGVzX2ZvciA+PSBvdXRzdGFuZGluZwogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIGZyYW1lX2RpZyAxCiAgICA+PQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9vdXRjb21lX2RlY2lkZWRfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjU4NwogICAgLy8gb3V0c3RhbmRpbmcgPSBlbGlnaWJsZS5uYXRpdmUgLSBjYXN0IGlmIGVsaWdpYmxlLm5hdGl2ZSA+IGNhc3QgZWxzZSBOYXRpdmVVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgX291dGNvbWVfZGVjaWRlZF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5faWRfc2V0X3BhZ2UoZmlsdGVyX2NhdGVnb3J5OiB1aW50NjQsIGhhc2hlZF9jYXRlZ29yeTogdWludDY0LCBzdGF0dXM6IHVpbnQ2NCwgcGFnZV9ubzogdWludDY0KSAtPiBieXRlczoKX2lkX3NldF9wYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYwMi02MDUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2lkX3NldF9wYWdlKAogICAgLy8gICAgIHNlbGYsIGZpbHRlcl9jYXRlZ29yeTogYm9vbCwgaGFzaGVkX2NhdGVnb3J5OiBOYXRpdmVVSW50NjQsIHN0YXR1czogTmF0aXZlVUludDY0LCBwYWdlX25vOiBOYXRpdmVVSW50NjQKICAgIC8vICkgLT4gQnl0ZXM6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDcKICAgIC8vIHBhZ2UgPSB+b3AuYnplcm8oaW5kZXhfcGFnZV9ieXRlcykKICAgIGludGMgNiAvLyAyNTYKICAgIGJ6ZXJvCiAgICBkdXAKICAgIGJ+CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MDgKICAgIC8vIGlmIHN0YXR1cyAhPSAwOgogICAgZnJhbWVfZGlnIC0yCiAgICBieiBfaWRfc2V0X3BhZ2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjA5CiAgICAvLyBrZXkgPSBJZFNldFBhZ2VLZXkoaW5kZXg9VUludDY0KHN0YXR1cyksIHBhZ2U9VUludDY0KHBhZ2Vfbm8pKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYxMAogICAgLy8gcGFnZSA9IHBhZ2UgJiBzZWxmLnN0YXR1c0luZGV4LmdldChrZXksIGRlZmF1bHQ9b3AuYnplcm8oaW5kZXhfcGFnZV9ieXRlcykpCiAgICBieXRlYyA1IC8vICJzdGF0dXNJbmRleF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBiJgogICAgZnJhbWVfYnVyeSAyCgpfaWRfc2V0X3BhZ2VfYWZ0ZXJfaWZfZWxzZUAyOgogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MTEKICAgIC8vIGlmIGZpbHRlcl9jYXRlZ29yeToKICAgIGZyYW1lX2RpZyAtNAogICAgYnogX2lkX3NldF9wYWdlX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYxMgogICAgLy8ga2V5ID0gSWRTZXRQYWdlS2V5KGluZGV4PVVJbnQ2NChoYXNoZWRfY2F0ZWdvcnkpLCBwYWdlPVVJbnQ2NChwYWdlX25vKSkKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MTMKICAgIC8vIHBhZ2UgPSBwYWdlICYgc2VsZi5jYXRlZ29yeUluZGV4LmdldChrZXksIGRlZmF1bHQ9b3AuYnplcm8oaW5kZXhfcGFnZV9ieXRlcykpCiAgICBieXRlYyAxNiAvLyAiY2F0ZWdvcnlJbmRleF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBiJgogICAgZnJhbWVfYnVyeSAyCgpfaWRfc2V0X3BhZ2VfYWZ0ZXJfaWZfZWxzZUA0OgogICAgZnJhbWVfZGlnIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MTQKICAgIC8vIHJldHVybiBwYWdlCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LmZ1bmRfZnV0dXJlX3NlbGYocHJpbWFyeTogYnl0ZXMsIGJhY2t1cDogYnl0ZXMsIHVubG9ja190aW1lOiBieXRlcywgcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpmdW5kX2Z1dHVyZV9zZWxmOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYxNy02MjUKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIEZ1dHVyZSBTZWxmIE1ldGhvZHMgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBmdW5kX2Z1dHVyZV9zZWxmKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJpbWFyeTogQWRkcmVzcywKICAgIC8vICAgICBiYWNrdXA6IEFkZHJlc3MsCiAgICAvLyAgICAgdW5sb2NrX3RpbWU6IFVJbnQ2NCwKICAgIC8vICAgICBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjI2CiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiUGF5bWVudCBtdXN0IGdvIHRvIGNvbnRyYWN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGdvIHRvIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjI3CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPiAwLCAiTXVzdCBmdW5kIHdpdGggcG9zaXRpdmUgYW1vdW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgYXNzZXJ0IC8vIE11c3QgZnVuZCB3aXRoIHBvc2l0aXZlIGFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYyOAogICAgLy8gYXNzZXJ0IHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIsICJGdW5kaW5nIG11c3QgYmUgZnJvbSBjYWxsZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBGdW5kaW5nIG11c3QgYmUgZnJvbSBjYWxsZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MjkKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjMxCiAgICAvLyBpZHggPSBzZWxmLm5vX29mX2Z1dHVyZV9mdW5kcy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gIm5vT2ZGdXR1cmVGdW5kcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ub19vZl9mdXR1cmVfZnVuZHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjM2CiAgICAvLyBhbW91bnQ9VUludDY0KHBheW1lbnQuYW1vdW50KSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MzItNjM4CiAgICAvLyBzZWxmLmZ1dHVyZUZ1bmRzW2lkeF0gPSBGdXR1cmVGdW5kKAogICAgLy8gICAgIHByaW1hcnk9cHJpbWFyeSwKICAgIC8vICAgICBiYWNrdXA9YmFja3VwLAogICAgLy8gICAgIHVubG9ja190aW1lPXVubG9ja190aW1lLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQocGF5bWVudC5hbW91bnQpLAogICAgLy8gICAgIGNsYWltZWQ9Qm9vbChGYWxzZSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2MzcKICAgIC8vIGNsYWltZWQ9Qm9vbChGYWxzZSkKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYzMi02MzgKICAgIC8vIHNlbGYuZnV0dXJlRnVuZHNbaWR4XSA9IEZ1dHVyZUZ1bmQoCiAgICAvLyAgICAgcHJpbWFyeT1wcmltYXJ5LAogICAgLy8gICAgIGJhY2t1cD1iYWNrdXAsCiAgICAvLyAgICAgdW5sb2NrX3RpbWU9dW5sb2NrX3RpbWUsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NChwYXltZW50LmFtb3VudCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjMyCiAgICAvLyBzZWxmLmZ1dHVyZUZ1bmRzW2lkeF0gPSBGdXR1cmVGdW5kKAogICAgYnl0ZWMgMTggLy8gImZ1dHVyZUZ1bmRfIgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYzMi02MzgKICAgIC8vIHNlbGYuZnV0dXJlRnVuZHNbaWR4XSA9IEZ1dHVyZUZ1bmQoCiAgICAvLyAgICAgcHJpbWFyeT1wcmltYXJ5LAogICAgLy8gICAgIGJhY2t1cD1iYWNrdXAsCiAgICAvLyAgICAgdW5sb2NrX3RpbWU9dW5sb2NrX3RpbWUsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NChwYXltZW50LmFtb3VudCksCiAgICAvLyAgICAgY2xhaW1lZD1Cb29sKEZhbHNlKQogICAgLy8gKQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjYzOQogICAgLy8gc2VsZi5ub19vZl9mdXR1cmVfZnVuZHMudmFsdWUgPSBVSW50NjQoaWR4Lm5hdGl2ZSArIDEpCiAgICBidG9pCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgYnl0ZWMgOCAvLyAibm9PZkZ1dHVyZUZ1bmRzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LmNsYWltX2Z1dHVyZV9zZWxmKGZ1bmRfaWQ6IGJ5dGVzKSAtPiB2b2lkOgpjbGFpbV9mdXR1cmVfc2VsZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NDItNjQzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjbGFpbV9mdXR1cmVfc2VsZihzZWxmLCBmdW5kX2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NDQKICAgIC8vIGFzc2VydCBzZWxmLmltcG9ydF9zdGFnZS52YWx1ZSAhPSBpbXBvcnRfb3BlbiwgIlN0YXRlIGltcG9ydCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjQ1CiAgICAvLyBhc3NlcnQgZnVuZF9pZCBpbiBzZWxmLmZ1dHVyZUZ1bmRzLCAiRnVuZCBkb2VzIG5vdCBleGlzdCIKICAgIGJ5dGVjIDE4IC8vICJmdXR1cmVGdW5kXyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEZ1bmQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NDYKICAgIC8vIGZ1bmQgPSBzZWxmLmZ1dHVyZUZ1bmRzW2Z1bmRfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1dHVyZUZ1bmRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY0OAogICAgLy8gYXNzZXJ0IG5vdCBmdW5kLmNsYWltZWQsICJBbHJlYWR5IGNsYWltZWQiCiAgICBkdXAKICAgIHB1c2hpbnQgNjQwIC8vIDY0MAogICAgZ2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWMgNCAvLyAweDAwCiAgICA9PQogICAgYXNzZXJ0IC8vIEFscmVhZHkgY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID49IGZ1bmQudW5sb2NrX3RpbWUubmF0aXZlLCAiVG9vIGVhcmx5IHRvIGNsYWltIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZGlnIDEKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICA+PQogICAgYXNzZXJ0IC8vIFRvbyBlYXJseSB0byBjbGFpbQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gZnVuZC5wcmltYXJ5IG9yIFR4bi5zZW5kZXIgPT0gZnVuZC5iYWNrdXAsICJOb3QgYXV0aG9yaXplZCIKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBibnogY2xhaW1fZnV0dXJlX3NlbGZfYm9vbF90cnVlQDIKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJ6IGNsYWltX2Z1dHVyZV9zZWxmX2Jvb2xfZmFsc2VAMwoKY2xhaW1fZnV0dXJlX3NlbGZfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQoKY2xhaW1fZnV0dXJlX3NlbGZfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gZnVuZC5wcmltYXJ5IG9yIFR4bi5zZW5kZXIgPT0gZnVuZC5iYWNrdXAsICJOb3QgYXV0aG9yaXplZCIKICAgIGFzc2VydCAvLyBOb3QgYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY1Mi02NTYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1mdW5kLmFtb3VudC5uYXRpdmUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NTMKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NTQKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjU1CiAgICAvLyBhbW91bnQ9ZnVuZC5hbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjUyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NTItNjU2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9ZnVuZC5hbW91bnQubmF0aXZlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gZnVuZC5jbGFpbWVkID0gQm9vbChUcnVlKQogICAgcHVzaGludCA2NDAgLy8gNjQwCiAgICBpbnRjXzEgLy8gMQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjU5CiAgICAvLyBzZWxmLmZ1dHVyZUZ1bmRzW2Z1bmRfaWRdID0gZnVuZC5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmNsYWltX2Z1dHVyZV9zZWxmX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGNsYWltX2Z1dHVyZV9zZWxmX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZi5jb250cmFjdC5Qcm9wb3NhbENvbnRyYWN0LmJlZ2luX2ltcG9ydCgpIC0+IHZvaWQ6CmJlZ2luX2ltcG9ydDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NjYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IHRoZSBjcmVhdG9yIGNhbiBpbXBvcnQgc3RhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSB0aGUgY3JlYXRvciBjYW4gaW1wb3J0IHN0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjY3CiAgICAvLyBhc3NlcnQgc2VsZi5pbXBvcnRfc3RhZ2UudmFsdWUgPT0gaW1wb3J0X25ldmVyLCAiU3RhdGUgd2FzIGFscmVhZHkgaW1wb3J0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaW1wb3J0U3RhZ2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaW1wb3J0X3N0YWdlIGV4aXN0cwogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgYXNzZXJ0IC8vIFN0YXRlIHdhcyBhbHJlYWR5IGltcG9ydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjY4CiAgICAvLyBhc3NlcnQgc2VsZi5ub19vZl9wcm9wb3NhbHMudmFsdWUgPT0gMCBhbmQgc2VsZi5ub19vZl9mdXR1cmVfZnVuZHMudmFsdWUgPT0gMCwgIkFwcCBhbHJlYWR5IGhhcyBzdGF0ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJub09mUHJvcG9zYWxzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5vX29mX3Byb3Bvc2FscyBleGlzdHMKICAgIGJ5dGVjXzAgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIGJ6IGJlZ2luX2ltcG9ydF9ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJub09mRnV0dXJlRnVuZHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubm9fb2ZfZnV0dXJlX2Z1bmRzIGV4aXN0cwogICAgYnl0ZWNfMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgYnogYmVnaW5faW1wb3J0X2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKCmJlZ2luX2ltcG9ydF9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjY4CiAgICAvLyBhc3NlcnQgc2VsZi5ub19vZl9wcm9wb3NhbHMudmFsdWUgPT0gMCBhbmQgc2VsZi5ub19vZl9mdXR1cmVfZnVuZHMudmFsdWUgPT0gMCwgIkFwcCBhbHJlYWR5IGhhcyBzdGF0ZSIKICAgIGFzc2VydCAvLyBBcHAgYWxyZWFkeSBoYXMgc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NjkKICAgIC8vIHNlbGYuaW1wb3J0X3N0YWdlLnZhbHVlID0gVUludDY0KGltcG9ydF9vcGVuKQogICAgYnl0ZWNfMSAvLyAiaW1wb3J0U3RhZ2UiCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKYmVnaW5faW1wb3J0X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGJlZ2luX2ltcG9ydF9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuZmYuY29udHJhY3QuUHJvcG9zYWxDb250cmFjdC5pbXBvcnRfYm94ZXMoY2h1bmtzOiBieXRlcykgLT4gdm9pZDoKaW1wb3J0X2JveGVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY3MS02NzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGltcG9ydF9ib3hlcyhzZWxmLCBjaHVua3M6IER5bmFtaWNBcnJheVtCb3hDaHVua10pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZi9jb250cmFjdC5weTo2NzMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IHRoZSBjcmVhdG9yIGNhbiBpbXBvcnQgc3RhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSB0aGUgY3JlYXRvciBjYW4gaW1wb3J0IHN0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Njc0CiAgICAvLyBhc3NlcnQgc2VsZi5pbXBvcnRfc3RhZ2UudmFsdWUgPT0gaW1wb3J0X29wZW4sICJTdGF0ZSBpbXBvcnQgbm90IGluIHByb2dyZXNzIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImltcG9ydFN0YWdlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmltcG9ydF9zdGFnZSBleGlzdHMKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAxCiAgICBiPT0KICAgIGFzc2VydCAvLyBTdGF0ZSBpbXBvcnQgbm90IGluIHByb2dyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Njc1CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKGNodW5rcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCgppbXBvcnRfYm94ZXNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY3NQogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShjaHVua3MubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogaW1wb3J0X2JveGVzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Njc2CiAgICAvLyBjaHVuayA9IGNodW5rc1tpbmRleF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIDAKICAgIGRpZyAxCiAgICAtIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY3NwogICAgLy8gX2NyZWF0ZWQgPSBvcC5Cb3guY3JlYXRlKGNodW5rLm5hbWUubmF0aXZlLCBjaHVuay5zaXplLm5hdGl2ZSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgcHVzaGludCAxOCAvLyAxOAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDIKICAgIGludGNfMiAvLyAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY3OAogICAgLy8gb3AuQm94LnJlcGxhY2UoY2h1bmsubmFtZS5uYXRpdmUsIGNodW5rLm9mZnNldC5uYXRpdmUsIGNodW5rLmRhdGEubmF0aXZlKQogICAgZGlnIDIKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBleHRyYWN0IDIgMAogICAgYm94X3JlcGxhY2UKICAgIGIgaW1wb3J0X2JveGVzX2Zvcl9oZWFkZXJAMQoKaW1wb3J0X2JveGVzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmLmNvbnRyYWN0LlByb3Bvc2FsQ29udHJhY3QuZW5kX2ltcG9ydChub19vZl9wcm9wb3NhbHM6IGJ5dGVzLCBub19vZl9mdXR1cmVfZnVuZHM6IGJ5dGVzKSAtPiB2b2lkOgplbmRfaW1wb3J0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY4MC02ODEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGVuZF9pbXBvcnQoc2VsZiwgbm9fb2ZfcHJvcG9zYWxzOiBVSW50NjQsIG5vX29mX2Z1dHVyZV9mdW5kczogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6NjgyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSB0aGUgY3JlYXRvciBjYW4gaW1wb3J0IHN0YXRlIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGNyZWF0b3IgY2FuIGltcG9ydCBzdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY4MwogICAgLy8gYXNzZXJ0IHNlbGYuaW1wb3J0X3N0YWdlLnZhbHVlID09IGltcG9ydF9vcGVuLCAiU3RhdGUgaW1wb3J0IG5vdCBpbiBwcm9ncmVzcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpbXBvcnRTdGFnZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pbXBvcnRfc3RhZ2UgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYj09CiAgICBhc3NlcnQgLy8gU3RhdGUgaW1wb3J0IG5vdCBpbiBwcm9ncmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY4NAogICAgLy8gc2VsZi5ub19vZl9wcm9wb3NhbHMudmFsdWUgPSBub19vZl9wcm9wb3NhbHMKICAgIGJ5dGVjIDYgLy8gIm5vT2ZQcm9wb3NhbHMiCiAgICBmcmFtZV9kaWcgLTIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmYvY29udHJhY3QucHk6Njg1CiAgICAvLyBzZWxmLm5vX29mX2Z1dHVyZV9mdW5kcy52YWx1ZSA9IG5vX29mX2Z1dHVyZV9mdW5kcwogICAgYnl0ZWMgOCAvLyAibm9PZkZ1dHVyZUZ1bmRzIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmL2NvbnRyYWN0LnB5OjY4NgogICAgLy8gc2VsZi5pbXBvcnRfc3RhZ2UudmFsdWUgPSBVSW50NjQoaW1wb3J0X2VuZGVkKQogICAgYnl0ZWNfMSAvLyAiaW1wb3J0U3RhZ2UiCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1993, 3597], "errorMessage": "All milestones already completed"}, {"pc": [4411], "errorMessage": "Already claimed"}, {"pc": [1466], "errorMessage": "Amount required must be greater than 0"}, {"pc": [4517], "errorMessage": "App already has state"}, {"pc": [1473], "errorMessage": "At least one milestone is required"}, {"pc": [1115], "errorMessage": "At least one proposal is required"}, {"pc": [2314, 2804], "errorMessage": "Creator cannot vote"}, {"pc": [4390], "errorMessage": "Fund does not exist"}, {"pc": [4326], "errorMessage": "Funding must be from caller"}, {"pc": [1712], "errorMessage": "Goal already reached"}, {"pc": [1961], "errorMessage": "Goal not reached yet"}, {"pc": [1197, 1278, 1356, 1385, 1704, 1708, 1766, 1849, 1853, 1944, 1952, 1957, 2033, 2242, 2294, 2308, 2554, 2599, 2706, 2743, 2747, 2781, 2795, 2824, 3092, 3172, 3386, 3568, 3618, 3667, 3723, 4421, 4432, 4582], "errorMessage": "Index access is out of bounds"}, {"pc": [2830], "errorMessage": "Invalid vote signature"}, {"pc": [3788], "errorMessage": "Limit is too large"}, {"pc": [1477], "errorMessage": "Maximum of 5 milestones allowed"}, {"pc": [3169], "errorMessage": "Milestone already claimed"}, {"pc": [3155], "errorMessage": "Milestone not approved"}, {"pc": [4318], "errorMessage": "Must fund with positive amount"}, {"pc": [1126], "errorMessage": "Must pay exactly 2 Algos per proposal"}, {"pc": [1050], "errorMessage": "Must pay exactly 2 Algos to create a proposal"}, {"pc": [2647], "errorMessage": "No votes to tally"}, {"pc": [4442], "errorMessage": "Not authorized"}, {"pc": [340, 358, 373, 385, 400, 431, 460, 483, 498, 513, 534, 552, 570, 595, 620], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1950], "errorMessage": "Only creator can submit proof"}, {"pc": [4488, 4534, 4656], "errorMessage": "Only the creator can import state"}, {"pc": [1066, 1142], "errorMessage": "Payment must be from the proposal creator"}, {"pc": [1058, 1134, 1733], "errorMessage": "Payment must be sent to the contract address"}, {"pc": [4312], "errorMessage": "Payment must go to contract"}, {"pc": [2331, 2630, 3131], "errorMessage": "Proof is not submitted yet"}, {"pc": [3137], "errorMessage": "Proof not submitted yet"}, {"pc": [1498], "errorMessage": "Proposal description cannot be empty"}, {"pc": [1696, 1936, 2197, 2546, 3050, 3339, 3560], "errorMessage": "Proposal doesn't exist"}, {"pc": [1484], "errorMessage": "Proposal name cannot be empty"}, {"pc": [1491], "errorMessage": "Proposal title cannot be empty"}, {"pc": [2363, 2846], "errorMessage": "Should have donated more than 1 Algo to vote"}, {"pc": [1073, 1149, 1685, 1925, 2186, 2535, 3040, 3329, 4333, 4379], "errorMessage": "State import in progress"}, {"pc": [4541, 4663], "errorMessage": "State import not in progress"}, {"pc": [4495], "errorMessage": "State was already imported"}, {"pc": [4420], "errorMessage": "Too early to claim"}, {"pc": [1461], "errorMessage": "Total milestone amount must equal the required amount"}, {"pc": [2785], "errorMessage": "Voter has already voted for this milestone"}, {"pc": [2841], "errorMessage": "Voter has not donated to this proposal"}, {"pc": [2756], "errorMessage": "Voters must be in increasing order"}, {"pc": [2560], "errorMessage": "Votes are not for the current milestone"}, {"pc": [2342, 2638], "errorMessage": "Voting period has ended"}, {"pc": [3144], "errorMessage": "Voting period not ended yet"}, {"pc": [2298], "errorMessage": "You have already voted for this milestone"}, {"pc": [2356, 3428], "errorMessage": "You have not donated to this proposal"}, {"pc": [665], "errorMessage": "can only call when creating"}, {"pc": [343, 361, 376, 388, 403, 434, 463, 486, 501, 516, 537, 555, 573, 598, 623], "errorMessage": "can only call when not creating"}, {"pc": [1901, 2358, 3433], "errorMessage": "check self.donations entry exists"}, {"pc": [4396], "errorMessage": "check self.futureFunds entry exists"}, {"pc": [1070, 1146, 1682, 1922, 2183, 2532, 3037, 3326, 4330, 4376, 4492, 4538, 4660], "errorMessage": "check self.import_stage exists"}, {"pc": [2269, 2663, 3645], "errorMessage": "check self.milestoneVotes entry exists"}, {"pc": [4338, 4510], "errorMessage": "check self.no_of_future_funds exists"}, {"pc": [1078, 1162, 3793, 4500], "errorMessage": "check self.no_of_proposals exists"}, {"pc": [1702, 1942, 2203, 2468, 2552, 2995, 3053, 3202, 3245, 3345, 3566], "errorMessage": "check self.proposals entry exists"}, {"pc": [422, 586, 611, 651], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+
+
+@functools.cache
+def _app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -64,6 +76,27 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class Milestone:
+    """Struct for Milestone"""
+    name: str
+    amount: int
+    proof_link: str
+    votes_for: int
+    votes_against: int
+    total_voters: int
+    claimed: bool
+    proof_submitted_time: int
+    voting_end_time: int
+
+@dataclasses.dataclass(frozen=True)
+class CurrentMilestone:
+    """Struct for CurrentMilestone"""
+    index: int
+    milestone: Milestone
+    has_voted: bool
+    vote_weight: int
+
 @dataclasses.dataclass(frozen=True)
 class DonationBoxKey:
     """Struct for DonationBoxKey"""
@@ -79,6 +112,12 @@ class FutureFund:
     amount: int
     claimed: bool
 
+@dataclasses.dataclass(frozen=True)
+class IdSetPageKey:
+    """Struct for IdSetPageKey"""
+    index: int
+    page: int
+
 @dataclasses.dataclass(frozen=True)
 class Proposal:
     """Struct for Proposal"""
@@ -95,6 +134,13 @@ class Proposal:
     current_milestone: int
     created_at: int
 
+@dataclasses.dataclass(frozen=True)
+class ProposalIdPage:
+    """Struct for ProposalIdPage"""
+    ids: list[int]
+    next_cursor: int
+    done: bool
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateProposalArgs:
@@ -111,6 +157,16 @@ class CreateProposalArgs:
     def abi_method_signature(self) -> str:
         return "create_proposal(string,string,string,string,uint64,(string,uint64)[],pay)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateProposalsArgs:
+    """Dataclass for create_proposals arguments"""
+    proposals: list[tuple[str, str, str, str, int, list[tuple[str, int]]]]
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class DonateProposalArgs:
     """Dataclass for donate_proposal arguments"""
@@ -141,6 +197,17 @@ class VoteMilestoneArgs:
     def abi_method_signature(self) -> str:
         return "vote_milestone(uint64,bool)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteMilestoneBatchArgs:
+    """Dataclass for vote_milestone_batch arguments"""
+    proposal_id: int
+    milestone_index: int
+    votes: list[tuple[str, bool, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ClaimMilestoneArgs:
     """Dataclass for claim_milestone arguments"""
@@ -159,6 +226,28 @@ class RefundIfInactiveArgs:
     def abi_method_signature(self) -> str:
         return "refund_if_inactive(uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCurrentMilestoneArgs:
+    """Dataclass for get_current_milestone arguments"""
+    proposal_id: int
+    voter: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ListProposalsArgs:
+    """Dataclass for list_proposals arguments"""
+    category: str
+    status: int
+    cursor: int
+    limit: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class FundFutureSelfArgs:
     """Dataclass for fund_future_self arguments"""
@@ -180,6 +269,25 @@ class ClaimFutureSelfArgs:
     def abi_method_signature(self) -> str:
         return "claim_future_self(uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ImportBoxesArgs:
+    """Dataclass for import_boxes arguments"""
+    chunks: list[tuple[bytes | str, int, int, bytes | str]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "import_boxes((byte[],uint64,uint64,byte[])[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class EndImportArgs:
+    """Dataclass for end_import arguments"""
+    no_of_proposals: int
+    no_of_future_funds: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "end_import(uint64,uint64)void"
+
 
 class ProposalContractParams:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -198,6 +306,19 @@ class ProposalContractParams:
             "args": method_args,
         }))
 
+    def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void",
+            "args": method_args,
+        }))
+
     def donate_proposal(
         self,
         args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
@@ -237,6 +358,19 @@ class ProposalContractParams:
             "args": method_args,
         }))
 
+    def vote_milestone_batch(
+        self,
+        args: tuple[int, int, list[tuple[str, bool, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | VoteMilestoneBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void",
+            "args": method_args,
+        }))
+
     def claim_milestone(
         self,
         args: tuple[int] | ClaimMilestoneArgs,
@@ -263,6 +397,32 @@ class ProposalContractParams:
             "args": method_args,
         }))
 
+    def get_current_milestone(
+        self,
+        args: tuple[int, str] | GetCurrentMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)",
+            "args": method_args,
+        }))
+
+    def list_proposals(
+        self,
+        args: tuple[str, int, int, int] | ListProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)",
+            "args": method_args,
+        }))
+
     def fund_future_self(
         self,
         args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
@@ -289,6 +449,43 @@ class ProposalContractParams:
             "args": method_args,
         }))
 
+    def begin_import(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "begin_import()void",
+        }))
+
+    def import_boxes(
+        self,
+        args: tuple[list[tuple[bytes | str, int, int, bytes | str]]] | ImportBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_boxes((byte[],uint64,uint64,byte[])[])void",
+            "args": method_args,
+        }))
+
+    def end_import(
+        self,
+        args: tuple[int, int] | EndImportArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "end_import(uint64,uint64)void",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -317,6 +514,19 @@ class ProposalContractCreateTransactionParams:
             "args": method_args,
         }))
 
+    def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void",
+            "args": method_args,
+        }))
+
     def donate_proposal(
         self,
         args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
@@ -356,6 +566,19 @@ class ProposalContractCreateTransactionParams:
             "args": method_args,
         }))
 
+    def vote_milestone_batch(
+        self,
+        args: tuple[int, int, list[tuple[str, bool, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | VoteMilestoneBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void",
+            "args": method_args,
+        }))
+
     def claim_milestone(
         self,
         args: tuple[int] | ClaimMilestoneArgs,
@@ -382,6 +605,32 @@ class ProposalContractCreateTransactionParams:
             "args": method_args,
         }))
 
+    def get_current_milestone(
+        self,
+        args: tuple[int, str] | GetCurrentMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)",
+            "args": method_args,
+        }))
+
+    def list_proposals(
+        self,
+        args: tuple[str, int, int, int] | ListProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)",
+            "args": method_args,
+        }))
+
     def fund_future_self(
         self,
         args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
@@ -408,6 +657,43 @@ class ProposalContractCreateTransactionParams:
             "args": method_args,
         }))
 
+    def begin_import(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "begin_import()void",
+        }))
+
+    def import_boxes(
+        self,
+        args: tuple[list[tuple[bytes | str, int, int, bytes | str]]] | ImportBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_boxes((byte[],uint64,uint64,byte[])[])void",
+            "args": method_args,
+        }))
+
+    def end_import(
+        self,
+        args: tuple[int, int] | EndImportArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "end_import(uint64,uint64)void",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -439,6 +725,22 @@ class ProposalContractSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def donate_proposal(
         self,
         args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
@@ -487,6 +789,22 @@ class ProposalContractSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def vote_milestone_batch(
+        self,
+        args: tuple[int, int, list[tuple[str, bool, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | VoteMilestoneBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def claim_milestone(
         self,
         args: tuple[int] | ClaimMilestoneArgs,
@@ -519,6 +837,38 @@ class ProposalContractSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def get_current_milestone(
+        self,
+        args: tuple[int, str] | GetCurrentMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CurrentMilestone]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CurrentMilestone, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CurrentMilestone], parsed_response)
+
+    def list_proposals(
+        self,
+        args: tuple[str, int, int, int] | ListProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[ProposalIdPage]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ProposalIdPage, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[ProposalIdPage], parsed_response)
+
     def fund_future_self(
         self,
         args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
@@ -551,6 +901,52 @@ class ProposalContractSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def begin_import(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "begin_import()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def import_boxes(
+        self,
+        args: tuple[list[tuple[bytes | str, int, int, bytes | str]]] | ImportBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "import_boxes((byte[],uint64,uint64,byte[])[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def end_import(
+        self,
+        args: tuple[int, int] | EndImportArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "end_import(uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -566,6 +962,7 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     no_of_proposals: int
     no_of_future_funds: int
+    import_stage: int
 
 class ProposalContractState:
     """Methods to access state for the current ProposalContract app"""
@@ -626,6 +1023,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def import_stage(self) -> int:
+        """Get the current value of the import_stage key in global_state state"""
+        value = self.app_client.state.global_state.get_value("import_stage")
+        if isinstance(value, dict) and "uint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _BoxState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -671,11 +1076,20 @@ class _BoxState:
         )
 
     @property
-    def donations(self) -> "_MapState[DonationBoxKey, int]":
-        """Get values from the donations map in box state"""
+    def donations(self) -> "_MapState[DonationBoxKey, int]":
+        """Get values from the donations map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "donations",
+            None
+        )
+
+    @property
+    def eligible_weight(self) -> "_MapState[int, int]":
+        """Get values from the eligibleWeight map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "donations",
+            "eligibleWeight",
             None
         )
 
@@ -688,6 +1102,24 @@ class _BoxState:
             self._struct_classes.get("FutureFund")
         )
 
+    @property
+    def status_index(self) -> "_MapState[IdSetPageKey, bytes]":
+        """Get values from the statusIndex map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "statusIndex",
+            None
+        )
+
+    @property
+    def category_index(self) -> "_MapState[IdSetPageKey, bytes]":
+        """Get values from the categoryIndex map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "categoryIndex",
+            None
+        )
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -760,7 +1192,7 @@ class ProposalContractClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -793,7 +1225,7 @@ class ProposalContractClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -815,7 +1247,7 @@ class ProposalContractClient:
     ) -> "ProposalContractClient":
         return ProposalContractClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -873,6 +1305,12 @@ class ProposalContractClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["donate_proposal(uint64,pay)void"],
@@ -891,6 +1329,12 @@ class ProposalContractClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["claim_milestone(uint64)void"],
@@ -903,6 +1347,18 @@ class ProposalContractClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CurrentMilestone | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> ProposalIdPage | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["fund_future_self(address,address,uint64,pay)void"],
@@ -915,6 +1371,24 @@ class ProposalContractClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["begin_import()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["import_boxes((byte[],uint64,uint64,byte[])[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["end_import(uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -925,7 +1399,7 @@ class ProposalContractClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | CurrentMilestone | None | ProposalIdPage:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -968,7 +1442,7 @@ class ProposalContractFactory(algokit_utils.TypedAppFactoryProtocol[ProposalCont
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1116,6 +1590,26 @@ class ProposalContractFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def donate_proposal(
         self,
         args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
@@ -1176,6 +1670,26 @@ class ProposalContractFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def vote_milestone_batch(
+        self,
+        args: tuple[int, int, list[tuple[str, bool, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | VoteMilestoneBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def claim_milestone(
         self,
         args: tuple[int] | ClaimMilestoneArgs,
@@ -1216,6 +1730,46 @@ class ProposalContractFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_current_milestone(
+        self,
+        args: tuple[int, str] | GetCurrentMilestoneArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def list_proposals(
+        self,
+        args: tuple[str, int, int, int] | ListProposalsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def fund_future_self(
         self,
         args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
@@ -1256,6 +1810,65 @@ class ProposalContractFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def begin_import(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the begin_import()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "begin_import()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def import_boxes(
+        self,
+        args: tuple[list[tuple[bytes | str, int, int, bytes | str]]] | ImportBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the import_boxes((byte[],uint64,uint64,byte[])[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "import_boxes((byte[],uint64,uint64,byte[])[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def end_import(
+        self,
+        args: tuple[int, int] | EndImportArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the end_import(uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "end_import(uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class ProposalContractFactoryUpdateParams:
     """Parameters for 'update' operations of ProposalContract contract"""
 
@@ -1375,6 +1988,24 @@ class ProposalContractComposer:
         )
         return self
 
+    def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_proposals(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_proposals((string,string,string,string,uint64,(string,uint64)[])[],pay)void", v
+            )
+        )
+        return self
+
     def donate_proposal(
         self,
         args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
@@ -1429,6 +2060,24 @@ class ProposalContractComposer:
         )
         return self
 
+    def vote_milestone_batch(
+        self,
+        args: tuple[int, int, list[tuple[str, bool, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | VoteMilestoneBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_milestone_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_milestone_batch(uint64,uint64,(address,bool,byte[64])[])void", v
+            )
+        )
+        return self
+
     def claim_milestone(
         self,
         args: tuple[int] | ClaimMilestoneArgs,
@@ -1465,6 +2114,42 @@ class ProposalContractComposer:
         )
         return self
 
+    def get_current_milestone(
+        self,
+        args: tuple[int, str] | GetCurrentMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_current_milestone(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_current_milestone(uint64,address)(uint64,(string,uint64,string,uint64,uint64,uint64,bool,uint64,uint64),bool,uint64)", v
+            )
+        )
+        return self
+
+    def list_proposals(
+        self,
+        args: tuple[str, int, int, int] | ListProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.list_proposals(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "list_proposals(string,uint64,uint64,uint64)(uint64[],uint64,bool)", v
+            )
+        )
+        return self
+
     def fund_future_self(
         self,
         args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
@@ -1501,6 +2186,59 @@ class ProposalContractComposer:
         )
         return self
 
+    def begin_import(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.begin_import(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "begin_import()void", v
+            )
+        )
+        return self
+
+    def import_boxes(
+        self,
+        args: tuple[list[tuple[bytes | str, int, int, bytes | str]]] | ImportBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.import_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "import_boxes((byte[],uint64,uint64,byte[])[])void", v
+            )
+        )
+        return self
+
+    def end_import(
+        self,
+        args: tuple[int, int] | EndImportArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.end_import(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "end_import(uint64,uint64)void", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
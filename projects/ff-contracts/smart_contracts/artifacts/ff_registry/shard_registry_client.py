@@ -0,0 +1,1000 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import functools
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "app_id"}], "name": "add_shard", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_shards", "returns": {"type": "uint64[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "global_id"}], "name": "shard_for", "returns": {"type": "(uint64,uint64)", "struct": "ShardLocation"}, "desc": "The shard holding `global_id`, and the ID it has in that shard.", "events": [], "readonly": true, "recommendations": {}}], "name": "ShardRegistry", "state": {"keys": {"box": {}, "global": {"no_of_shards": {"key": "bm9PZlNoYXJkcw==", "keyType": "AVMString", "valueType": "uint64"}}, "local": {}}, "maps": {"box": {"shards": {"keyType": "uint64", "valueType": "uint64", "prefix": "c2hhcmRz"}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"ShardLocation": [{"name": "app_id", "type": "uint64"}, {"name": "local_id", "type": "uint64"}]}, "byteCode": {"approval": "CiADAQCAgICAECYDCm5vT2ZTaGFyZHMEFR98dQZzaGFyZHMxGEAADCiACAAAAAAAAAAAZzEbQQBUggMEajvREARxKgK1BBGLfsQ2GgCOAwAlABUAAiNDMRkURDEYRDYaAYgAlSlMULAiQzEZFEQxGESIAEopTFCwIkMxGRREMRhENhoBiAARKUxQsCJDMRlA/8MxGBREIkOKAQExADIJEkSL/xdEIyhlREkXSYFADEQqSwJQi/+/IggWKExniYoAAYACAAAjKGVEFyOLAosBDEEAJYsAVwIAiwJJTgIWKkxQvkRQSRWBCAoWVwYCTFCMACIIjAJC/9OJigEBi/8XSSQKIyhlRBdLAQ1EFipMUL5ETCQYFlCJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuZmZfcmVnaXN0cnkuY29udHJhY3QuU2hhcmRSZWdpc3RyeS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgNDI5NDk2NzI5NgogICAgYnl0ZWNibG9jayAibm9PZlNoYXJkcyIgMHgxNTFmN2M3NSAic2hhcmRzIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwCiAgICAvLyBzZWxmLm5vX29mX3NoYXJkcyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSwga2V5PSJub09mU2hhcmRzIikKICAgIGJ5dGVjXzAgLy8gIm5vT2ZTaGFyZHMiCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MTctMTgKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgU2hhcmRSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDgKICAgIHB1c2hieXRlc3MgMHg2YTNiZDExMCAweDcxMmEwMmI1IDB4MTE4YjdlYzQgLy8gbWV0aG9kICJhZGRfc2hhcmQodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3NoYXJkcygpdWludDY0W10iLCBtZXRob2QgInNoYXJkX2Zvcih1aW50NjQpKHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9hZGRfc2hhcmRfcm91dGVANSBtYWluX2dldF9zaGFyZHNfcm91dGVANiBtYWluX3NoYXJkX2Zvcl9yb3V0ZUA3CgptYWluX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MTctMTgKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgU2hhcmRSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl9zaGFyZF9mb3Jfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTo0MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MTctMTgKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tIENvbnRyYWN0IC0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gY2xhc3MgU2hhcmRSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIHNoYXJkX2ZvcgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfc2hhcmRzX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MzUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfc2hhcmRzCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2FkZF9zaGFyZF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3LTE4CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLSBDb250cmFjdCAtLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIGNsYXNzIFNoYXJkUmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weToyNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF9zaGFyZAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weToxNy0xOAogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0gQ29udHJhY3QgLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBjbGFzcyBTaGFyZFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDEwCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZl9yZWdpc3RyeS5jb250cmFjdC5TaGFyZFJlZ2lzdHJ5LmFkZF9zaGFyZChhcHBfaWQ6IGJ5dGVzKSAtPiBieXRlczoKYWRkX3NoYXJkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0LTI1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfc2hhcmQoc2VsZiwgYXBwX2lkOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSB0aGUgcmVnaXN0cnkgY3JlYXRvciBjYW4gYWRkIHNoYXJkcyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSByZWdpc3RyeSBjcmVhdG9yIGNhbiBhZGQgc2hhcmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MjcKICAgIC8vIGFzc2VydCBhcHBfaWQubmF0aXZlICE9IDAsICJTaGFyZCBhcHAgSUQgY2Fubm90IGJlIDAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGFzc2VydCAvLyBTaGFyZCBhcHAgSUQgY2Fubm90IGJlIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weToyOAogICAgLy8gaWR4ID0gc2VsZi5ub19vZl9zaGFyZHMudmFsdWUKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJub09mU2hhcmRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5vX29mX3NoYXJkcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weToyOQogICAgLy8gYXNzZXJ0IGlkeC5uYXRpdmUgPCBtYXhfc2hhcmRzLCAiTWF4aW11bSBvZiA2NCBzaGFyZHMgYWxsb3dlZCIKICAgIGR1cAogICAgYnRvaQogICAgZHVwCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICA8CiAgICBhc3NlcnQgLy8gTWF4aW11bSBvZiA2NCBzaGFyZHMgYWxsb3dlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxCiAgICAvLyBzZWxmLnNoYXJkc1tpZHhdID0gYXBwX2lkCiAgICBieXRlY18yIC8vICJzaGFyZHMiCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTozMgogICAgLy8gc2VsZi5ub19vZl9zaGFyZHMudmFsdWUgPSBVSW50NjQoaWR4Lm5hdGl2ZSArIDEpCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAibm9PZlNoYXJkcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MzMKICAgIC8vIHJldHVybiBpZHgKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mZl9yZWdpc3RyeS5jb250cmFjdC5TaGFyZFJlZ2lzdHJ5LmdldF9zaGFyZHMoKSAtPiBieXRlczoKZ2V0X3NoYXJkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTozNS0zNgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9zaGFyZHMoc2VsZikgLT4gRHluYW1pY0FycmF5W1VJbnQ2NF06CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTozNwogICAgLy8gc2hhcmRzID0gRHluYW1pY0FycmF5W1VJbnQ2NF0oKQogICAgcHVzaGJ5dGVzIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHNlbGYubm9fb2Zfc2hhcmRzLnZhbHVlLm5hdGl2ZSk6CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAibm9PZlNoYXJkcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ub19vZl9zaGFyZHMgZXhpc3RzCiAgICBidG9pCiAgICBpbnRjXzEgLy8gMAoKZ2V0X3NoYXJkc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6MzgKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2Uoc2VsZi5ub19vZl9zaGFyZHMudmFsdWUubmF0aXZlKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogZ2V0X3NoYXJkc19hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5CiAgICAvLyBzaGFyZHMuYXBwZW5kKHNlbGYuc2hhcmRzW1VJbnQ2NChpbmRleCldKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdG9iCiAgICBieXRlY18yIC8vICJzaGFyZHMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNoYXJkcyBlbnRyeSBleGlzdHMKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTozOAogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShzZWxmLm5vX29mX3NoYXJkcy52YWx1ZS5uYXRpdmUpOgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBnZXRfc2hhcmRzX2Zvcl9oZWFkZXJAMQoKZ2V0X3NoYXJkc19hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTo0MAogICAgLy8gcmV0dXJuIHNoYXJkcwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZmX3JlZ2lzdHJ5LmNvbnRyYWN0LlNoYXJkUmVnaXN0cnkuc2hhcmRfZm9yKGdsb2JhbF9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpzaGFyZF9mb3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZmZfcmVnaXN0cnkvY29udHJhY3QucHk6NDItNDMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBzaGFyZF9mb3Ioc2VsZiwgZ2xvYmFsX2lkOiBVSW50NjQpIC0+IFNoYXJkTG9jYXRpb246CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTo0NQogICAgLy8gaW5kZXggPSBnbG9iYWxfaWQubmF0aXZlIC8vIHNoYXJkX2lkX3JhbmdlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgaW50Y18yIC8vIDQyOTQ5NjcyOTYKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTo0NgogICAgLy8gYXNzZXJ0IGluZGV4IDwgc2VsZi5ub19vZl9zaGFyZHMudmFsdWUubmF0aXZlLCAiTm8gc2hhcmQgaG9sZHMgdGhpcyBJRCIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJub09mU2hhcmRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5vX29mX3NoYXJkcyBleGlzdHMKICAgIGJ0b2kKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gTm8gc2hhcmQgaG9sZHMgdGhpcyBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBhcHBfaWQ9c2VsZi5zaGFyZHNbVUludDY0KGluZGV4KV0sCiAgICBpdG9iCiAgICBieXRlY18yIC8vICJzaGFyZHMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNoYXJkcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mZl9yZWdpc3RyeS9jb250cmFjdC5weTo0OQogICAgLy8gbG9jYWxfaWQ9VUludDY0KGdsb2JhbF9pZC5uYXRpdmUgJSBzaGFyZF9pZF9yYW5nZSksCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gNDI5NDk2NzI5NgogICAgJQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2ZmX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3LTUwCiAgICAvLyByZXR1cm4gU2hhcmRMb2NhdGlvbigKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5zaGFyZHNbVUludDY0KGluZGV4KV0sCiAgICAvLyAgICAgbG9jYWxfaWQ9VUludDY0KGdsb2JhbF9pZC5uYXRpdmUgJSBzaGFyZF9pZF9yYW5nZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [175], "errorMessage": "Maximum of 64 shards allowed"}, {"pc": [266], "errorMessage": "No shard holds this ID"}, {"pc": [90, 109, 125], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [160], "errorMessage": "Only the registry creator can add shards"}, {"pc": [164], "errorMessage": "Shard app ID cannot be 0"}, {"pc": [149], "errorMessage": "can only call when creating"}, {"pc": [93, 112, 128], "errorMessage": "can only call when not creating"}, {"pc": [168, 200, 261], "errorMessage": "check self.no_of_shards exists"}, {"pc": [226, 272], "errorMessage": "check self.shards entry exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+
+
+@functools.cache
+def _app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class ShardLocation:
+    """Struct for ShardLocation"""
+    app_id: int
+    local_id: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AddShardArgs:
+    """Dataclass for add_shard arguments"""
+    app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "add_shard(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ShardForArgs:
+    """Dataclass for shard_for arguments"""
+    global_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "shard_for(uint64)(uint64,uint64)"
+
+
+class ShardRegistryParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def add_shard(
+        self,
+        args: tuple[int] | AddShardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_shard(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_shards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_shards()uint64[]",
+        }))
+
+    def shard_for(
+        self,
+        args: tuple[int] | ShardForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "shard_for(uint64)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class ShardRegistryCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def add_shard(
+        self,
+        args: tuple[int] | AddShardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_shard(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_shards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_shards()uint64[]",
+        }))
+
+    def shard_for(
+        self,
+        args: tuple[int] | ShardForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "shard_for(uint64)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class ShardRegistrySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def add_shard(
+        self,
+        args: tuple[int] | AddShardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_shard(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_shards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_shards()uint64[]",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def shard_for(
+        self,
+        args: tuple[int] | ShardForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[ShardLocation]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "shard_for(uint64)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ShardLocation, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[ShardLocation], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    no_of_shards: int
+
+class ShardRegistryState:
+    """Methods to access state for the current ShardRegistry app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def no_of_shards(self) -> int:
+        """Get the current value of the no_of_shards key in global_state state"""
+        value = self.app_client.state.global_state.get_value("no_of_shards")
+        if isinstance(value, dict) and "uint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def shards(self) -> "_MapState[int, int]":
+        """Get values from the shards map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "shards",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class ShardRegistryClient:
+    """Client for interacting with ShardRegistry smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=_app_spec(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = ShardRegistryParams(self.app_client)
+        self.create_transaction = ShardRegistryCreateTransactionParams(self.app_client)
+        self.send = ShardRegistrySend(self.app_client)
+        self.state = ShardRegistryState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "ShardRegistryClient":
+        return ShardRegistryClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=_app_spec(),
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "ShardRegistryClient":
+        return ShardRegistryClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=_app_spec(),
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "ShardRegistryClient":
+        return ShardRegistryClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "ShardRegistryComposer":
+        return ShardRegistryComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["add_shard(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_shards()uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["shard_for(uint64)(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> ShardLocation | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | ShardLocation | int | list[int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class ShardRegistryBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating ShardRegistry contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class ShardRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ShardRegistryBareCallCreateParams, None, None]):
+    """Factory for deploying and managing ShardRegistryClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=_app_spec(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = ShardRegistryFactoryParams(self.app_factory)
+        self.create_transaction = ShardRegistryFactoryCreateTransaction(self.app_factory)
+        self.send = ShardRegistryFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: ShardRegistryBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[ShardRegistryClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return ShardRegistryClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> ShardRegistryClient:
+        """Get an app client by creator address and name"""
+        return ShardRegistryClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> ShardRegistryClient:
+        """Get an app client by app ID"""
+        return ShardRegistryClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class ShardRegistryFactoryParams:
+    """Parameters for creating transactions for ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ShardRegistryFactoryCreateParams(app_factory)
+        self.update = ShardRegistryFactoryUpdateParams(app_factory)
+        self.delete = ShardRegistryFactoryDeleteParams(app_factory)
+
+class ShardRegistryFactoryCreateParams:
+    """Parameters for 'create' operations of ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def add_shard(
+        self,
+        args: tuple[int] | AddShardArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the add_shard(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "add_shard(uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_shards(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_shards()uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_shards()uint64[]",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def shard_for(
+        self,
+        args: tuple[int] | ShardForArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the shard_for(uint64)(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "shard_for(uint64)(uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class ShardRegistryFactoryUpdateParams:
+    """Parameters for 'update' operations of ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class ShardRegistryFactoryDeleteParams:
+    """Parameters for 'delete' operations of ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class ShardRegistryFactoryCreateTransaction:
+    """Create transactions for ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ShardRegistryFactoryCreateTransactionCreate(app_factory)
+
+
+class ShardRegistryFactoryCreateTransactionCreate:
+    """Create new instances of ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class ShardRegistryFactorySend:
+    """Send calls to ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ShardRegistryFactorySendCreate(app_factory)
+
+
+class ShardRegistryFactorySendCreate:
+    """Send create calls to ShardRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[ShardRegistryClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return ShardRegistryClient(result[0]), result[1]
+
+
+class ShardRegistryComposer:
+    """Composer for creating transaction groups for ShardRegistry contract calls"""
+
+    def __init__(self, client: "ShardRegistryClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def add_shard(
+        self,
+        args: tuple[int] | AddShardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ShardRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.add_shard(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "add_shard(uint64)uint64", v
+            )
+        )
+        return self
+
+    def get_shards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ShardRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_shards(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_shards()uint64[]", v
+            )
+        )
+        return self
+
+    def shard_for(
+        self,
+        args: tuple[int] | ShardForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ShardRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.shard_for(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "shard_for(uint64)(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "ShardRegistryComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "ShardRegistryComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,637 @@
+import asyncio
+import base64
+import dataclasses
+import logging
+import time
+import typing
+
+import algokit_utils
+import httpx
+from algosdk import encoding, error, transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from smart_contracts.artifacts.ff.proposal_contract_client import (
+    ClaimFutureSelfArgs,
+    ClaimMilestoneArgs,
+    CreateProposalArgs,
+    CreateProposalsArgs,
+    DonateProposalArgs,
+    FundFutureSelfArgs,
+    ProposalContractClient,
+    RefundIfInactiveArgs,
+    SubmitProofArgs,
+    VoteMilestoneArgs,
+)
+from smart_contracts.ff.boxes import method_box_references
+
+logger = logging.getLogger(__name__)
+
+# Global state keys that hold the next free ID for methods that create a box
+_NEXT_ID_KEYS = {
+    "create_proposal": b"noOfProposals",
+    "create_proposals": b"noOfProposals",
+    "fund_future_self": b"noOfFutureFunds",
+}
+
+# Suggested params are reused for at most this long when no new round has been seen
+_PARAMS_MAX_AGE = 3.0
+
+_ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+class AsyncAlgod:
+    """
+    Minimal asyncio algod client that shares one HTTP session for every request.
+    Only covers the endpoints needed to submit groups, watch for confirmations and read boxes.
+    """
+
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str,
+        headers: dict[str, str] | None = None,
+        *,
+        timeout: float = 30,
+    ) -> None:
+        self._session = httpx.AsyncClient(
+            base_url=algod_address.rstrip("/") + "/v2",
+            headers={"X-Algo-API-Token": algod_token, **(headers or {})},
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def from_algorand(algorand: algokit_utils.AlgorandClient) -> "AsyncAlgod":
+        algod = algorand.client.algod
+        return AsyncAlgod(algod.algod_address, algod.algod_token, algod.headers)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None = None,
+        params: dict[str, typing.Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, typing.Any]:
+        headers = {"Content-Type": "application/x-binary"} if content is not None else None
+        kwargs: dict[str, typing.Any] = {"content": content, "headers": headers, "params": params}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        response = await self._session.request(method, path, **kwargs)
+        if response.is_error:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            raise error.AlgodHTTPError(
+                body.get("message", response.text), response.status_code, body.get("data")
+            )
+        return response.json() if response.content else {}
+
+    async def status(self) -> dict[str, typing.Any]:
+        return await self._request("GET", "/status")
+
+    async def status_after_block(self, round_num: int) -> dict[str, typing.Any]:
+        # algod holds this request open for up to a minute waiting for the next block
+        return await self._request(
+            "GET", f"/status/wait-for-block-after/{round_num}", timeout=70
+        )
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        res = await self._request("GET", "/transactions/params")
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            False,
+            res["consensus-version"],
+            res["min-fee"],
+        )
+
+    async def send_raw_transaction(self, txn_bytes: bytes) -> str:
+        res = await self._request("POST", "/transactions", content=txn_bytes)
+        return typing.cast(str, res["txId"])
+
+    async def pending_transaction_info(self, tx_id: str) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/transactions/pending/{tx_id}")
+
+    async def pending_transaction_count(self) -> int:
+        res = await self._request("GET", "/transactions/pending?max=1")
+        return typing.cast(int, res.get("total-transactions", 0))
+
+    async def block_txids(self, round_num: int) -> list[str]:
+        res = await self._request("GET", f"/blocks/{round_num}/txids")
+        return typing.cast(list[str], res.get("blockTxids") or [])
+
+    async def application_info(self, app_id: int) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/applications/{app_id}")
+
+    async def application_boxes(self, app_id: int) -> list[bytes]:
+        """Names of every box the app holds."""
+        res = await self._request("GET", f"/applications/{app_id}/boxes")
+        return [base64.b64decode(box["name"]) for box in res.get("boxes", [])]
+
+    async def application_box_by_name(self, app_id: int, name: bytes) -> dict[str, typing.Any]:
+        """The box's value, with `name` and `value` decoded to bytes and the `round` it was read at."""
+        res = await self._request(
+            "GET",
+            f"/applications/{app_id}/box",
+            params={"name": "b64:" + base64.b64encode(name).decode()},
+        )
+        return {**res, "name": name, "value": base64.b64decode(res["value"])}
+
+    async def aclose(self) -> None:
+        await self._session.aclose()
+
+
+async def fetch_boxes(
+    algod: AsyncAlgod, app_id: int, names: typing.Iterable[bytes], *, concurrency: int = 32
+) -> typing.AsyncIterator[dict[str, typing.Any]]:
+    """
+    Fetches boxes with at most `concurrency` requests in flight, yielding each as it
+    arrives (not in `names` order). Boxes that no longer exist are skipped.
+    """
+    names = iter(names)
+    in_flight: set[asyncio.Task[dict[str, typing.Any]]] = set()
+
+    def top_up() -> None:
+        for name in names:
+            in_flight.add(asyncio.create_task(algod.application_box_by_name(app_id, name)))
+            if len(in_flight) >= concurrency:
+                return
+
+    top_up()
+    while in_flight:
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        in_flight.difference_update(done)
+        top_up()
+        for task in done:
+            try:
+                yield task.result()
+            except error.AlgodHTTPError as ex:
+                if ex.code != 404:
+                    raise
+
+
+class ConfirmationWatcher:
+    """
+    Resolves confirmation futures for any number of pending transactions by
+    following the chain one round at a time and checking each block's txids once,
+    instead of polling every pending transaction individually.
+    """
+
+    def __init__(self, algod: AsyncAlgod) -> None:
+        self._algod = algod
+        self._pending: dict[str, tuple[asyncio.Future[int], int, int]] = {}
+        self._task: asyncio.Task[None] | None = None
+        # Highest round whose txids have been checked against the pending transactions
+        self._checked_round = 0
+        self.last_round: int = 0
+
+    def watch(
+        self, tx_id: str, first_valid_round: int, last_valid_round: int
+    ) -> "asyncio.Future[int]":
+        """
+        Returns a future that resolves to the round `tx_id` was confirmed in. Call this
+        before sending the transaction so a quick confirmation can't be missed.
+        """
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._pending[tx_id] = (future, first_valid_round, last_valid_round)
+        if self._task is None or self._task.done():
+            self._checked_round = first_valid_round - 1
+            self._task = asyncio.create_task(self._run())
+        else:
+            # The transaction may already have landed in a round that was checked before it was watched
+            self._checked_round = min(self._checked_round, first_valid_round - 1)
+        return future
+
+    def unwatch(self, tx_id: str) -> None:
+        """Stops watching a transaction that was never sent."""
+        entry = self._pending.pop(tx_id, None)
+        if entry:
+            entry[0].cancel()
+
+    async def _run(self) -> None:
+        try:
+            self.last_round = (await self._algod.status())["last-round"]
+            while self._pending:
+                while self._pending and self._checked_round < self.last_round:
+                    # Claimed before fetching so a watch registered meanwhile can lower it again
+                    self._checked_round += 1
+                    round_num = self._checked_round
+                    self._resolve_round(round_num, await self._algod.block_txids(round_num))
+                if self._pending:
+                    status = await self._algod.status_after_block(self.last_round)
+                    self.last_round = status["last-round"]
+        except Exception as ex:
+            logger.exception("Confirmation watcher stopped")
+            for future, _, _ in self._pending.values():
+                if not future.done():
+                    future.set_exception(ex)
+            self._pending.clear()
+
+    def _resolve_round(self, round_num: int, tx_ids: list[str]) -> None:
+        for tx_id in tx_ids:
+            entry = self._pending.pop(tx_id, None)
+            if entry and not entry[0].done():
+                entry[0].set_result(round_num)
+        for tx_id, (future, _, last_valid_round) in list(self._pending.items()):
+            if last_valid_round <= round_num:
+                del self._pending[tx_id]
+                if not future.done():
+                    future.set_exception(
+                        TimeoutError(f"Transaction {tx_id} expired at round {last_valid_round}")
+                    )
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncSendResult:
+    """Result of a confirmed transaction group"""
+
+    group_id: str
+    tx_ids: list[str]
+    confirmed_round: int
+    abi_returns: list[typing.Any]
+    # ID given to each box-creating call in the group (the first one for create_proposals)
+    created_ids: list[int] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass(frozen=True)
+class PendingGroup:
+    """A transaction group the node has accepted but that may not be confirmed yet"""
+
+    group_id: str
+    tx_ids: list[str]
+    confirmation: "asyncio.Future[AsyncSendResult]"
+
+    def __await__(self) -> typing.Generator[typing.Any, None, AsyncSendResult]:
+        return self.confirmation.__await__()
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    method: str
+    args: tuple
+    params: algokit_utils.CommonAppCallParams
+
+
+def _args_tuple(args: object) -> tuple:
+    if dataclasses.is_dataclass(args):
+        return tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+    return tuple(typing.cast(tuple, args))
+
+
+class AsyncProposalContractComposer:
+    """
+    Asyncio counterpart of `ProposalContractComposer`. Calls are queued and built
+    with the generated client's params at submission time, with box references
+    filled in from the call arguments so no simulate round-trip is needed.
+    """
+
+    def __init__(self, client: "AsyncProposalContractClient") -> None:
+        self.client = client
+        self._calls: list[_QueuedCall | tuple[transaction.Transaction, TransactionSigner | None]] = []
+
+    def _add(
+        self, method: str, args: object, params: algokit_utils.CommonAppCallParams | None
+    ) -> "AsyncProposalContractComposer":
+        self._calls.append(
+            _QueuedCall(method, _args_tuple(args), params or algokit_utils.CommonAppCallParams())
+        )
+        return self
+
+    def create_proposal(
+        self,
+        args: tuple[str, str, str, str, int, list[tuple[str, int]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("create_proposal", args, params)
+
+    def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("create_proposals", args, params)
+
+    def donate_proposal(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("donate_proposal", args, params)
+
+    def submit_proof(
+        self,
+        args: tuple[int, str] | SubmitProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("submit_proof", args, params)
+
+    def vote_milestone(
+        self,
+        args: tuple[int, bool] | VoteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("vote_milestone", args, params)
+
+    def claim_milestone(
+        self,
+        args: tuple[int] | ClaimMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("claim_milestone", args, params)
+
+    def refund_if_inactive(
+        self,
+        args: tuple[int] | RefundIfInactiveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("refund_if_inactive", args, params)
+
+    def fund_future_self(
+        self,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("fund_future_self", args, params)
+
+    def claim_future_self(
+        self,
+        args: tuple[int] | ClaimFutureSelfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AsyncProposalContractComposer":
+        return self._add("claim_future_self", args, params)
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> "AsyncProposalContractComposer":
+        self._calls.append((txn, signer))
+        return self
+
+    async def submit(self) -> PendingGroup:
+        """Signs and submits the group, returning as soon as the node accepts it."""
+        client = self.client
+        await client.prime_suggested_params()
+
+        group = client.sync_client.algorand.new_group()
+        reservations: list[tuple[bytes, int, int]] = []
+        for call in self._calls:
+            if not isinstance(call, _QueuedCall):
+                group.add_transaction(*call)
+                continue
+            method_params = getattr(client.sync_client.params, call.method)(
+                args=call.args, params=call.params
+            )
+            if method_params.box_references is None:
+                count = len(call.args[0]) if call.method == "create_proposals" else 1
+                next_id = await client._reserve_next_id(call.method, count)
+                if next_id is not None:
+                    reservations.append((_NEXT_ID_KEYS[call.method], next_id, count))
+                method_params = dataclasses.replace(
+                    method_params,
+                    box_references=method_box_references(
+                        call.method, call.args, method_params.sender, next_id=next_id
+                    ),
+                )
+            group.add_app_call_method_call(method_params)
+
+        try:
+            built = group.build()
+            signed = built.atc.gather_signatures()
+        except BaseException:
+            client._release_ids(reservations)
+            raise
+        tx_ids = [stxn.get_txid() for stxn in signed]
+        first_txn = built.transactions[0].txn
+        group_id = base64.b64encode(first_txn.group).decode() if first_txn.group else ""
+        first_valid = min(t.txn.first_valid_round for t in built.transactions)
+        last_valid = max(t.txn.last_valid_round for t in built.transactions)
+        # Groups are confirmed atomically so watching one transaction is enough
+        confirmed = client.watcher.watch(tx_ids[-1], first_valid, last_valid)
+        try:
+            await client.algod.send_raw_transaction(
+                b"".join(base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed)
+            )
+        except BaseException:
+            client.watcher.unwatch(tx_ids[-1])
+            client._release_ids(reservations)
+            raise
+
+        confirmation = asyncio.ensure_future(
+            client._await_confirmation(
+                confirmed, tx_ids, group_id, built.method_calls, [next_id for _, next_id, _ in reservations]
+            )
+        )
+        if reservations:
+
+            def release_if_failed(done: "asyncio.Future[AsyncSendResult]") -> None:
+                if done.cancelled() or done.exception() is not None:
+                    client._release_ids(reservations)
+
+            confirmation.add_done_callback(release_if_failed)
+        return PendingGroup(group_id=group_id, tx_ids=tx_ids, confirmation=confirmation)
+
+    async def send(self) -> AsyncSendResult:
+        """Submits the group and waits for it to be confirmed."""
+        return await (await self.submit())
+
+
+class AsyncProposalContractSend:
+    """Asyncio counterpart of `ProposalContractSend`; each call awaits confirmation."""
+
+    def __init__(self, client: "AsyncProposalContractClient") -> None:
+        self._client = client
+
+    async def create_proposal(
+        self,
+        args: tuple[str, str, str, str, int, list[tuple[str, int]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().create_proposal(args, params).send()
+
+    async def create_proposals(
+        self,
+        args: tuple[list[tuple[str, str, str, str, int, list[tuple[str, int]]]], algokit_utils.AppMethodCallTransactionArgument] | CreateProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().create_proposals(args, params).send()
+
+    async def donate_proposal(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | DonateProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().donate_proposal(args, params).send()
+
+    async def submit_proof(
+        self,
+        args: tuple[int, str] | SubmitProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().submit_proof(args, params).send()
+
+    async def vote_milestone(
+        self,
+        args: tuple[int, bool] | VoteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().vote_milestone(args, params).send()
+
+    async def claim_milestone(
+        self,
+        args: tuple[int] | ClaimMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().claim_milestone(args, params).send()
+
+    async def refund_if_inactive(
+        self,
+        args: tuple[int] | RefundIfInactiveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().refund_if_inactive(args, params).send()
+
+    async def fund_future_self(
+        self,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | FundFutureSelfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().fund_future_self(args, params).send()
+
+    async def claim_future_self(
+        self,
+        args: tuple[int] | ClaimFutureSelfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self._client.new_group().claim_future_self(args, params).send()
+
+
+class AsyncProposalContractClient:
+    """
+    Asyncio client for ProposalContract. Wraps the generated `ProposalContractClient`
+    for transaction construction and signing, and does all network I/O through one
+    shared `AsyncAlgod` session.
+
+    `send.<method>()` awaits confirmation; `new_group()....submit()` returns once the
+    node has accepted the group so many groups can be in flight at once.
+    """
+
+    def __init__(
+        self, sync_client: ProposalContractClient, algod: AsyncAlgod | None = None
+    ) -> None:
+        self.sync_client = sync_client
+        self.algod = algod or AsyncAlgod.from_algorand(sync_client.algorand)
+        self.watcher = ConfirmationWatcher(self.algod)
+        self.send = AsyncProposalContractSend(self)
+        self._suggested_params: transaction.SuggestedParams | None = None
+        self._suggested_params_fetched_at = 0.0
+        self._reserved_ids: dict[bytes, int] = {}
+
+    @property
+    def app_id(self) -> int:
+        return self.sync_client.app_id
+
+    def new_group(self) -> AsyncProposalContractComposer:
+        return AsyncProposalContractComposer(self)
+
+    async def get_suggested_params(self) -> transaction.SuggestedParams:
+        """Suggested params, refreshed once a newer round is seen or they get stale."""
+        cached = self._suggested_params
+        if (
+            cached is None
+            or self.watcher.last_round > cached.first
+            or time.monotonic() - self._suggested_params_fetched_at > _PARAMS_MAX_AGE
+        ):
+            cached = self._suggested_params = await self.algod.suggested_params()
+            self._suggested_params_fetched_at = time.monotonic()
+        return cached
+
+    async def prime_suggested_params(self) -> None:
+        """Makes the sync `AlgorandClient` build transactions with our cached suggested params."""
+        self.sync_client.algorand.set_suggested_params_cache(
+            await self.get_suggested_params(), until=time.time() + _PARAMS_MAX_AGE
+        )
+
+    async def payment_to_app(
+        self, sender: str, amount: algokit_utils.AlgoAmount, **kwargs: typing.Any
+    ) -> transaction.Transaction:
+        """Builds a payment to the app account, for use as a `pay` method argument."""
+        await self.prime_suggested_params()
+        return self.sync_client.algorand.create_transaction.payment(
+            algokit_utils.PaymentParams(
+                sender=sender, receiver=self.sync_client.app_address, amount=amount, **kwargs
+            )
+        )
+
+    async def _reserve_next_id(self, method: str, count: int = 1) -> int | None:
+        """
+        Predicts the ID a box-creating call will be assigned (the first of `count`),
+        accounting for calls from this client that are still in flight. Calls from other clients landing
+        first will make the prediction wrong and the call will fail on box access.
+        """
+        key = _NEXT_ID_KEYS.get(method)
+        if key is None:
+            return None
+        app_info = await self.algod.application_info(self.app_id)
+        on_chain = 0
+        for entry in app_info["params"].get("global-state", []):
+            if base64.b64decode(entry["key"]) == key:
+                on_chain = int.from_bytes(base64.b64decode(entry["value"]["bytes"]), "big")
+        next_id = max(on_chain, self._reserved_ids.get(key, 0))
+        self._reserved_ids[key] = next_id + count
+        return next_id
+
+    def _release_ids(self, reservations: list[tuple[bytes, int, int]]) -> None:
+        """
+        Gives back IDs reserved by a call that was rejected or didn't confirm. The latest
+        reservation is simply rolled back; if later ones were made on top of it their
+        predictions are now too high, so the reservation is dropped and the next call
+        re-reads the on-chain counter. Rolling back is safe even if the call did land,
+        since the on-chain counter then already covers its IDs.
+        """
+        for key, next_id, count in reversed(reservations):
+            if self._reserved_ids.get(key) == next_id + count:
+                self._reserved_ids[key] = next_id
+            else:
+                self._reserved_ids.pop(key, None)
+
+    async def _await_confirmation(
+        self,
+        confirmed: "asyncio.Future[int]",
+        tx_ids: list[str],
+        group_id: str,
+        method_calls: dict[int, Method],
+        created_ids: list[int],
+    ) -> AsyncSendResult:
+        confirmed_round = await confirmed
+        abi_returns: list[typing.Any] = []
+        for index, method in sorted(method_calls.items()):
+            if method.returns.type == "void":
+                continue
+            info = await self.algod.pending_transaction_info(tx_ids[index])
+            logs = [base64.b64decode(log) for log in info.get("logs", [])]
+            abi_returns.append(
+                method.returns.type.decode(logs[-1][len(_ABI_RETURN_PREFIX):])
+                if logs and logs[-1].startswith(_ABI_RETURN_PREFIX)
+                else None
+            )
+        return AsyncSendResult(
+            group_id=group_id,
+            tx_ids=tx_ids,
+            confirmed_round=confirmed_round,
+            abi_returns=abi_returns,
+            created_ids=created_ids,
+        )
+
+    async def aclose(self) -> None:
+        await self.algod.aclose()
+
+    async def __aenter__(self) -> "AsyncProposalContractClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
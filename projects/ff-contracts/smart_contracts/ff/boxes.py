@@ -0,0 +1,239 @@
+import base64
+import logging
+import typing
+
+import algokit_utils
+from algokit_utils.applications.abi import get_abi_decoded_value
+from algosdk import abi
+
+# The names that don't need algokit_utils live in read_only; re-exported for the modules building calls
+from smart_contracts.ff.read_only import (  # noqa: F401
+    BOX_MAPS,
+    CATEGORY_INDEX_PREFIX,
+    DONATIONS_PREFIX,
+    ELIGIBLE_WEIGHT_PREFIX,
+    EXPIRATION_TIME,
+    FUTURE_FUNDS_PREFIX,
+    INDEX_PAGE_BITS,
+    MILESTONE_FIELDS,
+    MILESTONE_VOTES_PREFIX,
+    PROPOSAL_STATUSES,
+    PROPOSALS_PREFIX,
+    STATUS_INDEX_PREFIX,
+    VOTING_TIME,
+    DecodedBox,
+    category_hash,
+    category_index_box_name,
+    classify_box_name,
+    decode_box_key,
+    donation_box_name,
+    eligible_weight_box_name,
+    future_fund_box_name,
+    id_set_page_ids,
+    milestone_votes_box_name,
+    outcome_decided,
+    partition_box_names,
+    proposal_box_name,
+    shape_box_value,
+    status_index_box_name,
+    vote_weight,
+)
+
+logger = logging.getLogger(__name__)
+
+# A single app call can reference at most 8 boxes (each one grants 1KB of box I/O)
+MAX_BOX_REFERENCES = 8
+
+
+def decode_box(app_spec: algokit_utils.Arc56Contract, name: bytes, value: bytes) -> DecodedBox | None:
+    """
+    Decodes a raw box into its map, key and value (structs as dicts, milestones
+    included, and index pages as the proposal IDs they hold), or None if the name
+    belongs to no box map.
+    """
+    classified = classify_box_name(name)
+    if classified is None:
+        return None
+    map_name, encoded_key = classified
+    metadata = app_spec.state.maps.box[map_name]
+    decoded = get_abi_decoded_value(value, metadata.value_type, app_spec.structs)
+    return DecodedBox(
+        map_name,
+        get_abi_decoded_value(encoded_key, metadata.key_type, app_spec.structs),
+        shape_box_value(map_name, encoded_key, value, decoded),
+    )
+
+
+def box_references(
+    *names: bytes, pad_to: int = MAX_BOX_REFERENCES
+) -> list[algokit_utils.BoxReference]:
+    """
+    Builds box references for the current app, padded with empty references so the
+    call gets the extra box I/O quota needed for proposals with several milestones.
+    """
+    references = [algokit_utils.BoxReference(0, name) for name in names]
+    references.extend(
+        algokit_utils.BoxReference(0, b"") for _ in range(pad_to - len(references))
+    )
+    return references
+
+
+def _chunk_name(chunk: typing.Any) -> bytes:
+    name = chunk.name if hasattr(chunk, "name") else chunk[0]
+    return name.encode() if isinstance(name, str) else bytes(name)
+
+
+def _status_index_box_names(proposal_id: int, *statuses: str) -> list[bytes]:
+    return [status_index_box_name(PROPOSAL_STATUSES[status], proposal_id) for status in statuses]
+
+
+def create_proposals_box_names(proposals: typing.Sequence[tuple], first_id: int) -> list[bytes]:
+    """
+    Boxes `create_proposals` creates or updates for its proposal argument tuples,
+    given IDs from `first_id` on, each index page only once.
+    """
+    names: dict[bytes, None] = {}
+    for proposal_id, proposal in enumerate(proposals, start=first_id):
+        category = proposal[3]
+        names.update(
+            dict.fromkeys(
+                (
+                    proposal_box_name(proposal_id),
+                    milestone_votes_box_name(proposal_id),
+                    eligible_weight_box_name(proposal_id),
+                    category_index_box_name(category, proposal_id),
+                    status_index_box_name(PROPOSAL_STATUSES["fundraising"], proposal_id),
+                )
+            )
+        )
+    return list(names)
+
+
+def method_box_references(
+    method: str, args: tuple, sender: str, *, next_id: int | None = None
+) -> list[algokit_utils.BoxReference]:
+    """
+    Returns the box references an ABI method call touches, so calls can be sent
+    without a simulate round-trip to populate resources.
+
+    `create_proposal`, `create_proposals` and `fund_future_self` write to the next
+    free ID (the first of several for `create_proposals`), which the caller has to
+    supply as `next_id` (usually read from global state).
+    """
+    match method:
+        case "create_proposal" | "create_proposals" | "fund_future_self" if next_id is None:
+            raise ValueError(f"next_id is required to reference boxes for {method}")
+        case "create_proposal":
+            category = args[3]
+            return box_references(
+                proposal_box_name(next_id),
+                milestone_votes_box_name(next_id),
+                eligible_weight_box_name(next_id),
+                category_index_box_name(category, next_id),
+                status_index_box_name(PROPOSAL_STATUSES["fundraising"], next_id),
+            )
+        case "create_proposals":
+            return box_references(*create_proposals_box_names(args[0], next_id))
+        case "donate_proposal":
+            proposal_id = args[0]
+            return box_references(
+                proposal_box_name(proposal_id),
+                donation_box_name(proposal_id, sender),
+                eligible_weight_box_name(proposal_id),
+                *_status_index_box_names(proposal_id, "fundraising", "in_voting"),
+            )
+        case "refund_if_inactive":
+            proposal_id = args[0]
+            return box_references(
+                proposal_box_name(proposal_id),
+                donation_box_name(proposal_id, sender),
+                *_status_index_box_names(proposal_id, "in_voting", "expired"),
+            )
+        case "submit_proof":
+            proposal_id = args[0]
+            return box_references(
+                proposal_box_name(proposal_id), milestone_votes_box_name(proposal_id)
+            )
+        case "claim_milestone":
+            proposal_id = args[0]
+            return box_references(
+                proposal_box_name(proposal_id),
+                *_status_index_box_names(proposal_id, "in_voting", "expired", "completed"),
+            )
+        case "list_proposals" | "get_current_milestone":
+            # Readonly, so only ever simulated with unnamed resources allowed
+            return []
+        case "vote_milestone":
+            proposal_id = args[0]
+            return box_references(
+                proposal_box_name(proposal_id),
+                milestone_votes_box_name(proposal_id),
+                donation_box_name(proposal_id, sender),
+                eligible_weight_box_name(proposal_id),
+            )
+        case "vote_milestone_batch":
+            # More than a call can carry once there are a few voters; share them out over the group
+            proposal_id, _milestone_index, votes = args
+            return box_references(
+                proposal_box_name(proposal_id),
+                milestone_votes_box_name(proposal_id),
+                eligible_weight_box_name(proposal_id),
+                *(donation_box_name(proposal_id, voter) for voter, *_ in votes),
+            )
+        case "fund_future_self":
+            return box_references(future_fund_box_name(next_id), pad_to=1)
+        case "claim_future_self":
+            return box_references(future_fund_box_name(args[0]), pad_to=1)
+        case "begin_import" | "end_import":
+            # Only global state
+            return []
+        case "import_boxes":
+            # Each chunk is (name, size, offset, data); names come as bytes, or byte lists once decoded
+            names = dict.fromkeys(_chunk_name(chunk) for chunk in args[0])
+            return box_references(*names, pad_to=0)
+        case _:
+            raise ValueError(f"Unknown method: {method}")
+
+
+def changed_box_names(
+    algorand: algokit_utils.AlgorandClient,
+    app_spec: algokit_utils.Arc56Contract,
+    app_id: int,
+    min_round: int,
+    max_round: int,
+) -> set[bytes]:
+    """
+    Boxes written by the app calls confirmed between `min_round` and `max_round`,
+    found through the indexer. Boxes created by `create_proposal` and
+    `fund_future_self` (or `create_proposals`) aren't included; find those from the
+    global state counters.
+    """
+    methods = {method.get_selector(): method for method in (method.to_abi_method() for method in app_spec.methods)}
+    names: set[bytes] = set()
+    next_page = None
+    while True:
+        page = algorand.client.indexer.search_transactions(
+            application_id=app_id,
+            txn_type="appl",
+            min_round=min_round,
+            max_round=max_round,
+            next_page=next_page,
+        )
+        for txn in page.get("transactions", []):
+            app_args = [base64.b64decode(arg) for arg in txn["application-transaction"].get("application-args", [])]
+            method = methods.get(app_args[0]) if app_args else None
+            if method is None or method.name in ("create_proposal", "create_proposals", "fund_future_self"):
+                continue
+            # Transaction arguments are other transactions in the group, not app args
+            arg_types = [arg.type for arg in method.args if isinstance(arg.type, abi.ABIType)]
+            args = tuple(arg_type.decode(raw) for arg_type, raw in zip(arg_types, app_args[1:], strict=False))
+            try:
+                references = method_box_references(method.name, args, txn["sender"])
+            except ValueError:
+                logger.warning(f"Can't tell which boxes {method.name} (txn {txn['id']}) wrote; skipping it")
+                continue
+            names.update(reference.name for reference in references if reference.name)
+        next_page = page.get("next-token")
+        if not next_page or not page.get("transactions"):
+            break
+    return names
@@ -0,0 +1,478 @@
+"""
+Creates proposals in bulk from CSV or JSONL files, in as few groups as they fit.
+
+Each input row is one proposal:
+
+- JSONL: `{"name", "title", "description", "category", "milestones": [{"name", "amount"}, ...]}`,
+  with an optional `amount_required` (the milestone total when left out);
+- CSV: a header row naming the `name`, `title`, `description`, `category` and
+  `milestones` columns (and optionally `amount_required`), milestones written as
+  `name:amount;name:amount`.
+
+Amounts are in microAlgos. Rows are checked against create_proposal's rules as they
+stream in, and the ones the contract would reject are reported and skipped. The rest
+go out in `create_proposals` calls, each paid for by one payment of 2 Algos per
+proposal, packed into groups up to the limits on app call arguments, group size,
+inner transactions and box references. The IDs the proposals got are printed as JSON
+lines, `{"row": <row number>, "proposal_id": <id>}`.
+
+    python -m smart_contracts.ff.bulk_create campaigns.csv --app-id 1006
+    python -m smart_contracts.ff.bulk_create - --format jsonl --app-id 1006 --dry-run < campaigns.jsonl
+"""
+
+import argparse
+import collections
+import csv
+import dataclasses
+import functools
+import json
+import logging
+import math
+import sys
+import typing
+
+import algokit_utils
+from algosdk import error
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts.artifacts.ff.proposal_contract_client import ProposalContractClient, ProposalContractComposer
+from smart_contracts.ff.boxes import create_proposals_box_names
+from smart_contracts.ff.cost_analysis import (
+    BOX_IO_PER_REFERENCE,
+    BOX_SIZES,
+    CREATE_BUDGET,
+    MAX_BOX_REFERENCES,
+    MAX_INNER_TXNS,
+    MAX_MILESTONES,
+    OPCODE_BUDGET,
+    Sizes,
+)
+from smart_contracts.ff.errors import failure_cause
+from smart_contracts.ff.metrics import installed_metrics
+
+logger = logging.getLogger(__name__)
+
+# As in contract.py
+PROPOSAL_DEPOSIT = 2_000_000
+
+# A group holds at most 16 transactions: a payment and an app call per create_proposals
+# call, then list_proposals calls that only carry the box references the create calls
+# have no room for, 8 per app call. A proposal needs about 3 references (its proposal,
+# milestoneVotes and eligibleWeight boxes, plus any index page it opens and padding for
+# a large proposal box) and a call carries 2KB of arguments, so a group creates about
+# 30 proposals of a few hundred bytes (9 per call) or 20 of the largest (3 per call).
+# ci-cost-analysis checks create_proposals at 10 proposals per call.
+_MAX_GROUP_SIZE = 16
+# Bytes of app call arguments a transaction can carry, the method selector included
+_MAX_ARGS_BYTES = 2048
+_SELECTOR_BYTES = 4
+
+_MIN_FEE = 1000
+
+# list_proposals arguments that return before reading a box, for calls that only carry references
+_FILLER_ARGS = ("", 0, 2**64 - 1, 0)
+
+
+@dataclasses.dataclass(frozen=True)
+class ProposalRow:
+    name: str
+    title: str
+    description: str
+    category: str
+    amount_required: int
+    milestones: tuple[tuple[str, int], ...]
+
+    @staticmethod
+    def from_fields(fields: dict[str, typing.Any]) -> "ProposalRow":
+        """From a JSONL object or CSV row; raises ValueError (or KeyError) if a field is missing or malformed."""
+        milestones = fields["milestones"]
+        if isinstance(milestones, str):
+            milestones = [
+                {"name": name, "amount": amount}
+                for name, _, amount in (item.rpartition(":") for item in milestones.split(";") if item)
+            ]
+        parsed = tuple((str(milestone["name"]), int(milestone["amount"])) for milestone in milestones)
+        amount_required = fields.get("amount_required")
+        return ProposalRow(
+            name=str(fields["name"]),
+            title=str(fields["title"]),
+            description=str(fields["description"]),
+            category=str(fields["category"]),
+            amount_required=int(amount_required) if amount_required not in (None, "") else sum(a for _, a in parsed),
+            milestones=parsed,
+        )
+
+    def problem(self) -> str | None:
+        """Why create_proposal would reject it (in the contract's words), or None."""
+        if self.amount_required != sum(amount for _, amount in self.milestones):
+            return "Total milestone amount must equal the required amount"
+        if self.amount_required <= 0:
+            return "Amount required must be greater than 0"
+        if not self.milestones:
+            return "At least one milestone is required"
+        if len(self.milestones) > MAX_MILESTONES:
+            return f"Maximum of {MAX_MILESTONES} milestones allowed"
+        if any(amount < 0 or amount >= 2**64 for _, amount in self.milestones):
+            return "Milestone amount out of range"
+        for field in ("name", "title", "description"):
+            if not getattr(self, field):
+                return f"Proposal {field} cannot be empty"
+        return None
+
+    def as_arg(self) -> tuple[str, str, str, str, int, list[tuple[str, int]]]:
+        return (self.name, self.title, self.description, self.category, self.amount_required, list(self.milestones))
+
+    @property
+    def encoded_size(self) -> int:
+        """Bytes of its ARC-4 encoding in the `create_proposals` argument."""
+        texts = (self.name, self.title, self.description, self.category)
+        # Heads of the four strings, the amount and the milestone array, then their tails
+        return (
+            4 * 2
+            + 8
+            + 2
+            + sum(2 + len(text.encode()) for text in texts)
+            + 2
+            + sum(2 + 2 + 8 + 2 + len(name.encode()) for name, _ in self.milestones)
+        )
+
+    @property
+    def box_size(self) -> int:
+        """Bytes of its `proposals` box once created (milestone names rounded up to the longest)."""
+        return BOX_SIZES["proposals"](
+            Sizes(
+                milestones=len(self.milestones),
+                proposal_text=sum(len(text.encode()) for text in (self.name, self.title, self.description, self.category)),
+                milestone_name=max((len(name.encode()) for name, _ in self.milestones), default=0),
+            )
+        )
+
+
+def inner_calls(proposals: int) -> int:
+    """Inner app calls a `create_proposals` call makes to reserve its budget (as in contract.py), at most."""
+    return max(0, math.ceil(proposals * CREATE_BUDGET / OPCODE_BUDGET) - 1)
+
+
+def _args_size(call: typing.Sequence[ProposalRow]) -> int:
+    # The selector, then the array length and an offset per proposal
+    return _SELECTOR_BYTES + 2 + sum(2 + row.encoded_size for row in call)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Group:
+    """`create_proposals` calls sent together, creating proposals from `first_id` on."""
+
+    first_id: int
+    calls: tuple[tuple[tuple[int, ProposalRow], ...], ...]
+
+    @property
+    def rows(self) -> list[tuple[int, ProposalRow]]:
+        return [row for call in self.calls for row in call]
+
+    @property
+    def opups(self) -> list[int]:
+        return [inner_calls(len(call)) for call in self.calls]
+
+    @functools.cached_property
+    def box_references(self) -> list[algokit_utils.BoxReference]:
+        """References to every box the group touches, padded until they cover the bytes they hold after it."""
+        rows = [row for _, row in self.rows]
+        names = create_proposals_box_names([row.as_arg() for row in rows], self.first_id)
+        touched = (
+            sum(
+                row.box_size + BOX_SIZES["milestoneVotes"](Sizes()) + BOX_SIZES["eligibleWeight"](Sizes())
+                for row in rows
+            )
+            + (len(names) - 3 * len(rows)) * BOX_SIZES["statusIndex"](Sizes())
+        )
+        padding = max(0, math.ceil(touched / BOX_IO_PER_REFERENCE) - len(names))
+        return [algokit_utils.BoxReference(0, name) for name in names] + [algokit_utils.BoxReference(0, b"")] * padding
+
+    @property
+    def fillers(self) -> int:
+        """App calls added only to carry the box references the create calls have no room for."""
+        return max(0, math.ceil(len(self.box_references) / MAX_BOX_REFERENCES) - len(self.calls))
+
+    @property
+    def size(self) -> int:
+        # A payment and an app call per create call, then the fillers
+        return 2 * len(self.calls) + self.fillers
+
+    def fits(self, max_group_size: int) -> bool:
+        return (
+            all(_args_size([row for _, row in call]) <= _MAX_ARGS_BYTES for call in self.calls)
+            and sum(self.opups) <= MAX_INNER_TXNS
+            and self.size <= max_group_size
+        )
+
+    def with_row(self, row: tuple[int, ProposalRow], max_group_size: int) -> "_Group | None":
+        """The group with the row added to its last call or in a new one, or None if it doesn't fit either way."""
+        if self.calls:
+            extended = dataclasses.replace(self, calls=(*self.calls[:-1], (*self.calls[-1], row)))
+            if extended.fits(max_group_size):
+                return extended
+        added = dataclasses.replace(self, calls=(*self.calls, (row,)))
+        return added if added.fits(max_group_size) else None
+
+
+@dataclasses.dataclass
+class BulkMetrics:
+    created: int = 0
+    groups: int = 0
+    # Fees paid, in microAlgos, including the inner calls' fees
+    fees: int = 0
+    # Rows skipped before sending, and rows in groups that failed, by reason
+    rejected: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    failed: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+
+class BulkCreator:
+    def __init__(
+        self, client: ProposalContractClient, sender: str, *, max_group_size: int = _MAX_GROUP_SIZE
+    ) -> None:
+        self.client = client
+        self.sender = sender
+        self.max_group_size = max_group_size
+        self.metrics = BulkMetrics()
+        # ID the next group's first proposal gets; read from the app before creating
+        self.next_id = 0
+
+    def valid_rows(
+        self, rows: typing.Iterable[tuple[int, ProposalRow | str]]
+    ) -> typing.Iterator[tuple[int, ProposalRow]]:
+        """The rows create_proposal would accept, counting the others as rejected."""
+        for row_no, row in rows:
+            if isinstance(row, str):
+                logger.warning(f"Skipping row {row_no}: unreadable ({row})")
+                self.metrics.rejected["unreadable"] += 1
+                continue
+            problem = row.problem()
+            if problem is None:
+                yield row_no, row
+                continue
+            logger.warning(f"Skipping row {row_no}: {problem}")
+            self.metrics.rejected[problem] += 1
+
+    def pack(self, rows: typing.Iterable[tuple[int, ProposalRow]]) -> typing.Iterator[_Group]:
+        """
+        Packs rows, in order, into groups that fit. A group is started from
+        `next_id` when the previous one has been yielded, so sending it first keeps
+        the box references right.
+        """
+        group: _Group | None = None
+        for row in rows:
+            if group is None:
+                group = _Group(self.next_id, ())
+            added = group.with_row(row, self.max_group_size)
+            if added is not None:
+                group = added
+                continue
+            if group.calls:
+                yield group
+                group = _Group(self.next_id, ())
+                added = group.with_row(row, self.max_group_size)
+            if added is None:
+                logger.warning(f"Skipping row {row[0]}: too large for a create_proposals call")
+                self.metrics.rejected["too large"] += 1
+                continue
+            group = added
+        if group is not None and group.calls:
+            yield group
+
+    def create(self, rows: typing.Iterable[tuple[int, ProposalRow | str]]) -> typing.Iterator[tuple[int, int]]:
+        """Creates the valid rows, yielding (row number, proposal ID) as each group is confirmed."""
+        self.next_id = self._read_next_id()
+        for group in self.pack(self.valid_rows(rows)):
+            sent = self._send(group)
+            if sent is not None:
+                self.next_id = sent.first_id + len(sent.rows)
+                yield from ((row_no, proposal_id) for proposal_id, (row_no, _) in enumerate(sent.rows, sent.first_id))
+
+    def _read_next_id(self) -> int:
+        return self.client.state.global_state.no_of_proposals
+
+    def _send(self, group: _Group) -> _Group | None:
+        """
+        Sends the group, once more from the new first ID if proposals were created
+        meanwhile and the group is known not to have been confirmed.
+        """
+        for retry in (False, True):
+            composer = self._compose(group)
+            try:
+                # Sent as built, so the transaction IDs checked after a failure are the ones sent
+                composer.send(
+                    algokit_utils.SendParams(
+                        populate_app_call_resources=False, cover_app_call_inner_transaction_fees=False
+                    )
+                )
+            except Exception as ex:
+                next_id = self._read_next_id()
+                confirmed = self._confirmed(group, composer, next_id)
+                if confirmed:
+                    logger.warning(f"The group was confirmed, though sending it failed: {ex}")
+                    self._record_sent(group)
+                    return group
+                moved = dataclasses.replace(group, first_id=next_id)
+                if retry or confirmed is None or next_id == group.first_id or not moved.fits(self.max_group_size):
+                    if confirmed is None:
+                        logger.warning("The group is still pending and may yet be confirmed")
+                    self._record_failure(group, ex)
+                    return None
+                installed_metrics().increment("retries_total", method="create_proposals", reason="next_id_changed")
+                group = moved
+            else:
+                self._record_sent(group)
+                return group
+        return None
+
+    def _confirmed(self, group: _Group, composer: ProposalContractComposer, next_id: int) -> bool | None:
+        """
+        Whether the group was confirmed after its send failed: False if it wasn't and
+        can't be any more, None if it is still waiting in the node's pool. Groups are
+        confirmed whole, so one transaction of it tells.
+        """
+        transactions = composer.composer().build().transactions
+        tx_id = transactions[-1].txn.get_txid()
+        algod = self.client.algorand.client.algod
+        try:
+            info = algod.pending_transaction_info(tx_id)
+            if info.get("confirmed-round"):  # type: ignore[union-attr]
+                return True
+            return False if info.get("pool-error") else None  # type: ignore[union-attr]
+        except error.AlgodHTTPError as ex:
+            if ex.code != 404:
+                raise
+        # The node has forgotten it; fewer new proposals than the group creates rules it out
+        if next_id - group.first_id < len(group.rows):
+            return False
+        first_valid = min(transaction.txn.first_valid_round for transaction in transactions)
+        last_valid = max(transaction.txn.last_valid_round for transaction in transactions)
+        last_round = algod.status()["last-round"]  # type: ignore[call-overload]
+        return any(
+            tx_id in (algod.get_block_txids(round_num)["blockTxids"] or [])  # type: ignore[call-overload]
+            for round_num in range(first_valid, min(last_valid, last_round) + 1)
+        )
+
+    def _record_failure(self, group: _Group, ex: Exception) -> None:
+        cause = failure_cause(str(ex), self.client.app_spec)
+        rows = [row_no for row_no, _ in group.rows]
+        logger.warning(f"Rows {rows[0]}-{rows[-1]} ({len(rows)} proposals) failed: {cause}")
+        self.metrics.failed[cause] += len(rows)
+
+    def _record_sent(self, group: _Group) -> None:
+        self.metrics.created += len(group.rows)
+        self.metrics.groups += 1
+        self.metrics.fees += (group.size + sum(group.opups)) * _MIN_FEE
+        logger.info(
+            f"Created proposals {group.first_id}-{group.first_id + len(group.rows) - 1} in "
+            f"{len(group.calls)} calls and {group.fillers} reference-only calls"
+        )
+
+    def _compose(self, group: _Group) -> ProposalContractComposer:
+        references = group.box_references
+        chunks = [references[start : start + MAX_BOX_REFERENCES] for start in range(0, len(references), MAX_BOX_REFERENCES)]
+        chunks += [[]] * (len(group.calls) + group.fillers - len(chunks))
+        algorand = self.client.algorand
+        composer = self.client.new_group()
+        for call, opups, chunk in zip(group.calls, group.opups, chunks, strict=False):
+            payment = algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    sender=self.sender,
+                    receiver=self.client.app_address,
+                    amount=algokit_utils.AlgoAmount(micro_algo=PROPOSAL_DEPOSIT * len(call)),
+                )
+            )
+            composer.create_proposals(
+                args=([row.as_arg() for _, row in call], payment),
+                params=algokit_utils.CommonAppCallParams(
+                    sender=self.sender,
+                    # Pays for the inner calls, which take their fees from the group's surplus
+                    extra_fee=algokit_utils.AlgoAmount(micro_algo=opups * _MIN_FEE),
+                    box_references=chunk,
+                ),
+            )
+        for chunk in chunks[len(group.calls) :]:
+            composer.list_proposals(
+                args=_FILLER_ARGS,
+                params=algokit_utils.CommonAppCallParams(sender=self.sender, box_references=chunk),
+            )
+        return composer
+
+
+def read_rows(paths: list[str], file_format: str | None = None) -> typing.Iterator[tuple[int, ProposalRow | str]]:
+    """
+    Streams (row number, row) from the files, numbering rows from 1 across them;
+    a row that can't be parsed comes as the reason instead.
+    """
+    row_no = 0
+    for path in paths:
+        kind = file_format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+        with sys.stdin if path == "-" else open(path, newline="") as rows:
+            records: typing.Iterable[typing.Any] = (
+                csv.DictReader(rows) if kind == "csv" else (line for line in rows if line.strip())
+            )
+            for record in records:
+                row_no += 1
+                try:
+                    fields = record if kind == "csv" else json.loads(record)
+                    yield row_no, ProposalRow.from_fields(fields)
+                except (ValueError, KeyError, TypeError) as ex:
+                    yield row_no, f"{type(ex).__name__}: {ex}"
+
+
+def print_plan(groups: list[_Group], console: Console | None = None) -> None:
+    table = Table(title=f"{sum(len(group.rows) for group in groups)} proposals in {len(groups)} groups")
+    for column in ("group", "first ID", "proposals", "create calls", "fillers", "box refs", "inner calls", "fees (µAlgo)"):
+        table.add_column(column, justify="right")
+    for index, group in enumerate(groups):
+        table.add_row(
+            str(index),
+            str(group.first_id),
+            str(len(group.rows)),
+            str(len(group.calls)),
+            str(group.fillers),
+            str(len(group.box_references)),
+            str(sum(group.opups)),
+            str((group.size + sum(group.opups)) * _MIN_FEE),
+        )
+    (console or Console(stderr=True)).print(table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("files", nargs="+", help="proposals to create, one per row ('-' for stdin)")
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="input format (default: by file extension)")
+    parser.add_argument("--creator", default="CREATOR", help="environment account name the proposals are created by")
+    parser.add_argument("--max-group-size", type=int, default=_MAX_GROUP_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="print how the proposals would be grouped, send nothing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    client = algorand.client.get_typed_app_client_by_id(ProposalContractClient, app_id=args.app_id)
+    creator = algorand.account.from_environment(args.creator)
+    bulk = BulkCreator(client, creator.address, max_group_size=args.max_group_size)
+
+    if args.dry_run:
+        bulk.next_id = bulk._read_next_id()
+        groups = []
+        for group in bulk.pack(bulk.valid_rows(read_rows(args.files, args.format))):
+            groups.append(group)
+            bulk.next_id = group.first_id + len(group.rows)
+        print_plan(groups)
+    else:
+        for row_no, proposal_id in bulk.create(read_rows(args.files, args.format)):
+            print(json.dumps({"row": row_no, "proposal_id": proposal_id}), flush=True)
+    metrics = bulk.metrics
+    logger.info(
+        f"Created {metrics.created} proposals in {metrics.groups} groups for {metrics.fees} microAlgos; "
+        f"rejected {dict(metrics.rejected)}, failed {dict(metrics.failed)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
-from algopy import ARC4Contract, GlobalState, BoxMap, Txn, UInt64 as NativeUInt64, Global, urange, gtxn, itxn, op
-from algopy.arc4 import abimethod, Address, String, Bool, Struct, DynamicArray, UInt64
+import typing
+
+from algopy import ARC4Contract, BigUInt, GlobalState, BoxMap, Bytes, Txn, UInt64 as NativeUInt64, Global, OpUpFeeSource, ensure_budget, urange, gtxn, itxn, op, subroutine
+from algopy.arc4 import abimethod, Address, String, Bool, Byte, Struct, DynamicArray, DynamicBytes, StaticArray, UInt64
 
 # ------------------ Structs ------------------
 class DonationBoxKey(Struct):
@@ -21,6 +23,15 @@ class MilestoneInput(Struct):
     name: String
     amount: UInt64
 
+# A proposal to create, as create_proposal takes it
+class ProposalInput(Struct):
+    name: String
+    title: String
+    description: String
+    category: String
+    amount_required: UInt64
+    milestones: DynamicArray[MilestoneInput]
+
 class Proposal(Struct):
     name: String
     title: String
@@ -43,25 +54,115 @@ class FutureFund(Struct):
     amount: UInt64
     claimed: Bool
 
+# Key of one page of a proposal ID set: the status, or the category hash, and the page number
+class IdSetPageKey(Struct):
+    index: UInt64
+    page: UInt64
+
+class CurrentMilestone(Struct):
+    index: UInt64
+    milestone: Milestone
+    has_voted: Bool
+    # Quadratic vote weight the voter has (or had) on this milestone; 0 if they can't vote
+    vote_weight: UInt64
+
+# A donor's vote on a milestone, signed off-chain over the `vote_message` for it
+class SignedVote(Struct):
+    voter: Address
+    vote: Bool
+    signature: StaticArray[Byte, typing.Literal[64]]
+
+class ProposalIdPage(Struct):
+    ids: DynamicArray[UInt64]
+    next_cursor: UInt64
+    done: Bool
+
+# Bytes of a box at `offset`, creating the box with `size` bytes first if it doesn't exist
+class BoxChunk(Struct):
+    name: DynamicBytes
+    size: UInt64
+    offset: UInt64
+    data: DynamicBytes
+
 
 # ------------------ Constants ------------------
+proposal_deposit = 2_000_000   # paid per proposal created, covering its boxes
 voting_time = 180       # (example: 3 minutes) 2 days = 172800
 expiration_time = 240   # (example: 4 minutes) 3 months = 7776000
 
+# Proposal statuses kept in the status index (0 means any status when listing)
+status_fundraising = 1
+status_in_voting = 2    # funded, milestones being proven and voted on
+status_completed = 3
+status_expired = 4
+
+# ID sets are bitsets split into pages, bit i of page p standing for proposal p * 2048 + i
+index_page_bytes = 256
+index_page_bits = 2048
+max_list_limit = 64
+max_list_words = 64     # 64-bit words of a bitset one listing call scans at most
+
+# Signed votes are over vote_message_prefix + app ID + proposal ID + milestone index + proof submitted time + vote
+# (ARC-4 bool); the proof time ties a vote to one voting round, so it can't be replayed after a resubmission
+vote_message_prefix = b"ffvote"
+# Opcode budget vote_milestone_batch reserves per call, per vote, and per vote for each earlier voter it checks against
+vote_batch_budget = 700
+vote_budget = 2_100
+vote_scan_budget = 24
+# Opcode budget create_proposals reserves per proposal (enough for 5 milestones)
+create_budget = 1_700
+
+# Stages of importing another app's state (migrating to a new storage layout); an app
+# can only be imported into while it's empty, and once the import ends it can't reopen.
+# While it's open, only the import methods change state.
+import_never = 0
+import_open = 1
+import_ended = 2
+
+
+# ------------------ Subroutines ------------------
+@subroutine
+def category_hash(category: String) -> NativeUInt64:
+    return op.extract_uint64(op.sha256(category.native.bytes), 0)
+
+
+@subroutine
+def set_id_set_bit(box_key: Bytes, proposal_id: NativeUInt64, member: bool) -> None:
+    """Adds the proposal to (or removes it from) the ID set page stored under `box_key`."""
+    _length, exists = op.Box.length(box_key)
+    if not exists:
+        if not member:
+            return
+        _created = op.Box.create(box_key, index_page_bytes)
+    bit = proposal_id % index_page_bits
+    byte = op.Box.extract(box_key, bit // 8, 1)
+    op.Box.replace(box_key, bit // 8, op.setbit_bytes(byte, bit % 8, NativeUInt64(1) if member else NativeUInt64(0)))
+
 
 # ------------------ Contract ------------------
 class ProposalContract(ARC4Contract):
     def __init__(self) -> None:
         # Crowdfunding state
         self.no_of_proposals = GlobalState(UInt64(0), key="noOfProposals")
-        self.proposals = BoxMap(UInt64, Proposal)
+        self.proposals = BoxMap(UInt64, Proposal, key_prefix="proposals")
         self.milestoneVotes = BoxMap(UInt64, DynamicArray[Address], key_prefix="milestoneVotes_")
-        self.donations = BoxMap(DonationBoxKey, UInt64)
+        self.donations = BoxMap(DonationBoxKey, UInt64, key_prefix="donations")
+        # Quadratic vote weight of each proposal's donors other than its creator. Donations
+        # close once the goal is reached, so it's fixed while milestones are voted on, and
+        # what of it a milestone's votes haven't cast yet is all that could still change them.
+        self.eligibleWeight = BoxMap(UInt64, UInt64, key_prefix="eligibleWeight_")
 
         # Future self state
         self.no_of_future_funds = GlobalState(UInt64(0), key="noOfFutureFunds")
         self.futureFunds = BoxMap(UInt64, FutureFund, key_prefix="futureFund_")
 
+        # Proposal ID sets for filtered listings
+        self.statusIndex = BoxMap(IdSetPageKey, Bytes, key_prefix="statusIndex_")
+        self.categoryIndex = BoxMap(IdSetPageKey, Bytes, key_prefix="categoryIndex_")
+
+        # State import for migrations
+        self.import_stage = GlobalState(UInt64(import_never), key="importStage")
+
 
     # ------------------ Crowdfunding Methods ------------------
     @abimethod()
@@ -75,11 +176,53 @@ class ProposalContract(ARC4Contract):
         milestones: DynamicArray[MilestoneInput],
         payment: gtxn.PaymentTransaction
     ) -> None:
-        assert payment.amount == 2_000_000, "Must pay exactly 2 Algos to create a proposal"
+        assert payment.amount == proposal_deposit, "Must pay exactly 2 Algos to create a proposal"
         assert payment.receiver == Global.current_application_address, "Payment must be sent to the contract address"
         assert payment.sender == Txn.sender, "Payment must be from the proposal creator"
+        assert self.import_stage.value != import_open, "State import in progress"
 
         idx = self.no_of_proposals.value
+        self._add_proposal(idx, name, title, description, category, amount_required, milestones)
+        self.no_of_proposals.value = UInt64(idx.native + 1)
+
+
+    @abimethod()
+    def create_proposals(self, proposals: DynamicArray[ProposalInput], payment: gtxn.PaymentTransaction) -> None:
+        """Creates several proposals with consecutive IDs, paid for together."""
+        assert proposals.length > 0, "At least one proposal is required"
+        assert payment.amount == proposals.length * proposal_deposit, "Must pay exactly 2 Algos per proposal"
+        assert payment.receiver == Global.current_application_address, "Payment must be sent to the contract address"
+        assert payment.sender == Txn.sender, "Payment must be from the proposal creator"
+        assert self.import_stage.value != import_open, "State import in progress"
+
+        ensure_budget(proposals.length * create_budget, OpUpFeeSource.GroupCredit)
+        first = self.no_of_proposals.value.native
+        for index in urange(proposals.length):
+            proposal = proposals[index].copy()
+            self._add_proposal(
+                UInt64(first + index),
+                proposal.name,
+                proposal.title,
+                proposal.description,
+                proposal.category,
+                proposal.amount_required,
+                proposal.milestones.copy(),
+            )
+        self.no_of_proposals.value = UInt64(first + proposals.length)
+
+
+    @subroutine
+    def _add_proposal(
+        self,
+        idx: UInt64,
+        name: String,
+        title: String,
+        description: String,
+        category: String,
+        amount_required: UInt64,
+        milestones: DynamicArray[MilestoneInput],
+    ) -> None:
+        """Checks and stores a new proposal under `idx`, leaving the proposal count to the caller."""
         final_milestones = DynamicArray[Milestone]()
         milestones_total = NativeUInt64(0)
 
@@ -123,11 +266,15 @@ class ProposalContract(ARC4Contract):
 
         self.proposals[idx] = new_proposal.copy()
         self.milestoneVotes[idx] = DynamicArray[Address]()
-        self.no_of_proposals.value = UInt64(self.no_of_proposals.value.native + 1)
+        self.eligibleWeight[idx] = UInt64(0)
+
+        set_id_set_bit(self.categoryIndex.key_prefix + self._page_key(category_hash(category), idx.native), idx.native, True)
+        self._set_status(idx.native, NativeUInt64(status_fundraising), True)
 
 
     @abimethod()
     def donate_proposal(self, proposal_id: UInt64, payment: gtxn.PaymentTransaction) -> None:
+        assert self.import_stage.value != import_open, "State import in progress"
         assert proposal_id in self.proposals, "Proposal doesn't exist"
         prop = self.proposals[proposal_id].copy()
         assert prop.amount_raised < prop.amount_required, "Goal already reached"
@@ -137,19 +284,28 @@ class ProposalContract(ARC4Contract):
         donation_box_key = DonationBoxKey(proposal_id=proposal_id, donor=Address(donor))
         assert payment.receiver == Global.current_application_address, "Payment must be sent to the contract address"
 
+        previous_amount = NativeUInt64(0)
         if donation_box_key not in self.donations:
             prop.no_of_unique_donors = UInt64(prop.no_of_unique_donors.native + 1)
             self.donations[donation_box_key] = UInt64(amount)
         else:
-            self.donations[donation_box_key] = UInt64(self.donations[donation_box_key].native + amount)
+            previous_amount = self.donations[donation_box_key].native
+            self.donations[donation_box_key] = UInt64(previous_amount + amount)
+        if donor != prop.created_by.native:
+            self._add_eligible_weight(proposal_id, previous_amount, previous_amount + amount)
 
         prop.no_of_donations = UInt64(prop.no_of_donations.native + 1)
         prop.amount_raised = UInt64(prop.amount_raised.native + amount)
         self.proposals[proposal_id] = prop.copy()
 
+        if prop.amount_raised >= prop.amount_required:
+            self._set_status(proposal_id.native, NativeUInt64(status_fundraising), False)
+            self._set_status(proposal_id.native, NativeUInt64(status_in_voting), True)
+
 
     @abimethod()
     def submit_proof(self, proposal_id: UInt64, proof_link: String) -> None:
+        assert self.import_stage.value != import_open, "State import in progress"
         assert proposal_id in self.proposals, "Proposal doesn't exist"
         prop = self.proposals[proposal_id].copy()
         assert prop.created_by == Address(Txn.sender), "Only creator can submit proof"
@@ -179,6 +335,7 @@ class ProposalContract(ARC4Contract):
 
     @abimethod()
     def vote_milestone(self, proposal_id: UInt64, vote: Bool) -> None:
+        assert self.import_stage.value != import_open, "State import in progress"
         assert proposal_id in self.proposals, "Proposal doesn't exist"
         prop = self.proposals[proposal_id].copy()
         milestone = prop.milestones[prop.current_milestone.native].copy()
@@ -205,13 +362,71 @@ class ProposalContract(ARC4Contract):
             milestone.votes_against = UInt64(milestone.votes_against.native + weight)
 
         milestone.total_voters = UInt64(milestone.total_voters.native + 1)
+        if self._outcome_decided(proposal_id, milestone.votes_for.native, milestone.votes_against.native):
+            # Voting closes now, and an approved milestone can be claimed straight away
+            milestone.voting_end_time = UInt64(current_time)
         milestone_votes.append(Address(Txn.sender))
         self.milestoneVotes[proposal_id] = milestone_votes.copy()
         self.proposals[proposal_id].milestones[prop.current_milestone.native] = milestone.copy()
 
 
+    @abimethod()
+    def vote_milestone_batch(self, proposal_id: UInt64, milestone_index: UInt64, votes: DynamicArray[SignedVote]) -> None:
+        """
+        Tallies votes donors signed off-chain, sent in by anyone. Voters must be in
+        strictly increasing address order; the fees of the inner calls raising the
+        opcode budget for the signature checks are taken from the group's surplus.
+        """
+        assert self.import_stage.value != import_open, "State import in progress"
+        assert proposal_id in self.proposals, "Proposal doesn't exist"
+        prop = self.proposals[proposal_id].copy()
+        assert milestone_index == prop.current_milestone, "Votes are not for the current milestone"
+        milestone = prop.milestones[prop.current_milestone.native].copy()
+        assert milestone.proof_link != "", "Proof is not submitted yet"
+        assert milestone.voting_end_time.native > Global.latest_timestamp, "Voting period has ended"
+        assert votes.length > 0, "No votes to tally"
+
+        milestone_votes = self.milestoneVotes[proposal_id].copy()
+        ensure_budget(vote_batch_budget + votes.length * (vote_budget + milestone_votes.length * vote_scan_budget), OpUpFeeSource.GroupCredit)
+
+        message = Bytes(vote_message_prefix) + op.itob(Global.current_application_id.id) + proposal_id.bytes + milestone_index.bytes + milestone.proof_submitted_time.bytes
+        votes_for = milestone.votes_for.native
+        votes_against = milestone.votes_against.native
+        new_voters = DynamicArray[Address]()
+        previous = BigUInt(0)
+        for index in urange(votes.length):
+            signed = votes[index].copy()
+            voter = signed.voter
+            assert BigUInt.from_bytes(voter.bytes) > previous, "Voters must be in increasing order"
+            previous = BigUInt.from_bytes(voter.bytes)
+            for addr in milestone_votes:
+                assert addr != voter, "Voter has already voted for this milestone"
+            assert prop.created_by != voter, "Creator cannot vote"
+            assert op.ed25519verify_bare(message + signed.vote.bytes, signed.signature.bytes, voter.bytes), "Invalid vote signature"
+
+            amount_donated, donated = self.donations.maybe(DonationBoxKey(proposal_id=proposal_id, donor=voter))
+            assert donated, "Voter has not donated to this proposal"
+            assert amount_donated >= 1_000_000, "Should have donated more than 1 Algo to vote"
+            weight = op.sqrt(amount_donated.native // NativeUInt64(1_000_000))
+            if signed.vote:
+                votes_for += weight
+            else:
+                votes_against += weight
+            new_voters.append(voter)
+
+        milestone.votes_for = UInt64(votes_for)
+        milestone.votes_against = UInt64(votes_against)
+        milestone.total_voters = UInt64(milestone.total_voters.native + votes.length)
+        if self._outcome_decided(proposal_id, votes_for, votes_against):
+            milestone.voting_end_time = UInt64(Global.latest_timestamp)
+        milestone_votes.extend(new_voters)
+        self.milestoneVotes[proposal_id] = milestone_votes.copy()
+        self.proposals[proposal_id].milestones[prop.current_milestone.native] = milestone.copy()
+
+
     @abimethod()
     def claim_milestone(self, proposal_id: UInt64) -> None:
+        assert self.import_stage.value != import_open, "State import in progress"
         assert proposal_id in self.proposals, "Proposal doesn't exist"
         prop = self.proposals[proposal_id].copy()
         milestone = prop.milestones[prop.current_milestone.native].copy()
@@ -219,7 +434,7 @@ class ProposalContract(ARC4Contract):
         current_time = Global.latest_timestamp
         assert milestone.proof_link != "", "Proof is not submitted yet"
         assert milestone.proof_submitted_time.native != 0, "Proof not submitted yet"
-        assert current_time > milestone.voting_end_time.native, "Voting period not ended yet"
+        assert current_time >= milestone.voting_end_time.native, "Voting period not ended yet"
         assert milestone.votes_for.native > milestone.votes_against.native, "Milestone not approved"
         assert not milestone.claimed, "Milestone already claimed"
 
@@ -234,9 +449,16 @@ class ProposalContract(ARC4Contract):
         self.proposals[proposal_id].milestones[prop.current_milestone.native] = milestone.copy()
         self.proposals[proposal_id].current_milestone = UInt64(prop.current_milestone.native + 1)
 
+        if prop.current_milestone.native + 1 == prop.milestones.length:
+            # The last milestone can still be claimed after the proposal expired
+            self._set_status(proposal_id.native, NativeUInt64(status_in_voting), False)
+            self._set_status(proposal_id.native, NativeUInt64(status_expired), False)
+            self._set_status(proposal_id.native, NativeUInt64(status_completed), True)
+
 
     @abimethod()
     def refund_if_inactive(self, proposal_id: UInt64) -> None:
+        assert self.import_stage.value != import_open, "State import in progress"
         assert proposal_id in self.proposals, "Proposal doesn't exist"
         prop = self.proposals[proposal_id].copy()
         current_milestone = prop.milestones[prop.current_milestone.native].copy()
@@ -248,6 +470,11 @@ class ProposalContract(ARC4Contract):
         amount_donated = self.donations[donator_box_key]
 
         if time_difference > expiration_time:
+            # Only a proven milestone left too long expires the proposal; without a proof the
+            # time is measured from 0, and a proposal still raising funds must stay listed there
+            if current_milestone.proof_submitted_time.native != 0:
+                self._set_status(proposal_id.native, NativeUInt64(status_in_voting), False)
+                self._set_status(proposal_id.native, NativeUInt64(status_expired), True)
             remaining_amount = prop.amount_required.native - prop.amount_raised.native
             if amount_donated > 0:
                 refund_amount = UInt64(remaining_amount * amount_donated.native // prop.amount_raised.native)
@@ -259,6 +486,135 @@ class ProposalContract(ARC4Contract):
                 self.donations[donator_box_key] = UInt64(0)
 
 
+    @abimethod(readonly=True)
+    def get_current_milestone(self, proposal_id: UInt64, voter: Address) -> CurrentMilestone:
+        """The proposal's current milestone, whether `voter` has voted on it and their vote weight."""
+        assert proposal_id in self.proposals, "Proposal doesn't exist"
+        prop = self.proposals[proposal_id].copy()
+        assert prop.current_milestone.native < prop.milestones.length, "All milestones already completed"
+        milestone = prop.milestones[prop.current_milestone.native].copy()
+
+        has_voted = False
+        milestone_votes = self.milestoneVotes[proposal_id].copy()
+        for addr in milestone_votes:
+            if addr == voter:
+                has_voted = True
+
+        weight = NativeUInt64(0)
+        donation_box_key = DonationBoxKey(proposal_id=proposal_id, donor=voter)
+        amount_donated, donated = self.donations.maybe(donation_box_key)
+        if donated and amount_donated >= 1_000_000 and prop.created_by != voter:
+            weight = op.sqrt(amount_donated.native // NativeUInt64(1_000_000))
+
+        return CurrentMilestone(
+            index=prop.current_milestone,
+            milestone=milestone.copy(),
+            has_voted=Bool(has_voted),
+            vote_weight=UInt64(weight),
+        )
+
+
+    @abimethod(readonly=True)
+    def list_proposals(self, category: String, status: UInt64, cursor: UInt64, limit: UInt64) -> ProposalIdPage:
+        """
+        IDs of the proposals from `cursor` on in `category` (any if empty) with `status`
+        (any if 0), at most `limit` of them. Pass `next_cursor` back in until `done`.
+        Categories are matched by the hash of their exact text.
+        """
+        assert limit.native <= max_list_limit, "Limit is too large"
+        end = self.no_of_proposals.value.native
+        ids = DynamicArray[UInt64]()
+        next_cursor = cursor.native
+        if next_cursor >= end:
+            return ProposalIdPage(ids=ids.copy(), next_cursor=UInt64(end), done=Bool(True))
+
+        filter_category = category.native.bytes.length > 0
+        hashed = category_hash(category)
+        page_no = next_cursor // index_page_bits
+        page = self._id_set_page(filter_category, hashed, status.native, page_no)
+        word_no = (next_cursor % index_page_bits) // 64
+        # Drop the bits of the proposals before the cursor
+        word = op.extract_uint64(page, word_no * 8) & (op.shr(NativeUInt64(2**64 - 1), next_cursor % 64))
+        words_left = NativeUInt64(max_list_words)
+
+        while ids.length < limit.native:
+            if word == 0:
+                words_left -= 1
+                word_no += 1
+                if word_no == index_page_bits // 64:
+                    page_no += 1
+                    word_no = NativeUInt64(0)
+                next_cursor = page_no * index_page_bits + word_no * 64
+                if words_left == 0 or next_cursor >= end:
+                    break
+                if word_no == 0:
+                    page = self._id_set_page(filter_category, hashed, status.native, page_no)
+                word = op.extract_uint64(page, word_no * 8)
+            else:
+                high = op.bitlen(word)
+                proposal_id = page_no * index_page_bits + word_no * 64 + 64 - high
+                if proposal_id >= end:
+                    next_cursor = end
+                    break
+                ids.append(UInt64(proposal_id))
+                next_cursor = proposal_id + 1
+                word = word ^ op.shl(NativeUInt64(1), high - 1)
+
+        if next_cursor > end:
+            next_cursor = end
+        return ProposalIdPage(ids=ids.copy(), next_cursor=UInt64(next_cursor), done=Bool(next_cursor == end))
+
+
+    # ------------------ Vote helpers ------------------
+    @subroutine
+    def _add_eligible_weight(self, proposal_id: UInt64, previous_amount: NativeUInt64, amount: NativeUInt64) -> None:
+        """Adds the vote weight a donor gains going from `previous_amount` donated to `amount`."""
+        eligible, tracked = self.eligibleWeight.maybe(proposal_id)
+        # Proposals created before the weight was tracked never get it, rather than an undercount
+        if tracked:
+            self.eligibleWeight[proposal_id] = UInt64(
+                eligible.native
+                + op.sqrt(amount // NativeUInt64(1_000_000))
+                - op.sqrt(previous_amount // NativeUInt64(1_000_000))
+            )
+
+    @subroutine
+    def _outcome_decided(self, proposal_id: UInt64, votes_for: NativeUInt64, votes_against: NativeUInt64) -> bool:
+        """Whether the eligible weight not cast yet on the milestone could no longer change its outcome."""
+        eligible, tracked = self.eligibleWeight.maybe(proposal_id)
+        if not tracked:
+            return False
+        cast = votes_for + votes_against
+        outstanding = eligible.native - cast if eligible.native > cast else NativeUInt64(0)
+        if votes_for > votes_against:
+            return votes_for - votes_against > outstanding
+        return votes_against - votes_for >= outstanding
+
+
+    # ------------------ Index helpers ------------------
+    @subroutine
+    def _page_key(self, index: NativeUInt64, proposal_id: NativeUInt64) -> Bytes:
+        return IdSetPageKey(index=UInt64(index), page=UInt64(proposal_id // index_page_bits)).bytes
+
+    @subroutine
+    def _set_status(self, proposal_id: NativeUInt64, status: NativeUInt64, member: bool) -> None:
+        set_id_set_bit(self.statusIndex.key_prefix + self._page_key(status, proposal_id), proposal_id, member)
+
+    @subroutine
+    def _id_set_page(
+        self, filter_category: bool, hashed_category: NativeUInt64, status: NativeUInt64, page_no: NativeUInt64
+    ) -> Bytes:
+        """One page of the set of proposals matching both filters, as a bitset."""
+        page = ~op.bzero(index_page_bytes)
+        if status != 0:
+            key = IdSetPageKey(index=UInt64(status), page=UInt64(page_no))
+            page = page & self.statusIndex.get(key, default=op.bzero(index_page_bytes))
+        if filter_category:
+            key = IdSetPageKey(index=UInt64(hashed_category), page=UInt64(page_no))
+            page = page & self.categoryIndex.get(key, default=op.bzero(index_page_bytes))
+        return page
+
+
     # ------------------ Future Self Methods ------------------
     @abimethod()
     def fund_future_self(
@@ -271,6 +627,7 @@ class ProposalContract(ARC4Contract):
         assert payment.receiver == Global.current_application_address, "Payment must go to contract"
         assert payment.amount > 0, "Must fund with positive amount"
         assert payment.sender == Txn.sender, "Funding must be from caller"
+        assert self.import_stage.value != import_open, "State import in progress"
 
         idx = self.no_of_future_funds.value
         self.futureFunds[idx] = FutureFund(
@@ -285,6 +642,7 @@ class ProposalContract(ARC4Contract):
 
     @abimethod()
     def claim_future_self(self, fund_id: UInt64) -> None:
+        assert self.import_stage.value != import_open, "State import in progress"
         assert fund_id in self.futureFunds, "Fund does not exist"
         fund = self.futureFunds[fund_id].copy()
 
@@ -300,4 +658,30 @@ class ProposalContract(ARC4Contract):
 
         fund.claimed = Bool(True)
         self.futureFunds[fund_id] = fund.copy()
-    
\ No newline at end of file
+    
+
+
+    # ------------------ Migration Methods ------------------
+    @abimethod()
+    def begin_import(self) -> None:
+        assert Txn.sender == Global.creator_address, "Only the creator can import state"
+        assert self.import_stage.value == import_never, "State was already imported"
+        assert self.no_of_proposals.value == 0 and self.no_of_future_funds.value == 0, "App already has state"
+        self.import_stage.value = UInt64(import_open)
+
+    @abimethod()
+    def import_boxes(self, chunks: DynamicArray[BoxChunk]) -> None:
+        assert Txn.sender == Global.creator_address, "Only the creator can import state"
+        assert self.import_stage.value == import_open, "State import not in progress"
+        for index in urange(chunks.length):
+            chunk = chunks[index].copy()
+            _created = op.Box.create(chunk.name.native, chunk.size.native)
+            op.Box.replace(chunk.name.native, chunk.offset.native, chunk.data.native)
+
+    @abimethod()
+    def end_import(self, no_of_proposals: UInt64, no_of_future_funds: UInt64) -> None:
+        assert Txn.sender == Global.creator_address, "Only the creator can import state"
+        assert self.import_stage.value == import_open, "State import not in progress"
+        self.no_of_proposals.value = no_of_proposals
+        self.no_of_future_funds.value = no_of_future_funds
+        self.import_stage.value = UInt64(import_ended)
@@ -0,0 +1,431 @@
+"""
+Static worst-case cost analysis of the ProposalContract approval program.
+
+Walks ProposalContract.approval.teal from each ABI method's router entry and bounds
+every loop by the input sizes it iterates over (milestones per proposal, voters per
+milestone), reporting the worst-case opcode cost, box bytes read and written, and the
+box references needed for those sizes.
+
+    python -m smart_contracts.ff.cost_analysis --milestones 5 --voters 40 --proof-link 256
+    python -m smart_contracts.ff.cost_analysis --check --app-calls 2
+"""
+
+import argparse
+import dataclasses
+import math
+import sys
+import typing
+from pathlib import Path
+
+import algokit_utils
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts._helpers.teal import Block, Instruction, TealProgram
+
+ARTIFACTS = Path(__file__).parent.parent / "artifacts" / "ff"
+
+# AVM limits for a single app call; a group can pool more by adding app calls
+OPCODE_BUDGET = 700
+# Readonly methods are only ever simulated, with the most extra budget simulate allows
+SIMULATE_OPCODE_BUDGET = 20_000 * 16
+BOX_IO_PER_REFERENCE = 1024
+MAX_BOX_REFERENCES = 8
+# Inner transactions a group can issue; methods using ensure_budget can spend them all on opcode budget
+MAX_INNER_TXNS = 256
+MAX_GROUP_SIZE = 16
+
+# Methods whose clients top their groups up with app calls that only carry box
+# references (bulk_create for create_proposals, the relayer for vote_milestone_batch),
+# so a call can reference as many boxes as a full group, less create_proposals' payment
+REFERENCE_FILLED_METHODS = {"create_proposals", "vote_milestone_batch"}
+
+MAX_MILESTONES = 5  # enforced by create_proposal
+MAX_LIST_LIMIT = 64  # enforced by list_proposals
+MAX_LIST_WORDS = 64  # bitset words list_proposals scans per call
+VOTE_BATCH_BUDGET = 700  # budget vote_milestone_batch reserves per call,
+VOTE_BUDGET = 2_100  # per vote,
+VOTE_SCAN_BUDGET = 24  # and per vote for each earlier voter
+CREATE_BUDGET = 1_700  # budget create_proposals reserves per proposal
+
+
+@dataclasses.dataclass(frozen=True)
+class Sizes:
+    """Input sizes the worst case is computed for. Text sizes are in bytes."""
+
+    milestones: int = MAX_MILESTONES
+    voters: int = 0
+    proof_link: int = 0
+    milestone_name: int = 0
+    # name, title, description and category together
+    proposal_text: int = 0
+    # Signed votes in one vote_milestone_batch call
+    batch_votes: int = 0
+    # Box chunks in one import_boxes call
+    import_chunks: int = 0
+    # Proposals in one create_proposals call
+    batch_proposals: int = 0
+
+
+# Iterations of every loop in the approval program, keyed by the contract statement
+# the loop was compiled from, or by label for puya library helpers (which have no
+# source). A new loop must be added here before the analysis will run, so CI
+# catches unbounded iteration.
+LOOP_BOUNDS: dict[str, typing.Callable[[Sizes], int]] = {
+    "for index in urange(milestones.length):": lambda s: s.milestones,
+    "for idx in urange(prop.milestones.length):": lambda s: s.milestones,
+    "for addr in milestone_votes:": lambda s: s.voters,
+    "for index in urange(votes.length):": lambda s: s.batch_votes,
+    "for index in urange(chunks.length):": lambda s: s.import_chunks,
+    "for index in urange(proposals.length):": lambda s: s.batch_proposals,
+    # One inner app call per OPCODE_BUDGET of the budget reserved. puya shares the
+    # helper between vote_milestone_batch and create_proposals, and the sizes of a
+    # call to one leave the other's reservation at 0.
+    "ensure_budget_while_top@1": lambda s: math.ceil(
+        max(
+            VOTE_BATCH_BUDGET + s.batch_votes * (VOTE_BUDGET + s.voters * VOTE_SCAN_BUDGET) if s.batch_votes else 0,
+            s.batch_proposals * CREATE_BUDGET,
+        )
+        / OPCODE_BUDGET
+    ),
+    # Each iteration either lists an ID or moves on to the next bitset word
+    "while ids.length < limit.native:": lambda s: MAX_LIST_LIMIT + MAX_LIST_WORDS,
+    # The helpers are only called on milestone arrays, appending one item at a time
+    "dynamic_array_concat_dynamic_element_for_header@1": lambda s: s.milestones,
+    "dynamic_array_concat_dynamic_element_for_header@5": lambda s: 1,
+    "dynamic_array_replace_dynamic_element_for_header@2": lambda s: s.milestones,
+    "static_array_replace_dynamic_element_for_header@1": lambda s: s.milestones,
+}
+
+# Loops working on another record (proposal, voter) every iteration, whose box accesses
+# each need boxes of their own. Other loops revisit the boxes they started with.
+BATCH_LOOPS = {
+    "for index in urange(votes.length):",
+    "for index in urange(proposals.length):",
+}
+
+
+# ARC-4 encoded box value sizes, from the structs in contract.py
+_PROPOSAL_HEAD = 4 * 2 + 8 + 32 + 8 + 2 + 4 * 8
+_MILESTONE_HEAD = 2 + 8 + 2 + 3 * 8 + 1 + 2 * 8
+
+BOX_SIZES: dict[str, typing.Callable[[Sizes], int]] = {
+    "proposals": lambda s: (
+        _PROPOSAL_HEAD
+        + 4 * 2
+        + s.proposal_text
+        + 2
+        + s.milestones * (2 + _MILESTONE_HEAD + 2 + s.milestone_name + 2 + s.proof_link)
+    ),
+    "milestoneVotes": lambda s: 2 + 32 * s.voters,
+    "donations": lambda s: 8,
+    "eligibleWeight": lambda s: 8,
+    "futureFunds": lambda s: 32 + 32 + 8 + 8 + 1,
+    "statusIndex": lambda s: 256,
+    "categoryIndex": lambda s: 256,
+}
+
+_BOX_READS = {"box_get", "box_extract"}
+_BOX_WRITES = {"box_put", "box_replace", "box_splice", "box_create", "box_resize"}
+
+
+@dataclasses.dataclass(frozen=True)
+class MethodCost:
+    method: str
+    opcodes: int
+    box_bytes_read: int
+    box_bytes_written: int
+    boxes: tuple[str, ...]
+    box_references: int
+    readonly: bool = False
+    # Raises its own opcode budget with inner app calls
+    opup: bool = False
+    # Sent in groups whose spare app calls carry its box references
+    reference_filled: bool = False
+
+    @property
+    def app_calls_needed(self) -> int:
+        """App calls the group needs to pool enough opcode budget (always 1 for simulated readonly and opup calls)."""
+        if self.readonly or self.opup:
+            return 1
+        return max(1, math.ceil(self.opcodes / OPCODE_BUDGET))
+
+    def fits(self, app_calls: int = 1) -> bool:
+        """Whether a group with `app_calls` app calls pools enough opcode budget and box references."""
+        if self.readonly:
+            return self.opcodes <= SIMULATE_OPCODE_BUDGET and self.box_references <= MAX_BOX_REFERENCES
+        inner_calls = MAX_INNER_TXNS if self.opup else 0
+        reference_calls = MAX_GROUP_SIZE - 1 if self.reference_filled else app_calls
+        return (
+            self.opcodes <= OPCODE_BUDGET * (app_calls + inner_calls)
+            and self.box_references <= MAX_BOX_REFERENCES * reference_calls
+        )
+
+
+def _box_map(instruction_source: str | None) -> str | None:
+    """
+    The box map a box op works on, from the contract statement it was compiled from.
+    For a call to a helper taking the box name as an argument (as `set_id_set_bit` does
+    with the index pages), the statement making the call names the map instead.
+    """
+    if instruction_source:
+        for name in BOX_SIZES:
+            if f"self.{name}" in instruction_source:
+                return name
+    return None
+
+
+class CostAnalyser:
+    def __init__(
+        self,
+        program: TealProgram | None = None,
+        app_spec: algokit_utils.Arc56Contract | None = None,
+    ) -> None:
+        self.program = program or TealProgram.from_file(ARTIFACTS / "ProposalContract.approval.teal")
+        self.app_spec = app_spec or algokit_utils.Arc56Contract.from_json(
+            (ARTIFACTS / "ProposalContract.arc56.json").read_text()
+        )
+        entries = self.program.method_entries()
+        self.entries = {
+            method.name: entries[method.to_abi_method().get_selector().hex()]
+            for method in self.app_spec.methods
+        }
+        self.readonly = {method.name for method in self.app_spec.methods if method.readonly}
+        self._loop_keys = {
+            header: self._loop_key(header)
+            for subroutine in {block.subroutine for block in self.program.blocks.values()}
+            for header in self.program.loops(subroutine)
+        }
+        unbounded = set(self._loop_keys.values()) - LOOP_BOUNDS.keys()
+        if unbounded:
+            raise ValueError(f"No iteration bound for loops: {', '.join(sorted(unbounded))}")
+        # Subroutines doing box ops on a name they are passed, so no map is in their own source
+        self._box_helpers = {
+            block.subroutine
+            for block in self.program.blocks.values()
+            for instruction in block.instructions
+            if instruction.op.startswith("box_") and _box_map(instruction.source) is None
+        }
+
+    def _loop_key(self, header: str) -> str:
+        instructions = self.program.blocks[header].instructions
+        source = next((i.source for i in instructions if i.source), None)
+        return source or header
+
+    def _reachable(self, label: str) -> list[Block]:
+        seen: set[str] = set()
+        stack = [label]
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in self.program.blocks:
+                continue
+            seen.add(current)
+            block = self.program.blocks[current]
+            stack.extend(block.successors)
+            stack.extend(block.calls)
+        return [self.program.blocks[name] for name in seen]
+
+    def _helper_box(self, instruction: Instruction) -> str | None:
+        """The map a call to a box helper works on, if `instruction` is one."""
+        if instruction.op != "callsub" or instruction.immediates[0] not in self._box_helpers:
+            return None
+        return _box_map(instruction.source)
+
+    def _subroutine_blocks(self, label: str) -> list[Block]:
+        """Blocks reachable from `label` without leaving its subroutine."""
+        subroutine = self.program.blocks[label].subroutine
+        seen: set[str] = set()
+        stack = [label]
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in self.program.blocks:
+                continue
+            if self.program.blocks[current].subroutine != subroutine:
+                continue
+            seen.add(current)
+            stack.extend(self.program.blocks[current].successors)
+        return [self.program.blocks[name] for name in seen]
+
+    def _box_counts(
+        self,
+        label: str,
+        loop_bound: typing.Callable[[str], int],
+        counts: dict[str, int],
+        repeats: int = 1,
+    ) -> dict[str, int]:
+        """
+        Boxes of each map the code from `label` on can touch, if it runs `repeats` times:
+        one per map and iteration of the batch loops around the access, and every call to
+        a box helper (every index page update) is a box of its own.
+        """
+        loops = {
+            header: body
+            for header, body in self.program.loops(self.program.blocks[label].subroutine).items()
+            if self._loop_keys[header] in BATCH_LOOPS
+        }
+        for block in self._subroutine_blocks(label):
+            block_repeats = repeats * math.prod(loop_bound(header) for header, body in loops.items() if block.label in body)
+            for instruction in block.instructions:
+                if instruction.op == "callsub":
+                    box = self._helper_box(instruction)
+                    if box:
+                        counts[box] = counts.get(box, 0) + block_repeats
+                    else:
+                        self._box_counts(instruction.immediates[0], loop_bound, counts, block_repeats)
+                elif instruction.op.startswith("box_") and (box := _box_map(instruction.source)):
+                    counts[box] = max(counts.get(box, 0), block_repeats)
+        return counts
+
+    def analyse(self, method: str, sizes: Sizes) -> MethodCost:
+        entry = self.entries[method]
+
+        def loop_bound(header: str) -> int:
+            return LOOP_BOUNDS[self._loop_keys[header]](sizes)
+
+        def box_bytes(ops: set[str]) -> typing.Callable[[Block], int]:
+            def helper_ops(block: Block) -> int:
+                return sum(1 for i in block.instructions if i.op in ops and _box_map(i.source) is None)
+
+            def cost(block: Block) -> int:
+                total = 0
+                for instruction in block.instructions:
+                    if instruction.op in ops and (box := _box_map(instruction.source)):
+                        total += BOX_SIZES[box](sizes)
+                    elif box := self._helper_box(instruction):
+                        helper = instruction.immediates[0]
+                        total += self.program.worst_case(helper, helper_ops, loop_bound) * BOX_SIZES[box](sizes)
+                return total
+
+            return cost
+
+        counts = self._box_counts(entry, loop_bound, {})
+        boxes = sorted(box for box, count in counts.items() if count)
+        touched = sum(BOX_SIZES[box](sizes) * count for box, count in counts.items())
+        opup = any(
+            instruction.source and "ensure_budget(" in instruction.source
+            for block in self._reachable(entry)
+            for instruction in block.instructions
+        )
+        return MethodCost(
+            method=method,
+            opcodes=self.program.worst_case(entry, lambda b: sum(i.cost for i in b.instructions), loop_bound),
+            box_bytes_read=self.program.worst_case(entry, box_bytes(_BOX_READS), loop_bound),
+            box_bytes_written=self.program.worst_case(entry, box_bytes(_BOX_WRITES), loop_bound),
+            boxes=tuple(boxes),
+            # Every accessed box needs a reference, and together they must cover its bytes
+            box_references=max(sum(counts.values()), math.ceil(touched / BOX_IO_PER_REFERENCE)),
+            readonly=method in self.readonly,
+            opup=opup,
+            reference_filled=method in REFERENCE_FILLED_METHODS,
+        )
+
+    def analyse_all(self, sizes: Sizes) -> list[MethodCost]:
+        return [self.analyse(method, sizes) for method in self.entries]
+
+    def max_size(self, method: str, field: str, sizes: Sizes, app_calls: int = 1, limit: int = 4096) -> int:
+        """
+        Largest value of size `field` (others as in `sizes`) at which `method` still fits
+        the budget of `app_calls` app calls, or -1 if it doesn't fit even at 0.
+        """
+        low, high = 0, limit
+        if not self.analyse(method, dataclasses.replace(sizes, **{field: 0})).fits(app_calls):
+            return -1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.analyse(method, dataclasses.replace(sizes, **{field: middle})).fits(app_calls):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+
+# Workloads compile variants are compared on; each method's cost is summed over them
+WORKLOADS = {
+    "typical": Sizes(milestones=3, voters=10, proof_link=64, milestone_name=16, proposal_text=256, batch_votes=5),
+    "large": Sizes(
+        milestones=MAX_MILESTONES, voters=16, proof_link=256, milestone_name=32, proposal_text=1024, batch_votes=16
+    ),
+}
+
+
+def variant_costs(output_dir: Path) -> dict[str, int]:
+    """Worst-case opcodes per method over `WORKLOADS` for a build in `output_dir`."""
+    analyser = CostAnalyser(
+        TealProgram.from_file(output_dir / "ProposalContract.approval.teal"),
+        algokit_utils.Arc56Contract.from_json((output_dir / "ProposalContract.arc56.json").read_text()),
+    )
+    return {
+        method: sum(analyser.analyse(method, sizes).opcodes for sizes in WORKLOADS.values())
+        for method in analyser.entries
+    }
+
+
+def print_report(
+    analyser: CostAnalyser, sizes: Sizes, app_calls: int = 1, console: Console | None = None
+) -> None:
+    console = console or Console()
+    table = Table(title=f"Worst case at {sizes}, budget of {app_calls} app call(s)")
+    for column in ("method", "opcodes", "app calls", "box read", "box written", "box refs", "boxes"):
+        table.add_column(column, justify="left" if column in ("method", "boxes") else "right")
+    for cost in analyser.analyse_all(sizes):
+        style = None if cost.fits(app_calls) else "red"
+        table.add_row(
+            cost.method,
+            str(cost.opcodes),
+            str(cost.app_calls_needed),
+            str(cost.box_bytes_read),
+            str(cost.box_bytes_written),
+            str(cost.box_references),
+            ", ".join(cost.boxes),
+            style=style,
+        )
+    console.print(table)
+
+    scaling = Table(title="Opcode cost by milestone count")
+    scaling.add_column("method")
+    for milestones in range(1, MAX_MILESTONES + 1):
+        scaling.add_column(str(milestones), justify="right")
+    scaling.add_column(f"max voters @ {sizes.milestones}", justify="right")
+    for method in analyser.entries:
+        costs = [
+            analyser.analyse(method, dataclasses.replace(sizes, milestones=milestones)).opcodes
+            for milestones in range(1, MAX_MILESTONES + 1)
+        ]
+        max_voters = analyser.max_size(method, "voters", sizes, app_calls)
+        scaling.add_row(
+            method,
+            *(str(cost) for cost in costs),
+            "-" if max_voters < 0 else ("unbounded" if max_voters >= 4096 else str(max_voters)),
+        )
+    console.print(scaling)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    for field in dataclasses.fields(Sizes):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=int, default=field.default)
+    parser.add_argument(
+        "--app-calls",
+        type=int,
+        default=1,
+        help="app calls per group to pool opcode budget and box references over",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if any method exceeds the pooled budget at these sizes",
+    )
+    args = parser.parse_args()
+
+    sizes = Sizes(**{field.name: getattr(args, field.name) for field in dataclasses.fields(Sizes)})
+    analyser = CostAnalyser()
+    print_report(analyser, sizes, args.app_calls)
+    if args.check:
+        over = [cost.method for cost in analyser.analyse_all(sizes) if not cost.fits(args.app_calls)]
+        if over:
+            print(f"Over budget at {sizes}: {', '.join(over)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,148 @@
 import logging
+import os
 
 import algokit_utils
 
 logger = logging.getLogger(__name__)
 
 
-# define deployment behaviour based on supplied app spec
-def deploy() -> None:
+def _fund_if_new(
+    algorand: algokit_utils.AlgorandClient,
+    sender: str,
+    app_address: str,
+    result: algokit_utils.AppFactoryDeployResult,
+) -> None:
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=1),
+                sender=sender,
+                receiver=app_address,
+            )
+        )
+
+
+def deploy_shards(
+    algorand: algokit_utils.AlgorandClient, deployer: str, no_of_shards: int
+) -> int:
+    """
+    Deploys a ShardRegistry and `no_of_shards` ProposalContract shards, adding any
+    shard the registry doesn't list yet. Shards keep their place in the registry, so
+    the count can be raised on a later deploy but not lowered. Returns the registry app ID.
+    """
     from smart_contracts.artifacts.ff.proposal_contract_client import (
         ProposalContractFactory,
     )
+    from smart_contracts.artifacts.ff_registry.shard_registry_client import (
+        AddShardArgs,
+        ShardRegistryFactory,
+    )
 
+    registry_factory = algorand.client.get_typed_app_factory(
+        ShardRegistryFactory, default_sender=deployer
+    )
+    registry, result = registry_factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+    _fund_if_new(algorand, deployer, registry.app_address, result)
+
+    registered = list(registry.send.get_shards().abi_return or [])
+    if no_of_shards < len(registered):
+        raise ValueError(
+            f"Registry {registry.app_id} already has {len(registered)} shards, can't shrink to {no_of_shards}"
+        )
+
+    factory = algorand.client.get_typed_app_factory(
+        ProposalContractFactory, default_sender=deployer
+    )
+    for shard in range(no_of_shards):
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+            app_name=f"ProposalContract-shard-{shard}",
+        )
+        _fund_if_new(algorand, deployer, app_client.app_address, result)
+        if shard < len(registered):
+            if registered[shard] != app_client.app_id:
+                # Appended apps start with empty state, so the old shard stays the one holding its IDs
+                logger.warning(
+                    f"Shard {shard} is registered as app {registered[shard]}, not {app_client.app_id}"
+                )
+            continue
+        registry.send.add_shard(AddShardArgs(app_id=app_client.app_id))
+        logger.info(f"Registered app {app_client.app_id} as shard {shard}")
+
+    logger.info(
+        f"Deployed shard registry {registry.app_id} with {no_of_shards} shards"
+    )
+    return registry.app_id
+
+
+# define deployment behaviour based on supplied app spec
+def deploy() -> None:
     algorand = algokit_utils.AlgorandClient.from_environment()
     deployer_ = algorand.account.from_environment("DEPLOYER")
 
+    # Set FF_METRICS to a file to write the deploy's client metrics to, in Prometheus text
+    metrics_path = os.environ.get("FF_METRICS")
+    if metrics_path:
+        from smart_contracts.ff.metrics import instrument, operation
+
+        registry = instrument(algorand)
+        with operation("deploy"):
+            _deploy(algorand, deployer_.address)
+        registry.write(metrics_path)
+        logger.info(f"Wrote deploy metrics to {metrics_path}")
+        return
+
+    _deploy(algorand, deployer_.address)
+
+
+def _deploy(algorand: algokit_utils.AlgorandClient, deployer: str) -> None:
+    from smart_contracts.artifacts.ff.proposal_contract_client import (
+        ProposalContractFactory,
+    )
+
+    # Set FF_SHARDS to spread proposals over that many apps behind a registry
+    no_of_shards = int(os.environ.get("FF_SHARDS", "0"))
+    if no_of_shards:
+        deploy_shards(algorand, deployer, no_of_shards)
+        return
+
     factory = algorand.client.get_typed_app_factory(
-        ProposalContractFactory, default_sender=deployer_.address
+        ProposalContractFactory, default_sender=deployer
     )
 
     #algorand.client.algod.set_timestamp_offset(0)
 
+    previous = algorand.app_deployer.get_creator_apps_by_name(
+        creator_address=deployer
+    ).apps.get(factory.app_name)
+
     app_client, result = factory.deploy(
         on_update=algokit_utils.OnUpdate.AppendApp,
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
     )
 
-    if result.operation_performed in [
-        algokit_utils.OperationPerformed.Create,
-        algokit_utils.OperationPerformed.Replace,
-    ]:
-        algorand.send.payment(
-            algokit_utils.PaymentParams(
-                amount=algokit_utils.AlgoAmount(algo=1),
-                sender=deployer_.address,
-                receiver=app_client.app_address,
-            )
+    _fund_if_new(algorand, deployer, app_client.app_address, result)
+
+    # Set FF_MIGRATE to carry the state of the app a new one was appended over into it
+    if (
+        os.environ.get("FF_MIGRATE")
+        and previous is not None
+        and previous.app_id != app_client.app_id
+    ):
+        from smart_contracts.ff.migrate import migrate
+
+        migrate(
+            algorand,
+            previous.app_id,
+            deployer,
+            target_app_id=app_client.app_id,
         )
 
     logger.info(
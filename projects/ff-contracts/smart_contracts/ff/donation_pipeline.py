@@ -0,0 +1,356 @@
+import asyncio
+import base64
+import dataclasses
+import hashlib
+import logging
+import time
+import typing
+
+import algokit_utils
+import httpx
+from algosdk import encoding, error
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts._helpers.stats import LatencyRecorder
+from smart_contracts.ff.async_client import AsyncProposalContractClient
+from smart_contracts.ff.boxes import method_box_references
+from smart_contracts.ff.errors import failure_cause
+from smart_contracts.ff.metrics import installed_metrics
+
+logger = logging.getLogger(__name__)
+
+# How long to wait for more donations before signing a partial batch
+_BATCH_LINGER = 0.02
+# How long a pending pool size reading is trusted before asking algod again
+_POOL_CHECK_INTERVAL = 0.5
+_POOL_BACKOFF = 0.25
+
+
+@dataclasses.dataclass(frozen=True)
+class Donation:
+    """A donation to submit. `reference` is the caller's idempotency key, e.g. a gateway payment ID."""
+
+    proposal_id: int
+    donor: str
+    amount: int
+    reference: str
+
+
+@dataclasses.dataclass(frozen=True)
+class DonationResult:
+    donation: Donation
+    status: typing.Literal["confirmed", "duplicate", "failed"]
+    attempts: int
+    tx_ids: list[str]
+    confirmed_round: int | None = None
+    error: str | None = None
+
+
+def donation_lease(donation: Donation) -> bytes:
+    """Deterministic 32-byte lease for a donation, derived from its reference."""
+    return hashlib.sha256(b"ff-donation:" + donation.reference.encode()).digest()
+
+
+@dataclasses.dataclass
+class _Attempt:
+    donation: Donation
+    result: "asyncio.Future[DonationResult]"
+    enqueued_at: float
+    attempts: int = 0
+    # After an expired attempt, the first round a rebuilt group may be valid in
+    first_valid_round: int | None = None
+    txns: list[TransactionWithSigner] = dataclasses.field(default_factory=list)
+    signed: list[bytes] = dataclasses.field(default_factory=list)
+
+    @property
+    def tx_ids(self) -> list[str]:
+        return [t.txn.get_txid() for t in self.txns]
+
+
+class DonationPipeline:
+    """
+    High-throughput `donate_proposal` submission built on the generated composer.
+
+    Donations flow through build -> sign -> submit -> confirm stages:
+
+    - every donation's payment carries a lease derived from its `reference`, so the
+      node rejects a second payment for the same reference while an earlier attempt
+      is still valid. Retries resend the exact same signed bytes (same txids) while
+      the first attempt's validity window is open, and only rebuild once that window
+      has passed without confirmation, at which point the earlier attempt can no
+      longer land.
+    - suggested params are fetched once per round and shared by every group built
+      in that round.
+    - groups are signed in batches, one `sign_transactions` call per signer.
+    - submission pauses when `max_in_flight` groups are unconfirmed or the node's
+      pending pool holds more than `max_pending_pool` transactions, and `submit()`
+      blocks once `max_queued` donations are waiting.
+
+    Per-stage latency percentiles and throughput are available from `stats`.
+    """
+
+    def __init__(
+        self,
+        client: AsyncProposalContractClient,
+        *,
+        sign_batch_size: int = 64,
+        max_in_flight: int = 256,
+        max_queued: int = 1024,
+        max_pending_pool: int = 10_000,
+        max_attempts: int = 3,
+        validity_window: int | None = None,
+    ) -> None:
+        self.client = client
+        self.stats = LatencyRecorder()
+        self._sign_batch_size = sign_batch_size
+        self._max_pending_pool = max_pending_pool
+        self._max_attempts = max_attempts
+        self._validity_window = validity_window
+        self._queue: asyncio.Queue[_Attempt] = asyncio.Queue(maxsize=max_queued)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._pool_size = 0
+        self._pool_checked_at = 0.0
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._batcher: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "DonationPipeline":
+        self._batcher = asyncio.create_task(self._batch_loop())
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.drain()
+        if self._batcher:
+            self._batcher.cancel()
+
+    async def submit(self, donation: Donation) -> "asyncio.Future[DonationResult]":
+        """Queues a donation, waiting while the queue is full. Returns a future for its result."""
+        result: asyncio.Future[DonationResult] = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Attempt(donation, result, time.monotonic()))
+        return result
+
+    async def run(self, donations: typing.Iterable[Donation]) -> list[DonationResult]:
+        """Submits every donation and waits for all of them to finish."""
+        futures = [await self.submit(donation) for donation in donations]
+        return list(await asyncio.gather(*futures))
+
+    async def drain(self) -> None:
+        """Waits until every queued donation has a result."""
+        while True:
+            await self._queue.join()
+            if not self._tasks:
+                return
+            # Expired attempts are put back on the queue, so check it again afterwards
+            await asyncio.gather(*list(self._tasks))
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_LINGER
+            while len(batch) < self._sign_batch_size:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), max(0.0, deadline - loop.time()))
+                    )
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._build(batch)
+                self._sign(batch)
+            except Exception as ex:
+                logger.exception("Failed to build donation batch")
+                for attempt in batch:
+                    self._finish(attempt, "failed", error_message=str(ex))
+            else:
+                for attempt in batch:
+                    task = asyncio.create_task(self._submit(attempt))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _build(self, batch: list[_Attempt]) -> None:
+        started = time.monotonic()
+        sync_client = self.client.sync_client
+        algorand = sync_client.algorand
+        await self.client.prime_suggested_params()
+        for attempt in batch:
+            donation = attempt.donation
+            payment = algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    sender=donation.donor,
+                    receiver=sync_client.app_address,
+                    amount=algokit_utils.AlgoAmount(micro_algo=donation.amount),
+                    lease=donation_lease(donation),
+                    note=donation.reference.encode(),
+                    validity_window=self._validity_window,
+                    first_valid_round=attempt.first_valid_round,
+                )
+            )
+            group = sync_client.new_group().donate_proposal(
+                args=(donation.proposal_id, payment),
+                params=algokit_utils.CommonAppCallParams(
+                    sender=donation.donor,
+                    validity_window=self._validity_window,
+                    first_valid_round=attempt.first_valid_round,
+                    box_references=method_box_references(
+                        "donate_proposal", (donation.proposal_id,), donation.donor
+                    ),
+                ),
+            )
+            attempt.txns = group.composer().build().transactions
+            attempt.attempts += 1
+        elapsed = time.monotonic() - started
+        for _ in batch:
+            self.stats.record("build", elapsed)
+
+    def _sign(self, batch: list[_Attempt]) -> None:
+        started = time.monotonic()
+        by_signer: dict[int, list[tuple[_Attempt, int]]] = {}
+        signers = {}
+        for attempt in batch:
+            attempt.signed = [b""] * len(attempt.txns)
+            for index, txn in enumerate(attempt.txns):
+                by_signer.setdefault(id(txn.signer), []).append((attempt, index))
+                signers[id(txn.signer)] = txn.signer
+        for signer_id, entries in by_signer.items():
+            txns = [attempt.txns[index].txn for attempt, index in entries]
+            signed = signers[signer_id].sign_transactions(txns, list(range(len(txns))))
+            for (attempt, index), stxn in zip(entries, signed, strict=True):
+                attempt.signed[index] = base64.b64decode(encoding.msgpack_encode(stxn))
+        elapsed = time.monotonic() - started
+        for _ in batch:
+            self.stats.record("sign", elapsed)
+
+    async def _wait_for_pool_capacity(self) -> None:
+        while True:
+            now = time.monotonic()
+            if now - self._pool_checked_at > _POOL_CHECK_INTERVAL:
+                self._pool_size = await self.client.algod.pending_transaction_count()
+                self._pool_checked_at = now
+            if self._pool_size < self._max_pending_pool:
+                return
+            self.stats.increment("pool_backoff")
+            await asyncio.sleep(_POOL_BACKOFF)
+
+    async def _submit(self, attempt: _Attempt) -> None:
+        try:
+            await self._send_and_confirm(attempt)
+        except Exception as ex:
+            # Any error must still give the donation a result, or run() and drain() never return
+            logger.exception(f"Submitting donation {attempt.donation.reference} failed")
+            self.client.watcher.unwatch(attempt.tx_ids[-1])
+            self._finish(attempt, "failed", error_message=str(ex))
+
+    async def _send_and_confirm(self, attempt: _Attempt) -> None:
+        async with self._in_flight:
+            confirmed_round: int | None
+            started = time.monotonic()
+            payload = b"".join(attempt.signed)
+            first_valid = min(t.txn.first_valid_round for t in attempt.txns)
+            last_valid = max(t.txn.last_valid_round for t in attempt.txns)
+            # Watched before sending so a confirmation in the very next round isn't missed
+            confirmed = self.client.watcher.watch(attempt.tx_ids[-1], first_valid, last_valid)
+            try:
+                while True:
+                    await self._wait_for_pool_capacity()
+                    try:
+                        await self.client.algod.send_raw_transaction(payload)
+                        break
+                    except httpx.TransportError:
+                        # The node may or may not have accepted it; resending the same bytes is safe
+                        self.stats.increment("submit_retry")
+                        installed_metrics().increment("retries_total", method="donate_proposal", reason="transport")
+                        await asyncio.sleep(_POOL_BACKOFF)
+                    except error.AlgodHTTPError as ex:
+                        message = str(ex)
+                        cause = failure_cause(message)
+                        if cause == "overlapping lease":
+                            self.client.watcher.unwatch(attempt.tx_ids[-1])
+                            self._finish(attempt, "duplicate", error_message=message)
+                            return
+                        if cause == "already in ledger":
+                            # An earlier send of these exact bytes confirmed
+                            self.client.watcher.unwatch(attempt.tx_ids[-1])
+                            confirmed_round = await self._confirmed_round(
+                                attempt, first_valid, last_valid
+                            )
+                            self._finish(attempt, "confirmed", confirmed_round=confirmed_round)
+                            return
+                        if cause == "transaction pool full":
+                            self.stats.increment("pool_backoff")
+                            installed_metrics().increment("retries_total", method="donate_proposal", reason="pool_full")
+                            self._pool_checked_at = 0.0
+                            await asyncio.sleep(_POOL_BACKOFF)
+                            continue
+                        self.client.watcher.unwatch(attempt.tx_ids[-1])
+                        self._finish(attempt, "failed", error_message=message)
+                        return
+            except BaseException:
+                self.client.watcher.unwatch(attempt.tx_ids[-1])
+                raise
+            self.stats.record("submit", time.monotonic() - started)
+
+            started = time.monotonic()
+            try:
+                confirmed_round = await confirmed
+            except TimeoutError as ex:
+                # Never rebuild on the watcher's word alone: if the group did land, a
+                # rebuilt one outside the old lease would pay a second time
+                confirmed_round = await self._confirmed_round(attempt, first_valid, last_valid)
+                if confirmed_round is None:
+                    self.stats.increment("expired")
+                    if attempt.attempts >= self._max_attempts:
+                        self._finish(attempt, "failed", error_message=str(ex))
+                        return
+                    # The previous group is confirmed not to be in any round it was valid
+                    # for, so a rebuilt one valid only after its window can't double-donate
+                    attempt.first_valid_round = last_valid + 1
+                    await self._queue.put(attempt)
+                    return
+            self.stats.record("confirm", time.monotonic() - started)
+            self._finish(attempt, "confirmed", confirmed_round=confirmed_round)
+
+    async def _confirmed_round(
+        self, attempt: _Attempt, first_valid: int, last_valid: int
+    ) -> int | None:
+        """
+        The round the attempt's group was confirmed in, or None if it isn't in any round
+        of its validity window. Asks the node's pending pool first, and falls back to
+        reading the txids of every round in the window once the node has forgotten it.
+        """
+        tx_id = attempt.tx_ids[-1]
+        try:
+            info = await self.client.algod.pending_transaction_info(tx_id)
+            if info.get("confirmed-round"):
+                return typing.cast(int, info["confirmed-round"])
+        except error.AlgodHTTPError as ex:
+            if ex.code != 404:
+                raise
+        last_round = (await self.client.algod.status())["last-round"]
+        for round_num in range(first_valid, min(last_valid, last_round) + 1):
+            if tx_id in await self.client.algod.block_txids(round_num):
+                return round_num
+        return None
+
+    def _finish(
+        self,
+        attempt: _Attempt,
+        status: typing.Literal["confirmed", "duplicate", "failed"],
+        *,
+        confirmed_round: int | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        self.stats.increment(status)
+        self.stats.record("end_to_end", time.monotonic() - attempt.enqueued_at)
+        if not attempt.result.done():
+            attempt.result.set_result(
+                DonationResult(
+                    donation=attempt.donation,
+                    status=status,
+                    attempts=attempt.attempts,
+                    tx_ids=attempt.tx_ids,
+                    confirmed_round=confirmed_round,
+                    error=error_message,
+                )
+            )
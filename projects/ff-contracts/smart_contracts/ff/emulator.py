@@ -0,0 +1,27 @@
+"""
+Workarounds for gaps in algorand-python-testing, for code that runs ProposalContract
+in its emulator rather than on a network.
+"""
+
+import typing
+
+
+def patch_static_struct_sizes() -> None:
+    """
+    algorand-python-testing 0.4 sizes static structs as 0 bytes when they are array
+    items, so arrays of them (the `SignedVote`s of vote_milestone_batch) can't be decoded.
+    Sizes them as the tuples they encode as instead. Calling it again does nothing.
+    """
+    from _algopy_testing import arc4 as testing_arc4
+
+    original = testing_arc4._get_max_bytes_len
+    if getattr(original, "__emulator_patched__", False):
+        return
+
+    def get_max_bytes_len(type_info: typing.Any) -> int:
+        if isinstance(type_info, testing_arc4._StructTypeInfo):
+            return original(testing_arc4._tuple_type_from_struct(type_info.struct_type)._type_info)
+        return original(type_info)
+
+    get_max_bytes_len.__emulator_patched__ = True  # type: ignore[attr-defined]
+    testing_arc4._get_max_bytes_len = get_max_bytes_len
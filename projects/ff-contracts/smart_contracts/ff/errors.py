@@ -0,0 +1,44 @@
+import re
+
+import algokit_utils
+
+_PC_PATTERN = re.compile(r"pc=(\d+)")
+
+# Node-side rejections that aren't tied to an assert in the approval program
+_NODE_FAILURES = {
+    "dynamic cost budget exceeded": "opcode budget exceeded",
+    "cost budget exceeded": "opcode budget exceeded",
+    "box read budget": "box I/O budget exceeded",
+    "box write budget": "box I/O budget exceeded",
+    "exceeds box quota": "box I/O budget exceeded",
+    "box size too large": "box size limit exceeded",
+    "invalid Box reference": "missing box reference",
+    "unavailable Box": "missing box reference",
+    "overspend": "insufficient balance",
+    "below min": "insufficient balance",
+    "fee too small": "fee too small",
+    "overlapping lease": "overlapping lease",
+    "transaction pool have reached capacity": "transaction pool full",
+    "transaction pool is full": "transaction pool full",
+    "txn dead": "validity window passed",
+    "already in ledger": "already in ledger",
+}
+
+
+def failure_cause(message: str, app_spec: algokit_utils.Arc56Contract | None = None) -> str:
+    """
+    Reduces a node or logic error message to a short, stable cause. Failed asserts are
+    mapped back to their message in contract.py through the ARC-56 source info.
+    """
+    for needle, cause in _NODE_FAILURES.items():
+        if needle in message:
+            return cause
+    match = _PC_PATTERN.search(message)
+    if match and app_spec and app_spec.source_info:
+        pc = int(match.group(1))
+        for info in app_spec.source_info.approval.source_info:
+            if pc in info.pc and info.error_message:
+                return info.error_message
+    if match:
+        return f"logic error at pc={match.group(1)}"
+    return message.splitlines()[0][:120] if message else "unknown error"
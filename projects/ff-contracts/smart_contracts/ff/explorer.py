@@ -0,0 +1,721 @@
+"""
+Search for ProposalContract calls that pass validation but don't fit the budget.
+
+A candidate is a proposal's lifecycle: create_proposal, donations reaching its goal,
+then for each of its proof links a submit_proof and a vote_milestone (made after as
+many earlier voters as the candidate has, written straight into the votes box), the
+milestone being claimed before the next proof. Candidates run in algorand-python-testing,
+one new proposal each; as the emulator runs contract.py rather than TEAL, the cost of a
+create_proposal, submit_proof or vote_milestone call is the static worst case for the
+sizes it left in state (see cost_analysis), as replay.py measures it.
+
+New candidates are drawn at random, their sizes biased to the boundaries, or mutated
+from a corpus that keeps the ones reaching contract.py lines, line hit counts, cost
+levels or rejections no earlier candidate did, and the costliest so far per method.
+Worker processes search in parallel and merge their corpora between rounds. The
+smallest candidates found whose calls don't fit `--app-calls` app calls' budget are
+then shrunk one size at a time, and reported.
+
+    python -m smart_contracts.ff.explorer --workers 4 --rounds 5 --executions 200 --app-calls 3
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import random
+import sys
+import time
+import typing
+from pathlib import Path
+
+from algopy_testing import algopy_testing_context
+from algosdk import abi, encoding
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts.ff import contract
+from smart_contracts.ff.boxes import milestone_votes_box_name
+from smart_contracts.ff.cost_analysis import (
+    MAX_BOX_REFERENCES,
+    MAX_INNER_TXNS,
+    MAX_MILESTONES,
+    OPCODE_BUDGET,
+    CostAnalyser,
+    MethodCost,
+)
+from smart_contracts.ff.replay import RecordedCall, Replayer
+
+logger = logging.getLogger(__name__)
+
+# Calls whose cost is measured
+MEASURED = ("create_proposal", "submit_proof", "vote_milestone")
+
+# App ID candidates run under, and the latest timestamp when a worker starts
+_EXPLORER_APP_ID = 1001
+_START = 1_700_000_000
+# Mirrors the constant in contract.py
+_PROPOSAL_FEE = 2_000_000
+# The least a donor can vote with
+_DONATION = 1_000_000
+
+# A call's application arguments, its selector included, can't be larger
+_MAX_ARGS_BYTES = 2048
+_SELECTOR_BYTES = 4
+
+# How the emulator rejects a value over the AVM's 4096-byte stack limit, which no
+# budget lifts: a box read whole that grew past it can't be read by the call at all
+_OVER_STACK_LIMIT = "expected value length <= 4096"
+
+# Largest sizes candidates are drawn with
+_MAX_VOTERS = 512
+_MAX_AMOUNT = 10**12
+# Text is drawn from characters of 1 to 4 UTF-8 bytes, as box sizes count bytes
+_ALPHABET = "abcdefxyz0123456789 -_/.:éß€𝔉"
+
+# Candidates drawn fresh rather than mutated, and mutated from the costliest, out of every 10
+_FRESH_IN_10 = 2
+_COSTLIEST_IN_10 = 5
+_COSTLIEST_PARENTS = 8
+_MAX_CORPUS = 512
+
+_CONTRACT_FILE = inspect.getsourcefile(contract)
+
+Feature = tuple[typing.Any, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class Candidate:
+    name: str = "p"
+    title: str = "t"
+    description: str = "d"
+    category: str = ""
+    # (name, amount) per milestone
+    milestones: tuple[tuple[str, int], ...] = (("m", _DONATION),)
+    # Proof links submitted for the first milestones in turn; each is voted on, and all but the last claimed
+    proof_links: tuple[str, ...] = ()
+    # Voters already in the votes box when each milestone's vote is measured
+    voters: int = 0
+
+    @property
+    def amount_required(self) -> int:
+        return sum(amount for _, amount in self.milestones)
+
+    @property
+    def size(self) -> int:
+        """What shrinking minimises: the bytes of text, and the milestones, proofs and voters."""
+        return (
+            sum(len(text.encode()) for text in self._texts())
+            + len(self.milestones)
+            + len(self.proof_links)
+            + self.voters
+        )
+
+    def _texts(self) -> list[str]:
+        return [
+            self.name,
+            self.title,
+            self.description,
+            self.category,
+            *(name for name, _ in self.milestones),
+            *self.proof_links,
+        ]
+
+    def describe(self) -> str:
+        text = sum(len(field.encode()) for field in (self.name, self.title, self.description, self.category))
+        names = sum(len(name.encode()) for name, _ in self.milestones)
+        proofs = ", ".join(str(len(link.encode())) for link in self.proof_links) or "none"
+        return (
+            f"text {text}B, {len(self.milestones)} milestones (names {names}B), "
+            f"proofs of {proofs} B, {self.voters} earlier voters"
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Outcome:
+    candidate: Candidate
+    # Worst-case cost of each measured call, in the order they ran
+    costs: tuple[MethodCost, ...]
+    # "method: cause" of the call that failed, if one did
+    rejected: str | None
+    features: frozenset[Feature]
+    # App calls whose budget the calls must fit in
+    app_calls: int
+
+    def load(self, method: str | None = None) -> float:
+        """Share of its budget the costliest measured call (of `method`, or any) uses."""
+        return max(
+            (_load(cost, self.app_calls) for cost in self.costs if method in (None, cost.method)),
+            default=0.0,
+        )
+
+    def exceeds(self, method: str) -> bool:
+        """Whether a call of `method` didn't fit the budget, or failed on a value over the stack limit."""
+        return self.over_stack_limit(method) or any(
+            cost.method == method and not cost.fits(self.app_calls) for cost in self.costs
+        )
+
+    def over_stack_limit(self, method: str) -> bool:
+        return self.rejected == f"{method}: {_OVER_STACK_LIMIT}"
+
+    def costliest(self, method: str) -> MethodCost | None:
+        return max(
+            (cost for cost in self.costs if cost.method == method),
+            key=lambda cost: _load(cost, self.app_calls),
+            default=None,
+        )
+
+
+def _load(cost: MethodCost, app_calls: int) -> float:
+    """How much of the budget of `app_calls` app calls the call uses; above 1 it doesn't fit."""
+    inner_calls = MAX_INNER_TXNS if cost.opup else 0
+    return max(
+        cost.opcodes / (OPCODE_BUDGET * (app_calls + inner_calls)),
+        cost.box_references / (MAX_BOX_REFERENCES * app_calls),
+    )
+
+
+def _address(role: str, index: int = 0) -> bytes:
+    return hashlib.sha256(f"ff-explorer:{role}:{index}".encode()).digest()
+
+
+class _LineHits:
+    """Counts the contract.py lines run while it's entered, into `hits` (swap it between candidates)."""
+
+    def __init__(self) -> None:
+        self.hits: collections.Counter[tuple[str, int]] = collections.Counter()
+
+    def _on_line(self, code: typing.Any, line: int) -> typing.Any:
+        if code.co_filename != _CONTRACT_FILE:
+            return sys.monitoring.DISABLE
+        self.hits[code.co_name, line] += 1
+        return None
+
+    def __enter__(self) -> "_LineHits":
+        monitoring = sys.monitoring
+        monitoring.use_tool_id(monitoring.COVERAGE_ID, "ff-explorer")
+        monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, self._on_line)
+        monitoring.set_events(monitoring.COVERAGE_ID, monitoring.events.LINE)
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        monitoring = sys.monitoring
+        monitoring.set_events(monitoring.COVERAGE_ID, 0)
+        monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, None)
+        monitoring.free_tool_id(monitoring.COVERAGE_ID)
+        monitoring.restart_events()
+
+
+class Runner:
+    """Runs candidates one after another in the emulator, each on a new proposal of the same app."""
+
+    def __init__(self, replayer: Replayer, analyser: CostAnalyser, line_hits: _LineHits, app_calls: int) -> None:
+        self.replayer = replayer
+        self.analyser = analyser
+        self.line_hits = line_hits
+        self.app_calls = app_calls
+        self.timestamp = _START
+        self.creator = encoding.encode_address(_address("creator"))
+        self.voter = encoding.encode_address(_address("voter"))
+        self._arg_types = {
+            method.name: [
+                abi.ABIType.from_string(str(arg.type))
+                for arg in method.args
+                if not abi.is_abi_transaction_type(str(arg.type))
+            ]
+            for method in replayer.app_spec.methods
+        }
+        self._costs: dict[tuple[str, typing.Any], MethodCost] = {}
+
+    @property
+    def _next_id(self) -> int:
+        return int.from_bytes(self.replayer.global_state.get(b"noOfProposals", b""), "big")
+
+    def run(self, candidate: Candidate) -> Outcome:
+        hits = self.line_hits.hits = collections.Counter()
+        costs: list[MethodCost] = []
+        rejected = self._play(candidate, costs)
+        # Hit counts in powers of two, so more loop iterations reach new features
+        features: set[Feature] = {(function, line, count.bit_length()) for (function, line), count in hits.items()}
+        features.update(
+            (cost.method, cost.opcodes // OPCODE_BUDGET, cost.box_references) for cost in costs
+        )
+        if rejected:
+            features.add(("rejected", rejected))
+        return Outcome(candidate, tuple(costs), rejected, frozenset(features), self.app_calls)
+
+    def _play(self, candidate: Candidate, costs: list[MethodCost]) -> str | None:
+        proposal_id = self._next_id
+        create_args = [
+            candidate.name,
+            candidate.title,
+            candidate.description,
+            candidate.category,
+            candidate.amount_required,
+            [list(milestone) for milestone in candidate.milestones],
+            {"sender": self.creator, "amount": _PROPOSAL_FEE},
+        ]
+        if rejected := self._call(self.creator, "create_proposal", create_args, costs):
+            return rejected
+        # The voter donates the least it can vote with, and the creator the rest of the goal
+        donations = [(self.voter, _DONATION)]
+        if candidate.amount_required > _DONATION:
+            donations.append((self.creator, candidate.amount_required - _DONATION))
+        for donor, amount in donations:
+            if rejected := self._call(donor, "donate_proposal", [proposal_id, {"sender": donor, "amount": amount}], costs):
+                return rejected
+        earlier_voters = candidate.voters.to_bytes(2, "big") + b"".join(
+            _address("earlier-voter", index) for index in range(candidate.voters)
+        )
+        for index, proof_link in enumerate(candidate.proof_links):
+            if index:
+                self.timestamp += contract.voting_time
+                if rejected := self._call(self.creator, "claim_milestone", [proposal_id], costs):
+                    return rejected
+            if rejected := self._call(self.creator, "submit_proof", [proposal_id, proof_link], costs):
+                return rejected
+            self.replayer.ctx.ledger.set_box(
+                self.replayer.app,
+                milestone_votes_box_name(proposal_id),
+                earlier_voters,
+            )
+            if rejected := self._call(self.voter, "vote_milestone", [proposal_id, True], costs):
+                return rejected
+        return None
+
+    def _call(self, sender: str, method: str, args: list[typing.Any], costs: list[MethodCost]) -> str | None:
+        self.timestamp += 1
+        size = _SELECTOR_BYTES + sum(
+            len(abi_type.encode(value))
+            for abi_type, value in zip(self._arg_types[method], (arg for arg in args if not isinstance(arg, dict)), strict=True)
+        )
+        if size > _MAX_ARGS_BYTES:
+            return f"{method}: app args over {_MAX_ARGS_BYTES} bytes"
+        call = RecordedCall(
+            round=self.timestamp - _START, timestamp=self.timestamp, tx_id="", sender=sender, method=method, args=args
+        )
+        if not self.replayer.replay(call):
+            failure = typing.cast(str, self.replayer.last_failure)
+            return f"{method}: {_OVER_STACK_LIMIT if failure.startswith(_OVER_STACK_LIMIT) else failure}"
+        if method in MEASURED:
+            sizes = self.replayer._sizes(call)
+            cost = self._costs.get((method, sizes))
+            if cost is None:
+                cost = self._costs[method, sizes] = self.analyser.analyse(method, sizes)
+            costs.append(cost)
+        return None
+
+
+@functools.cache
+def _analyser() -> CostAnalyser:
+    return CostAnalyser()
+
+
+def _runner(stack: contextlib.ExitStack, app_calls: int) -> Runner:
+    """A runner on a new emulator app, closed with `stack` (an ExitStack)."""
+    ctx = stack.enter_context(algopy_testing_context())
+    line_hits = stack.enter_context(_LineHits())
+    return Runner(Replayer(ctx, _EXPLORER_APP_ID), _analyser(), line_hits, app_calls)
+
+
+# ------------------ Strategies ------------------
+
+
+def _size(rng: random.Random, limit: int) -> int:
+    """A size up to `limit`, mostly small and often at a boundary."""
+    choice = rng.randrange(5)
+    if choice == 0:
+        return rng.choice((0, 1, limit))
+    if choice == 1:
+        return rng.randint(0, min(limit, 32))
+    return min(limit, int(limit ** rng.random()))
+
+
+def _text(rng: random.Random, limit: int) -> str:
+    """A string of at most `limit` UTF-8 bytes."""
+    target = _size(rng, limit)
+    chars: list[str] = []
+    size = 0
+    while size < target:
+        char = rng.choice(_ALPHABET)
+        if size + len(char.encode()) > target:
+            char = "a"
+        chars.append(char)
+        size += len(char.encode())
+    return "".join(chars)
+
+
+def _amount(rng: random.Random) -> int:
+    return rng.choice((0, 1, _DONATION, rng.randint(1, _MAX_AMOUNT)))
+
+
+def random_candidate(rng: random.Random) -> Candidate:
+    # Texts share the app args of create_proposal, with a random split between them
+    limit = _MAX_ARGS_BYTES // rng.choice((4, 8, 16, 32))
+    milestones = tuple(
+        (_text(rng, limit), rng.choice((_DONATION, rng.randint(1, _MAX_AMOUNT))))
+        for _ in range(rng.choice((1, rng.randint(0, MAX_MILESTONES + 1), MAX_MILESTONES)))
+    )
+    return Candidate(
+        name=_text(rng, limit) or "p",
+        title=_text(rng, limit) or "t",
+        description=_text(rng, limit) or "d",
+        category=_text(rng, limit),
+        milestones=milestones,
+        proof_links=tuple(
+            _text(rng, _MAX_ARGS_BYTES // rng.choice((1, 2, 4, 16)))
+            for _ in range(rng.randint(0, len(milestones)))
+        ),
+        voters=_size(rng, _MAX_VOTERS),
+    )
+
+
+def _resized(rng: random.Random, text: str, limit: int) -> str:
+    choice = rng.randrange(4)
+    if choice == 0:
+        return _text(rng, limit)
+    if choice == 1:
+        return text[: len(text) // 2]
+    if choice == 2:
+        return (text * 2 or "a")[: limit]
+    return text + _text(rng, max(0, limit - len(text.encode())))
+
+
+def mutate(rng: random.Random, candidate: Candidate, other: Candidate) -> Candidate:
+    """`candidate` with one to three random changes, one of which may take fields from `other`."""
+    for _ in range(rng.randint(1, 3)):
+        milestones = list(candidate.milestones)
+        proof_links = list(candidate.proof_links)
+        choice = rng.randrange(8)
+        if choice == 0:
+            field = rng.choice(("name", "title", "description", "category"))
+            candidate = dataclasses.replace(
+                candidate, **{field: _resized(rng, getattr(candidate, field), _MAX_ARGS_BYTES)}
+            )
+        elif choice == 1 and milestones:
+            index = rng.randrange(len(milestones))
+            milestones[index] = (_resized(rng, milestones[index][0], _MAX_ARGS_BYTES), milestones[index][1])
+        elif choice == 2 and proof_links:
+            index = rng.randrange(len(proof_links))
+            proof_links[index] = _resized(rng, proof_links[index], _MAX_ARGS_BYTES)
+        elif choice == 3:
+            if rng.random() < 0.5 and milestones:
+                milestones.pop(rng.randrange(len(milestones)))
+            else:
+                milestones.append((_text(rng, 64), rng.choice((_DONATION, _amount(rng)))))
+        elif choice == 4:
+            if rng.random() < 0.5 and proof_links:
+                proof_links.pop()
+            else:
+                proof_links.append(_text(rng, _MAX_ARGS_BYTES))
+        elif choice == 5:
+            voters = candidate.voters
+            candidate = dataclasses.replace(
+                candidate,
+                voters=min(
+                    _MAX_VOTERS,
+                    rng.choice((0, voters + 1, max(0, voters - 1), voters * 2 + 1, voters // 2, _size(rng, _MAX_VOTERS))),
+                ),
+            )
+        elif choice == 6 and milestones:
+            index = rng.randrange(len(milestones))
+            milestones[index] = (milestones[index][0], _amount(rng))
+        elif choice == 7:
+            fields = [field.name for field in dataclasses.fields(Candidate)]
+            candidate = dataclasses.replace(
+                candidate, **{field: getattr(other, field) for field in rng.sample(fields, rng.randint(1, len(fields)))}
+            )
+        if choice in (1, 2, 3, 4, 6):
+            candidate = dataclasses.replace(candidate, milestones=tuple(milestones), proof_links=tuple(proof_links))
+    return candidate
+
+
+# ------------------ Search ------------------
+
+
+@dataclasses.dataclass
+class RoundResult:
+    # Outcomes that reached features the worker hadn't been given, or were the costliest of a method
+    kept: list[Outcome] = dataclasses.field(default_factory=list)
+    # Method -> the smallest candidate found whose call of it doesn't fit
+    smallest: dict[str, Outcome] = dataclasses.field(default_factory=dict)
+    rejections: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    executions: int = 0
+
+
+def _keep_smallest(smallest: dict[str, Outcome], outcome: Outcome) -> None:
+    for method in MEASURED:
+        if outcome.exceeds(method) and (
+            method not in smallest or outcome.candidate.size < smallest[method].candidate.size
+        ):
+            smallest[method] = outcome
+
+
+def search_round(
+    seed: int, corpus: list[Outcome], known: frozenset[Feature], executions: int, app_calls: int
+) -> RoundResult:
+    """One worker's share of a round: `executions` candidates drawn or mutated from `corpus`."""
+    rng = random.Random(seed)
+    result = RoundResult()
+    corpus = list(corpus)
+    seen = set(known)
+    costliest = {method: max((o.load(method) for o in corpus), default=0.0) for method in MEASURED}
+    with contextlib.ExitStack() as stack:
+        runner = _runner(stack, app_calls)
+        for _ in range(executions):
+            draw = rng.randrange(10)
+            if not corpus or draw < _FRESH_IN_10:
+                candidate = random_candidate(rng)
+            else:
+                if draw < _FRESH_IN_10 + _COSTLIEST_IN_10:
+                    parent = rng.choice(sorted(corpus, key=lambda o: -o.load())[:_COSTLIEST_PARENTS])
+                else:
+                    parent = rng.choice(corpus)
+                candidate = mutate(rng, parent.candidate, rng.choice(corpus).candidate)
+            outcome = runner.run(candidate)
+            result.executions += 1
+            if outcome.rejected:
+                result.rejections[outcome.rejected] += 1
+            _keep_smallest(result.smallest, outcome)
+            new_features = outcome.features - seen
+            costlier = [method for method in MEASURED if outcome.load(method) > costliest[method]]
+            if new_features or costlier:
+                seen |= new_features
+                for method in costlier:
+                    costliest[method] = outcome.load(method)
+                corpus.append(outcome)
+                result.kept.append(outcome)
+    return result
+
+
+def shrink(runner: Runner, outcome: Outcome, method: str) -> Outcome:
+    """
+    The smallest candidate found from `outcome`'s whose `method` call still doesn't fit:
+    each size (voters, each text, proofs, milestones) is binary searched down in turn,
+    until none goes down any more.
+    """
+    best = outcome
+    changed = True
+    while changed:
+        changed = False
+        index = 0
+        while index < len(dimensions := _dimensions(best.candidate)):
+            length, resize = dimensions[index]
+            low, high = 0, length
+            while low < high:
+                middle = (low + high) // 2
+                trial = runner.run(resize(middle))
+                if trial.exceeds(method):
+                    high = middle
+                    best, changed = trial, True
+                else:
+                    low = middle + 1
+            index += 1
+    return best
+
+
+def _dimensions(candidate: Candidate) -> list[tuple[int, typing.Callable[[int], Candidate]]]:
+    """Each size of `candidate` that can shrink, with how to make a copy with it at a given length."""
+    replace = functools.partial(dataclasses.replace, candidate)
+    dimensions: list[tuple[int, typing.Callable[[int], Candidate]]] = [
+        (candidate.voters, lambda n: replace(voters=n)),
+        (len(candidate.proof_links), lambda n: replace(proof_links=candidate.proof_links[:n])),
+        (len(candidate.milestones), lambda n: replace(milestones=candidate.milestones[:n])),
+    ]
+    for field in ("name", "title", "description", "category"):
+        text = getattr(candidate, field)
+        dimensions.append((len(text), lambda n, field=field, text=text: replace(**{field: text[:n]})))
+    for index, (name, amount) in enumerate(candidate.milestones):
+        dimensions.append(
+            (
+                len(name),
+                lambda n, index=index, name=name, amount=amount: replace(
+                    milestones=(*candidate.milestones[:index], (name[:n], amount), *candidate.milestones[index + 1 :])
+                ),
+            )
+        )
+    for index, link in enumerate(candidate.proof_links):
+        dimensions.append(
+            (
+                len(link),
+                lambda n, index=index, link=link: replace(
+                    proof_links=(*candidate.proof_links[:index], link[:n], *candidate.proof_links[index + 1 :])
+                ),
+            )
+        )
+    return dimensions
+
+
+def _shrink_task(outcome: Outcome, method: str, app_calls: int) -> tuple[str, Outcome]:
+    with contextlib.ExitStack() as stack:
+        return method, shrink(_runner(stack, app_calls), outcome, method)
+
+
+@dataclasses.dataclass
+class ExplorerReport:
+    app_calls: int
+    executions: int = 0
+    seconds: float = 0.0
+    corpus: list[Outcome] = dataclasses.field(default_factory=list)
+    features: int = 0
+    # Method -> the costliest outcome found for it
+    costliest: dict[str, Outcome] = dataclasses.field(default_factory=dict)
+    # Method -> the smallest outcome found whose call of it doesn't fit, shrunk
+    smallest: dict[str, Outcome] = dataclasses.field(default_factory=dict)
+    rejections: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+
+def explore(*, workers: int, rounds: int, executions: int, app_calls: int, seed: int = 0) -> ExplorerReport:
+    """Searches in `workers` processes for `rounds` rounds of `executions` candidates each, then shrinks what was found."""
+    report = ExplorerReport(app_calls=app_calls)
+    known: set[Feature] = set()
+    started = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for round_index in range(rounds):
+            futures = [
+                executor.submit(
+                    search_round,
+                    seed * 1_000_003 + round_index * workers + worker,
+                    report.corpus,
+                    frozenset(known),
+                    executions,
+                    app_calls,
+                )
+                for worker in range(workers)
+            ]
+            for future in futures:
+                result = future.result()
+                report.executions += result.executions
+                report.rejections.update(result.rejections)
+                for outcome in result.kept:
+                    _keep_smallest(report.smallest, outcome)
+                    new_features = outcome.features - known
+                    costlier = [
+                        method
+                        for method in MEASURED
+                        if outcome.load(method) > (report.costliest[method].load(method) if method in report.costliest else 0.0)
+                    ]
+                    for method in costlier:
+                        report.costliest[method] = outcome
+                    if new_features or costlier:
+                        known |= new_features
+                        report.corpus.append(outcome)
+                for outcome in result.smallest.values():
+                    _keep_smallest(report.smallest, outcome)
+            # The costliest outcomes stay in the corpus, then the newest
+            if len(report.corpus) > _MAX_CORPUS:
+                costliest = {id(outcome) for outcome in report.costliest.values()}
+                report.corpus = [o for o in report.corpus if id(o) in costliest] + [
+                    o for o in report.corpus if id(o) not in costliest
+                ][-(_MAX_CORPUS - len(costliest)) :]
+            logger.info(
+                f"Round {round_index + 1}/{rounds}: {report.executions} candidates, {len(known)} features, "
+                f"over the limits: {', '.join(sorted(report.smallest)) or 'none'}"
+            )
+        shrunk = executor.map(
+            _shrink_task,
+            list(report.smallest.values()),
+            list(report.smallest),
+            [app_calls] * len(report.smallest),
+        )
+        report.smallest = dict(shrunk)
+    report.features = len(known)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+# ------------------ Reporting ------------------
+
+
+def _cost_row(outcome: Outcome, method: str) -> list[str]:
+    cost = outcome.costliest(method)
+    return [
+        method,
+        str(cost.opcodes) if cost else "-",
+        str(cost.box_references) if cost else "-",
+        "value > 4096B" if outcome.over_stack_limit(method) else f"{outcome.load(method):.0%}",
+        str(outcome.candidate.size),
+        outcome.candidate.describe(),
+    ]
+
+
+def print_report(report: ExplorerReport, console: Console | None = None) -> None:
+    console = console or Console()
+    console.print(
+        f"{report.executions} candidates in {report.seconds:.1f}s "
+        f"({report.executions / report.seconds if report.seconds else 0:.0f}/s), "
+        f"{report.features} features, corpus of {len(report.corpus)}"
+    )
+    columns = ("method", "opcodes", "box refs", f"of {report.app_calls} app call(s)", "size", "input")
+    for title, outcomes, style in (
+        ("Costliest calls found", report.costliest, None),
+        ("Smallest inputs over the limits", report.smallest, "red"),
+    ):
+        table = Table(title=title)
+        for column in columns:
+            table.add_column(column, justify="left" if column in ("method", "input") else "right")
+        for method in MEASURED:
+            if method in outcomes:
+                table.add_row(*_cost_row(outcomes[method], method), style=style)
+        console.print(table)
+
+    rejections = Table(title="Rejected candidates")
+    rejections.add_column("cause")
+    rejections.add_column("candidates", justify="right")
+    for cause, count in report.rejections.most_common():
+        rejections.add_row(cause, str(count))
+    console.print(rejections)
+
+
+def write_findings(report: ExplorerReport, path: Path) -> None:
+    """Writes the smallest inputs over the limits, with their costs, as JSON."""
+    path.write_text(
+        json.dumps(
+            {
+                method: {
+                    "candidate": dataclasses.asdict(outcome.candidate),
+                    "costs": [dataclasses.asdict(cost) for cost in outcome.costs if cost.method == method],
+                }
+                for method, outcome in report.smallest.items()
+            },
+            indent=2,
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--executions", type=int, default=200, help="Candidates each worker runs per round")
+    parser.add_argument(
+        "--app-calls",
+        type=int,
+        default=3,
+        help="App calls whose pooled opcode budget and box references a call must fit in",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="Write the smallest inputs over the limits here, as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    report = explore(
+        workers=args.workers, rounds=args.rounds, executions=args.executions, app_calls=args.app_calls, seed=args.seed
+    )
+    print_report(report)
+    if args.out:
+        write_findings(report, args.out)
+    sys.exit(1 if report.smallest else 0)
+
+
+if __name__ == "__main__":
+    main()
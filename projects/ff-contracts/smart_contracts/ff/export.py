@@ -0,0 +1,375 @@
+"""
+Columnar export of ProposalContract state to Parquet.
+
+Writes one dataset per table (proposals, milestones, donations, milestone_voters,
+future_funds, eligible_weights) under the output directory, partitioned by the round each export ran
+at. The first run exports every box; later runs only refetch the boxes touched by app
+calls since the previous export (found through the indexer) and append them as a new
+partition.
+
+Every box's rows are rewritten whenever it changes, so the current rows for a key (a
+proposal, donation or future fund) are the ones in the newest partition holding that
+key. Rows with `deleted` set are tombstones for a box that no longer exists, and a
+milestone_voters row with a null `position` marks a voter list that is now empty (as
+submit_proof leaves it), so neither case leaves older rows looking current.
+
+    python -m smart_contracts.ff.export --app-id 1002 --out ./ff-export
+
+Requires pyarrow (`poetry install --extras export`). Load with e.g.
+`pyarrow.dataset.dataset("ff-export/proposals", partitioning="hive")`.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import typing
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts.artifacts.ff.proposal_contract_client import ProposalContractClient
+from smart_contracts.ff.async_client import AsyncAlgod, fetch_boxes
+from smart_contracts.ff.boxes import (
+    DecodedBox,
+    changed_box_names,
+    classify_box_name,
+    decode_box,
+    decode_box_key,
+    eligible_weight_box_name,
+    future_fund_box_name,
+    milestone_votes_box_name,
+    proposal_box_name,
+)
+
+if typing.TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "_manifest.json"
+
+_UINT64 = "uint64"
+_STRING = "string"
+_BOOL = "bool_"
+
+# Column name -> pyarrow type factory name, per table
+TABLE_COLUMNS: dict[str, dict[str, str]] = {
+    "proposals": {
+        "proposal_id": _UINT64,
+        "name": _STRING,
+        "title": _STRING,
+        "description": _STRING,
+        "category": _STRING,
+        "amount_required": _UINT64,
+        "created_by": _STRING,
+        "amount_raised": _UINT64,
+        "no_of_donations": _UINT64,
+        "no_of_unique_donors": _UINT64,
+        "current_milestone": _UINT64,
+        "created_at": _UINT64,
+        "milestone_count": _UINT64,
+        "round": _UINT64,
+        "deleted": _BOOL,
+    },
+    "milestones": {
+        "proposal_id": _UINT64,
+        "milestone_index": _UINT64,
+        "name": _STRING,
+        "amount": _UINT64,
+        "proof_link": _STRING,
+        "votes_for": _UINT64,
+        "votes_against": _UINT64,
+        "total_voters": _UINT64,
+        "claimed": _BOOL,
+        "proof_submitted_time": _UINT64,
+        "voting_end_time": _UINT64,
+        "round": _UINT64,
+        "deleted": _BOOL,
+    },
+    "milestone_voters": {
+        "proposal_id": _UINT64,
+        "position": _UINT64,
+        "voter": _STRING,
+        "round": _UINT64,
+        "deleted": _BOOL,
+    },
+    "donations": {
+        "proposal_id": _UINT64,
+        "donor": _STRING,
+        "amount": _UINT64,
+        "round": _UINT64,
+        "deleted": _BOOL,
+    },
+    "future_funds": {
+        "fund_id": _UINT64,
+        "primary": _STRING,
+        "backup": _STRING,
+        "unlock_time": _UINT64,
+        "amount": _UINT64,
+        "claimed": _BOOL,
+        "round": _UINT64,
+        "deleted": _BOOL,
+    },
+    "eligible_weights": {
+        "proposal_id": _UINT64,
+        "eligible_weight": _UINT64,
+        "round": _UINT64,
+        "deleted": _BOOL,
+    },
+}
+
+
+def _pyarrow() -> typing.Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as ex:
+        raise ImportError("The state exporter requires pyarrow: poetry install --extras export") from ex
+    return pyarrow
+
+
+def table_rows(box: DecodedBox, round_num: int) -> typing.Iterator[tuple[str, dict[str, typing.Any]]]:
+    """Flattens a decoded box into (table, row) pairs."""
+    value = box.value
+    match box.map_name:
+        case "proposals":
+            milestones = value["milestones"]
+            yield "proposals", {
+                **{k: v for k, v in value.items() if k != "milestones"},
+                "proposal_id": box.key,
+                "milestone_count": len(milestones),
+                "round": round_num,
+                "deleted": False,
+            }
+            for index, milestone in enumerate(milestones):
+                yield "milestones", {
+                    **milestone,
+                    "proposal_id": box.key,
+                    "milestone_index": index,
+                    "round": round_num,
+                    "deleted": False,
+                }
+        case "milestoneVotes":
+            if not value:
+                # No voter rows would leave the previous vote's voters as the latest ones
+                yield "milestone_voters", {"proposal_id": box.key, "round": round_num, "deleted": False}
+            for position, voter in enumerate(value):
+                yield "milestone_voters", {
+                    "proposal_id": box.key,
+                    "position": position,
+                    "voter": voter,
+                    "round": round_num,
+                    "deleted": False,
+                }
+        case "donations":
+            yield "donations", {**box.key, "amount": value, "round": round_num, "deleted": False}
+        case "futureFunds":
+            yield "future_funds", {**value, "fund_id": box.key, "round": round_num, "deleted": False}
+        case "eligibleWeight":
+            yield "eligible_weights", {
+                "proposal_id": box.key,
+                "eligible_weight": value,
+                "round": round_num,
+                "deleted": False,
+            }
+
+
+def tombstone_rows(map_name: str, key: typing.Any, round_num: int) -> typing.Iterator[tuple[str, dict[str, typing.Any]]]:
+    """(table, row) pairs marking the rows of a deleted box as deleted, with only the key columns set."""
+    match map_name:
+        case "proposals":
+            yield "proposals", {"proposal_id": key, "round": round_num, "deleted": True}
+            yield "milestones", {"proposal_id": key, "round": round_num, "deleted": True}
+        case "milestoneVotes":
+            yield "milestone_voters", {"proposal_id": key, "round": round_num, "deleted": True}
+        case "donations":
+            yield "donations", {**key, "round": round_num, "deleted": True}
+        case "futureFunds":
+            yield "future_funds", {"fund_id": key, "round": round_num, "deleted": True}
+        case "eligibleWeight":
+            yield "eligible_weights", {"proposal_id": key, "round": round_num, "deleted": True}
+
+
+class ParquetSink:
+    """
+    Buffers rows per table and writes them as record batches to
+    `<out_dir>/<table>/export_round=<round>/part-0.parquet`, so memory stays bounded
+    by `batch_size` rows per table however large the export is.
+    """
+
+    def __init__(self, out_dir: Path, export_round: int, batch_size: int = 10_000) -> None:
+        self._pa = _pyarrow()
+        self.out_dir = out_dir
+        self.export_round = export_round
+        self.batch_size = batch_size
+        self.rows_written: dict[str, int] = {table: 0 for table in TABLE_COLUMNS}
+        self._buffers: dict[str, list[dict[str, typing.Any]]] = {table: [] for table in TABLE_COLUMNS}
+        self._writers: dict[str, typing.Any] = {}
+        self._schemas: dict[str, "pyarrow.Schema"] = {
+            table: self._pa.schema([(name, getattr(self._pa, type_name)()) for name, type_name in columns.items()])
+            for table, columns in TABLE_COLUMNS.items()
+        }
+
+    def add(self, table: str, row: dict[str, typing.Any]) -> None:
+        buffer = self._buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self._flush(table)
+
+    def _flush(self, table: str) -> None:
+        rows = self._buffers[table]
+        if not rows:
+            return
+        if table not in self._writers:
+            path = self.out_dir / table / f"export_round={self.export_round}" / "part-0.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._writers[table] = self._pa.parquet.ParquetWriter(path, self._schemas[table])
+        self._writers[table].write_batch(self._pa.RecordBatch.from_pylist(rows, self._schemas[table]))
+        self.rows_written[table] += len(rows)
+        self._buffers[table] = []
+
+    def close(self) -> None:
+        for table in self._buffers:
+            self._flush(table)
+        for writer in self._writers.values():
+            writer.close()
+
+
+@dataclasses.dataclass
+class _Manifest:
+    app_id: int
+    last_round: int
+    no_of_proposals: int
+    no_of_future_funds: int
+    rounds: list[int] = dataclasses.field(default_factory=list)
+
+    @staticmethod
+    def load(out_dir: Path) -> "_Manifest | None":
+        path = out_dir / MANIFEST_FILE_NAME
+        return _Manifest(**json.loads(path.read_text())) if path.exists() else None
+
+    def save(self, out_dir: Path) -> None:
+        (out_dir / MANIFEST_FILE_NAME).write_text(json.dumps(dataclasses.asdict(self), indent=2) + "\n")
+
+
+def _changed_box_names(
+    algorand: algokit_utils.AlgorandClient,
+    app_spec: algokit_utils.Arc56Contract,
+    app_id: int,
+    previous: _Manifest,
+    export_round: int,
+    counts: tuple[int, int],
+) -> set[bytes]:
+    """
+    Boxes written since the previous export: by app calls found through the indexer, or
+    newly created. The status and category index pages aren't exported, so a new
+    proposal only adds the boxes of its own that are.
+    """
+    names = changed_box_names(algorand, app_spec, app_id, previous.last_round + 1, export_round)
+    no_of_proposals, no_of_future_funds = counts
+    for proposal_id in range(previous.no_of_proposals, no_of_proposals):
+        names.update(
+            (
+                proposal_box_name(proposal_id),
+                milestone_votes_box_name(proposal_id),
+                eligible_weight_box_name(proposal_id),
+            )
+        )
+    names.update(future_fund_box_name(fund_id) for fund_id in range(previous.no_of_future_funds, no_of_future_funds))
+    return names
+
+
+async def export_state(
+    algorand: algokit_utils.AlgorandClient,
+    app_id: int,
+    out_dir: Path,
+    *,
+    full: bool = False,
+    batch_size: int = 10_000,
+    concurrency: int = 32,
+) -> dict[str, int]:
+    """Exports (or incrementally appends) the app's state under `out_dir`. Returns rows written per table."""
+    client = algorand.client.get_typed_app_client_by_id(ProposalContractClient, app_id=app_id)
+    app_spec = client.app_spec
+    previous = _Manifest.load(out_dir)
+    if previous and previous.app_id != app_id:
+        raise ValueError(f"{out_dir} holds an export of app {previous.app_id}, not {app_id}")
+
+    algod = AsyncAlgod.from_algorand(algorand)
+    try:
+        # Changes are found through the indexer, so an export only covers the rounds it has
+        # caught up with; later ones are picked up by the next export
+        export_round = min((await algod.status())["last-round"], algorand.client.indexer.health()["round"])
+        global_state = client.state.global_state.get_all()
+        counts = (global_state["no_of_proposals"], global_state["no_of_future_funds"])
+        changed: set[bytes] = set()
+        if previous is None or full:
+            names: typing.Iterable[bytes] = await algod.application_boxes(app_id)
+        else:
+            names = changed = await asyncio.to_thread(
+                _changed_box_names, algorand, app_spec, app_id, previous, export_round, counts
+            )
+        logger.info(f"Exporting app {app_id} at round {export_round}")
+
+        sink = ParquetSink(out_dir, export_round, batch_size)
+        try:
+            fetched = set()
+            async for box in fetch_boxes(algod, app_id, names, concurrency=concurrency):
+                fetched.add(box["name"])
+                decoded = decode_box(app_spec, box["name"], box["value"])
+                if decoded is None:
+                    continue
+                for table, row in table_rows(decoded, box["round"]):
+                    sink.add(table, row)
+            # Changed boxes that are gone were deleted since the previous export
+            for name in changed - fetched:
+                classified = classify_box_name(name)
+                if classified is None:
+                    continue
+                map_name, encoded_key = classified
+                for table, row in tombstone_rows(map_name, decode_box_key(map_name, encoded_key), export_round):
+                    sink.add(table, row)
+        finally:
+            sink.close()
+    finally:
+        await algod.aclose()
+
+    _Manifest(
+        app_id=app_id,
+        last_round=export_round,
+        no_of_proposals=counts[0],
+        no_of_future_funds=counts[1],
+        rounds=[*(previous.rounds if previous else []), export_round],
+    ).save(out_dir)
+    return sink.rows_written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument("--out", type=Path, required=True, help="output directory")
+    parser.add_argument("--full", action="store_true", help="export every box instead of appending changes")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="rows per record batch")
+    parser.add_argument("--concurrency", type=int, default=32, help="box requests in flight")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    args.out.mkdir(parents=True, exist_ok=True)
+    rows = asyncio.run(
+        export_state(
+            algokit_utils.AlgorandClient.from_environment(),
+            args.app_id,
+            args.out,
+            full=args.full,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+    )
+    for table, count in rows.items():
+        logger.info(f"{table}: {count} rows")
+
+
+if __name__ == "__main__":
+    main()
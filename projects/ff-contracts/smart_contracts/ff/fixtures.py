@@ -0,0 +1,397 @@
+"""
+Snapshot fixtures of ProposalContract state for test and benchmark setup.
+
+A `ScenarioSpec` describes a scenario (proposals, donations, proofs submitted); the
+first time one is asked for, it's played out in algorand-python-testing and the
+resulting boxes, global state and app balance are saved under `.fixtures/<key>`,
+the key being a hash of the spec and of the compiled contract. Later runs load
+the snapshot straight from there, and rebuild it only when the spec or the
+contract changes.
+
+A snapshot restores into a fresh emulator app by writing its state into the
+ledger, or into a fresh localnet app through the contract's state import (as
+migrate.py uses it), a hundred or so boxes per atomic group. Timestamps in the
+restored proposals are moved forward by the time elapsed since the snapshot, so
+proofs submitted in the scenario are still open for voting.
+
+The scenario's accounts are derived from its seed, so tests can sign as any of them:
+
+    snapshot = get_snapshot(ScenarioSpec(proposals=50, donations=5000))
+    with algopy_testing_context() as ctx:
+        contract = restore_into_emulator(ctx, snapshot)
+        creator, donors = scenario_accounts(snapshot.spec)
+
+    python -m smart_contracts.ff.fixtures build --proposals 50 --donations 5000
+    python -m smart_contracts.ff.fixtures restore --proposals 50 --donations 5000
+"""
+
+import argparse
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import random
+import time
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algokit_utils.applications.abi import get_abi_decoded_value, get_abi_encoded_value
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk import encoding
+from nacl import signing
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts.artifacts.ff.proposal_contract_client import ProposalContractClient, ProposalContractFactory
+from smart_contracts.ff.boxes import MILESTONE_FIELDS, PROPOSALS_PREFIX, classify_box_name
+from smart_contracts.ff.contract import ProposalContract
+from smart_contracts.ff.cost_analysis import ARTIFACTS
+from smart_contracts.ff.migrate import Importer
+from smart_contracts.ff.replay import BOXES_FILE_NAME, GLOBAL_FILE_NAME, RecordedCall, Replayer
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / ".fixtures"
+SNAPSHOT_FILE_NAME = "snapshot.json"
+
+# App ID the scenarios are played out under
+_SCENARIO_APP_ID = 1001
+# Latest timestamp when a scenario starts; each call it makes is a second later
+_SCENARIO_START = 1_700_000_000
+# What deploy_config funds a new app with
+_DEPLOY_FUNDING = 1_000_000
+_PROPOSAL_FEE = 2_000_000
+_DONATION = 1_000_000
+# Payments funding the scenario's accounts per group
+_MAX_GROUP_SIZE = 16
+
+_PROPOSAL_TIME_FIELDS = (MILESTONE_FIELDS.index("proof_submitted_time"), MILESTONE_FIELDS.index("voting_end_time"))
+
+
+@dataclasses.dataclass(frozen=True)
+class ScenarioSpec:
+    """
+    `proposals` proposals with `milestones` equal milestones each, and `donations` donations
+    of 1 Algo from `donors` donors spread evenly over them. The first `funded` share of the
+    proposals get exactly enough to reach their goal (the rest half of it), and with
+    `proofs_submitted` their creators submit proof for the first milestone.
+    """
+
+    proposals: int = 50
+    donations: int = 5000
+    donors: int = 500
+    milestones: int = 3
+    funded: float = 0.5
+    proofs_submitted: bool = True
+    # Proposals are created by this many accounts, in turn
+    creators: int = 10
+    seed: int = 0
+
+    def key(self) -> str:
+        """Hash of the spec and the contract it's played out against."""
+        digest = hashlib.sha256(json.dumps(dataclasses.asdict(self), sort_keys=True).encode())
+        digest.update((ARTIFACTS / "ProposalContract.approval.teal").read_bytes())
+        return digest.hexdigest()[:16]
+
+
+@dataclasses.dataclass(frozen=True)
+class ScenarioAccount:
+    address: str
+    private_key: str
+
+    @property
+    def signer(self) -> algokit_utils.SigningAccount:
+        return algokit_utils.SigningAccount(private_key=self.private_key)
+
+
+def _account(seed: int, role: str, index: int) -> ScenarioAccount:
+    signing_key = signing.SigningKey(hashlib.sha256(f"ff-fixture:{seed}:{role}:{index}".encode()).digest())
+    public_key = bytes(signing_key.verify_key)
+    return ScenarioAccount(
+        address=encoding.encode_address(public_key),
+        private_key=base64.b64encode(bytes(signing_key) + public_key).decode(),
+    )
+
+
+def scenario_accounts(spec: ScenarioSpec) -> tuple[list[ScenarioAccount], list[ScenarioAccount]]:
+    """The scenario's proposal creators and donors."""
+    return (
+        [_account(spec.seed, "creator", index) for index in range(spec.creators)],
+        [_account(spec.seed, "donor", index) for index in range(spec.donors)],
+    )
+
+
+def scenario_calls(spec: ScenarioSpec) -> typing.Iterator[RecordedCall]:
+    rng = random.Random(spec.seed)
+    creators, donors = scenario_accounts(spec)
+    funded = round(spec.proposals * spec.funded)
+    per_proposal = [
+        spec.donations // spec.proposals + (1 if proposal_id < spec.donations % spec.proposals else 0)
+        for proposal_id in range(spec.proposals)
+    ]
+    timestamp = _SCENARIO_START
+
+    def call(sender: str, method: str, args: list[typing.Any]) -> RecordedCall:
+        nonlocal timestamp
+        timestamp += 1
+        return RecordedCall(
+            round=timestamp - _SCENARIO_START, timestamp=timestamp, tx_id="", sender=sender, method=method, args=args
+        )
+
+    for proposal_id in range(spec.proposals):
+        creator = creators[proposal_id % len(creators)].address
+        # Funded proposals' goal is what their donations add up to, the others' twice that
+        required = max(per_proposal[proposal_id], 1) * _DONATION * (1 if proposal_id < funded else 2)
+        amounts = [required // spec.milestones] * spec.milestones
+        amounts[-1] += required - sum(amounts)
+        yield call(
+            creator,
+            "create_proposal",
+            [
+                f"Proposal {proposal_id}",
+                f"Scenario proposal {proposal_id}",
+                f"Proposal {proposal_id} of fixture scenario {spec.seed}",
+                rng.choice(("education", "health", "environment", "technology")),
+                required,
+                [[f"Milestone {index}", amount] for index, amount in enumerate(amounts)],
+                {"sender": creator, "amount": _PROPOSAL_FEE},
+            ],
+        )
+
+    donations = [proposal_id for proposal_id, count in enumerate(per_proposal) for _ in range(count)]
+    rng.shuffle(donations)
+    for proposal_id in donations:
+        donor = rng.choice(donors).address
+        yield call(donor, "donate_proposal", [proposal_id, {"sender": donor, "amount": _DONATION}])
+
+    if spec.proofs_submitted:
+        for proposal_id in range(funded):
+            creator = creators[proposal_id % len(creators)].address
+            yield call(creator, "submit_proof", [proposal_id, f"https://proofs.example/{spec.seed}/{proposal_id}/0"])
+
+
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+    spec: ScenarioSpec
+    boxes: dict[bytes, bytes]
+    global_state: dict[bytes, bytes | int]
+    # microAlgos the app holds
+    app_balance: int
+    # Latest timestamp when the scenario finished
+    timestamp: int
+
+    def save(self, directory: Path) -> None:
+        """Saves in replay's formats, so a snapshot directory also works as expected state for it."""
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / BOXES_FILE_NAME, "w") as boxes:
+            for name, value in self.boxes.items():
+                boxes.write(
+                    json.dumps({"name": base64.b64encode(name).decode(), "value": base64.b64encode(value).decode()})
+                    + "\n"
+                )
+        global_state = {
+            key.decode(): base64.b64encode(value).decode() if isinstance(value, bytes) else value
+            for key, value in self.global_state.items()
+        }
+        (directory / GLOBAL_FILE_NAME).write_text(
+            json.dumps({"app_id": _SCENARIO_APP_ID, "global_state": global_state}, indent=2)
+        )
+        (directory / SNAPSHOT_FILE_NAME).write_text(
+            json.dumps(
+                {"spec": dataclasses.asdict(self.spec), "app_balance": self.app_balance, "timestamp": self.timestamp},
+                indent=2,
+            )
+        )
+
+    @staticmethod
+    def load(directory: Path) -> "Snapshot":
+        saved = json.loads((directory / SNAPSHOT_FILE_NAME).read_text())
+        boxes = {}
+        with open(directory / BOXES_FILE_NAME) as boxes_file:
+            for line in boxes_file:
+                if line.strip():
+                    box = json.loads(line)
+                    boxes[base64.b64decode(box["name"])] = base64.b64decode(box["value"])
+        global_state = json.loads((directory / GLOBAL_FILE_NAME).read_text())["global_state"]
+        return Snapshot(
+            spec=ScenarioSpec(**saved["spec"]),
+            boxes=boxes,
+            global_state={
+                key.encode(): base64.b64decode(value) if isinstance(value, str) else value
+                for key, value in global_state.items()
+            },
+            app_balance=saved["app_balance"],
+            timestamp=saved["timestamp"],
+        )
+
+
+def build_snapshot(spec: ScenarioSpec) -> Snapshot:
+    """Plays the scenario out in algorand-python-testing."""
+    started = time.perf_counter()
+    app_balance = _DEPLOY_FUNDING
+    timestamp = _SCENARIO_START
+    with algopy_testing_context() as ctx:
+        replayer = Replayer(ctx, _SCENARIO_APP_ID)
+        for call in scenario_calls(spec):
+            if not replayer.replay(call):
+                raise RuntimeError(f"Scenario call failed: {dict(replayer.report.failures)}")
+            app_balance += sum(arg["amount"] for arg in call.args if isinstance(arg, dict))
+            timestamp = call.timestamp
+        snapshot = Snapshot(
+            spec=spec,
+            boxes=dict(replayer.boxes),
+            global_state=dict(replayer.global_state),
+            app_balance=app_balance,
+            timestamp=timestamp,
+        )
+    logger.info(
+        f"Built scenario {spec.key()} ({replayer.report.calls} calls, {len(snapshot.boxes)} boxes) "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return snapshot
+
+
+def get_snapshot(spec: ScenarioSpec, *, fixtures_dir: Path = FIXTURES_DIR, rebuild: bool = False) -> Snapshot:
+    """The scenario's snapshot, built and saved the first time it's asked for."""
+    directory = fixtures_dir / spec.key()
+    if not rebuild and (directory / SNAPSHOT_FILE_NAME).exists():
+        return Snapshot.load(directory)
+    snapshot = build_snapshot(spec)
+    snapshot.save(directory)
+    return snapshot
+
+
+def restore_into_emulator(ctx: AlgopyTestContext, snapshot: Snapshot) -> ProposalContract:
+    """A new ProposalContract in `ctx` holding the snapshot's state, at the time the scenario finished."""
+    contract = ProposalContract()
+    app = ctx.ledger.get_app(contract)
+    for name, value in snapshot.boxes.items():
+        ctx.ledger.set_box(app, name, value)
+    for key, value in snapshot.global_state.items():
+        ctx.ledger.set_global_state(app, key, value)
+    ctx.ledger.update_account(app.address, balance=snapshot.app_balance)
+    ctx.ledger.patch_global_fields(latest_timestamp=snapshot.timestamp)
+    return contract
+
+
+def shift_timestamps(boxes: dict[bytes, bytes], seconds: int) -> dict[bytes, bytes]:
+    """The boxes with the times in every proposal (creation, proof submission and voting end) `seconds` later."""
+    app_spec = algokit_utils.Arc56Contract.from_json((ARTIFACTS / "ProposalContract.arc56.json").read_text())
+    value_type = app_spec.state.maps.box["proposals"].value_type
+    shifted = dict(boxes)
+    for name, value in boxes.items():
+        if not name.startswith(PROPOSALS_PREFIX) or classify_box_name(name) is None:
+            continue
+        proposal = get_abi_decoded_value(value, value_type, app_spec.structs)
+        proposal["created_at"] += seconds
+        for milestone in proposal["milestones"]:
+            for field in _PROPOSAL_TIME_FIELDS:
+                if milestone[field]:
+                    milestone[field] += seconds
+        shifted[name] = get_abi_encoded_value(proposal, value_type, app_spec.structs)
+    return shifted
+
+
+def _latest_timestamp(algorand: algokit_utils.AlgorandClient) -> int:
+    last_round = algorand.client.algod.status()["last-round"]  # type: ignore[call-overload]
+    return typing.cast(int, algorand.client.algod.block_info(last_round)["block"]["ts"])  # type: ignore[call-overload]
+
+
+def restore_to_localnet(
+    algorand: algokit_utils.AlgorandClient,
+    snapshot: Snapshot,
+    deployer: str,
+    *,
+    fund_accounts: algokit_utils.AlgoAmount | None = algokit_utils.AlgoAmount(algo=10),
+) -> ProposalContractClient:
+    """
+    A new app holding the snapshot's state, imported as a migration would, with the
+    scenario's accounts funded with `fund_accounts` each (from `deployer`) so tests can
+    transact as them.
+    """
+    started = time.perf_counter()
+    factory = algorand.client.get_typed_app_factory(ProposalContractFactory, default_sender=deployer)
+    client, _ = factory.send.create.bare()
+    algorand.send.payment(
+        algokit_utils.PaymentParams(
+            sender=deployer,
+            receiver=client.app_address,
+            amount=algokit_utils.AlgoAmount(micro_algo=snapshot.app_balance),
+        )
+    )
+
+    boxes = shift_timestamps(snapshot.boxes, _latest_timestamp(algorand) - snapshot.timestamp)
+    importer = Importer(client)
+    importer.begin()
+    importer.send(boxes.items())
+    importer.end(
+        int.from_bytes(typing.cast(bytes, snapshot.global_state[b"noOfProposals"]), "big"),
+        int.from_bytes(typing.cast(bytes, snapshot.global_state[b"noOfFutureFunds"]), "big"),
+    )
+
+    if fund_accounts is not None:
+        creators, donors = scenario_accounts(snapshot.spec)
+        accounts = creators + donors
+        for start in range(0, len(accounts), _MAX_GROUP_SIZE):
+            payments = algorand.new_group()
+            for account in accounts[start : start + _MAX_GROUP_SIZE]:
+                payments.add_payment(
+                    algokit_utils.PaymentParams(sender=deployer, receiver=account.address, amount=fund_accounts)
+                )
+            payments.send()
+
+    logger.info(
+        f"Restored scenario {snapshot.spec.key()} ({importer.boxes} boxes in {importer.calls} calls) "
+        f"to app {client.app_id} in {time.perf_counter() - started:.1f}s"
+    )
+    return client
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=("build", "restore"), help="build (or load) the snapshot, or restore it to localnet")
+    defaults = ScenarioSpec()
+    for field in dataclasses.fields(ScenarioSpec):
+        default = getattr(defaults, field.name)
+        if isinstance(default, bool):
+            parser.add_argument(f"--{field.name.replace('_', '-')}", action=argparse.BooleanOptionalAction, default=default)
+        else:
+            parser.add_argument(f"--{field.name.replace('_', '-')}", type=type(default), default=default)
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the snapshot even if one is saved")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    spec = ScenarioSpec(**{field.name: getattr(args, field.name) for field in dataclasses.fields(ScenarioSpec)})
+    started = time.perf_counter()
+    snapshot = get_snapshot(spec, rebuild=args.rebuild)
+    loaded = time.perf_counter() - started
+
+    table = Table(title=f"Scenario {spec.key()}")
+    table.add_column("map")
+    table.add_column("boxes", justify="right")
+    table.add_column("bytes", justify="right")
+    by_map: dict[str, list[int]] = {}
+    for name, value in snapshot.boxes.items():
+        classified = classify_box_name(name)
+        counts = by_map.setdefault(classified[0] if classified else "(unknown)", [0, 0])
+        counts[0] += 1
+        counts[1] += len(name) + len(value)
+    for map_name, (count, size) in sorted(by_map.items()):
+        table.add_row(map_name, str(count), str(size))
+    console = Console()
+    console.print(table)
+    console.print(f"Snapshot ready in {loaded:.2f}s, app balance {snapshot.app_balance / 1e6:.1f} Algo")
+
+    if args.command == "restore":
+        algorand = algokit_utils.AlgorandClient.from_environment()
+        deployer = algorand.account.from_environment("DEPLOYER")
+        client = restore_to_localnet(algorand, snapshot, deployer.address)
+        console.print(f"Restored to app {client.app_id}")
+
+
+if __name__ == "__main__":
+    main()
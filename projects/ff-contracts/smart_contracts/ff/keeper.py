@@ -0,0 +1,346 @@
+"""
+Keeper that sends ProposalContract calls as soon as their deadlines pass.
+
+Keeps a priority queue of milestone voting deadlines (from which an approved
+milestone can be claimed with `claim_milestone`; a vote that decides the outcome
+brings it forward to that vote) and milestone expiries (after which donors can call
+`refund_if_inactive`). The queue is seeded from the proposals in the
+on-chain `in_voting` index and kept current from the app calls in each new block, so
+the keeper only looks at proposals that changed. It sleeps on algod until the next
+block and sends every call whose deadline that block's timestamp has reached, batched
+into groups, logging how long after each deadline it ran. A deadline whose calls
+fail, transient errors included, is retried a few times with exponential backoff.
+
+Anyone can claim a milestone (the funds go to the creator), but refunds go to the
+caller, so the keeper only refunds donors whose accounts it is given.
+
+    python -m smart_contracts.ff.keeper --app-id 1002
+    python -m smart_contracts.ff.keeper --app-id 1002 --refund-account DONOR_1 --refund-account DONOR_2
+"""
+
+import argparse
+import dataclasses
+import heapq
+import logging
+import statistics
+import time
+import typing
+
+import algokit_utils
+from algosdk import error
+
+from smart_contracts.artifacts.ff.proposal_contract_client import (
+    DonationBoxKey,
+    Proposal,
+    ProposalContractClient,
+)
+from smart_contracts.ff.boxes import (
+    EXPIRATION_TIME,
+    MILESTONE_FIELDS,
+    changed_box_names,
+    classify_box_name,
+    method_box_references,
+)
+from smart_contracts.ff.errors import failure_cause
+from smart_contracts.ff.streaming_state import iter_proposal_ids
+
+logger = logging.getLogger(__name__)
+
+# Most app calls in one group
+_GROUP_SIZE = 16
+
+# Seconds before a deadline whose calls failed is retried, doubling with each attempt,
+# and the attempts after which it is dropped
+_RETRY_DELAY = 5
+_MAX_ATTEMPTS = 5
+
+# Each call's inner payment has its fee pooled from the outer transaction
+_INNER_PAYMENT_FEE = algokit_utils.AlgoAmount(micro_algo=1000)
+
+_CLAIM = "claim_milestone"
+_REFUND = "refund_if_inactive"
+
+
+@dataclasses.dataclass(frozen=True, order=True)
+class Deadline:
+    # Earliest chain timestamp the call can run at (the contract compares against the previous block's)
+    due: int
+    method: str
+    proposal_id: int
+    milestone: int
+    # Earlier attempts whose calls failed
+    attempt: int = dataclasses.field(default=0, compare=False)
+
+
+@dataclasses.dataclass
+class KeeperMetrics:
+    executed: dict[str, int] = dataclasses.field(default_factory=dict)
+    failed: dict[str, int] = dataclasses.field(default_factory=dict)
+    # Seconds between each executed call's deadline and the timestamp of the block it was confirmed in
+    lags: list[int] = dataclasses.field(default_factory=list)
+
+    def record(self, method: str, lag: int) -> None:
+        self.executed[method] = self.executed.get(method, 0) + 1
+        self.lags.append(lag)
+
+    def record_failure(self, cause: str) -> None:
+        self.failed[cause] = self.failed.get(cause, 0) + 1
+
+    def lag_summary(self) -> dict[str, float]:
+        if not self.lags:
+            return {}
+        ordered = sorted(self.lags)
+        return {
+            "p50": statistics.median(ordered),
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+        }
+
+
+@dataclasses.dataclass(frozen=True)
+class _Call:
+    deadline: Deadline
+    sender: str
+    args: tuple
+
+
+def proposal_deadlines(proposal_id: int, proposal: Proposal) -> list[Deadline]:
+    """Deadlines of the proposal's current milestone, if its proof has been submitted."""
+    if proposal.current_milestone >= len(proposal.milestones):
+        return []
+    milestone = dict(zip(MILESTONE_FIELDS, proposal.milestones[proposal.current_milestone], strict=True))
+    if not milestone["proof_link"] or milestone["claimed"]:
+        return []
+    return [
+        Deadline(milestone["voting_end_time"], _CLAIM, proposal_id, proposal.current_milestone),
+        Deadline(
+            milestone["proof_submitted_time"] + EXPIRATION_TIME + 1, _REFUND, proposal_id, proposal.current_milestone
+        ),
+    ]
+
+
+class Keeper:
+    def __init__(
+        self,
+        client: ProposalContractClient,
+        sender: str,
+        *,
+        refund_accounts: typing.Sequence[str] = (),
+        group_size: int = _GROUP_SIZE,
+    ) -> None:
+        self.client = client
+        self.algod = client.algorand.client.algod
+        self.sender = sender
+        self.refund_accounts = list(refund_accounts)
+        self.group_size = group_size
+        self.metrics = KeeperMetrics()
+        self.last_round = 0
+        self._queue: list[Deadline] = []
+        # The live deadline per (method, proposal); queued entries that don't match it are stale
+        self._scheduled: dict[tuple[str, int], Deadline] = {}
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    @property
+    def next_deadline(self) -> Deadline | None:
+        while self._queue and self._scheduled.get(self._key(self._queue[0])) != self._queue[0]:
+            heapq.heappop(self._queue)
+        return self._queue[0] if self._queue else None
+
+    @staticmethod
+    def _key(deadline: Deadline) -> tuple[str, int]:
+        return deadline.method, deadline.proposal_id
+
+    def schedule(self, proposal_id: int, proposal: Proposal | None) -> None:
+        """Replaces the proposal's deadlines with those of its current state."""
+        for method in (_CLAIM, _REFUND):
+            self._scheduled.pop((method, proposal_id), None)
+        for deadline in proposal_deadlines(proposal_id, proposal) if proposal else []:
+            if deadline.method == _REFUND and not self.refund_accounts:
+                continue
+            self._scheduled[self._key(deadline)] = deadline
+            heapq.heappush(self._queue, deadline)
+
+    def load(self) -> None:
+        """Seeds the queue from every proposal that is funded and not yet completed."""
+        self.last_round = self.algod.status()["last-round"]  # type: ignore[call-overload]
+        proposals = self.client.state.box.proposals
+        for proposal_id in iter_proposal_ids(self.client, status="in_voting"):
+            self.schedule(proposal_id, proposals.get_value(proposal_id))
+        logger.info(f"Loaded {len(self)} deadlines at round {self.last_round}")
+
+    def refresh(self, round_num: int) -> None:
+        """Reschedules the proposals written to by app calls in the rounds since the last refresh."""
+        # Rounds the indexer hasn't caught up with yet are picked up on a later refresh
+        round_num = min(round_num, self.client.algorand.client.indexer.health()["round"])
+        if round_num <= self.last_round:
+            return
+        changed = set()
+        for name in changed_box_names(
+            self.client.algorand, self.client.app_spec, self.client.app_id, self.last_round + 1, round_num
+        ):
+            classified = classify_box_name(name)
+            if classified and classified[0] == "proposals":
+                changed.add(int.from_bytes(classified[1], "big"))
+        proposals = self.client.state.box.proposals
+        for proposal_id in changed:
+            self.schedule(proposal_id, proposals.get_value(proposal_id))
+        self.last_round = round_num
+
+    def pop_due(self, now: int) -> list[Deadline]:
+        """Removes and returns the deadlines a call in the next block can act on."""
+        due = []
+        while (deadline := self.next_deadline) is not None and deadline.due <= now:
+            heapq.heappop(self._queue)
+            del self._scheduled[self._key(deadline)]
+            due.append(deadline)
+        return due
+
+    def _calls(self, deadline: Deadline) -> list[_Call]:
+        """The calls still worth sending for a due deadline, from the proposal's current state."""
+        proposal = self.client.state.box.proposals.get_value(deadline.proposal_id)
+        if proposal is None or proposal.current_milestone != deadline.milestone:
+            return []
+        milestone = dict(zip(MILESTONE_FIELDS, proposal.milestones[deadline.milestone], strict=True))
+        if milestone["claimed"]:
+            return []
+        if deadline.method == _CLAIM:
+            if milestone["votes_for"] <= milestone["votes_against"]:
+                return []
+            return [_Call(deadline, self.sender, (deadline.proposal_id,))]
+        donations = self.client.state.box.donations
+        return [
+            _Call(deadline, donor, (deadline.proposal_id,))
+            for donor in self.refund_accounts
+            if donations.get_value(DonationBoxKey(deadline.proposal_id, donor))
+        ]
+
+    def execute(self, deadlines: list[Deadline], now: int) -> None:
+        """Sends the calls of due deadlines, requeuing the deadlines any call failed for."""
+        calls: list[_Call] = []
+        failed: dict[Deadline, None] = {}
+        for deadline in deadlines:
+            try:
+                calls.extend(self._calls(deadline))
+            except Exception as ex:
+                logger.warning(f"Reading proposal {deadline.proposal_id} for {deadline.method} failed: {ex}")
+                failed[deadline] = None
+        for start in range(0, len(calls), self.group_size):
+            batch = calls[start : start + self.group_size]
+            try:
+                self._send(batch)
+            except Exception as ex:
+                if len(batch) == 1:
+                    self._record_failure(batch[0], ex)
+                    failed[batch[0].deadline] = None
+                    continue
+                # One call failing rejects its whole group, so send the rest on their own
+                for call in batch:
+                    try:
+                        self._send([call])
+                    except Exception as single_ex:
+                        self._record_failure(call, single_ex)
+                        failed[call.deadline] = None
+        for deadline in failed:
+            self._retry(deadline, now)
+
+    def _retry(self, deadline: Deadline, now: int) -> None:
+        """
+        Requeues a deadline after a backoff. The retry rechecks the proposal, so calls that
+        no longer apply (a claim someone else sent, a donor already refunded) are dropped.
+        """
+        if deadline.attempt + 1 >= _MAX_ATTEMPTS:
+            logger.warning(
+                f"Dropping {deadline.method} for proposal {deadline.proposal_id} after {_MAX_ATTEMPTS} attempts"
+            )
+            return
+        retry = dataclasses.replace(deadline, due=now + _RETRY_DELAY * 2**deadline.attempt, attempt=deadline.attempt + 1)
+        self._scheduled[self._key(retry)] = retry
+        heapq.heappush(self._queue, retry)
+
+    def _record_failure(self, call: _Call, ex: Exception) -> None:
+        cause = failure_cause(str(ex), self.client.app_spec)
+        logger.warning(f"{call.deadline.method} for proposal {call.deadline.proposal_id}: {cause}")
+        self.metrics.record_failure(cause)
+
+    def _send(self, calls: list[_Call]) -> None:
+        group = self.client.new_group()
+        for call in calls:
+            getattr(group, call.deadline.method)(
+                args=call.args,
+                params=algokit_utils.CommonAppCallParams(
+                    sender=call.sender,
+                    extra_fee=_INNER_PAYMENT_FEE,
+                    box_references=method_box_references(call.deadline.method, call.args, call.sender),
+                ),
+            )
+        result = group.send()
+        confirmed_round = result.confirmations[-1]["confirmed-round"]  # type: ignore[index]
+        timestamp = self._block_timestamp(confirmed_round)
+        for call in calls:
+            lag = timestamp - call.deadline.due
+            self.metrics.record(call.deadline.method, lag)
+            logger.info(
+                f"{call.deadline.method} for proposal {call.deadline.proposal_id} "
+                f"confirmed in round {confirmed_round}, {lag}s after its deadline"
+            )
+
+    def _block_timestamp(self, round_num: int) -> int:
+        return typing.cast(int, self.algod.block_info(round_num)["block"]["ts"])  # type: ignore[call-overload]
+
+    def run(self, *, rounds: int | None = None) -> None:
+        """
+        Follows the chain block by block, sending due calls as soon as a block's
+        timestamp reaches their deadline. Runs for `rounds` blocks, or until interrupted.
+        """
+        if not self.last_round:
+            self.load()
+        stop_at = self.last_round + rounds if rounds is not None else None
+        while stop_at is None or self.last_round < stop_at:
+            try:
+                # Chain time only moves with blocks, so the next block is the earliest a deadline can pass
+                status = self.algod.status_after_block(self.last_round)
+            except error.AlgodHTTPError as ex:
+                logger.warning(f"Waiting for round {self.last_round + 1} failed: {ex}")
+                time.sleep(1)
+                continue
+            round_num = status["last-round"]  # type: ignore[call-overload]
+            self.refresh(round_num)
+            now = self._block_timestamp(round_num)
+            due = self.pop_due(now)
+            if due:
+                self.execute(due, now)
+                logger.info(f"Lag so far: {self.metrics.lag_summary()}, failures: {self.metrics.failed}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument("--sender", default="KEEPER", help="environment account name the keeper sends claims from")
+    parser.add_argument(
+        "--refund-account",
+        action="append",
+        default=[],
+        help="environment account name of a donor to refund when a milestone expires",
+    )
+    parser.add_argument("--rounds", type=int, help="stop after this many rounds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    sender = algorand.account.from_environment(args.sender)
+    refund_accounts = [algorand.account.from_environment(name).address for name in args.refund_account]
+    client = algorand.client.get_typed_app_client_by_id(ProposalContractClient, app_id=args.app_id)
+    keeper = Keeper(client, sender.address, refund_accounts=refund_accounts)
+    try:
+        keeper.run(rounds=args.rounds)
+    finally:
+        logger.info(
+            f"Executed {keeper.metrics.executed}, failed {keeper.metrics.failed}, "
+            f"lag {keeper.metrics.lag_summary()}"
+        )
+
+
+if __name__ == "__main__":
+    main()
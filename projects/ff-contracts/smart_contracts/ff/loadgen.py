@@ -0,0 +1,408 @@
+"""
+Synthetic load generator for the crowdfunding lifecycle.
+
+Deploys a fresh ProposalContract to LocalNet (or whatever network the environment
+points at), funds a pool of generated accounts from the dispenser and then drives a
+weighted mix of contract calls against it for a fixed duration, recording per-method
+throughput, latency percentiles and failure causes.
+
+    python -m smart_contracts.ff.loadgen --donors 2000 --proposals 50 --duration 120 \
+        --mix donate_proposal=60,vote_milestone=20,submit_proof=5,claim_milestone=5
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import logging
+import random
+import time
+import typing
+
+import algokit_utils
+from algosdk import account
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts._helpers.stats import LatencyRecorder
+from smart_contracts.artifacts.ff.proposal_contract_client import ProposalContractFactory
+from smart_contracts.ff.async_client import AsyncProposalContractClient, AsyncSendResult
+from smart_contracts.ff.boxes import EXPIRATION_TIME, VOTING_TIME, outcome_decided, vote_weight
+from smart_contracts.ff.errors import failure_cause
+
+logger = logging.getLogger(__name__)
+
+# Mirrors the constant in contract.py
+CREATE_PROPOSAL_FEE = 2_000_000
+
+# Updates the local model once a call has confirmed
+_OnSuccess = typing.Callable[[AsyncSendResult], None]
+
+DEFAULT_MIX = {
+    "donate_proposal": 55,
+    "vote_milestone": 15,
+    "create_proposal": 5,
+    "submit_proof": 5,
+    "claim_milestone": 5,
+    "refund_if_inactive": 5,
+    "fund_future_self": 6,
+    "claim_future_self": 4,
+}
+
+# Payments to new accounts are grouped to cut the number of submissions while funding
+_FUNDING_GROUP_SIZE = 16
+_FUNDING_GROUPS_IN_FLIGHT = 64
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadConfig:
+    donors: int = 1000
+    creators: int = 20
+    proposals: int = 50
+    milestones: int = 3
+    milestone_amount: int = 5_000_000
+    donation_range: tuple[int, int] = (1_000_000, 4_000_000)
+    duration: float = 60.0
+    concurrency: int = 128
+    mix: dict[str, float] = dataclasses.field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 0
+
+
+@dataclasses.dataclass
+class _ProposalModel:
+    creator: str
+    amount_required: int
+    milestone_count: int
+    amount_raised: int = 0
+    current_milestone: int = 0
+    proof_submitted_at: float | None = None
+    # When the current milestone's vote closes: VOTING_TIME after its proof, or earlier
+    # at the vote that decided the outcome
+    voting_ends_at: float = 0.0
+    # Vote weight of everyone who has donated, as the contract's eligibleWeight box tracks it
+    eligible_weight: int = 0
+    votes_for: int = 0
+    votes_against: int = 0
+    voters: set[str] = dataclasses.field(default_factory=set)
+    donations: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class _FutureFundModel:
+    primary: str
+    unlock_time: int
+    claimed: bool = False
+
+
+class LoadGenerator:
+    """
+    Keeps a local model of contract state so most generated calls are valid, and
+    records everything that still fails by cause. Chain time is approximated by the
+    local clock, which is close enough on LocalNet to time votes, claims and refunds.
+    """
+
+    def __init__(self, client: AsyncProposalContractClient, accounts: list[str], config: LoadConfig) -> None:
+        self.client = client
+        self.config = config
+        self.stats = LatencyRecorder()
+        self.failures: dict[str, dict[str, int]] = {}
+        self._random = random.Random(config.seed)
+        self._creators = accounts[: config.creators]
+        self._donors = accounts[config.creators :]
+        self._proposals: dict[int, _ProposalModel] = {}
+        self._future_funds: dict[int, _FutureFundModel] = {}
+
+    async def run(self) -> None:
+        for index in range(self.config.proposals):
+            await self._call("create_proposal", self._creators[index % len(self._creators)])
+        deadline = time.monotonic() + self.config.duration
+        await asyncio.gather(*(self._worker(deadline) for _ in range(self.config.concurrency)))
+
+    async def _worker(self, deadline: float) -> None:
+        methods = list(self.config.mix)
+        weights = list(self.config.mix.values())
+        while time.monotonic() < deadline:
+            method = self._random.choices(methods, weights)[0]
+            if not await self._call(method):
+                self.stats.increment(f"skipped:{method}")
+                # Nothing is eligible for this method yet; give the chain a moment
+                await asyncio.sleep(0.05)
+
+    async def _call(self, method: str, sender: str | None = None) -> bool:
+        """Sends one call of `method` with arguments picked from the model. Returns False if none were eligible."""
+        plan = self._plan(method, sender)
+        if plan is None:
+            return False
+        sender, args, on_success = await plan
+        started = time.monotonic()
+        try:
+            result = await getattr(self.client.new_group(), method)(
+                args, algokit_utils.CommonAppCallParams(sender=sender)
+            ).send()
+        except Exception as ex:
+            cause = failure_cause(str(ex), self.client.sync_client.app_spec)
+            by_cause = self.failures.setdefault(method, {})
+            by_cause[cause] = by_cause.get(cause, 0) + 1
+            self.stats.record(f"{method}:failed", time.monotonic() - started)
+            return True
+        self.stats.record(method, time.monotonic() - started)
+        on_success(result)
+        return True
+
+    def _plan(
+        self, method: str, sender: str | None
+    ) -> typing.Awaitable[tuple[str, tuple, _OnSuccess]] | None:
+        now = time.time()
+        proposals = list(self._proposals.items())
+        pick = self._random.choice
+        match method:
+            case "create_proposal":
+                return self._plan_create(sender or pick(self._creators))
+            case "donate_proposal":
+                open_ = [(pid, p) for pid, p in proposals if p.amount_raised < p.amount_required]
+                if not open_:
+                    return None
+                pid, proposal = pick(open_)
+                return self._plan_donate(pid, proposal, pick(self._donors))
+            case "submit_proof":
+                ready = [
+                    (pid, p) for pid, p in proposals
+                    if p.amount_raised >= p.amount_required
+                    and p.current_milestone < p.milestone_count
+                    and p.proof_submitted_at is None
+                ]
+                if not ready:
+                    return None
+                pid, proposal = pick(ready)
+                return self._ready(proposal.creator, (pid, f"https://proofs.example/{pid}/{proposal.current_milestone}"),
+                                   lambda _: self._on_proof(proposal, now))
+            case "vote_milestone":
+                voting = [
+                    (pid, p, donor) for pid, p in proposals
+                    if p.proof_submitted_at is not None and now < p.voting_ends_at
+                    for donor, amount in p.donations.items()
+                    if amount >= 1_000_000 and donor not in p.voters
+                ]
+                if not voting:
+                    return None
+                pid, proposal, donor = pick(voting)
+                vote = self._random.random() < 0.8
+                return self._ready(donor, (pid, vote), lambda _: self._on_vote(proposal, donor, vote))
+            case "claim_milestone":
+                claimable = [
+                    (pid, p) for pid, p in proposals
+                    if p.proof_submitted_at is not None
+                    and now >= p.voting_ends_at
+                    and p.votes_for > p.votes_against
+                ]
+                if not claimable:
+                    return None
+                pid, proposal = pick(claimable)
+                return self._ready(proposal.creator, (pid,), lambda _: self._on_claim(proposal))
+            case "refund_if_inactive":
+                refundable = [
+                    (pid, p, donor) for pid, p in proposals
+                    if p.proof_submitted_at is None or now > p.proof_submitted_at + EXPIRATION_TIME
+                    for donor, amount in p.donations.items()
+                    if amount > 0
+                ]
+                if not refundable:
+                    return None
+                pid, proposal, donor = pick(refundable)
+                return self._ready(donor, (pid,), lambda _: proposal.donations.__setitem__(donor, 0))
+            case "fund_future_self":
+                return self._plan_fund(pick(self._donors))
+            case "claim_future_self":
+                unlocked = [
+                    (fid, f) for fid, f in self._future_funds.items()
+                    if not f.claimed and f.unlock_time <= now
+                ]
+                if not unlocked:
+                    return None
+                fid, fund = pick(unlocked)
+                return self._ready(fund.primary, (fid,), lambda _: setattr(fund, "claimed", True))
+            case _:
+                raise ValueError(f"Unknown method in mix: {method}")
+
+    @staticmethod
+    async def _ready(
+        sender: str, args: tuple, on_success: _OnSuccess
+    ) -> tuple[str, tuple, _OnSuccess]:
+        return sender, args, on_success
+
+    async def _plan_create(self, creator: str) -> tuple[str, tuple, _OnSuccess]:
+        config = self.config
+        milestones = [(f"Milestone {i + 1}", config.milestone_amount) for i in range(config.milestones)]
+        required = config.milestone_amount * config.milestones
+        payment = await self.client.payment_to_app(
+            creator, algokit_utils.AlgoAmount(micro_algo=CREATE_PROPOSAL_FEE)
+        )
+        args = ("Load test", "Synthetic proposal", "Generated by loadgen", "Testing", required, milestones, payment)
+
+        def on_success(result: AsyncSendResult) -> None:
+            # Keyed by the ID the create was given, not completion order, as creates run concurrently
+            self._proposals[result.created_ids[0]] = _ProposalModel(creator, required, config.milestones)
+
+        return creator, args, on_success
+
+    async def _plan_donate(
+        self, proposal_id: int, proposal: _ProposalModel, donor: str
+    ) -> tuple[str, tuple, _OnSuccess]:
+        amount = self._random.randint(*self.config.donation_range)
+        payment = await self.client.payment_to_app(donor, algokit_utils.AlgoAmount(micro_algo=amount))
+
+        def on_success(_: AsyncSendResult) -> None:
+            previous = proposal.donations.get(donor, 0)
+            proposal.amount_raised += amount
+            proposal.donations[donor] = previous + amount
+            proposal.eligible_weight += vote_weight(previous + amount) - vote_weight(previous)
+
+        return donor, (proposal_id, payment), on_success
+
+    async def _plan_fund(self, owner: str) -> tuple[str, tuple, _OnSuccess]:
+        unlock_time = int(time.time()) + self._random.randint(0, 30)
+        payment = await self.client.payment_to_app(owner, algokit_utils.AlgoAmount(micro_algo=100_000))
+
+        def on_success(result: AsyncSendResult) -> None:
+            self._future_funds[result.created_ids[0]] = _FutureFundModel(owner, unlock_time)
+
+        return owner, (owner, owner, unlock_time, payment), on_success
+
+    @staticmethod
+    def _on_proof(proposal: _ProposalModel, now: float) -> None:
+        proposal.proof_submitted_at = now
+        proposal.voting_ends_at = now + VOTING_TIME
+        proposal.votes_for = proposal.votes_against = 0
+        proposal.voters.clear()
+
+    @staticmethod
+    def _on_vote(proposal: _ProposalModel, donor: str, vote: bool) -> None:
+        weight = vote_weight(proposal.donations[donor])
+        if vote:
+            proposal.votes_for += weight
+        else:
+            proposal.votes_against += weight
+        proposal.voters.add(donor)
+        if outcome_decided(proposal.votes_for, proposal.votes_against, proposal.eligible_weight):
+            proposal.voting_ends_at = min(proposal.voting_ends_at, time.time())
+
+    @staticmethod
+    def _on_claim(proposal: _ProposalModel) -> None:
+        proposal.current_milestone += 1
+        proposal.proof_submitted_at = None
+        proposal.voters.clear()
+
+    def report(self, console: Console | None = None) -> None:
+        console = console or Console()
+        table = Table(title=f"ProposalContract load ({self.config.duration:g}s)")
+        for column in ("method", "ok", "failed", "ok/s", "p50 ms", "p90 ms", "p99 ms"):
+            table.add_column(column, justify="left" if column == "method" else "right")
+        summary = self.stats.summary()
+        for method in self.config.mix:
+            ok = summary.get(method, {})
+            failed = summary.get(f"{method}:failed", {})
+            table.add_row(
+                method,
+                str(int(ok.get("count", 0))),
+                str(int(failed.get("count", 0))),
+                f"{ok.get('per_second', 0):.1f}",
+                f"{ok.get('p50_ms', 0):.0f}",
+                f"{ok.get('p90_ms', 0):.0f}",
+                f"{ok.get('p99_ms', 0):.0f}",
+            )
+        console.print(table)
+        if self.failures:
+            causes = Table(title="Failure causes")
+            for column in ("method", "cause", "count"):
+                causes.add_column(column)
+            for method, by_cause in self.failures.items():
+                for cause, count in sorted(by_cause.items(), key=lambda item: -item[1]):
+                    causes.add_row(method, cause, str(count))
+            console.print(causes)
+
+
+async def _fund_accounts(
+    client: AsyncProposalContractClient, dispenser: str, addresses: list[str], amount: int
+) -> None:
+    chunk = _FUNDING_GROUP_SIZE * _FUNDING_GROUPS_IN_FLIGHT
+    for start in range(0, len(addresses), chunk):
+        pending = []
+        for group_start in range(start, min(start + chunk, len(addresses)), _FUNDING_GROUP_SIZE):
+            group = client.new_group()
+            for address in addresses[group_start : group_start + _FUNDING_GROUP_SIZE]:
+                group.add_transaction(
+                    client.sync_client.algorand.create_transaction.payment(
+                        algokit_utils.PaymentParams(
+                            sender=dispenser,
+                            receiver=address,
+                            amount=algokit_utils.AlgoAmount(micro_algo=amount),
+                        )
+                    )
+                )
+            pending.append(await group.submit())
+        await asyncio.gather(*pending)
+        logger.info(f"Funded {min(start + chunk, len(addresses))}/{len(addresses)} accounts")
+
+
+async def run_load(config: LoadConfig, algorand: algokit_utils.AlgorandClient | None = None) -> LoadGenerator:
+    algorand = algorand or algokit_utils.AlgorandClient.from_environment()
+    dispenser = algorand.account.dispenser_from_environment()
+
+    factory = algorand.client.get_typed_app_factory(ProposalContractFactory, default_sender=dispenser.address)
+    sync_client, _ = factory.send.create.bare()
+    algorand.account.ensure_funded(
+        sync_client.app_address, dispenser, algokit_utils.AlgoAmount(algo=1)
+    )
+
+    addresses = []
+    for _ in range(config.creators + config.donors):
+        private_key, address = account.generate_account()
+        algorand.account.set_signer_from_account(algokit_utils.SigningAccount(private_key=private_key))
+        addresses.append(address)
+
+    async with AsyncProposalContractClient(sync_client) as client:
+        logger.info(f"Funding {len(addresses)} accounts for app {sync_client.app_id}")
+        await _fund_accounts(client, dispenser.address, addresses, 100_000_000)
+        generator = LoadGenerator(client, addresses, config)
+        await generator.run()
+    return generator
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        method, _, weight = part.partition("=")
+        if method.strip() not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown method in mix: {method}")
+        mix[method.strip()] = float(weight or 1)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--donors", type=int, default=LoadConfig.donors)
+    parser.add_argument("--creators", type=int, default=LoadConfig.creators)
+    parser.add_argument("--proposals", type=int, default=LoadConfig.proposals)
+    parser.add_argument("--milestones", type=int, default=LoadConfig.milestones)
+    parser.add_argument("--duration", type=float, default=LoadConfig.duration, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=LoadConfig.concurrency)
+    parser.add_argument("--mix", type=_parse_mix, default=dict(DEFAULT_MIX),
+                        help="comma separated method=weight pairs")
+    parser.add_argument("--seed", type=int, default=LoadConfig.seed)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    config = LoadConfig(
+        donors=args.donors,
+        creators=args.creators,
+        proposals=args.proposals,
+        milestones=args.milestones,
+        duration=args.duration,
+        concurrency=args.concurrency,
+        mix=args.mix,
+        seed=args.seed,
+    )
+    asyncio.run(run_load(config)).report()
+
+
+if __name__ == "__main__":
+    main()
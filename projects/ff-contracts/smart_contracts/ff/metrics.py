@@ -0,0 +1,321 @@
+"""
+Metrics for ProposalContract client calls, kept in process and exported as Prometheus text.
+
+Nothing is measured until `instrument` is called on an AlgorandClient; until then the
+installed metrics are a no-op `Metrics` and no client code is wrapped. Once instrumented:
+
+- every algod request is timed by the stage it belongs to (simulate, submit, confirm,
+  suggested params, box reads, ...), and box reads are counted;
+- signing is timed, through the signers the account manager hands out;
+- `InstrumentedProposalContractClient` counts calls and errors per ABI method and times
+  each call, its stages labelled with the method, and the time left over as composing;
+- `operation` labels whatever runs inside it (a page render, a deploy) and records the
+  box reads it triggered;
+- retries made by the donation pipeline and vote relayer are counted.
+
+    registry = instrument(algorand)
+    client = InstrumentedProposalContractClient(app_client=..., metrics=registry)
+    with operation("proposal_page"):
+        client.state.box.proposals.get_value(proposal_id)
+    serve(registry, 9464)  # or registry.write("ff.prom"), or print(registry.to_prometheus())
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import http.server
+import re
+import threading
+import time
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from smart_contracts.artifacts.ff.proposal_contract_client import ProposalContractClient, ProposalContractSend
+
+# Prefix of every exported metric name
+_PREFIX = "ff_"
+
+# Histogram bucket upper bounds: latencies in seconds, and box reads per operation
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Stage of an algod request, by method and path (the first match wins)
+_STAGES = (
+    ("POST", re.compile(r"^/transactions/simulate"), "simulate"),
+    ("POST", re.compile(r"^/transactions$"), "submit"),
+    ("GET", re.compile(r"^/transactions/pending/"), "confirm"),
+    ("GET", re.compile(r"^/status/wait-for-block-after/"), "confirm"),
+    ("GET", re.compile(r"^/transactions/params"), "params"),
+    ("GET", re.compile(r"^/applications/\d+/box$"), "box_read"),
+    ("GET", re.compile(r"^/applications/\d+/boxes"), "box_list"),
+)
+
+# Label for requests made outside any call or operation
+_UNLABELLED = "none"
+
+
+class Metrics:
+    """Where measurements go. This base discards them, so it's the default."""
+
+    def increment(self, name: str, by: int = 1, **labels: str) -> None:
+        pass
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+
+NOOP = Metrics()
+_installed: Metrics = NOOP
+
+
+def installed_metrics() -> Metrics:
+    """The metrics the last `instrument` call installed, or the no-op default."""
+    return _installed
+
+
+@dataclasses.dataclass
+class _Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+
+# Histogram buckets per metric name, latencies being the default
+_HISTOGRAM_BUCKETS = {
+    "operation_box_reads": _COUNT_BUCKETS,
+}
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+class Registry(Metrics):
+    """Counters and histograms kept in process, safe to update from several threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: dict[str, dict[LabelSet, float]] = {}
+        self.histograms: dict[str, dict[LabelSet, _Histogram]] = {}
+
+    def increment(self, name: str, by: int = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + by
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                buckets = _HISTOGRAM_BUCKETS.get(name, _LATENCY_BUCKETS)
+                histogram = series[key] = _Histogram(buckets, [0] * len(buckets))
+            histogram.total += value
+            histogram.count += 1
+            for index, bound in enumerate(histogram.buckets):
+                if value <= bound:
+                    histogram.counts[index] += 1
+
+    def to_prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                lines.append(f"# TYPE {_PREFIX}{name} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{_PREFIX}{name}{_format_labels(labels)} {value:g}")
+            for name, histograms in sorted(self.histograms.items()):
+                lines.append(f"# TYPE {_PREFIX}{name} histogram")
+                for labels, histogram in sorted(histograms.items()):
+                    for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                        lines.append(f"{_PREFIX}{name}_bucket{_format_labels(labels, le=f'{bound:g}')} {count}")
+                    lines.append(f"{_PREFIX}{name}_bucket{_format_labels(labels, le='+Inf')} {histogram.count}")
+                    lines.append(f"{_PREFIX}{name}_sum{_format_labels(labels)} {histogram.total:g}")
+                    lines.append(f"{_PREFIX}{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path | str) -> None:
+        """Writes the metrics for a textfile collector to pick up."""
+        Path(path).write_text(self.to_prometheus())
+
+
+def _format_labels(labels: LabelSet, **extra: str) -> str:
+    pairs = [*labels, *extra.items()]
+    if not pairs:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for key, value in pairs
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def serve(registry: Registry, port: int, host: str = "") -> http.server.ThreadingHTTPServer:
+    """Serves the registry for Prometheus to scrape, from a daemon thread. Shut it down with `.shutdown()`."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            body = registry.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@dataclasses.dataclass
+class _Span:
+    """What's measured within one client call or operation."""
+
+    label: str
+    # Seconds spent in algod requests and signing, which the rest of a call's time isn't
+    waiting: float = 0.0
+    box_reads: int = 0
+
+
+_current_span: contextvars.ContextVar[_Span | None] = contextvars.ContextVar("ff_metrics_span", default=None)
+
+
+@contextlib.contextmanager
+def operation(name: str, metrics: Metrics | None = None) -> typing.Iterator[None]:
+    """Labels requests made inside with `name`, and records its duration and box reads."""
+    metrics = metrics or _installed
+    span = _Span(name)
+    token = _current_span.set(span)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current_span.reset(token)
+        metrics.observe("operation_seconds", time.perf_counter() - started, operation=name)
+        metrics.observe("operation_box_reads", span.box_reads, operation=name)
+
+
+def _stage(method: str, path: str) -> str:
+    for stage_method, pattern, stage in _STAGES:
+        if method == stage_method and pattern.match(path):
+            return stage
+    return "algod"
+
+
+class _TimedSigner(TransactionSigner):
+    def __init__(self, signer: TransactionSigner, metrics: Metrics) -> None:
+        self.signer = signer
+        self.metrics = metrics
+
+    def sign_transactions(
+        self, txn_group: list[transaction.Transaction], indexes: list[int]
+    ) -> list[transaction.GenericSignedTransaction]:
+        span = _current_span.get()
+        started = time.perf_counter()
+        try:
+            return self.signer.sign_transactions(txn_group, indexes)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.observe("stage_seconds", elapsed, method=span.label if span else _UNLABELLED, stage="sign")
+            if span:
+                span.waiting += elapsed
+
+
+def instrument(algorand: algokit_utils.AlgorandClient, metrics: Metrics | None = None) -> Registry:
+    """
+    Times the algod requests and signing of `algorand` into `metrics` (a new registry if
+    not given), and installs it as the metrics other modules count retries into.
+    Instrumenting the same client again keeps its first registry.
+    """
+    global _installed
+    algod = algorand.client.algod
+    existing = getattr(algod, "_ff_metrics", None)
+    if existing is not None:
+        return typing.cast(Registry, existing)
+    registry = typing.cast(Registry, metrics or Registry())
+    _installed = registry
+
+    request = algod.algod_request
+
+    def timed_request(method: str, requrl: str, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        span = _current_span.get()
+        label = span.label if span else _UNLABELLED
+        stage = _stage(method, requrl)
+        started = time.perf_counter()
+        try:
+            return request(method, requrl, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            registry.observe("stage_seconds", elapsed, method=label, stage=stage)
+            if span:
+                span.waiting += elapsed
+            if stage == "box_read":
+                registry.increment("box_reads_total", method=label)
+                if span:
+                    span.box_reads += 1
+
+    algod.algod_request = timed_request  # type: ignore[method-assign]
+    algod._ff_metrics = registry  # type: ignore[attr-defined]
+
+    # One wrapper per signer, as the composer signs together the transactions sharing a signer
+    signers: dict[int, _TimedSigner] = {}
+    get_signer = algorand.account.get_signer
+
+    def timed_get_signer(sender: typing.Any) -> TransactionSigner:
+        signer = get_signer(sender)
+        timed = signers.get(id(signer))
+        if timed is None or timed.signer is not signer:
+            timed = signers[id(signer)] = _TimedSigner(signer, registry)
+        return timed
+
+    algorand.account.get_signer = timed_get_signer  # type: ignore[method-assign]
+    return registry
+
+
+class _InstrumentedSend:
+    """Wraps `ProposalContractSend` so each call is counted, timed and labels its requests."""
+
+    def __init__(self, send: ProposalContractSend, metrics: Metrics) -> None:
+        self._send = send
+        self._metrics = metrics
+
+    def __getattr__(self, name: str) -> typing.Any:
+        method = getattr(self._send, name)
+        metrics = self._metrics
+
+        def call(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            span = _Span(name)
+            token = _current_span.set(span)
+            metrics.increment("calls_total", method=name)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            except Exception as ex:
+                metrics.increment("errors_total", method=name, error=type(ex).__name__)
+                raise
+            finally:
+                _current_span.reset(token)
+                elapsed = time.perf_counter() - started
+                metrics.observe("call_seconds", elapsed, method=name)
+                metrics.observe("stage_seconds", max(0.0, elapsed - span.waiting), method=name, stage="compose")
+
+        return call
+
+
+class InstrumentedProposalContractClient(ProposalContractClient):
+    """
+    `ProposalContractClient` whose `send` calls are counted and timed per method into
+    `metrics`, its AlgorandClient instrumented for their stages (see `instrument`).
+    """
+
+    def __init__(self, *args: typing.Any, metrics: Registry | None = None, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = instrument(self.algorand, metrics)
+        self.send = _InstrumentedSend(self.send, self.metrics)  # type: ignore[assignment]
@@ -0,0 +1,446 @@
+"""
+Migrates ProposalContract state from an old app to a new one.
+
+Deploys append a new app when the storage layout changes (OnSchemaBreak.AppendApp),
+which starts empty. `migrate` streams the old app's boxes, passes each through a
+transform into the new layout (unchanged by default), and writes them into the new
+app with its creator-only import methods: `begin_import` (only on an empty app),
+`import_boxes` in atomic groups of calls sized to the box reference and opcode
+limits, then `end_import`, which sets the ID counters and closes the import for good.
+Proposals and future funds can't be created on the new app until it has ended.
+
+Every confirmed group is appended to a checkpoint file, so a migration that stops
+part way resumes where it left off when run again with the same checkpoint. After
+importing, a verification pass compares every (transformed) old box with the new
+app's, along with the ID counters and balances.
+
+The old app's funds can't be moved by the new app, so the deployer funds the new
+app with as much as the old one holds.
+
+    python -m smart_contracts.ff.migrate --source 1002
+    python -m smart_contracts.ff.migrate --source 1002 --target 1044 --transform my_migration:transform
+    python -m smart_contracts.ff.migrate --source 1002 --target 1044 --verify-only
+"""
+
+import argparse
+import asyncio
+import base64
+import collections
+import dataclasses
+import hashlib
+import importlib
+import json
+import logging
+import math
+import time
+import typing
+from pathlib import Path
+
+import algokit_utils
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts.artifacts.ff.proposal_contract_client import (
+    EndImportArgs,
+    ImportBoxesArgs,
+    ProposalContractClient,
+    ProposalContractFactory,
+)
+from smart_contracts.ff.async_client import AsyncAlgod, fetch_boxes
+from smart_contracts.ff.boxes import classify_box_name
+from smart_contracts.ff.cost_analysis import BOX_IO_PER_REFERENCE, MAX_BOX_REFERENCES, CostAnalyser, Sizes
+
+logger = logging.getLogger(__name__)
+
+# Maps one box of the old layout to the boxes it becomes in the new one
+BoxTransform = typing.Callable[[bytes, bytes], typing.Iterable[tuple[bytes, bytes]]]
+
+# (box name, box size, offset, data) for one write of import_boxes
+Chunk = tuple[bytes, int, int, bytes]
+
+# Room for chunks in the 2KB of app call arguments, after the selector and array length
+_MAX_CHUNK_ARGS = 1900
+# Bytes a chunk takes besides its name and data: its head in the array and struct, size and offset
+_CHUNK_OVERHEAD = 2 + 2 + 8 + 8 + 2 + 2 + 2
+_MAX_GROUP_SIZE = 16
+# Old boxes read from algod at a time
+_READ_PAGE_SIZE = 1024
+
+# import_stage before an app's import has begun, as in contract.py
+_IMPORT_NEVER = 0
+
+
+def unchanged(name: bytes, value: bytes) -> typing.Iterable[tuple[bytes, bytes]]:
+    yield name, value
+
+
+def load_transform(path: str) -> BoxTransform:
+    """A transform given as `module:function`."""
+    module_name, _, function_name = path.partition(":")
+    return typing.cast(BoxTransform, getattr(importlib.import_module(module_name), function_name))
+
+
+def _references(size: int) -> int:
+    return max(1, math.ceil(size / BOX_IO_PER_REFERENCE))
+
+
+def box_chunks(name: bytes, value: bytes) -> typing.Iterator[Chunk]:
+    """Chunks writing the box, each small enough for the arguments of one call."""
+    data_size = _MAX_CHUNK_ARGS - _CHUNK_OVERHEAD - len(name)
+    for offset in range(0, max(len(value), 1), data_size):
+        yield name, len(value), offset, value[offset : offset + data_size]
+
+
+def pack_import_calls(
+    boxes: typing.Iterable[tuple[bytes, bytes]], chunks_per_call: int
+) -> typing.Iterator[list[Chunk]]:
+    """
+    Splits the boxes into import_boxes calls of at most `chunks_per_call` chunks, each
+    within the argument size limit and referencing its boxes often enough to cover their size.
+    """
+    current: list[Chunk] = []
+    current_args = current_references = 0
+    for name, value in boxes:
+        references = _references(len(value))
+        if references > MAX_BOX_REFERENCES:
+            raise ValueError(f"Box {name!r} is too large to import ({len(value)} bytes)")
+        for chunk in box_chunks(name, value):
+            args = _CHUNK_OVERHEAD + len(name) + len(chunk[3])
+            if current and (
+                len(current) >= chunks_per_call
+                or current_args + args > _MAX_CHUNK_ARGS
+                or current_references + references > MAX_BOX_REFERENCES
+            ):
+                yield current
+                current, current_args, current_references = [], 0, 0
+            current.append(chunk)
+            current_args += args
+            current_references += references
+    if current:
+        yield current
+
+
+def call_box_references(chunks: list[Chunk]) -> list[algokit_utils.BoxReference]:
+    return [
+        algokit_utils.BoxReference(app_id=0, name=name)
+        for name, size in dict.fromkeys((name, size) for name, size, _offset, _data in chunks)
+        for _ in range(_references(size))
+    ]
+
+
+class Checkpoint:
+    """
+    Progress of a migration, as JSON lines: the source and target apps first, then the
+    old box names each confirmed group imported, then whether the import was ended.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.source: int | None = None
+        self.target: int | None = None
+        self.done: set[bytes] = set()
+        self.ended = False
+        if path.exists():
+            with open(path) as lines:
+                for line in lines:
+                    if line.strip():
+                        self._apply(json.loads(line))
+
+    def _apply(self, entry: dict[str, typing.Any]) -> None:
+        if "source" in entry:
+            self.source, self.target = entry["source"], entry["target"]
+        self.done.update(base64.b64decode(name) for name in entry.get("boxes", []))
+        self.ended = self.ended or entry.get("ended", False)
+
+    def _append(self, entry: dict[str, typing.Any]) -> None:
+        self._apply(entry)
+        with open(self.path, "a") as lines:
+            lines.write(json.dumps(entry) + "\n")
+
+    def start(self, source: int, target: int) -> None:
+        self._append({"source": source, "target": target})
+
+    def imported(self, names: typing.Iterable[bytes]) -> None:
+        self._append({"boxes": [base64.b64encode(name).decode() for name in names]})
+
+    def end(self) -> None:
+        self._append({"ended": True})
+
+
+def global_counters(algorand: algokit_utils.AlgorandClient, app_id: int) -> tuple[int, int]:
+    """(proposals, future funds) of an app of any version, from its raw global state."""
+    state = algorand.app.get_global_state(app_id)
+
+    def counter(key: str) -> int:
+        return int.from_bytes(state[key].value_raw or b"", "big") if key in state else 0
+
+    return counter("noOfProposals"), counter("noOfFutureFunds")
+
+
+def _balance(algorand: algokit_utils.AlgorandClient, address: str) -> int:
+    return typing.cast(int, algorand.client.algod.account_info(address)["amount"])  # type: ignore[call-overload]
+
+
+async def _read_boxes(
+    algorand: algokit_utils.AlgorandClient, app_id: int, skip: typing.Container[bytes] = ()
+) -> typing.AsyncIterator[tuple[bytes, bytes]]:
+    """The app's boxes, except those named in `skip`, fetched a page at a time."""
+    algod = AsyncAlgod.from_algorand(algorand)
+    try:
+        names = [name for name in await algod.application_boxes(app_id) if name not in skip]
+        for start in range(0, len(names), _READ_PAGE_SIZE):
+            async for box in fetch_boxes(algod, app_id, names[start : start + _READ_PAGE_SIZE]):
+                yield box["name"], box["value"]
+    finally:
+        await algod.aclose()
+
+
+class Importer:
+    """Writes boxes into an app with its import methods, a group of calls at a time."""
+
+    def __init__(self, client: ProposalContractClient, analyser: CostAnalyser | None = None) -> None:
+        self.client = client
+        analyser = analyser or CostAnalyser()
+        # As many chunks as one call's opcode budget covers, at most one per box reference
+        self.chunks_per_call = min(
+            analyser.max_size("import_boxes", "import_chunks", Sizes()), MAX_BOX_REFERENCES
+        )
+        self.calls = 0
+        self.boxes = 0
+
+    def begin(self) -> None:
+        if self.client.state.global_state.import_stage == _IMPORT_NEVER:
+            self.client.send.begin_import()
+
+    def send(
+        self,
+        boxes: typing.Iterable[tuple[bytes, bytes]],
+        on_group: typing.Callable[[list[bytes]], None] | None = None,
+    ) -> None:
+        """Imports the boxes, calling `on_group` with the boxes each group completed once it's confirmed."""
+        calls = pack_import_calls(boxes, self.chunks_per_call)
+        while group := [call for _, call in zip(range(_MAX_GROUP_SIZE), calls, strict=False)]:
+            composer = self.client.new_group()
+            for chunks in group:
+                composer.import_boxes(
+                    args=ImportBoxesArgs(chunks=chunks),
+                    params=algokit_utils.CommonAppCallParams(box_references=call_box_references(chunks)),
+                )
+            composer.send()
+            names = [
+                name for chunks in group for name, size, offset, data in chunks if offset + len(data) >= size
+            ]
+            self.calls += len(group)
+            self.boxes += len(names)
+            if on_group:
+                on_group(names)
+
+    def end(self, no_of_proposals: int, no_of_future_funds: int) -> None:
+        self.client.send.end_import(
+            EndImportArgs(no_of_proposals=no_of_proposals, no_of_future_funds=no_of_future_funds)
+        )
+
+
+async def _import_transformed(
+    algorand: algokit_utils.AlgorandClient,
+    source_app_id: int,
+    importer: Importer,
+    checkpoint: Checkpoint,
+    transform: BoxTransform,
+) -> None:
+    # Transformed boxes of a page of old ones, the old box each came from, and how
+    # many of each old box's new boxes are still to be confirmed
+    page: list[tuple[bytes, bytes]] = []
+    sources: dict[bytes, bytes] = {}
+    remaining: collections.Counter[bytes] = collections.Counter()
+
+    def imported(names: list[bytes]) -> None:
+        completed = []
+        for name in names:
+            remaining[sources[name]] -= 1
+            if not remaining[sources[name]]:
+                completed.append(sources[name])
+        checkpoint.imported(completed)
+
+    def flush() -> None:
+        importer.send(page, imported)
+        page.clear()
+        sources.clear()
+        remaining.clear()
+
+    async for name, value in _read_boxes(algorand, source_app_id, checkpoint.done):
+        for new_name, new_value in transform(name, value):
+            page.append((new_name, new_value))
+            sources[new_name] = name
+            remaining[name] += 1
+        if len(page) >= _READ_PAGE_SIZE:
+            flush()
+    flush()
+
+
+def migrate(
+    algorand: algokit_utils.AlgorandClient,
+    source_app_id: int,
+    deployer: str,
+    *,
+    target_app_id: int | None = None,
+    checkpoint_path: Path | None = None,
+    transform: BoxTransform = unchanged,
+) -> int:
+    """
+    Imports the source app's state into the target app (a new one if not given, or the one
+    in the checkpoint when resuming), then verifies it. Returns the target app ID.
+
+    A transform producing several boxes from one old box must produce them all again on
+    resume, as the checkpoint only tracks old boxes whose new boxes were all confirmed.
+    """
+    checkpoint = Checkpoint(checkpoint_path or Path(f"migration-{source_app_id}.checkpoint"))
+    if checkpoint.source is not None and checkpoint.source != source_app_id:
+        raise ValueError(f"Checkpoint {checkpoint.path} is for a migration from app {checkpoint.source}")
+    target_app_id = checkpoint.target or target_app_id
+    started = time.perf_counter()
+
+    if target_app_id is None:
+        factory = algorand.client.get_typed_app_factory(ProposalContractFactory, default_sender=deployer)
+        client, _ = factory.send.create.bare()
+        logger.info(f"Created app {client.app_id} to migrate app {source_app_id} into")
+    else:
+        client = algorand.client.get_typed_app_client_by_id(
+            ProposalContractClient, app_id=target_app_id, default_sender=deployer
+        )
+    if checkpoint.source is None:
+        checkpoint.start(source_app_id, client.app_id)
+
+    # Topped up rather than paid once, so resuming never pays twice
+    shortfall = _balance(algorand, algokit_utils.get_application_address(source_app_id)) - _balance(
+        algorand, client.app_address
+    )
+    if shortfall > 0:
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                sender=deployer, receiver=client.app_address, amount=algokit_utils.AlgoAmount(micro_algo=shortfall)
+            )
+        )
+
+    importer = Importer(client)
+    if not checkpoint.ended:
+        importer.begin()
+        asyncio.run(_import_transformed(algorand, source_app_id, importer, checkpoint, transform))
+        importer.end(*global_counters(algorand, source_app_id))
+        checkpoint.end()
+        logger.info(
+            f"Imported {importer.boxes} boxes in {importer.calls} calls "
+            f"({len(checkpoint.done)} in all) in {time.perf_counter() - started:.1f}s"
+        )
+
+    report = verify(algorand, source_app_id, client.app_id, transform)
+    print_verification(report)
+    if not report.ok:
+        raise RuntimeError(f"App {client.app_id} doesn't match app {source_app_id} after migrating")
+    return client.app_id
+
+
+@dataclasses.dataclass
+class Verification:
+    # Map -> {"matching", "different", "missing", "extra"} box counts
+    boxes: dict[str, collections.Counter[str]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(collections.Counter)
+    )
+    # (source, target) ID counters and balances
+    counters: tuple[tuple[int, int], tuple[int, int]] = ((0, 0), (0, 0))
+    balances: tuple[int, int] = (0, 0)
+
+    @property
+    def ok(self) -> bool:
+        return (
+            all(counts.keys() <= {"matching"} for counts in self.boxes.values())
+            and self.counters[0] == self.counters[1]
+            and self.balances[1] >= self.balances[0]
+        )
+
+
+def verify(
+    algorand: algokit_utils.AlgorandClient, source_app_id: int, target_app_id: int, transform: BoxTransform = unchanged
+) -> Verification:
+    """Compares the transformed source boxes with the target's, by digest so only names are held for all of them."""
+
+    async def digests(app_id: int, apply: BoxTransform) -> dict[bytes, bytes]:
+        return {
+            new_name: hashlib.sha256(new_value).digest()
+            async for name, value in _read_boxes(algorand, app_id)
+            for new_name, new_value in apply(name, value)
+        }
+
+    expected = asyncio.run(digests(source_app_id, transform))
+    actual = asyncio.run(digests(target_app_id, unchanged))
+    report = Verification(
+        counters=(global_counters(algorand, source_app_id), global_counters(algorand, target_app_id)),
+        balances=(
+            _balance(algorand, algokit_utils.get_application_address(source_app_id)),
+            _balance(algorand, algokit_utils.get_application_address(target_app_id)),
+        ),
+    )
+    for name in expected.keys() | actual.keys():
+        classified = classify_box_name(name)
+        if name not in actual:
+            outcome = "missing"
+        elif name not in expected:
+            outcome = "extra"
+        else:
+            outcome = "matching" if expected[name] == actual[name] else "different"
+        report.boxes[classified[0] if classified else "(unknown)"][outcome] += 1
+    return report
+
+
+def print_verification(report: Verification, console: Console | None = None) -> None:
+    console = console or Console()
+    table = Table(title="Migrated state against the source app")
+    for column in ("map", "matching", "different", "missing", "extra"):
+        table.add_column(column, justify="left" if column == "map" else "right")
+    for map_name, counts in sorted(report.boxes.items()):
+        table.add_row(
+            map_name,
+            *(str(counts[outcome]) for outcome in ("matching", "different", "missing", "extra")),
+            style=None if counts.keys() <= {"matching"} else "red",
+        )
+    console.print(table)
+    (source_proposals, source_funds), (target_proposals, target_funds) = report.counters
+    console.print(
+        f"Proposals {source_proposals} -> {target_proposals}, future funds {source_funds} -> {target_funds}, "
+        f"balance {report.balances[0] / 1e6:.6f} -> {report.balances[1] / 1e6:.6f} Algo"
+    )
+    console.print("[green]Migration verified[/green]" if report.ok else "[red]Migration doesn't match[/red]")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--source", type=int, required=True, help="app to migrate state from")
+    parser.add_argument("--target", type=int, help="app to migrate into (created if not given)")
+    parser.add_argument("--checkpoint", type=Path, help="checkpoint file (default migration-<source>.checkpoint)")
+    parser.add_argument("--transform", help="module:function mapping an old box to new ones")
+    parser.add_argument("--verify-only", action="store_true", help="only compare the source and target apps")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    transform = load_transform(args.transform) if args.transform else unchanged
+    if args.verify_only:
+        if args.target is None:
+            parser.error("--verify-only needs --target")
+        print_verification(verify(algorand, args.source, args.target, transform))
+        return
+    deployer = algorand.account.from_environment("DEPLOYER")
+    migrate(
+        algorand,
+        args.source,
+        deployer.address,
+        target_app_id=args.target,
+        checkpoint_path=args.checkpoint,
+        transform=transform,
+    )
+
+
+if __name__ == "__main__":
+    main()
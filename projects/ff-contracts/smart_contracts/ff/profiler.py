@@ -0,0 +1,208 @@
+"""
+Opcode profiler for ProposalContract calls.
+
+Simulates a transaction group with execution traces enabled and attributes every
+executed approval program opcode, and every box read and write, to the line of
+`smart_contracts/ff/contract.py` it was compiled from.
+
+    python -m smart_contracts.ff.profiler --app-id 1002 --sender ADDRESS vote_milestone '[0, true]'
+"""
+
+import argparse
+import base64
+import dataclasses
+import json
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import EmptySigner
+from algosdk.v2client.models import SimulateTraceConfig
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts._helpers.source_map import PuyaSourceMap, SourceLocation
+
+APPROVAL_SOURCE_MAP = (
+    Path(__file__).parent.parent / "artifacts" / "ff" / "ProposalContract.approval.puya.map"
+)
+
+_BOX_READS = {"box_get", "box_extract", "box_len"}
+_BOX_WRITES = {"box_put", "box_replace", "box_create", "box_del", "box_resize", "box_splice"}
+# Writes whose byte count is the length of the value on top of the stack
+_BOX_SPAN_WRITES = {"box_put", "box_replace", "box_splice"}
+
+
+@dataclasses.dataclass
+class LineProfile:
+    opcodes: int = 0
+    box_reads: int = 0
+    box_writes: int = 0
+    box_bytes_read: int = 0
+    box_bytes_written: int = 0
+    ops: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class Profile:
+    """Per-source-line totals for one simulated group. Opcodes without a source line are keyed by `None`."""
+
+    lines: dict[SourceLocation | None, LineProfile] = dataclasses.field(default_factory=dict)
+    budget_consumed: int = 0
+    budget_added: int = 0
+
+    @property
+    def opcodes(self) -> int:
+        return sum(line.opcodes for line in self.lines.values())
+
+    def add_trace(self, trace: list[dict[str, typing.Any]], source_map: PuyaSourceMap) -> None:
+        # Rebuilt from each step's pops and additions, so ops can see the values they consumed
+        stack: list[dict[str, typing.Any]] = []
+        for step in trace:
+            pc = step["pc"]
+            popped = step.get("stack-pop-count", 0)
+            args = stack[len(stack) - popped :] if popped else []
+            line = self.lines.setdefault(source_map.location(pc), LineProfile())
+            opcode = source_map.opcode(pc) or f"pc={pc}"
+            line.opcodes += 1
+            line.ops[opcode] = line.ops.get(opcode, 0) + 1
+            if opcode in _BOX_READS:
+                line.box_reads += 1
+                line.box_bytes_read += sum(
+                    len(base64.b64decode(value.get("bytes", "")))
+                    for value in step.get("stack-additions", [])
+                )
+            elif opcode in _BOX_SPAN_WRITES and args:
+                # Only the bytes taken from the stack are written, not the whole box
+                line.box_writes += 1
+                line.box_bytes_written += len(base64.b64decode(args[-1].get("bytes", "")))
+            elif opcode in _BOX_WRITES:
+                line.box_writes += 1
+                line.box_bytes_written += sum(
+                    len(base64.b64decode(change.get("new-value", {}).get("bytes", "")))
+                    for change in step.get("state-changes", [])
+                    if change.get("app-state-type") == "b"
+                )
+            if popped:
+                del stack[-popped:]
+            stack.extend(step.get("stack-additions", []))
+
+
+def _approval_traces(txn_result: dict[str, typing.Any]) -> typing.Iterator[list[dict[str, typing.Any]]]:
+    # Inner traces are never this program, as an app can't call itself, but the opup
+    # app's calls, whose pcs mean nothing in this program's source map
+    trace = txn_result.get("exec-trace", {})
+    if "approval-program-trace" in trace:
+        yield trace["approval-program-trace"]
+
+
+def profile_group(
+    composer: algokit_utils.TransactionComposer,
+    source_map: PuyaSourceMap | None = None,
+    *,
+    app_id: int | None = None,
+) -> Profile:
+    """
+    Simulates `composer`'s group and profiles the approval program traces. Signatures
+    are skipped and unnamed resources allowed, so the senders need no real signer.
+    Only calls to `app_id` are profiled when it is given.
+    """
+    source_map = source_map or PuyaSourceMap(APPROVAL_SOURCE_MAP)
+    result = composer.simulate(
+        allow_unnamed_resources=True,
+        skip_signatures=True,
+        exec_trace_config=SimulateTraceConfig(enable=True, stack_change=True, state_change=True),
+    )
+    group = result.simulate_response["txn-groups"][0]
+    if group.get("failure-message"):
+        raise Exception(f"Simulation failed: {group['failure-message']}")
+
+    profile = Profile(
+        budget_consumed=group.get("app-budget-consumed", 0),
+        budget_added=group.get("app-budget-added", 0),
+    )
+    for txn, txn_result in zip(result.transactions, group["txn-results"], strict=True):
+        if app_id is not None and getattr(txn.raw, "index", None) != app_id:
+            continue
+        for trace in _approval_traces(txn_result):
+            profile.add_trace(trace, source_map)
+    return profile
+
+
+def print_profile(profile: Profile, limit: int | None = None, console: Console | None = None) -> None:
+    console = console or Console()
+    table = Table(
+        title=f"{profile.opcodes} opcodes, {profile.budget_consumed}/{profile.budget_added} budget used"
+    )
+    for column in ("line", "source", "ops", "box r", "box w", "bytes r", "bytes w", "top ops"):
+        table.add_column(column, justify="left" if column in ("line", "source", "top ops") else "right")
+    sources: dict[Path, list[str]] = {}
+    ranked = sorted(profile.lines.items(), key=lambda item: -item[1].opcodes)
+    for location, line in ranked[:limit]:
+        if location is None:
+            label, text = "-", "(compiler generated)"
+        else:
+            if location.path not in sources:
+                sources[location.path] = location.path.read_text().splitlines()
+            label, text = str(location), sources[location.path][location.line - 1].strip()
+        top_ops = sorted(line.ops.items(), key=lambda item: -item[1])[:3]
+        table.add_row(
+            label,
+            text,
+            str(line.opcodes),
+            str(line.box_reads),
+            str(line.box_writes),
+            str(line.box_bytes_read),
+            str(line.box_bytes_written),
+            ", ".join(f"{op}×{count}" for op, count in top_ops),
+        )
+    console.print(table)
+
+
+def _method_args(
+    client: algokit_utils.AppClient, method: str, raw_args: list[typing.Any], sender: str
+) -> list[typing.Any]:
+    """Turns JSON arguments into call arguments; a number passed for a `pay` argument becomes a payment to the app."""
+    spec = next(m for m in client.app_spec.methods if m.name == method)
+    args = []
+    for arg, value in zip(spec.args, raw_args, strict=True):
+        if arg.type == "pay":
+            value = client.algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    sender=sender,
+                    receiver=client.app_address,
+                    amount=algokit_utils.AlgoAmount(micro_algo=int(value)),
+                )
+            )
+        elif isinstance(value, list):
+            value = [tuple(item) if isinstance(item, list) else item for item in value]
+        args.append(value)
+    return args
+
+
+def main() -> None:
+    from smart_contracts.artifacts.ff.proposal_contract_client import ProposalContractClient
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument("--sender", required=True, help="address to simulate the call from")
+    parser.add_argument("--limit", type=int, default=30, help="number of lines to show")
+    parser.add_argument("method")
+    parser.add_argument("args", type=json.loads, help="JSON array of method arguments")
+    args = parser.parse_args()
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    algorand.account.set_signer(args.sender, EmptySigner())
+    client = algorand.client.get_typed_app_client_by_id(
+        ProposalContractClient, app_id=args.app_id, default_sender=args.sender
+    )
+    composer = algorand.new_group().add_app_call_method_call(
+        getattr(client.params, args.method)(
+            args=_method_args(client.app_client, args.method, args.args, args.sender)
+        )
+    )
+    print_profile(profile_group(composer, app_id=args.app_id), limit=args.limit)
+
+
+if __name__ == "__main__":
+    main()
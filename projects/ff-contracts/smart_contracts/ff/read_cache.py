@@ -0,0 +1,256 @@
+import base64
+import collections
+import dataclasses
+import inspect
+import time
+import typing
+
+import algokit_utils
+from algokit_utils.applications.abi import get_abi_decoded_value, get_abi_encoded_value
+
+from smart_contracts.artifacts.ff.proposal_contract_client import (
+    DonationBoxKey,
+    FutureFund,
+    GlobalStateValue,
+    Proposal,
+    ProposalContractClient,
+    ProposalContractSend,
+    _MapState,
+)
+from smart_contracts.ff.boxes import method_box_references
+
+# Cache key for the whole global state, which algod returns in one response
+_GLOBAL_STATE_KEY = ("global", b"")
+
+# Methods that change a global state counter as well as the boxes they reference
+_GLOBAL_STATE_WRITERS = {"create_proposal", "create_proposals", "fund_future_self", "end_import"}
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclasses.dataclass
+class _Entry:
+    value: typing.Any
+    round: int
+    fetched_at: float
+
+
+class RoundAwareCache:
+    """
+    LRU cache of decoded state values, each tagged with the round it was read at.
+
+    An entry is only served while it belongs to the latest round the cache has seen
+    and is younger than `max_age` seconds (roughly one block), so readers sharing a
+    cache within one round hit algod once per key.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_age: float = 3.0) -> None:
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.known_round = 0
+        self.stats = CacheStats()
+        self._entries: collections.OrderedDict[tuple[str, bytes], _Entry] = collections.OrderedDict()
+
+    def get(self, key: tuple[str, bytes]) -> tuple[bool, typing.Any]:
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry.round < self.known_round
+            or time.monotonic() - entry.fetched_at > self.max_age
+        ):
+            self.stats.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return True, entry.value
+
+    def put(self, key: tuple[str, bytes], value: typing.Any, round_num: int | None = None) -> None:
+        if round_num is not None:
+            self.observe_round(round_num)
+        self._entries[key] = _Entry(value, round_num or self.known_round, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def observe_round(self, round_num: int) -> None:
+        """Records that `round_num` exists; entries read in earlier rounds stop being served."""
+        self.known_round = max(self.known_round, round_num)
+
+    def invalidate(self, key: tuple[str, bytes]) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+
+class _CachedBoxAccessor:
+    """Box map accessor with the same interface as `app_client.state.box`, backed by a `RoundAwareCache`."""
+
+    def __init__(self, app_client: algokit_utils.AppClient, cache: RoundAwareCache) -> None:
+        self._app_client = app_client
+        self._cache = cache
+
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        # Listing a whole map always needs fresh box names, so it bypasses the cache
+        return self._app_client.state.box.get_map(map_name)
+
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        app_spec = self._app_client.app_spec
+        metadata = app_spec.state.maps.box[map_name]
+        name = base64.b64decode(metadata.prefix or "") + get_abi_encoded_value(
+            key, metadata.key_type, app_spec.structs
+        )
+        found, value = self._cache.get(("box", name))
+        if found:
+            return value
+        box = self._app_client.algorand.client.algod.application_box_by_name(
+            self._app_client.app_id, name
+        )
+        value = get_abi_decoded_value(
+            base64.b64decode(box["value"]), metadata.value_type, app_spec.structs
+        )
+        self._cache.put(("box", name), value, box.get("round"))
+        return value
+
+
+class _CachedGlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: RoundAwareCache) -> None:
+        self._app_client = app_client
+        self._cache = cache
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        found, value = self._cache.get(_GLOBAL_STATE_KEY)
+        if not found:
+            value = self._app_client.state.global_state.get_all()
+            self._cache.put(_GLOBAL_STATE_KEY, value)
+        return typing.cast(GlobalStateValue, value)
+
+    @property
+    def no_of_proposals(self) -> int:
+        return typing.cast(int, self.get_all()["no_of_proposals"])
+
+    @property
+    def no_of_future_funds(self) -> int:
+        return typing.cast(int, self.get_all()["no_of_future_funds"])
+
+
+class _CachedBoxState:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: RoundAwareCache) -> None:
+        self._accessor = _CachedBoxAccessor(app_client, cache)
+
+    @property
+    def proposals(self) -> "_MapState[int, Proposal]":
+        return _MapState(self._accessor, "proposals", Proposal)
+
+    @property
+    def milestone_votes(self) -> "_MapState[int, list[str]]":
+        return _MapState(self._accessor, "milestoneVotes", None)
+
+    @property
+    def donations(self) -> "_MapState[DonationBoxKey, int]":
+        return _MapState(self._accessor, "donations", None)
+
+    @property
+    def eligible_weight(self) -> "_MapState[int, int]":
+        return _MapState(self._accessor, "eligibleWeight", None)
+
+    @property
+    def future_funds(self) -> "_MapState[int, FutureFund]":
+        return _MapState(self._accessor, "futureFunds", FutureFund)
+
+
+class CachedProposalContractState:
+    """Drop-in replacement for `ProposalContractState` that reads through a `RoundAwareCache`."""
+
+    def __init__(self, app_client: algokit_utils.AppClient, cache: RoundAwareCache) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self._global_state = _CachedGlobalState(app_client, cache)
+        self._box = _CachedBoxState(app_client, cache)
+
+    @property
+    def global_state(self) -> _CachedGlobalState:
+        return self._global_state
+
+    @property
+    def box(self) -> _CachedBoxState:
+        return self._box
+
+    def note_sent(self, method: str, args: tuple, sender: str, confirmed_round: int | None) -> None:
+        """Drops every cached key a confirmed call of ours wrote to."""
+        if confirmed_round:
+            self.cache.observe_round(confirmed_round)
+        if method in _GLOBAL_STATE_WRITERS:
+            # These create new boxes at most, which can't be cached as reads of missing boxes fail
+            self.cache.invalidate(_GLOBAL_STATE_KEY)
+            return
+        try:
+            references = method_box_references(method, args, sender)
+        except ValueError:
+            # The call went through, but which boxes it wrote isn't known
+            self.cache.clear()
+            return
+        for reference in references:
+            if reference.name:
+                self.cache.invalidate(("box", reference.name))
+
+
+class _InvalidatingSend:
+    """Wraps `ProposalContractSend` so our own calls invalidate the keys they touched."""
+
+    def __init__(self, send: ProposalContractSend, state: CachedProposalContractState) -> None:
+        self._send = send
+        self._state = state
+
+    def __getattr__(self, name: str) -> typing.Any:
+        method = getattr(self._send, name)
+        if name == "clear_state":
+            return method
+
+        def call(*call_args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            result = method(*call_args, **kwargs)
+            # Methods without arguments (begin_import) take no `args` at all
+            args = inspect.signature(method).bind(*call_args, **kwargs).arguments.get("args", ())
+            method_args = (
+                tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+                if dataclasses.is_dataclass(args)
+                else tuple(args)
+            )
+            self._state.note_sent(
+                name,
+                method_args,
+                result.transaction.raw.sender,
+                result.confirmation.get("confirmed-round"),
+            )
+            return result
+
+        return call
+
+
+class CachedProposalContractClient(ProposalContractClient):
+    """
+    `ProposalContractClient` whose `state` reads go through a round-aware LRU cache.
+    Several clients (or page components) can share one `RoundAwareCache`; hit rates
+    are exposed on `cache.stats`.
+    """
+
+    def __init__(self, *args: typing.Any, cache: RoundAwareCache | None = None, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache = cache or RoundAwareCache()
+        self.state = CachedProposalContractState(self.app_client, self.cache)  # type: ignore[assignment]
+        self.send = _InvalidatingSend(self.send, self.state)  # type: ignore[assignment]
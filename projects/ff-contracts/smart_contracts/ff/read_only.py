@@ -0,0 +1,426 @@
+"""
+Read-only access to ProposalContract state, using the standard library only.
+
+Box names, box and global state decoding, and a small algod reader for the
+consumers that only look at state (decoders, dashboards, exports). Importing it
+doesn't load algosdk or algokit_utils, which importing the typed client does
+(about 300ms, most of it algosdk's crypto and HTTP dependencies); `boxes`
+re-exports the names from here for the modules that build transactions.
+
+Values decode the way the typed client's decoders return them: structs as dicts,
+tuples and arrays as lists (`byte[]` too) and addresses as strings.
+
+    reader = StateReader("http://localhost:4001", "a" * 64)
+    proposal = reader.box(1006, proposal_box_name(0)).value
+"""
+
+import base64
+import dataclasses
+import functools
+import hashlib
+import json
+import math
+import re
+import typing
+import urllib.parse
+from pathlib import Path
+
+APP_SPEC_PATH = Path(__file__).parent.parent / "artifacts" / "ff" / "ProposalContract.arc56.json"
+
+# Seconds a milestone's vote stays open after its proof, and after which its donors
+# can be refunded, as in contract.py
+VOTING_TIME = 180
+EXPIRATION_TIME = 240
+
+# Box key prefixes, as declared on the BoxMaps in contract.py. None is a prefix of
+# another and each starts with a different byte, so a name's map is known from its
+# first byte alone.
+PROPOSALS_PREFIX = b"proposals"
+MILESTONE_VOTES_PREFIX = b"milestoneVotes_"
+DONATIONS_PREFIX = b"donations"
+FUTURE_FUNDS_PREFIX = b"futureFund_"
+STATUS_INDEX_PREFIX = b"statusIndex_"
+CATEGORY_INDEX_PREFIX = b"categoryIndex_"
+ELIGIBLE_WEIGHT_PREFIX = b"eligibleWeight_"
+
+# Box map names in the app spec, by prefix
+BOX_MAPS = (
+    (MILESTONE_VOTES_PREFIX, "milestoneVotes"),
+    (FUTURE_FUNDS_PREFIX, "futureFunds"),
+    (PROPOSALS_PREFIX, "proposals"),
+    (DONATIONS_PREFIX, "donations"),
+    (STATUS_INDEX_PREFIX, "statusIndex"),
+    (CATEGORY_INDEX_PREFIX, "categoryIndex"),
+    (ELIGIBLE_WEIGHT_PREFIX, "eligibleWeight"),
+)
+
+# Proposal statuses in the status index, as numbered in contract.py
+PROPOSAL_STATUSES = {"fundraising": 1, "in_voting": 2, "completed": 3, "expired": 4}
+
+# Proposals per page of a status or category index bitset
+INDEX_PAGE_BITS = 2048
+
+_BOX_MAPS_BY_FIRST_BYTE = {prefix[0]: (prefix, map_name) for prefix, map_name in BOX_MAPS}
+
+# Field names of the Milestone struct in contract.py, which Proposal.milestones only has as a tuple type
+MILESTONE_FIELDS = (
+    "name",
+    "amount",
+    "proof_link",
+    "votes_for",
+    "votes_against",
+    "total_voters",
+    "claimed",
+    "proof_submitted_time",
+    "voting_end_time",
+)
+
+# Bytes of an address checksum (the end of the SHA-512/256 of the public key)
+_CHECKSUM_LENGTH = 4
+
+_ARRAY_TYPE = re.compile(r"^(.+)\[(\d*)\]$")
+_UINT_TYPE = re.compile(r"^uint(\d+)$")
+
+Structs = dict[str, list[dict[str, str]]]
+
+
+def encode_address(public_key: bytes) -> str:
+    """The base32 address of a 32-byte public key."""
+    checksum = hashlib.new("sha512_256", public_key).digest()[-_CHECKSUM_LENGTH:]
+    return base64.b32encode(public_key + checksum).decode().rstrip("=")
+
+
+def decode_address(address: str) -> bytes:
+    """The 32-byte public key of an address, checking its checksum."""
+    decoded = base64.b32decode(address + "=" * (-len(address) % 8))
+    public_key, checksum = decoded[:-_CHECKSUM_LENGTH], decoded[-_CHECKSUM_LENGTH:]
+    if len(public_key) != 32 or hashlib.new("sha512_256", public_key).digest()[-_CHECKSUM_LENGTH:] != checksum:
+        raise ValueError(f"Invalid address: {address}")
+    return public_key
+
+
+def proposal_box_name(proposal_id: int) -> bytes:
+    """Box name of the `proposals` entry for a proposal."""
+    return PROPOSALS_PREFIX + proposal_id.to_bytes(8, "big")
+
+
+def milestone_votes_box_name(proposal_id: int) -> bytes:
+    """Box name of the `milestoneVotes` entry for a proposal."""
+    return MILESTONE_VOTES_PREFIX + proposal_id.to_bytes(8, "big")
+
+
+def eligible_weight_box_name(proposal_id: int) -> bytes:
+    """Box name of the `eligibleWeight` entry for a proposal."""
+    return ELIGIBLE_WEIGHT_PREFIX + proposal_id.to_bytes(8, "big")
+
+
+def donation_box_name(proposal_id: int, donor: str) -> bytes:
+    """Box name of the `donations` entry for a (proposal, donor) pair."""
+    return DONATIONS_PREFIX + proposal_id.to_bytes(8, "big") + decode_address(donor)
+
+
+def future_fund_box_name(fund_id: int) -> bytes:
+    """Box name of the `futureFunds` entry for a fund."""
+    return FUTURE_FUNDS_PREFIX + fund_id.to_bytes(8, "big")
+
+
+def category_hash(category: str) -> int:
+    """The category's key in the category index: the first 8 bytes of the SHA-256 of its exact text."""
+    return int.from_bytes(hashlib.sha256(category.encode()).digest()[:8], "big")
+
+
+def status_index_box_name(status: int, proposal_id: int) -> bytes:
+    """Box name of the status index page holding a proposal's bit."""
+    return STATUS_INDEX_PREFIX + status.to_bytes(8, "big") + (proposal_id // INDEX_PAGE_BITS).to_bytes(8, "big")
+
+
+def category_index_box_name(category: str, proposal_id: int) -> bytes:
+    """Box name of the category index page holding a proposal's bit."""
+    return (
+        CATEGORY_INDEX_PREFIX
+        + category_hash(category).to_bytes(8, "big")
+        + (proposal_id // INDEX_PAGE_BITS).to_bytes(8, "big")
+    )
+
+
+def vote_weight(amount_donated: int) -> int:
+    """A donor's vote weight, as in contract.py: the square root of the whole Algos they donated."""
+    return math.isqrt(amount_donated // 1_000_000)
+
+
+def outcome_decided(votes_for: int, votes_against: int, eligible_weight: int) -> bool:
+    """
+    Whether the vote weight not yet cast on a milestone could no longer change its
+    outcome, in which case the contract closes voting at the vote that decided it.
+    """
+    outstanding = max(0, eligible_weight - votes_for - votes_against)
+    if votes_for > votes_against:
+        return votes_for - votes_against > outstanding
+    return votes_against - votes_for >= outstanding
+
+
+def classify_box_name(name: bytes) -> tuple[str, bytes] | None:
+    """Splits a box name into its map name and encoded key, or None if it belongs to no map."""
+    found = _BOX_MAPS_BY_FIRST_BYTE.get(name[0]) if name else None
+    if found is None or not name.startswith(found[0]):
+        return None
+    prefix, map_name = found
+    return map_name, name[len(prefix) :]
+
+
+def decode_box_key(map_name: str, encoded_key: bytes) -> typing.Any:
+    """
+    Decodes a box key without the app spec: an int for the uint64-keyed maps, a
+    `{"proposal_id", "donor"}` dict (as the ABI decoder returns) for `donations`.
+    """
+    if map_name == "donations":
+        return {"proposal_id": int.from_bytes(encoded_key[:8], "big"), "donor": encode_address(encoded_key[8:])}
+    if map_name in ("statusIndex", "categoryIndex"):
+        return {"index": int.from_bytes(encoded_key[:8], "big"), "page": int.from_bytes(encoded_key[8:], "big")}
+    return int.from_bytes(encoded_key, "big")
+
+
+def partition_box_names(
+    names: typing.Iterable[bytes], maps: typing.Container[str] | None = None
+) -> dict[str, list[tuple[bytes, typing.Any]]]:
+    """
+    Partitions a box listing by map in one pass, as map name -> [(box name, decoded
+    key)]. With `maps`, names of other maps are skipped without decoding their keys.
+    Names that belong to no map are dropped.
+    """
+    partitioned: dict[str, list[tuple[bytes, typing.Any]]] = {}
+    for name in names:
+        classified = classify_box_name(name)
+        if classified is None or (maps is not None and classified[0] not in maps):
+            continue
+        map_name, encoded_key = classified
+        partitioned.setdefault(map_name, []).append((name, decode_box_key(map_name, encoded_key)))
+    return partitioned
+
+
+@dataclasses.dataclass(frozen=True)
+class DecodedBox:
+    map_name: str
+    key: typing.Any
+    value: typing.Any
+
+
+def id_set_page_ids(page: int, bitset: bytes) -> list[int]:
+    """Proposal IDs in a page of a status or category index (the first byte's high bit is the page's first ID)."""
+    first = page * INDEX_PAGE_BITS
+    return [
+        first + byte_index * 8 + bit
+        for byte_index, byte in enumerate(bitset)
+        if byte
+        for bit in range(8)
+        if byte & (0x80 >> bit)
+    ]
+
+
+def shape_box_value(map_name: str, encoded_key: bytes, value: bytes, decoded: typing.Any) -> typing.Any:
+    """Index pages as the proposal IDs they hold, and proposal milestones as dicts rather than tuples."""
+    if map_name in ("statusIndex", "categoryIndex"):
+        return id_set_page_ids(int.from_bytes(encoded_key[8:], "big"), value)
+    if map_name == "proposals":
+        decoded["milestones"] = [dict(zip(MILESTONE_FIELDS, m, strict=True)) for m in decoded["milestones"]]
+    return decoded
+
+
+@functools.cache
+def app_spec(path: Path = APP_SPEC_PATH) -> dict[str, typing.Any]:
+    """The ARC-56 app spec as plain JSON, read once per path."""
+    return json.loads(path.read_text())
+
+
+def _split_tuple(abi_type: str) -> list[str]:
+    types, depth, start = [], 0, 1
+    for index, char in enumerate(abi_type[1:-1], start=1):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and not depth:
+            types.append(abi_type[start:index])
+            start = index + 1
+    if start < len(abi_type) - 1:
+        types.append(abi_type[start:-1])
+    return types
+
+
+def _element_types(abi_type: str, structs: Structs) -> list[str] | None:
+    if abi_type in structs:
+        return [field["type"] for field in structs[abi_type]]
+    if abi_type.startswith("("):
+        return _split_tuple(abi_type)
+    return None
+
+
+def _is_dynamic(abi_type: str, structs: Structs) -> bool:
+    if abi_type in ("string", "AVMBytes", "AVMString"):
+        return True
+    array = _ARRAY_TYPE.match(abi_type)
+    if array:
+        return not array[2] or _is_dynamic(array[1], structs)
+    elements = _element_types(abi_type, structs)
+    return elements is not None and any(_is_dynamic(element, structs) for element in elements)
+
+
+def _static_size(abi_type: str, structs: Structs) -> int:
+    if abi_type in ("bool", "byte"):
+        return 1
+    if abi_type == "address":
+        return 32
+    uint = _UINT_TYPE.match(abi_type)
+    if uint:
+        return int(uint[1]) // 8
+    array = _ARRAY_TYPE.match(abi_type)
+    if array:
+        return _tuple_size([array[1]] * int(array[2]), structs)
+    elements = _element_types(abi_type, structs)
+    if elements is None:
+        raise ValueError(f"Unsupported ABI type: {abi_type}")
+    return _tuple_size(elements, structs)
+
+
+def _tuple_size(types: list[str], structs: Structs) -> int:
+    size, bools = 0, 0
+    for abi_type in types:
+        if abi_type == "bool":
+            bools += 1
+            continue
+        size += (bools + 7) // 8 + _static_size(abi_type, structs)
+        bools = 0
+    return size + (bools + 7) // 8
+
+
+def _decode_tuple(types: list[str], data: bytes, structs: Structs) -> list[typing.Any]:
+    values: list[typing.Any] = []
+    offset, index = 0, 0
+    while index < len(types):
+        abi_type = types[index]
+        if abi_type == "bool":
+            # Consecutive bools share bytes, the first in the high bit
+            run = 0
+            while index + run < len(types) and types[index + run] == "bool":
+                values.append(bool(data[offset + run // 8] & (0x80 >> run % 8)))
+                run += 1
+            offset += (run + 7) // 8
+            index += run
+            continue
+        if _is_dynamic(abi_type, structs):
+            start = int.from_bytes(data[offset : offset + 2], "big")
+            values.append(decode_abi_value(abi_type, data[start:], structs))
+            offset += 2
+        else:
+            size = _static_size(abi_type, structs)
+            values.append(decode_abi_value(abi_type, data[offset : offset + size], structs))
+            offset += size
+        index += 1
+    return values
+
+
+def decode_abi_value(abi_type: str, data: bytes, structs: Structs) -> typing.Any:
+    """Decodes an ARC-4 encoded value of an ARC-56 type (an ABI type, a struct name or an AVM type)."""
+    if abi_type in structs:
+        fields = structs[abi_type]
+        values = _decode_tuple([field["type"] for field in fields], data, structs)
+        return {field["name"]: value for field, value in zip(fields, values, strict=True)}
+    match abi_type:
+        case "AVMBytes":
+            return data
+        case "AVMString":
+            return data.decode()
+        case "AVMUint64":
+            return int.from_bytes(data, "big")
+        case "bool":
+            return bool(data[0] & 0x80)
+        case "byte":
+            return data[0]
+        case "address":
+            return encode_address(data[:32])
+        case "string":
+            return data[2 : 2 + int.from_bytes(data[:2], "big")].decode()
+    uint = _UINT_TYPE.match(abi_type)
+    if uint:
+        return int.from_bytes(data[: int(uint[1]) // 8], "big")
+    array = _ARRAY_TYPE.match(abi_type)
+    if array:
+        element, length = array[1], array[2]
+        if not length:
+            length, data = int.from_bytes(data[:2], "big"), data[2:]
+        return _decode_tuple([element] * int(length), data, structs)
+    if abi_type.startswith("("):
+        return _decode_tuple(_split_tuple(abi_type), data, structs)
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+
+def decode_box(name: bytes, value: bytes, spec: dict[str, typing.Any] | None = None) -> DecodedBox | None:
+    """
+    Decodes a raw box into its map, key and value (structs as dicts, milestones
+    included, and index pages as the proposal IDs they hold), or None if the name
+    belongs to no box map.
+    """
+    classified = classify_box_name(name)
+    if classified is None:
+        return None
+    spec = spec or app_spec()
+    map_name, encoded_key = classified
+    metadata = spec["state"]["maps"]["box"][map_name]
+    decoded = decode_abi_value(metadata["valueType"], value, spec["structs"])
+    return DecodedBox(
+        map_name,
+        decode_abi_value(metadata["keyType"], encoded_key, spec["structs"]),
+        shape_box_value(map_name, encoded_key, value, decoded),
+    )
+
+
+def decode_global_state(
+    global_state: list[dict[str, typing.Any]], spec: dict[str, typing.Any] | None = None
+) -> dict[str, typing.Any]:
+    """Decodes algod's `global-state` list into values by key name. Keys the spec doesn't declare are dropped."""
+    spec = spec or app_spec()
+    keys = {metadata["key"]: (name, metadata) for name, metadata in spec["state"]["keys"]["global"].items()}
+    decoded = {}
+    for entry in global_state:
+        found = keys.get(entry["key"])
+        if found is None:
+            continue
+        name, metadata = found
+        value = entry["value"]
+        if value["type"] == 2:
+            decoded[name] = value.get("uint", 0)
+        else:
+            raw = base64.b64decode(value.get("bytes", ""))
+            decoded[name] = decode_abi_value(metadata["valueType"], raw, spec["structs"])
+    return decoded
+
+
+class StateReader:
+    """Reads boxes and global state straight from algod's REST API."""
+
+    def __init__(self, algod_url: str, algod_token: str = "", spec: dict[str, typing.Any] | None = None) -> None:
+        self.algod_url = algod_url.rstrip("/")
+        self.algod_token = algod_token
+        self.spec = spec or app_spec()
+
+    def _get(self, path: str) -> dict[str, typing.Any]:
+        # Imported here so decoding alone doesn't load the HTTP client
+        import urllib.request
+
+        request = urllib.request.Request(self.algod_url + path, headers={"X-Algo-API-Token": self.algod_token})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def box(self, app_id: int, name: bytes) -> DecodedBox | None:
+        """The decoded box, None if its name belongs to no box map. Raises HTTPError (404) if it doesn't exist."""
+        encoded = base64.b64encode(name).decode()
+        response = self._get(f"/v2/applications/{app_id}/box?name=b64:{urllib.parse.quote(encoded, safe='')}")
+        return decode_box(base64.b64decode(response["name"]), base64.b64decode(response["value"]), self.spec)
+
+    def box_names(self, app_id: int) -> list[bytes]:
+        response = self._get(f"/v2/applications/{app_id}/boxes")
+        return [base64.b64decode(box["name"]) for box in response.get("boxes", [])]
+
+    def global_state(self, app_id: int) -> dict[str, typing.Any]:
+        response = self._get(f"/v2/applications/{app_id}")
+        return decode_global_state(response["params"].get("global-state", []), self.spec)
@@ -0,0 +1,470 @@
+"""
+Relayer for milestone votes signed off-chain by donors.
+
+Donors sign a vote message naming the app, proposal, milestone, the time its proof
+was submitted and their vote (the `sign` command), so voting costs them no
+transaction, and a vote only counts in the voting round it was signed for. The relayer collects signed
+votes, drops bad signatures, duplicates and votes the contract would reject (signed
+for an earlier proof, voter already voted, creator, not a donor of at least 1 Algo, after the
+vote that decided the outcome and so closed voting early), and sends the rest with
+`vote_milestone_batch`, packed into as few groups as the opcode budget, inner
+transaction and box reference limits allow. It pays every fee, including those of
+the inner calls the contract makes to raise its budget for the signature checks.
+
+    python -m smart_contracts.ff.relayer sign --app-id 1002 --proposal-id 3 --vote for --account DONOR >> votes.ndjson
+    python -m smart_contracts.ff.relayer relay --app-id 1002 --sender RELAYER votes.ndjson
+"""
+
+import argparse
+import base64
+import collections
+import dataclasses
+import functools
+import json
+import logging
+import math
+import sys
+import typing
+
+import algokit_utils
+from algosdk import encoding
+from nacl import exceptions, signing
+
+from smart_contracts.artifacts.ff.proposal_contract_client import DonationBoxKey, ProposalContractClient
+from smart_contracts.ff.boxes import (
+    MILESTONE_FIELDS,
+    method_box_references,
+    outcome_decided,
+    proposal_box_name,
+    vote_weight,
+)
+from smart_contracts.ff.cost_analysis import (
+    BOX_IO_PER_REFERENCE,
+    MAX_BOX_REFERENCES,
+    MAX_INNER_TXNS,
+    OPCODE_BUDGET,
+    VOTE_BATCH_BUDGET,
+    VOTE_BUDGET,
+    VOTE_SCAN_BUDGET,
+)
+from smart_contracts.ff.errors import failure_cause
+from smart_contracts.ff.metrics import installed_metrics
+
+logger = logging.getLogger(__name__)
+
+# As in contract.py
+VOTE_MESSAGE_PREFIX = b"ffvote"
+
+# Most votes per call; each takes 97 of the 2048 bytes of app call arguments
+_VOTES_PER_CALL = 16
+# A group holds at most 16 app calls, batch calls and the fillers carrying their box
+# references (8 per call) alike. Each vote adds its voter's donation box to the
+# proposal, milestoneVotes and eligibleWeight boxes, so the references allow over 100
+# votes a group, but the 256 inner calls raising the budget for the signature checks
+# run out first: at about 65 votes with no earlier voters, or 25 with 200.
+# ci-cost-analysis checks vote_milestone_batch at 16 votes per call.
+_MAX_GROUP_SIZE = 16
+
+_MIN_FEE = 1000
+
+
+def vote_message(app_id: int, proposal_id: int, milestone_index: int, proof_submitted_time: int, vote: bool) -> bytes:
+    return (
+        VOTE_MESSAGE_PREFIX
+        + app_id.to_bytes(8, "big")
+        + proposal_id.to_bytes(8, "big")
+        + milestone_index.to_bytes(8, "big")
+        + proof_submitted_time.to_bytes(8, "big")
+        + (b"\x80" if vote else b"\x00")
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class SignedVote:
+    proposal_id: int
+    milestone_index: int
+    # When the proof voted on was submitted, as in the milestone
+    proof_submitted_time: int
+    voter: str
+    vote: bool
+    signature: bytes
+
+    def verify(self, app_id: int) -> bool:
+        try:
+            signing.VerifyKey(encoding.decode_address(self.voter)).verify(
+                vote_message(app_id, self.proposal_id, self.milestone_index, self.proof_submitted_time, self.vote),
+                self.signature,
+            )
+        except (exceptions.BadSignatureError, ValueError):
+            return False
+        return True
+
+    def to_json(self) -> str:
+        return json.dumps({**dataclasses.asdict(self), "signature": base64.b64encode(self.signature).decode()})
+
+    @staticmethod
+    def from_json(line: str) -> "SignedVote":
+        fields = json.loads(line)
+        return SignedVote(**{**fields, "signature": base64.b64decode(fields["signature"])})
+
+
+def sign_vote(
+    private_key: str, app_id: int, proposal_id: int, milestone_index: int, proof_submitted_time: int, vote: bool
+) -> SignedVote:
+    """A vote signed with an algosdk (base64) private key."""
+    key = signing.SigningKey(base64.b64decode(private_key)[:32])
+    return SignedVote(
+        proposal_id=proposal_id,
+        milestone_index=milestone_index,
+        proof_submitted_time=proof_submitted_time,
+        voter=encoding.encode_address(bytes(key.verify_key)),
+        vote=vote,
+        signature=key.sign(vote_message(app_id, proposal_id, milestone_index, proof_submitted_time, vote)).signature,
+    )
+
+
+def inner_calls(votes: int, earlier_voters: int) -> int:
+    """
+    Inner app calls a `vote_milestone_batch` call makes to reserve its budget (as
+    in contract.py), at most; the call itself brings one app call's worth.
+    """
+    budget = VOTE_BATCH_BUDGET + votes * (VOTE_BUDGET + earlier_voters * VOTE_SCAN_BUDGET)
+    return max(0, math.ceil(budget / OPCODE_BUDGET) - 1)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Group:
+    """`vote_milestone_batch` calls on one proposal, sent together."""
+
+    proposal_id: int
+    calls: tuple[tuple[SignedVote, ...], ...]
+    # Voters on the milestone before the group, and the size of the proposal box
+    earlier_voters: int
+    proposal_size: int
+
+    @property
+    def votes(self) -> list[SignedVote]:
+        return [vote for call in self.calls for vote in call]
+
+    @property
+    def opups(self) -> list[int]:
+        """Inner app calls made by each call, each checking its votes against every voter before it."""
+        opups = []
+        earlier = self.earlier_voters
+        for call in self.calls:
+            opups.append(inner_calls(len(call), earlier))
+            earlier += len(call)
+        return opups
+
+    @functools.cached_property
+    def box_references(self) -> list[algokit_utils.BoxReference]:
+        """References to every box the group touches, padded until they cover the bytes they hold after it."""
+        votes = self.votes
+        references = [
+            reference
+            for reference in method_box_references(
+                "vote_milestone_batch", (self.proposal_id, 0, [(vote.voter,) for vote in votes]), ""
+            )
+            if reference.name
+        ]
+        # The donations and the eligible weight are 8 bytes each
+        touched = self.proposal_size + 2 + 32 * (self.earlier_voters + len(votes)) + 8 * (len(votes) + 1)
+        padding = max(0, math.ceil(touched / BOX_IO_PER_REFERENCE) - len(references))
+        return references + [algokit_utils.BoxReference(0, b"")] * padding
+
+    @property
+    def fillers(self) -> int:
+        """App calls added only to carry the box references the batch calls have no room for."""
+        return max(0, math.ceil(len(self.box_references) / MAX_BOX_REFERENCES) - len(self.calls))
+
+    def fits(self, max_group_size: int) -> bool:
+        return sum(self.opups) <= MAX_INNER_TXNS and len(self.calls) + self.fillers <= max_group_size
+
+    def with_call(self, call: typing.Sequence[SignedVote]) -> "_Group":
+        return dataclasses.replace(self, calls=(*self.calls, tuple(call)))
+
+    def followed_by(self) -> "_Group":
+        """An empty group for the calls after this one."""
+        return dataclasses.replace(self, calls=(), earlier_voters=self.earlier_voters + len(self.votes))
+
+
+@dataclasses.dataclass(frozen=True)
+class VoteTally:
+    """A milestone's votes so far, for finding the call whose votes close its voting early."""
+
+    votes_for: int
+    votes_against: int
+    # Vote weight of the proposal's donors, which is what could be cast in total
+    eligible_weight: int
+    # Vote weight of each voter with a queued vote
+    weights: typing.Mapping[str, int]
+
+    @property
+    def decided(self) -> bool:
+        return outcome_decided(self.votes_for, self.votes_against, self.eligible_weight)
+
+    def after(self, call: typing.Sequence[SignedVote]) -> "VoteTally":
+        return dataclasses.replace(
+            self,
+            votes_for=self.votes_for + sum(self.weights[vote.voter] for vote in call if vote.vote),
+            votes_against=self.votes_against + sum(self.weights[vote.voter] for vote in call if not vote.vote),
+        )
+
+
+@dataclasses.dataclass
+class RelayMetrics:
+    tallied: int = 0
+    groups: int = 0
+    # Fees paid, in microAlgos, including the inner calls' fees
+    fees: int = 0
+    # Votes dropped before sending, and votes in calls that failed, by reason
+    rejected: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    failed: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+
+class VoteRelayer:
+    def __init__(
+        self,
+        client: ProposalContractClient,
+        sender: str,
+        *,
+        votes_per_call: int = _VOTES_PER_CALL,
+        max_group_size: int = _MAX_GROUP_SIZE,
+    ) -> None:
+        self.client = client
+        self.sender = sender
+        self.votes_per_call = votes_per_call
+        self.max_group_size = max_group_size
+        self.metrics = RelayMetrics()
+        # (proposal, milestone, proof time) -> voter -> their vote; the first valid vote from a voter wins
+        self._pending: dict[tuple[int, int, int], dict[str, SignedVote]] = collections.defaultdict(dict)
+
+    def __len__(self) -> int:
+        return sum(len(votes) for votes in self._pending.values())
+
+    def add(self, vote: SignedVote) -> bool:
+        """Queues a vote, unless its signature is bad or the voter already has one queued for the milestone."""
+        if not vote.verify(self.client.app_id):
+            self.metrics.rejected["invalid signature"] += 1
+            return False
+        votes = self._pending[(vote.proposal_id, vote.milestone_index, vote.proof_submitted_time)]
+        if vote.voter in votes:
+            self.metrics.rejected["duplicate"] += 1
+            return False
+        votes[vote.voter] = vote
+        return True
+
+    def flush(self) -> None:
+        """Sends every queued vote the contract would accept, proposal by proposal."""
+        pending, self._pending = self._pending, collections.defaultdict(dict)
+        for (proposal_id, milestone_index, proof_submitted_time), votes in pending.items():
+            eligible, earlier_voters, proposal_size, tally = self._eligible(
+                proposal_id, milestone_index, proof_submitted_time, list(votes.values())
+            )
+            for group in self.pack(proposal_id, eligible, earlier_voters, proposal_size, tally):
+                self._send(milestone_index, group)
+
+    def _eligible(
+        self, proposal_id: int, milestone_index: int, proof_submitted_time: int, votes: list[SignedVote]
+    ) -> tuple[list[SignedVote], int, int, VoteTally | None]:
+        """
+        The votes the contract would tally now, the number of earlier voters, the proposal
+        box size, and the milestone's tally if voting on it can close early.
+        """
+        rejected = self.metrics.rejected
+        boxes = self.client.state.box
+        proposal = boxes.proposals.get_value(proposal_id)
+        if proposal is None:
+            rejected["proposal doesn't exist"] += len(votes)
+            return [], 0, 0, None
+        if milestone_index != proposal.current_milestone or milestone_index >= len(proposal.milestones):
+            rejected["not the current milestone"] += len(votes)
+            return [], 0, 0, None
+        milestone = dict(zip(MILESTONE_FIELDS, proposal.milestones[milestone_index], strict=True))
+        if not milestone["proof_link"]:
+            rejected["proof not submitted"] += len(votes)
+            return [], 0, 0, None
+        if proof_submitted_time != milestone["proof_submitted_time"]:
+            rejected["signed for an earlier proof"] += len(votes)
+            return [], 0, 0, None
+
+        voted = set(boxes.milestone_votes.get_value(proposal_id) or [])
+        eligible = []
+        weights = {}
+        for vote in votes:
+            if vote.voter in voted:
+                rejected["already voted"] += 1
+            elif vote.voter == proposal.created_by:
+                rejected["creator"] += 1
+            elif (donated := boxes.donations.get_value(DonationBoxKey(proposal_id, vote.voter)) or 0) < 1_000_000:
+                rejected["donated less than 1 Algo"] += 1
+            else:
+                eligible.append(vote)
+                weights[vote.voter] = vote_weight(donated)
+        # Proposals created before the eligible weight was tracked never close early
+        eligible_weight = boxes.eligible_weight.get_value(proposal_id)
+        tally = None
+        if eligible_weight is not None:
+            tally = VoteTally(milestone["votes_for"], milestone["votes_against"], eligible_weight, weights)
+            if eligible and tally.decided:
+                rejected["voting closed early"] += len(eligible)
+                return [], 0, 0, None
+        box = self.client.algorand.client.algod.application_box_by_name(
+            self.client.app_id, proposal_box_name(proposal_id)
+        )
+        return eligible, len(voted), len(base64.b64decode(box["value"])), tally  # type: ignore[call-overload]
+
+    def pack(
+        self,
+        proposal_id: int,
+        votes: list[SignedVote],
+        earlier_voters: int,
+        proposal_size: int,
+        tally: VoteTally | None = None,
+    ) -> typing.Iterator[_Group]:
+        """
+        Splits votes (sorted by voter, as the contract requires within a call) into
+        calls and the calls into groups within the limits on group size, inner
+        transactions and box references. Each call checks its votes against every
+        voter before it, so later calls fit fewer votes in the same budget.
+
+        With the milestone's `tally`, packing stops at the call whose votes decide the
+        outcome: the contract closes voting there and would refuse every later call,
+        failing the group they were sent in.
+        """
+        remaining = sorted(votes, key=lambda vote: encoding.decode_address(vote.voter))
+        group = _Group(proposal_id, (), earlier_voters, proposal_size)
+        while remaining:
+            size = min(self.votes_per_call, len(remaining))
+            if group.calls and not group.with_call(remaining[:size]).fits(self.max_group_size):
+                yield group
+                group = group.followed_by()
+                continue
+            while size and not group.with_call(remaining[:size]).fits(self.max_group_size):
+                size //= 2
+            if not size:
+                self.metrics.rejected["too many earlier voters"] += len(remaining)
+                break
+            group = group.with_call(remaining[:size])
+            if tally is not None:
+                tally = tally.after(remaining[:size])
+            remaining = remaining[size:]
+            if remaining and tally is not None and tally.decided:
+                self.metrics.rejected["voting closed early"] += len(remaining)
+                break
+        if group.calls:
+            yield group
+
+    def _send(self, milestone_index: int, group: _Group) -> None:
+        try:
+            self._send_group(milestone_index, group)
+        except Exception as ex:
+            if len(group.calls) == 1:
+                self._record_failure(group, ex)
+                return
+            # One call failing rejects its whole group, so send the rest on their own
+            earlier_voters = group.earlier_voters
+            for call in group.calls:
+                installed_metrics().increment("retries_total", method="vote_milestone_batch", reason="group_failed")
+                single = dataclasses.replace(group, calls=(call,), earlier_voters=earlier_voters)
+                earlier_voters += len(call)
+                try:
+                    self._send_group(milestone_index, single)
+                except Exception as single_ex:
+                    self._record_failure(single, single_ex)
+
+    def _record_failure(self, group: _Group, ex: Exception) -> None:
+        cause = failure_cause(str(ex), self.client.app_spec)
+        logger.warning(f"{len(group.votes)} votes on proposal {group.proposal_id} failed: {cause}")
+        self.metrics.failed[cause] += len(group.votes)
+
+    def _send_group(self, milestone_index: int, group: _Group) -> None:
+        references = group.box_references
+        chunks = [references[start : start + MAX_BOX_REFERENCES] for start in range(0, len(references), MAX_BOX_REFERENCES)]
+        chunks += [[]] * (len(group.calls) + group.fillers - len(chunks))
+        composer = self.client.new_group()
+        for call, opups, chunk in zip(group.calls, group.opups, chunks, strict=False):
+            composer.vote_milestone_batch(
+                args=(group.proposal_id, milestone_index, [(vote.voter, vote.vote, vote.signature) for vote in call]),
+                params=algokit_utils.CommonAppCallParams(
+                    sender=self.sender,
+                    # Pays for the inner calls, which take their fees from the group's surplus
+                    extra_fee=algokit_utils.AlgoAmount(micro_algo=opups * _MIN_FEE),
+                    box_references=chunk,
+                ),
+            )
+        for chunk in chunks[len(group.calls) :]:
+            # Readonly and only touching boxes the group already references, so it only adds references
+            composer.get_current_milestone(
+                args=(group.proposal_id, group.votes[0].voter),
+                params=algokit_utils.CommonAppCallParams(sender=self.sender, box_references=chunk),
+            )
+        composer.send()
+        self.metrics.tallied += len(group.votes)
+        self.metrics.groups += 1
+        self.metrics.fees += (len(group.calls) + group.fillers + sum(group.opups)) * _MIN_FEE
+        logger.info(
+            f"Tallied {len(group.votes)} votes on proposal {group.proposal_id} in {len(group.calls)} calls "
+            f"and {group.fillers} reference-only calls"
+        )
+
+
+def _read_votes(paths: list[str]) -> typing.Iterator[SignedVote]:
+    for path in paths:
+        with sys.stdin if path == "-" else open(path) as votes:
+            for line in votes:
+                if line.strip():
+                    yield SignedVote.from_json(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    sign = commands.add_parser("sign", help="print a signed vote as a JSON line")
+    sign.add_argument("--app-id", type=int, required=True)
+    sign.add_argument("--proposal-id", type=int, required=True)
+    sign.add_argument("--milestone", type=int, help="milestone index (default: the proposal's current one)")
+    sign.add_argument("--vote", choices=["for", "against"], required=True)
+    sign.add_argument("--account", required=True, help="environment account name of the donor")
+    relay = commands.add_parser("relay", help="send signed votes from JSON line files")
+    relay.add_argument("files", nargs="+", help="signed votes, one per line ('-' for stdin)")
+    relay.add_argument("--app-id", type=int, required=True)
+    relay.add_argument("--sender", default="RELAYER", help="environment account name the relayer pays fees from")
+    relay.add_argument("--votes-per-call", type=int, default=_VOTES_PER_CALL)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    client = algorand.client.get_typed_app_client_by_id(ProposalContractClient, app_id=args.app_id)
+    if args.command == "sign":
+        account = algorand.account.from_environment(args.account)
+        proposal = client.state.box.proposals.get_value(args.proposal_id)
+        if proposal is None:
+            parser.error(f"Proposal {args.proposal_id} doesn't exist")
+        milestone = proposal.current_milestone if args.milestone is None else args.milestone
+        if milestone >= len(proposal.milestones):
+            parser.error(f"Proposal {args.proposal_id} has no milestone {milestone}")
+        proof_submitted_time = dict(zip(MILESTONE_FIELDS, proposal.milestones[milestone], strict=True))["proof_submitted_time"]
+        if not proof_submitted_time:
+            parser.error(f"Milestone {milestone} has no proof submitted to vote on")
+        vote = sign_vote(account.private_key, args.app_id, args.proposal_id, milestone, proof_submitted_time, args.vote == "for")
+        print(vote.to_json())
+        return
+
+    sender = algorand.account.from_environment(args.sender)
+    relayer = VoteRelayer(client, sender.address, votes_per_call=args.votes_per_call)
+    for vote in _read_votes(args.files):
+        relayer.add(vote)
+    logger.info(f"Relaying {len(relayer)} votes")
+    relayer.flush()
+    metrics = relayer.metrics
+    logger.info(
+        f"Tallied {metrics.tallied} votes in {metrics.groups} groups for {metrics.fees} microAlgos; "
+        f"rejected {dict(metrics.rejected)}, failed {dict(metrics.failed)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""
+Deterministic replay of recorded ProposalContract calls against contract.py.
+
+`record` exports an app's history from the indexer into a directory: every ABI call
+in confirmation order with its decoded arguments and the timestamp it ran at
+(`calls.ndjson`), and the app's boxes and global state at the last recorded round
+(`boxes.ndjson`, in the raw dump format decode_box.py reads, and `global.json`).
+Clients can capture calls to the same line format themselves.
+
+`replay` re-executes the calls in order against the current contract.py under
+algorand-python-testing, with each call's block timestamp and round patched in,
+then compares the resulting boxes and global state with the recorded ones. Per-method
+opcode costs on the recorded workload are compared between a baseline build and the
+current artifacts (rebuild after editing contract.py), using the static worst case for
+each call's sizes.
+
+    python -m smart_contracts.ff.replay record --app-id 1002 --out ./ff-history
+    python -m smart_contracts.ff.replay replay ./ff-history --baseline-ref HEAD~1
+"""
+
+import argparse
+import asyncio
+import base64
+import collections
+import dataclasses
+import functools
+import inspect
+import json
+import logging
+import subprocess
+import tempfile
+import time
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algopy import arc4, gtxn
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk import abi
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts._helpers.teal import TealProgram
+from smart_contracts.ff.async_client import AsyncAlgod, fetch_boxes
+from smart_contracts.ff.boxes import (
+    MILESTONE_FIELDS,
+    classify_box_name,
+    decode_box,
+    milestone_votes_box_name,
+    proposal_box_name,
+)
+from smart_contracts.ff.contract import ProposalContract
+from smart_contracts.ff.cost_analysis import ARTIFACTS, CostAnalyser, Sizes
+from smart_contracts.ff.emulator import patch_static_struct_sizes
+
+logger = logging.getLogger(__name__)
+
+CALLS_FILE_NAME = "calls.ndjson"
+BOXES_FILE_NAME = "boxes.ndjson"
+GLOBAL_FILE_NAME = "global.json"
+
+_APPROVAL = "ProposalContract.approval.teal"
+_APP_SPEC = "ProposalContract.arc56.json"
+
+# Transactions per indexer page
+_PAGE_SIZE = 1000
+
+# Differing boxes listed per map in the report
+_DIFF_EXAMPLES = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class RecordedCall:
+    round: int
+    # Timestamp of the block before `round`, which is what the call saw as the latest timestamp
+    timestamp: int
+    tx_id: str
+    sender: str
+    method: str
+    # ABI-decoded arguments; payment arguments as {"sender", "amount"}
+    args: list[typing.Any]
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self), separators=(",", ":"))
+
+    @staticmethod
+    def from_json(line: str) -> "RecordedCall":
+        return RecordedCall(**json.loads(line))
+
+
+def read_calls(directory: Path) -> typing.Iterator[RecordedCall]:
+    with open(directory / CALLS_FILE_NAME) as calls:
+        for line in calls:
+            if line.strip():
+                yield RecordedCall.from_json(line)
+
+
+# ------------------------------ Recording ------------------------------ #
+
+
+def _indexer_pages(search: typing.Callable[..., dict], key: str, **params: typing.Any) -> typing.Iterator[dict]:
+    next_page = None
+    while True:
+        page = search(limit=_PAGE_SIZE, next_page=next_page, **params)
+        yield from page.get(key, [])
+        next_page = page.get("next-token")
+        if not next_page or not page.get(key):
+            return
+
+
+def _json_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, bytes | bytearray):
+        return list(value)
+    if isinstance(value, list | tuple):
+        return [_json_value(item) for item in value]
+    return value
+
+
+def record(algorand: algokit_utils.AlgorandClient, app_id: int, out: Path, *, min_round: int = 0) -> int:
+    """Writes the app's calls from `min_round` on and its current state to `out`. Returns the number of calls."""
+    indexer = algorand.client.indexer
+    app_spec = algorand.client.get_app_client_by_id(
+        algokit_utils.Arc56Contract.from_json((ARTIFACTS / _APP_SPEC).read_text()), app_id
+    ).app_spec
+    methods = {method.to_abi_method().get_selector(): method.to_abi_method() for method in app_spec.methods}
+    max_round = algorand.client.algod.status()["last-round"]  # type: ignore[call-overload]
+    rounds = {"min_round": min_round, "max_round": max_round}
+
+    # Payments to the app, per group, for the calls' pay arguments
+    payments: dict[str, list[dict]] = collections.defaultdict(list)
+    app_address = algokit_utils.get_application_address(app_id)
+    for txn in _indexer_pages(
+        indexer.search_transactions, "transactions", address=app_address, address_role="receiver", txn_type="pay", **rounds
+    ):
+        if txn.get("group"):
+            payments[txn["group"]].append(txn)
+
+    @functools.cache
+    def latest_timestamp(round_num: int) -> int:
+        return typing.cast(int, indexer.block_info(round_num - 1)["timestamp"])
+
+    out.mkdir(parents=True, exist_ok=True)
+    count = 0
+    calls = _indexer_pages(indexer.search_transactions, "transactions", application_id=app_id, txn_type="appl", **rounds)
+    with open(out / CALLS_FILE_NAME, "w") as calls_file:
+        for txn in sorted(calls, key=lambda t: (t["confirmed-round"], t["intra-round-offset"])):
+            app_args = [base64.b64decode(arg) for arg in txn["application-transaction"].get("application-args", [])]
+            method = methods.get(app_args[0]) if app_args else None
+            if method is None:
+                continue
+            group_payments = sorted(
+                (p for p in payments.get(txn.get("group", ""), []) if p["intra-round-offset"] < txn["intra-round-offset"]),
+                key=lambda p: p["intra-round-offset"],
+            )
+            args: list[typing.Any] = []
+            encoded = iter(app_args[1:])
+            txn_args = [arg for arg in method.args if abi.is_abi_transaction_type(arg.type)]
+            # Transaction arguments are the transactions right before the call, in order
+            txn_payments = iter(group_payments[len(group_payments) - len(txn_args) :])
+            for arg in method.args:
+                if abi.is_abi_transaction_type(arg.type):
+                    payment = next(txn_payments)
+                    args.append({"sender": payment["sender"], "amount": payment["payment-transaction"]["amount"]})
+                else:
+                    args.append(_json_value(typing.cast(abi.ABIType, arg.type).decode(next(encoded))))
+            recorded = RecordedCall(
+                round=txn["confirmed-round"],
+                timestamp=latest_timestamp(txn["confirmed-round"]),
+                tx_id=txn["id"],
+                sender=txn["sender"],
+                method=method.name,
+                args=args,
+            )
+            calls_file.write(recorded.to_json() + "\n")
+            count += 1
+
+    asyncio.run(_record_state(algorand, app_id, out))
+    logger.info(f"Recorded {count} calls up to round {max_round} to {out}")
+    return count
+
+
+async def _record_state(algorand: algokit_utils.AlgorandClient, app_id: int, out: Path) -> None:
+    algod = AsyncAlgod.from_algorand(algorand)
+    try:
+        names = await algod.application_boxes(app_id)
+        with open(out / BOXES_FILE_NAME, "w") as boxes_file:
+            async for box in fetch_boxes(algod, app_id, names):
+                boxes_file.write(
+                    json.dumps(
+                        {
+                            "name": base64.b64encode(box["name"]).decode(),
+                            "value": base64.b64encode(box["value"]).decode(),
+                            "round": box.get("round"),
+                        }
+                    )
+                    + "\n"
+                )
+    finally:
+        await algod.aclose()
+    app_info = algorand.client.algod.application_info(app_id)
+    global_state = {
+        base64.b64decode(entry["key"]).decode(): (
+            entry["value"]["uint"] if entry["value"]["type"] == 2 else entry["value"]["bytes"]
+        )
+        for entry in app_info["params"].get("global-state", [])  # type: ignore[call-overload]
+    }
+    (out / GLOBAL_FILE_NAME).write_text(json.dumps({"app_id": app_id, "global_state": global_state}, indent=2))
+
+
+# ------------------------------ Replaying ------------------------------ #
+
+
+@dataclasses.dataclass
+class ReplayReport:
+    calls: int = 0
+    seconds: float = 0.0
+    # Method -> cause -> count, for calls that failed on replay (all recorded calls succeeded)
+    failures: dict[str, collections.Counter[str]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(collections.Counter)
+    )
+    # Map -> {"matching", "missing", "extra", "different"} counts, and a few differing names
+    box_diff: dict[str, collections.Counter[str]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(collections.Counter)
+    )
+    box_examples: dict[str, list[bytes]] = dataclasses.field(default_factory=lambda: collections.defaultdict(list))
+    # Global state key -> (recorded, replayed), for keys that differ
+    global_diff: dict[str, tuple[typing.Any, typing.Any]] = dataclasses.field(default_factory=dict)
+    # Method -> (calls, baseline opcodes, candidate opcodes), summed over the calls
+    costs: dict[str, list[int]] = dataclasses.field(default_factory=lambda: collections.defaultdict(lambda: [0, 0, 0]))
+
+    @property
+    def calls_per_second(self) -> float:
+        return self.calls / self.seconds if self.seconds else 0.0
+
+
+class Replayer:
+    """
+    Replays calls into a fresh ProposalContract in an algorand-python-testing context,
+    created under the recorded app ID so signatures over it (signed votes) still verify.
+    """
+
+    def __init__(
+        self,
+        ctx: AlgopyTestContext,
+        app_id: int,
+        *,
+        baseline: CostAnalyser | None = None,
+        candidate: CostAnalyser | None = None,
+    ) -> None:
+        patch_static_struct_sizes()
+        self.ctx = ctx
+        # The emulator has no way to pick an app's ID, so start its counter at the one wanted
+        ctx.ledger._app_id = iter(range(app_id, 2**64))
+        self.contract = ProposalContract()
+        self.app = ctx.ledger.get_app(self.contract)
+        self.baseline = baseline
+        self.candidate = candidate
+        self.app_spec = algokit_utils.Arc56Contract.from_json((ARTIFACTS / _APP_SPEC).read_text())
+        self.report = ReplayReport()
+        # Why the last call that failed did
+        self.last_failure: str | None = None
+        # Parameters of the ABI methods contract.py still has, with their types
+        self._signatures = {
+            method.name: list(inspect.signature(getattr(ProposalContract, method.name)).parameters.values())[1:]
+            for method in self.app_spec.methods
+            if hasattr(ProposalContract, method.name)
+        }
+        self._hints = {name: typing.get_type_hints(getattr(ProposalContract, name)) for name in self._signatures}
+
+    @property
+    def boxes(self) -> dict[bytes, bytes]:
+        # The ledger has no public listing of an app's boxes
+        return typing.cast(dict[bytes, bytes], self.ctx.ledger._get_app_data(self.app.id.value).boxes)
+
+    @property
+    def global_state(self) -> dict[bytes, typing.Any]:
+        return typing.cast(dict[bytes, typing.Any], self.ctx.ledger._get_app_data(self.app.id.value).global_state)
+
+    def _argument(self, hint: type, value: typing.Any) -> typing.Any:
+        if hint is gtxn.PaymentTransaction:
+            payer = self.ctx.ledger.get_account(value["sender"])
+            return self.ctx.any.txn.payment(sender=payer, receiver=self.app.address, amount=value["amount"])
+        abi_type = abi.ABIType.from_string(hint._type_info.arc4_name)  # type: ignore[attr-defined]
+        return hint.from_bytes(abi_type.encode(value))  # type: ignore[attr-defined]
+
+    def replay(self, call: RecordedCall) -> bool:
+        """Runs one call; returns whether it succeeded."""
+        parameters = self._signatures.get(call.method)
+        report = self.report
+        report.calls += 1
+        if parameters is None:
+            self.last_failure = "method no longer exists"
+            report.failures[call.method][self.last_failure] += 1
+            return False
+        self.ctx.ledger.patch_global_fields(latest_timestamp=call.timestamp, round=call.round)
+        sender = self.ctx.ledger.get_account(call.sender)
+        hints = self._hints[call.method]
+        try:
+            args = [
+                self._argument(hints[parameter.name], value)
+                for parameter, value in zip(parameters, call.args, strict=True)
+            ]
+            with self.ctx.txn.create_group(active_txn_overrides={"sender": sender}):
+                getattr(self.contract, call.method)(*args)
+        except Exception as ex:
+            # State the call wrote before failing stays written; the emulator has no rollback
+            self.last_failure = str(ex).splitlines()[0][:120] or type(ex).__name__
+            report.failures[call.method][self.last_failure] += 1
+            return False
+        if self.baseline or self.candidate:
+            self._record_cost(call)
+        return True
+
+    def _record_cost(self, call: RecordedCall) -> None:
+        sizes = self._sizes(call)
+        costs = self.report.costs[call.method]
+        costs[0] += 1
+        costs[1] += _opcodes(self.baseline, call.method, sizes)
+        costs[2] += _opcodes(self.candidate, call.method, sizes)
+
+    def _sizes(self, call: RecordedCall) -> Sizes:
+        """Sizes the call worked on, from the proposal it touched (after the call) and its arguments."""
+        if call.method in ("create_proposal", "create_proposals"):
+            proposal_id = int.from_bytes(self.global_state[b"noOfProposals"], "big") - 1
+        elif call.method in ("fund_future_self", "claim_future_self", "list_proposals") or not call.args:
+            return Sizes()
+        else:
+            proposal_id = call.args[0]
+        raw = self.boxes.get(proposal_box_name(proposal_id))
+        if raw is None:
+            return Sizes()
+        proposal = typing.cast(typing.Any, decode_box(self.app_spec, proposal_box_name(proposal_id), raw)).value
+        milestones = proposal["milestones"]
+        voters = self.boxes.get(milestone_votes_box_name(proposal_id), b"\x00\x00")
+        return Sizes(
+            milestones=len(milestones),
+            voters=(len(voters) - 2) // 32,
+            proof_link=max((len(m["proof_link"].encode()) for m in milestones), default=0),
+            milestone_name=max((len(m["name"].encode()) for m in milestones), default=0),
+            proposal_text=sum(len(proposal[field].encode()) for field in ("name", "title", "description", "category")),
+            batch_votes=len(call.args[2]) if call.method == "vote_milestone_batch" else 0,
+            batch_proposals=len(call.args[0]) if call.method == "create_proposals" else 0,
+        )
+
+    def compare(self, directory: Path) -> None:
+        """Diffs the replayed boxes and global state against those recorded in `directory`."""
+        report = self.report
+        recorded: dict[bytes, bytes] = {}
+        with open(directory / BOXES_FILE_NAME) as boxes_file:
+            for line in boxes_file:
+                if line.strip():
+                    box = json.loads(line)
+                    recorded[base64.b64decode(box["name"])] = base64.b64decode(box["value"])
+        replayed = self.boxes
+        for name in recorded.keys() | replayed.keys():
+            classified = classify_box_name(name)
+            map_name = classified[0] if classified else "(unknown)"
+            if name not in replayed:
+                outcome = "missing"
+            elif name not in recorded:
+                outcome = "extra"
+            elif recorded[name] != replayed[name]:
+                outcome = "different"
+            else:
+                outcome = "matching"
+            report.box_diff[map_name][outcome] += 1
+            if outcome != "matching" and len(report.box_examples[map_name]) < _DIFF_EXAMPLES:
+                report.box_examples[map_name].append(name)
+
+        saved = json.loads((directory / GLOBAL_FILE_NAME).read_text())["global_state"]
+        for key, value in saved.items():
+            replayed_value = self.global_state.get(key.encode())
+            if isinstance(replayed_value, bytes):
+                replayed_value = base64.b64encode(replayed_value).decode()
+            if replayed_value != value:
+                report.global_diff[key] = (value, replayed_value)
+
+
+def _opcodes(analyser: CostAnalyser | None, method: str, sizes: Sizes) -> int:
+    if analyser is None or method not in analyser.entries:
+        return 0
+    return _cached_opcodes(analyser, method, sizes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_opcodes(analyser: CostAnalyser, method: str, sizes: Sizes) -> int:
+    return analyser.analyse(method, sizes).opcodes
+
+
+def load_analyser(directory: Path) -> CostAnalyser:
+    return CostAnalyser(
+        TealProgram.from_file(directory / _APPROVAL),
+        algokit_utils.Arc56Contract.from_json((directory / _APP_SPEC).read_text()),
+    )
+
+
+def baseline_from_git(ref: str, into: Path) -> CostAnalyser:
+    """The cost analyser for the artifacts committed at `ref`."""
+    for file_name in (_APPROVAL, _APP_SPEC):
+        content = subprocess.run(
+            ["git", "show", f"{ref}:./{file_name}"], cwd=ARTIFACTS, check=True, capture_output=True
+        ).stdout
+        (into / file_name).write_bytes(content)
+    return load_analyser(into)
+
+
+def replay_directory(
+    directory: Path,
+    *,
+    baseline: CostAnalyser | None = None,
+    candidate: CostAnalyser | None = None,
+    limit: int | None = None,
+) -> ReplayReport:
+    app_id = json.loads((directory / GLOBAL_FILE_NAME).read_text())["app_id"]
+    with algopy_testing_context() as ctx:
+        replayer = Replayer(ctx, app_id, baseline=baseline, candidate=candidate)
+        started = time.perf_counter()
+        for index, call in enumerate(read_calls(directory)):
+            if limit is not None and index >= limit:
+                break
+            replayer.replay(call)
+        replayer.report.seconds = time.perf_counter() - started
+        if limit is None:
+            replayer.compare(directory)
+        return replayer.report
+
+
+def print_report(report: ReplayReport, console: Console | None = None) -> None:
+    console = console or Console()
+    console.print(
+        f"Replayed {report.calls} calls in {report.seconds:.2f}s ({report.calls_per_second:.0f}/s), "
+        f"{sum(sum(causes.values()) for causes in report.failures.values())} failed"
+    )
+    if report.failures:
+        failures = Table(title="Calls that failed on replay")
+        for column in ("method", "cause", "calls"):
+            failures.add_column(column, justify="right" if column == "calls" else "left")
+        for method, causes in sorted(report.failures.items()):
+            for cause, count in causes.most_common():
+                failures.add_row(method, cause, str(count))
+        console.print(failures)
+
+    if report.box_diff:
+        boxes = Table(title="Box state against the recording")
+        for column in ("map", "matching", "different", "missing", "extra", "examples"):
+            boxes.add_column(column, justify="left" if column in ("map", "examples") else "right")
+        for map_name, counts in sorted(report.box_diff.items()):
+            differs = counts["different"] or counts["missing"] or counts["extra"]
+            boxes.add_row(
+                map_name,
+                *(str(counts[outcome]) for outcome in ("matching", "different", "missing", "extra")),
+                ", ".join(base64.b64encode(name).decode() for name in report.box_examples[map_name]),
+                style="red" if differs else None,
+            )
+        console.print(boxes)
+    for key, (recorded, replayed) in report.global_diff.items():
+        console.print(f"[red]Global {key}: recorded {recorded}, replayed {replayed}[/red]")
+
+    if report.costs:
+        costs = Table(title="Worst-case opcodes per call on the recorded workload")
+        for column in ("method", "calls", "baseline", "candidate", "change"):
+            costs.add_column(column, justify="left" if column == "method" else "right")
+        for method, (calls, baseline, candidate) in sorted(report.costs.items()):
+            change = f"{(candidate - baseline) / baseline:+.1%}" if baseline else "new"
+            costs.add_row(method, str(calls), f"{baseline / calls:.0f}", f"{candidate / calls:.0f}", change)
+        console.print(costs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(), formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="export an app's calls and state through the indexer")
+    record_parser.add_argument("--app-id", type=int, required=True)
+    record_parser.add_argument("--out", type=Path, required=True)
+    record_parser.add_argument("--min-round", type=int, default=0)
+    replay_parser = commands.add_parser("replay", help="replay a recording against contract.py")
+    replay_parser.add_argument("directory", type=Path)
+    baseline = replay_parser.add_mutually_exclusive_group()
+    baseline.add_argument("--baseline-ref", default="HEAD", help="git ref whose committed artifacts are the baseline")
+    baseline.add_argument("--baseline", type=Path, help="artifacts directory to use as the baseline instead")
+    replay_parser.add_argument("--no-costs", action="store_true", help="skip the cost comparison")
+    replay_parser.add_argument("--limit", type=int, help="replay only the first calls (skips the state comparison)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    if args.command == "record":
+        record(algokit_utils.AlgorandClient.from_environment(), args.app_id, args.out, min_round=args.min_round)
+        return
+
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        baseline_analyser = candidate_analyser = None
+        if not args.no_costs:
+            candidate_analyser = load_analyser(ARTIFACTS)
+            baseline_analyser = (
+                load_analyser(args.baseline) if args.baseline else baseline_from_git(args.baseline_ref, Path(baseline_dir))
+            )
+        report = replay_directory(
+            args.directory, baseline=baseline_analyser, candidate=candidate_analyser, limit=args.limit
+        )
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
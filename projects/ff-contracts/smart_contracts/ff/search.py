@@ -0,0 +1,343 @@
+"""
+Local full-text and faceted search over ProposalContract proposals.
+
+Keeps an inverted index over each proposal's title and description, plus facets on
+category, funding progress and milestone state, in memory and saved as JSON between
+runs. Each refresh only refetches the proposals created, donated to or otherwise
+changed since the round the index was last refreshed at.
+
+    python -m smart_contracts.ff.search --app-id 1002 --index ff-search.json "solar school"
+    python -m smart_contracts.ff.search --app-id 1002 --index ff-search.json --category Education --funding funded
+    python -m smart_contracts.ff.search --app-id 1002 --index ff-search.json --watch
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import dataclasses
+import json
+import logging
+import math
+import re
+import time
+import typing
+import unicodedata
+from pathlib import Path
+
+import algokit_utils
+from rich.console import Console
+from rich.table import Table
+
+from smart_contracts.artifacts.ff.proposal_contract_client import Proposal, ProposalContractClient
+from smart_contracts.ff.boxes import MILESTONE_FIELDS, changed_box_names, classify_box_name, decode_box_key
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Title terms count this many times as much as description terms when ranking
+_TITLE_WEIGHT = 3
+
+# Upper bounds (percent raised, exclusive) of the funding progress facet's buckets
+_FUNDING_BUCKETS = ((25, "0-25%"), (50, "25-50%"), (75, "50-75%"), (100, "75-100%"))
+_FUNDED = "funded"
+
+FACETS = ("category", "funding", "milestone_state")
+
+_TOKEN = re.compile(r"\w+")
+
+# Proposals fetched in parallel while refreshing
+_FETCH_CONCURRENCY = 16
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens with accents stripped, so "Café" matches "cafe"."""
+    normalized = unicodedata.normalize("NFKD", text.casefold())
+    return _TOKEN.findall("".join(char for char in normalized if not unicodedata.combining(char)))
+
+
+def funding_bucket(amount_raised: int, amount_required: int) -> str:
+    if amount_raised >= amount_required:
+        return _FUNDED
+    percent = 100 * amount_raised // amount_required if amount_required else 0
+    return next(label for bound, label in _FUNDING_BUCKETS if percent < bound)
+
+
+def milestone_state(proposal: Proposal) -> str:
+    """Where a proposal is in its lifecycle; doesn't depend on the current time, so it only changes with app calls."""
+    milestones = [dict(zip(MILESTONE_FIELDS, m, strict=True)) for m in proposal.milestones]
+    if proposal.amount_raised < proposal.amount_required:
+        return "fundraising"
+    if proposal.current_milestone >= len(milestones):
+        return "completed"
+    if milestones[proposal.current_milestone]["proof_link"]:
+        return "proof_submitted"
+    return "awaiting_proof"
+
+
+@dataclasses.dataclass(frozen=True)
+class ProposalDocument:
+    proposal_id: int
+    title: str
+    description: str
+    category: str
+    amount_required: int
+    amount_raised: int
+    funding: str
+    milestone_state: str
+
+    @staticmethod
+    def from_proposal(proposal_id: int, proposal: Proposal) -> "ProposalDocument":
+        return ProposalDocument(
+            proposal_id=proposal_id,
+            title=proposal.title,
+            description=proposal.description,
+            category=proposal.category,
+            amount_required=proposal.amount_required,
+            amount_raised=proposal.amount_raised,
+            funding=funding_bucket(proposal.amount_raised, proposal.amount_required),
+            milestone_state=milestone_state(proposal),
+        )
+
+    def facet_values(self) -> dict[str, str]:
+        # Categories are free text, so they are matched case-insensitively
+        return {"category": self.category.casefold(), "funding": self.funding, "milestone_state": self.milestone_state}
+
+    def term_counts(self) -> collections.Counter[str]:
+        counts = collections.Counter(tokenize(self.description))
+        for term in tokenize(self.title):
+            counts[term] += _TITLE_WEIGHT
+        return counts
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchResult:
+    # (proposal ID, score), best match first
+    hits: list[tuple[int, float]]
+    total: int
+    # Facet -> value -> number of matching proposals with it
+    facets: dict[str, dict[str, int]]
+
+
+class SearchIndex:
+    """
+    Inverted index of proposal terms plus facet postings. Updating a proposal
+    replaces its postings, so the index can be fed every changed proposal as it
+    is seen.
+    """
+
+    def __init__(self) -> None:
+        self.documents: dict[int, ProposalDocument] = {}
+        # Round the index reflects and the proposal count at that round, for incremental refreshes
+        self.last_round = 0
+        self.no_of_proposals = 0
+        self._postings: dict[str, dict[int, int]] = collections.defaultdict(dict)
+        self._facets: dict[str, dict[str, set[int]]] = {facet: collections.defaultdict(set) for facet in FACETS}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def upsert(self, document: ProposalDocument) -> None:
+        self.remove(document.proposal_id)
+        self.documents[document.proposal_id] = document
+        for term, count in document.term_counts().items():
+            self._postings[term][document.proposal_id] = count
+        for facet, value in document.facet_values().items():
+            self._facets[facet][value].add(document.proposal_id)
+
+    def remove(self, proposal_id: int) -> None:
+        document = self.documents.pop(proposal_id, None)
+        if document is None:
+            return
+        for term in document.term_counts():
+            postings = self._postings[term]
+            postings.pop(proposal_id, None)
+            if not postings:
+                del self._postings[term]
+        for facet, value in document.facet_values().items():
+            ids = self._facets[facet][value]
+            ids.discard(proposal_id)
+            if not ids:
+                del self._facets[facet][value]
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        category: str | None = None,
+        funding: str | None = None,
+        milestone_state: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> SearchResult:
+        """
+        Proposals containing every query term (prefix matches for the last one, so
+        results can follow typing), filtered to the given facet values and ranked by
+        tf-idf. Facet counts cover every match, not just the returned page.
+        """
+        terms = tokenize(query)
+        scores: dict[int, float] = {}
+        if terms:
+            matches: set[int] | None = None
+            for position, term in enumerate(terms):
+                expansions = [term]
+                if position == len(terms) - 1:
+                    expansions = [t for t in self._postings if t.startswith(term)]
+                term_matches: set[int] = set()
+                for expansion in expansions:
+                    postings = self._postings.get(expansion, {})
+                    idf = math.log(1 + len(self.documents) / len(postings)) if postings else 0.0
+                    for proposal_id, count in postings.items():
+                        scores[proposal_id] = scores.get(proposal_id, 0.0) + (1 + math.log(count)) * idf
+                    term_matches.update(postings)
+                matches = term_matches if matches is None else matches & term_matches
+            candidates = matches or set()
+        else:
+            candidates = set(self.documents)
+
+        for facet, value in (("category", category), ("funding", funding), ("milestone_state", milestone_state)):
+            if value is not None:
+                candidates &= self._facets[facet].get(value.casefold() if facet == "category" else value, set())
+
+        ranked = sorted(candidates, key=lambda proposal_id: (-scores.get(proposal_id, 0.0), -proposal_id))
+        facet_counts = {
+            facet: {
+                value: count
+                for value, ids in sorted(values.items())
+                if (count := len(ids & candidates))
+            }
+            for facet, values in self._facets.items()
+        }
+        return SearchResult(
+            hits=[(proposal_id, scores.get(proposal_id, 0.0)) for proposal_id in ranked[offset : offset + limit]],
+            total=len(ranked),
+            facets=facet_counts,
+        )
+
+    def save(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(
+                {
+                    "version": INDEX_VERSION,
+                    "last_round": self.last_round,
+                    "no_of_proposals": self.no_of_proposals,
+                    "documents": [dataclasses.asdict(document) for document in self.documents.values()],
+                }
+            )
+        )
+
+    @staticmethod
+    def load(path: Path) -> "SearchIndex":
+        """The index saved at `path`, or an empty one if there is none (or it's from another version)."""
+        index = SearchIndex()
+        if not path.exists():
+            return index
+        saved = json.loads(path.read_text())
+        if saved.get("version") != INDEX_VERSION:
+            logger.info(f"Rebuilding {path}, which was saved by a different index version")
+            return index
+        index.last_round = saved["last_round"]
+        index.no_of_proposals = saved["no_of_proposals"]
+        for document in saved["documents"]:
+            index.upsert(ProposalDocument(**document))
+        return index
+
+
+def refresh_index(index: SearchIndex, client: ProposalContractClient) -> int:
+    """
+    Brings `index` up to the latest round the indexer has caught up with: every
+    proposal the first time, then only the ones created or written to since
+    `index.last_round`. Returns the number of proposals refetched.
+    """
+    algorand = client.algorand
+    # Writes are found through the indexer, so rounds it hasn't reached yet are left to a later refresh
+    current_round = min(
+        algorand.client.algod.status()["last-round"],  # type: ignore[call-overload]
+        algorand.client.indexer.health()["round"],
+    )
+    no_of_proposals = client.state.global_state.no_of_proposals
+    if index.last_round == 0:
+        proposal_ids = set(range(no_of_proposals))
+    else:
+        proposal_ids = set(range(index.no_of_proposals, no_of_proposals))
+        for name in changed_box_names(algorand, client.app_spec, client.app_id, index.last_round + 1, current_round):
+            classified = classify_box_name(name)
+            if classified and classified[0] in ("proposals", "donations"):
+                key = decode_box_key(*classified)
+                proposal_ids.add(key if isinstance(key, int) else key["proposal_id"])
+
+    proposals = client.state.box.proposals
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_FETCH_CONCURRENCY) as executor:
+        for proposal_id, proposal in zip(proposal_ids, executor.map(proposals.get_value, proposal_ids), strict=True):
+            if proposal is None:
+                index.remove(proposal_id)
+            else:
+                index.upsert(ProposalDocument.from_proposal(proposal_id, proposal))
+    index.last_round = current_round
+    index.no_of_proposals = no_of_proposals
+    return len(proposal_ids)
+
+
+def print_result(index: SearchIndex, result: SearchResult, console: Console | None = None) -> None:
+    console = console or Console()
+    table = Table(title=f"{result.total} of {len(index)} proposals")
+    for column in ("id", "score", "title", "category", "raised", "funding", "milestones"):
+        table.add_column(column, justify="right" if column in ("id", "score", "raised") else "left")
+    for proposal_id, score in result.hits:
+        document = index.documents[proposal_id]
+        table.add_row(
+            str(proposal_id),
+            f"{score:.2f}",
+            document.title,
+            document.category,
+            f"{document.amount_raised}/{document.amount_required}",
+            document.funding,
+            document.milestone_state,
+        )
+    console.print(table)
+    for facet, counts in result.facets.items():
+        console.print(f"{facet}: " + ", ".join(f"{value} ({count})" for value, count in counts.items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("query", nargs="?", default="")
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument("--index", type=Path, required=True, help="index file, created if missing")
+    parser.add_argument("--category")
+    parser.add_argument("--funding", choices=[label for _, label in _FUNDING_BUCKETS] + [_FUNDED])
+    parser.add_argument(
+        "--milestone-state", choices=["fundraising", "awaiting_proof", "proof_submitted", "completed"]
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--watch", action="store_true", help="keep refreshing the index every round, rerunning the query when it changes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    client = algorand.client.get_typed_app_client_by_id(ProposalContractClient, app_id=args.app_id)
+    index = SearchIndex.load(args.index)
+    first = True
+    while True:
+        refreshed = refresh_index(index, client)
+        index.save(args.index)
+        logger.info(f"Refreshed {refreshed} proposals up to round {index.last_round}")
+        # While watching, the results are shown again whenever a refresh changed something
+        if first or refreshed:
+            started = time.perf_counter()
+            result = index.search(
+                args.query,
+                category=args.category,
+                funding=args.funding,
+                milestone_state=args.milestone_state,
+                limit=args.limit,
+            )
+            logger.info(f"Query took {(time.perf_counter() - started) * 1000:.2f}ms")
+            print_result(index, result)
+        if not args.watch:
+            break
+        first = False
+        algorand.client.algod.status_after_block(index.last_round)
+
+if __name__ == "__main__":
+    main()
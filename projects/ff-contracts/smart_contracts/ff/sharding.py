@@ -0,0 +1,227 @@
+"""
+Client for a ProposalContract deployment sharded across several apps.
+
+A `ShardRegistry` app lists the shard apps in order, and shard n holds the global
+proposal and future fund IDs n * SHARD_ID_RANGE up to (n + 1) * SHARD_ID_RANGE - 1,
+stored under the ID minus n * SHARD_ID_RANGE. Calls made through
+`ShardedProposalClient` take and return global IDs and go to the shard holding the ID
+they act on; calls that create proposals or a future fund go to a shard picked from
+the sender's address, so one creator's calls always land on the same shard while
+different creators spread across all of them. Each shard has its own ID counter,
+balance and boxes, so no state is shared between calls on different shards.
+
+Payment arguments are given as the amount to pay, and the payment to the right
+shard's account is built when the call is sent.
+"""
+
+import dataclasses
+import typing
+
+import algokit_utils
+from algosdk import encoding
+
+from smart_contracts.artifacts.ff.proposal_contract_client import Proposal, ProposalContractClient
+from smart_contracts.artifacts.ff_registry.shard_registry_client import ShardRegistryClient
+from smart_contracts.ff.boxes import method_box_references
+from smart_contracts.ff.bulk_create import inner_calls
+from smart_contracts.ff.cost_analysis import MAX_BOX_REFERENCES
+
+# As in ff_registry/contract.py
+SHARD_ID_RANGE = 2**32
+
+# Methods acting on an existing proposal or fund, all taking its ID as the first argument
+_ID_METHODS = (
+    "donate_proposal",
+    "submit_proof",
+    "vote_milestone",
+    "vote_milestone_batch",
+    "claim_milestone",
+    "refund_if_inactive",
+    "get_current_milestone",
+    "claim_future_self",
+)
+
+# Methods that create proposals or a fund, and the global state key holding the (first) ID they will get
+_CREATE_METHODS = {
+    "create_proposal": "no_of_proposals",
+    "create_proposals": "no_of_proposals",
+    "fund_future_self": "no_of_future_funds",
+}
+
+# Position of the payment argument, for the methods that take one
+_PAYMENT_ARGS = {
+    "create_proposal": 6,
+    "create_proposals": 1,
+    "donate_proposal": 1,
+    "fund_future_self": 3,
+}
+
+# Methods whose inner payment has its fee pooled from the outer transaction
+_INNER_PAYMENT_METHODS = ("claim_milestone", "refund_if_inactive", "claim_future_self")
+_MIN_FEE = 1000
+_INNER_PAYMENT_FEE = algokit_utils.AlgoAmount(micro_algo=_MIN_FEE)
+
+
+def to_global_id(shard: int, local_id: int) -> int:
+    return shard * SHARD_ID_RANGE + local_id
+
+
+def split_id(global_id: int) -> tuple[int, int]:
+    """(shard index, ID within the shard) of a global ID."""
+    return divmod(global_id, SHARD_ID_RANGE)
+
+
+def creator_shard(sender: str, no_of_shards: int) -> int:
+    """
+    Shard new proposals and funds from `sender` are created on. Addresses are public
+    keys, so their leading bytes are already evenly spread.
+    """
+    return int.from_bytes(encoding.decode_address(sender)[:8], "big") % no_of_shards
+
+
+@dataclasses.dataclass(frozen=True)
+class ShardedCallResult:
+    shard: int
+    result: algokit_utils.SendAppTransactionResult
+    # Global ID of the proposal or fund the call acted on or created (the first of several for create_proposals)
+    global_id: int
+    count: int = 1
+
+    @property
+    def abi_return(self) -> typing.Any:
+        return self.result.abi_return
+
+    @property
+    def global_ids(self) -> range:
+        """Global IDs of the proposals or fund the call acted on or created."""
+        return range(self.global_id, self.global_id + self.count)
+
+
+class ShardedProposalClient:
+    """
+    Routes ProposalContract calls to the shards listed in a registry:
+
+        sharded = ShardedProposalClient.from_registry(algorand, registry_app_id, default_sender=creator)
+        created = sharded.call("create_proposal", (name, title, description, category, required, milestones, algo(2)))
+        sharded.call("donate_proposal", (created.global_id, algo(5)), sender=donor)
+        batch = sharded.call("create_proposals", ([proposal, proposal], algo(4)))
+        batch.global_ids  # range of the two new proposals' global IDs
+
+    `create_proposals` goes out as one app call, so it creates only as many proposals
+    as their boxes fit in one transaction's references (two in the same category);
+    bulk_create packs larger batches into groups.
+    """
+
+    def __init__(
+        self,
+        registry: ShardRegistryClient,
+        shards: typing.Sequence[ProposalContractClient],
+        *,
+        default_sender: str | None = None,
+    ) -> None:
+        if not shards:
+            raise ValueError(f"Registry {registry.app_id} has no shards")
+        self.registry = registry
+        self.shards = list(shards)
+        self.default_sender = default_sender
+
+    @staticmethod
+    def from_registry(
+        algorand: algokit_utils.AlgorandClient, registry_app_id: int, *, default_sender: str | None = None
+    ) -> "ShardedProposalClient":
+        registry = algorand.client.get_typed_app_client_by_id(
+            ShardRegistryClient, app_id=registry_app_id, default_sender=default_sender
+        )
+        shard_ids = registry.send.get_shards().abi_return or []
+        return ShardedProposalClient(
+            registry,
+            [
+                algorand.client.get_typed_app_client_by_id(
+                    ProposalContractClient, app_id=app_id, default_sender=default_sender
+                )
+                for app_id in shard_ids
+            ],
+            default_sender=default_sender,
+        )
+
+    def shard_for_id(self, global_id: int) -> tuple[ProposalContractClient, int]:
+        """The shard holding a global ID and the ID it has there."""
+        shard, local_id = split_id(global_id)
+        if shard >= len(self.shards):
+            raise ValueError(f"No shard holds ID {global_id}")
+        return self.shards[shard], local_id
+
+    def shard_for_sender(self, sender: str) -> int:
+        return creator_shard(sender, len(self.shards))
+
+    def get_proposal(self, global_id: int) -> Proposal | None:
+        shard, local_id = self.shard_for_id(global_id)
+        return shard.state.box.proposals.get_value(local_id)
+
+    def iter_proposal_ids(self) -> typing.Iterator[int]:
+        """Global IDs of every proposal, shard by shard."""
+        for shard, client in enumerate(self.shards):
+            for local_id in range(client.state.global_state.no_of_proposals):
+                yield to_global_id(shard, local_id)
+
+    def call(
+        self,
+        method: str,
+        args: tuple,
+        *,
+        sender: str | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> ShardedCallResult:
+        """
+        Sends `method` to the shard its global ID argument (or, for creating calls, its
+        sender) routes to. The ID argument is a global ID and the payment argument an
+        `AlgoAmount`; both are replaced with what the shard expects.
+        """
+        params = params or algokit_utils.CommonAppCallParams()
+        sender = sender or params.sender or self.default_sender
+        if sender is None:
+            raise ValueError(f"No sender for {method}")
+
+        args = list(args)
+        next_id = None
+        count = len(args[0]) if method == "create_proposals" else 1
+        if method in _CREATE_METHODS:
+            shard = self.shard_for_sender(sender)
+            client = self.shards[shard]
+            # Calls from other clients creating on the same shard first make this wrong, failing on box access
+            next_id = getattr(client.state.global_state, _CREATE_METHODS[method])
+            result_id = to_global_id(shard, next_id)
+        elif method in _ID_METHODS:
+            result_id = args[0]
+            client, args[0] = self.shard_for_id(result_id)
+            shard = split_id(result_id)[0]
+        else:
+            raise ValueError(f"Method {method} can't be routed to a shard")
+
+        if method in _PAYMENT_ARGS:
+            args[_PAYMENT_ARGS[method]] = client.algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    sender=sender, receiver=client.app_address, amount=args[_PAYMENT_ARGS[method]]
+                )
+            )
+
+        extra_fee = params.extra_fee
+        if extra_fee is None and method in _INNER_PAYMENT_METHODS:
+            extra_fee = _INNER_PAYMENT_FEE
+        elif extra_fee is None and method == "create_proposals" and inner_calls(count):
+            # Pays for the inner calls raising the budget, which take their fees from the outer call
+            extra_fee = algokit_utils.AlgoAmount(micro_algo=inner_calls(count) * _MIN_FEE)
+        params = dataclasses.replace(
+            params,
+            sender=sender,
+            box_references=params.box_references
+            or method_box_references(method, tuple(args), sender, next_id=next_id),
+            extra_fee=extra_fee,
+        )
+        if len(params.box_references or ()) > MAX_BOX_REFERENCES:
+            raise ValueError(
+                f"{method} needs {len(params.box_references or ())} box references, more than one call carries; "
+                "send fewer proposals per call or use bulk_create"
+            )
+        result = getattr(client.send, method)(args=tuple(args), params=params)
+        return ShardedCallResult(shard=shard, result=result, global_id=result_id, count=count)
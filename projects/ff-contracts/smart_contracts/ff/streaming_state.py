@@ -0,0 +1,196 @@
+import base64
+import concurrent.futures
+import itertools
+import typing
+
+import algokit_utils
+from algokit_utils.applications.abi import get_abi_decoded_value
+from algosdk import error
+
+from smart_contracts.artifacts.ff.proposal_contract_client import (
+    DonationBoxKey,
+    FutureFund,
+    ListProposalsArgs,
+    Proposal,
+    ProposalContractClient,
+    _BoxState,
+    _init_dataclass,
+    _KeyType,
+    _MapState,
+    _ValueType,
+)
+from smart_contracts.ff.boxes import PROPOSAL_STATUSES
+
+# Box names listed per indexer request
+_PAGE_SIZE = 100
+
+# Box values fetched in parallel; also the most values held in memory at once
+_BATCH_SIZE = 16
+
+# Most IDs list_proposals returns per call
+_LIST_LIMIT = 64
+
+# Generated struct classes by ARC-56 struct name, for decoding keys and values
+_STRUCT_CLASSES: dict[str, type] = {
+    "DonationBoxKey": DonationBoxKey,
+    "FutureFund": FutureFund,
+    "Proposal": Proposal,
+}
+
+
+def iter_box_names(
+    algorand: algokit_utils.AlgorandClient, app_id: int, prefix: bytes = b"", *, page_size: int = _PAGE_SIZE
+) -> typing.Iterator[bytes]:
+    """
+    Names of the app's boxes starting with `prefix`, paged through the indexer when
+    one is configured. algod can only list every name in one response, so without an
+    indexer the listing is a single request.
+    """
+    indexer = algorand.client.indexer_if_present
+    if indexer is None:
+        boxes = algorand.client.algod.application_boxes(app_id)["boxes"]  # type: ignore[call-overload]
+        pages: typing.Iterable[list[dict[str, str]]] = [boxes]
+    else:
+
+        def indexer_pages() -> typing.Iterator[list[dict[str, str]]]:
+            next_page = None
+            while True:
+                page = indexer.application_boxes(app_id, limit=page_size, next_page=next_page)
+                yield page.get("boxes", [])
+                next_page = page.get("next-token")
+                if not next_page or not page.get("boxes"):
+                    return
+
+        pages = indexer_pages()
+    for page in pages:
+        for box in page:
+            name = base64.b64decode(box["name"])
+            if name.startswith(prefix):
+                yield name
+
+
+class StreamingMapState(_MapState[_KeyType, _ValueType]):
+    """
+    `_MapState` that can also walk the map without materialising it: box names are
+    paged in, values fetched `batch_size` at a time, and each entry yielded as a typed
+    (key, value) pair, so memory stays flat however many boxes the app holds.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        map_name: str,
+        struct_class: typing.Type[_ValueType] | None = None,
+    ) -> None:
+        super().__init__(app_client.state.box, map_name, struct_class)
+        self._app_client = app_client
+        metadata = app_client.app_spec.state.maps.box[map_name]
+        self._prefix = base64.b64decode(metadata.prefix or "")
+        self._key_type = metadata.key_type
+        self._value_type = metadata.value_type
+
+    def _decode(self, abi_type: str, encoded: bytes) -> typing.Any:
+        value = get_abi_decoded_value(encoded, abi_type, self._app_client.app_spec.structs)
+        struct_class = _STRUCT_CLASSES.get(abi_type)
+        return _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict) else value
+
+    def _names(self, page_size: int) -> typing.Iterator[bytes]:
+        return iter_box_names(self._app_client.algorand, self._app_client.app_id, self._prefix, page_size=page_size)
+
+    def iter_keys(self, *, page_size: int = _PAGE_SIZE) -> typing.Iterator[_KeyType]:
+        """Keys of every entry in the map, in box name order when listed through the indexer."""
+        for name in self._names(page_size):
+            yield typing.cast(_KeyType, self._decode(self._key_type, name[len(self._prefix) :]))
+
+    def iter_map(
+        self, *, page_size: int = _PAGE_SIZE, batch_size: int = _BATCH_SIZE
+    ) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        """(key, value) pairs of every entry in the map. Entries deleted while iterating are skipped."""
+        algod = self._app_client.algorand.client.algod
+        app_id = self._app_client.app_id
+
+        def fetch(name: bytes) -> bytes | None:
+            try:
+                box = algod.application_box_by_name(app_id, name)
+            except error.AlgodHTTPError as ex:
+                if ex.code == 404:
+                    return None
+                raise
+            return base64.b64decode(box["value"])  # type: ignore[index]
+
+        names = self._names(page_size)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            while batch := list(itertools.islice(names, batch_size)):
+                for name, value in zip(batch, executor.map(fetch, batch), strict=True):
+                    if value is None:
+                        continue
+                    yield (
+                        typing.cast(_KeyType, self._decode(self._key_type, name[len(self._prefix) :])),
+                        typing.cast(_ValueType, self._decode(self._value_type, value)),
+                    )
+
+
+class StreamingBoxState(_BoxState):
+    """
+    `_BoxState` whose maps are `StreamingMapState`s, so any of them can be walked with
+    `iter_map()` / `iter_keys()`:
+
+        box_state = StreamingBoxState(client.app_client)
+        for key, amount in box_state.donations.iter_map():
+            ...
+    """
+
+    @property
+    def proposals(self) -> "StreamingMapState[int, Proposal]":
+        return StreamingMapState(self.app_client, "proposals", Proposal)
+
+    @property
+    def milestone_votes(self) -> "StreamingMapState[int, list[str]]":
+        return StreamingMapState(self.app_client, "milestoneVotes", None)
+
+    @property
+    def donations(self) -> "StreamingMapState[DonationBoxKey, int]":
+        return StreamingMapState(self.app_client, "donations", None)
+
+    @property
+    def eligible_weight(self) -> "StreamingMapState[int, int]":
+        return StreamingMapState(self.app_client, "eligibleWeight", None)
+
+    @property
+    def future_funds(self) -> "StreamingMapState[int, FutureFund]":
+        return StreamingMapState(self.app_client, "futureFunds", FutureFund)
+
+    def iter_keys(self, map_name: str, *, page_size: int = _PAGE_SIZE) -> typing.Iterator[typing.Any]:
+        """Keys of the box map `map_name` (as named in the app spec)."""
+        return StreamingMapState(self.app_client, map_name).iter_keys(page_size=page_size)
+
+    def iter_map(
+        self, map_name: str, *, page_size: int = _PAGE_SIZE, batch_size: int = _BATCH_SIZE
+    ) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        """(key, value) pairs of the box map `map_name` (as named in the app spec)."""
+        return StreamingMapState(self.app_client, map_name).iter_map(page_size=page_size, batch_size=batch_size)
+
+
+def iter_proposal_ids(
+    client: ProposalContractClient, *, category: str = "", status: str | None = None
+) -> typing.Iterator[int]:
+    """
+    IDs of the proposals in `category` (exact text) with `status` (a key of
+    `PROPOSAL_STATUSES`), paged through the on-chain indexes with `list_proposals`.
+    Either filter can be left out.
+    """
+    cursor = 0
+    while True:
+        page = client.send.list_proposals(
+            ListProposalsArgs(
+                category=category,
+                status=PROPOSAL_STATUSES[status] if status else 0,
+                cursor=cursor,
+                limit=_LIST_LIMIT,
+            )
+        ).abi_return
+        assert page is not None
+        yield from page.ids
+        if page.done:
+            return
+        cursor = page.next_cursor
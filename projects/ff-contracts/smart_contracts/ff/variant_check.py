@@ -0,0 +1,202 @@
+"""
+Lifecycle equivalence check for compile variants.
+
+`python -m smart_contracts build-variants` only picks a variant whose behaviour matches
+the default build's. Comparing ARC-56 specs catches interface and layout changes, but
+not a variant that compiles the same source into a program that does something else,
+so each variant is also deployed to LocalNet as a fresh app and a few short proposal
+lifecycles are simulated against it, each as one atomic group:
+
+- approve: create, donate to the goal, submit proof, vote it through, claim
+- reject: the same, but the first vote is against, which decides it, then a claim that must fail
+- claim early: a claim before the vote is decided, which must fail
+- outsider vote: a vote from an account that never donated, which must fail
+- batch: create_proposals creating two proposals at once, then donating to the second
+
+Each lifecycle runs against an app created just for it, so the outcomes compared are
+each group's failure cause and the call it failed at, each call's logs and payments,
+and the boxes and global state the group left behind, with times made relative to the
+simulated block. LocalNet must be running (`algokit localnet start`).
+"""
+
+import base64
+import json
+import logging
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import EmptySigner
+from algosdk.v2client.models import SimulateTraceConfig
+
+from smart_contracts.ff.cost_analysis import SIMULATE_OPCODE_BUDGET
+from smart_contracts.ff.errors import failure_cause
+from smart_contracts.ff.fixtures import ScenarioSpec, scenario_accounts, shift_timestamps
+
+logger = logging.getLogger(__name__)
+
+# The lifecycles run as the same derived accounts for every variant, so their state matches
+_ACCOUNTS_SPEC = ScenarioSpec(creators=1, donors=3, seed=7)
+_ACCOUNT_FUNDING = algokit_utils.AlgoAmount(algo=20)
+_APP_FUNDING = algokit_utils.AlgoAmount(algo=10)
+# Covers the inner transactions of any call, so fees never decide an outcome
+_CALL_FEE = algokit_utils.AlgoAmount(micro_algo=20_000)
+_PROPOSAL_FEE = 2_000_000
+_DONATION = 1_000_000
+
+# (sender role, method, args) with payments given as {"amount": ...} from the sender
+_Step = tuple[str, str, list[typing.Any]]
+
+_PROPOSAL = ["Variant check", "Lifecycle", "Compile variant equivalence run", "testing", 2 * _DONATION,
+             [("Milestone 0", _DONATION), ("Milestone 1", _DONATION)]]
+_FUNDED: list[_Step] = [
+    ("creator", "create_proposal", [*_PROPOSAL, {"amount": _PROPOSAL_FEE}]),
+    ("donor0", "donate_proposal", [0, {"amount": _DONATION}]),
+    ("donor1", "donate_proposal", [0, {"amount": _DONATION}]),
+    ("creator", "submit_proof", [0, "https://proofs.example/variant/0"]),
+]
+LIFECYCLES: dict[str, list[_Step]] = {
+    "approve": [
+        *_FUNDED,
+        ("donor0", "vote_milestone", [0, True]),
+        ("donor1", "vote_milestone", [0, True]),
+        ("creator", "claim_milestone", [0]),
+    ],
+    "reject": [
+        *_FUNDED,
+        ("donor0", "vote_milestone", [0, False]),
+        ("creator", "claim_milestone", [0]),
+    ],
+    "claim early": [
+        *_FUNDED,
+        ("donor0", "vote_milestone", [0, True]),
+        ("creator", "claim_milestone", [0]),
+    ],
+    "outsider vote": [
+        *_FUNDED,
+        ("donor2", "vote_milestone", [0, True]),
+    ],
+    "batch": [
+        ("creator", "create_proposals", [[_PROPOSAL, _PROPOSAL], {"amount": 2 * _PROPOSAL_FEE}]),
+        ("donor0", "donate_proposal", [1, {"amount": _DONATION}]),
+    ],
+}
+
+
+def _accounts() -> dict[str, str]:
+    creators, donors = scenario_accounts(_ACCOUNTS_SPEC)
+    return {"creator": creators[0].address} | {f"donor{index}": donor.address for index, donor in enumerate(donors)}
+
+
+def _deploy(algorand: algokit_utils.AlgorandClient, app_spec: str, deployer: str) -> algokit_utils.AppClient:
+    factory = algorand.client.get_app_factory(app_spec, default_sender=deployer)
+    client, _ = factory.send.bare.create()
+    algorand.send.payment(
+        algokit_utils.PaymentParams(sender=deployer, receiver=client.app_address, amount=_APP_FUNDING)
+    )
+    return client
+
+
+def _simulate(client: algokit_utils.AppClient, steps: list[_Step], accounts: dict[str, str]) -> dict[str, typing.Any]:
+    algorand = client.algorand
+    group = algorand.new_group()
+    for role, method, args in steps:
+        sender = accounts[role]
+        call_args = [
+            algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    sender=sender,
+                    receiver=client.app_address,
+                    amount=algokit_utils.AlgoAmount(micro_algo=arg["amount"]),
+                )
+            )
+            if isinstance(arg, dict)
+            else arg
+            for arg in args
+        ]
+        group.add_app_call_method_call(
+            client.params.call(
+                algokit_utils.AppClientMethodCallParams(
+                    method=method, args=call_args, sender=sender, static_fee=_CALL_FEE
+                )
+            )
+        )
+    return group.simulate(
+        allow_unnamed_resources=True,
+        skip_signatures=True,
+        extra_opcode_budget=SIMULATE_OPCODE_BUDGET,
+        exec_trace_config=SimulateTraceConfig(enable=True, state_change=True),
+    ).simulate_response
+
+
+def _outcome(
+    response: dict[str, typing.Any], app_spec: algokit_utils.Arc56Contract, timestamp: int
+) -> dict[str, typing.Any]:
+    """The parts of a simulated group that don't depend on the app ID or the compiled program."""
+    group = response["txn-groups"][0]
+    boxes: dict[bytes, bytes] = {}
+    global_state: dict[str, typing.Any] = {}
+    calls = []
+    for txn_result in group["txn-results"]:
+        result = txn_result["txn-result"]
+        calls.append(
+            {
+                "logs": result.get("logs", []),
+                "payments": [
+                    [inner["txn"]["txn"].get("rcv"), inner["txn"]["txn"].get("amt", 0)]
+                    for inner in result.get("inner-txns", [])
+                    if inner["txn"]["txn"]["type"] == "pay"
+                ],
+            }
+        )
+        # Inner traces are the opup app's, whose state isn't part of the outcome
+        for step in txn_result.get("exec-trace", {}).get("approval-program-trace", []):
+            for change in step.get("state-changes", []):
+                key = base64.b64decode(change["key"])
+                if change["app-state-type"] == "b":
+                    if change["operation"] == "d":
+                        boxes.pop(key, None)
+                    else:
+                        boxes[key] = base64.b64decode(change["new-value"].get("bytes", ""))
+                elif change["app-state-type"] == "g":
+                    global_state[key.decode()] = change.get("new-value")
+    boxes = shift_timestamps(boxes, -timestamp)
+    failure = group.get("failure-message")
+    return {
+        # Asserts without a message only have a pc, which moves between variants
+        "failure": failure_cause(failure, app_spec).split(" at pc=")[0] if failure else None,
+        "failed_at": group.get("failed-at"),
+        "calls": calls,
+        "boxes": {name.hex(): value.hex() for name, value in sorted(boxes.items())},
+        "global_state": global_state,
+    }
+
+
+def variant_lifecycle(output_dir: Path) -> dict[str, typing.Any]:
+    """
+    Simulates every lifecycle in `LIFECYCLES` against a fresh LocalNet app running the
+    programs compiled into `output_dir`, and returns the outcomes to compare variants by.
+    """
+    app_spec_text = next(output_dir.glob("*.arc56.json")).read_text()
+    app_spec = algokit_utils.Arc56Contract.from_json(app_spec_text)
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    dispenser = algorand.account.localnet_dispenser()
+    accounts = _accounts()
+    for address in accounts.values():
+        algorand.account.ensure_funded(address, dispenser, _ACCOUNT_FUNDING)
+        algorand.account.set_signer(address, EmptySigner())
+
+    outcomes = {}
+    for name, steps in LIFECYCLES.items():
+        client = _deploy(algorand, app_spec_text, dispenser.address)
+        response = _simulate(client, steps, accounts)
+        # The group runs on top of the last round, so that block's time is what it saw
+        last_round = response["last-round"]
+        timestamp = algorand.client.algod.block_info(last_round)["block"]["ts"]  # type: ignore[call-overload]
+        outcomes[name] = _outcome(response, app_spec, timestamp)
+    logger.info(
+        f"Lifecycle outcomes for {output_dir.name}: "
+        + ", ".join(f"{name}={outcome['failure'] or 'ok'}" for name, outcome in outcomes.items())
+    )
+    # Round-tripped through JSON so outcomes compare the same however they were built
+    return typing.cast(dict[str, typing.Any], json.loads(json.dumps(outcomes)))
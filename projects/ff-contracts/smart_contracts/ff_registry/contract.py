@@ -0,0 +1,50 @@
+from algopy import ARC4Contract, BoxMap, Global, GlobalState, Txn, urange
+from algopy.arc4 import abimethod, DynamicArray, Struct, UInt64
+
+# ------------------ Structs ------------------
+class ShardLocation(Struct):
+    app_id: UInt64
+    local_id: UInt64
+
+
+# ------------------ Constants ------------------
+# Proposal and future fund IDs are split into ranges of this many, shard n holding global IDs
+# n * shard_id_range up to (n + 1) * shard_id_range - 1 under its own IDs counted from 0
+shard_id_range = 2**32
+max_shards = 64
+
+
+# ------------------ Contract ------------------
+class ShardRegistry(ARC4Contract):
+    def __init__(self) -> None:
+        self.no_of_shards = GlobalState(UInt64(0), key="noOfShards")
+        # Shard index -> ProposalContract app ID
+        self.shards = BoxMap(UInt64, UInt64, key_prefix="shards")
+
+    @abimethod()
+    def add_shard(self, app_id: UInt64) -> UInt64:
+        assert Txn.sender == Global.creator_address, "Only the registry creator can add shards"
+        assert app_id.native != 0, "Shard app ID cannot be 0"
+        idx = self.no_of_shards.value
+        assert idx.native < max_shards, "Maximum of 64 shards allowed"
+
+        self.shards[idx] = app_id
+        self.no_of_shards.value = UInt64(idx.native + 1)
+        return idx
+
+    @abimethod(readonly=True)
+    def get_shards(self) -> DynamicArray[UInt64]:
+        shards = DynamicArray[UInt64]()
+        for index in urange(self.no_of_shards.value.native):
+            shards.append(self.shards[UInt64(index)])
+        return shards
+
+    @abimethod(readonly=True)
+    def shard_for(self, global_id: UInt64) -> ShardLocation:
+        """The shard holding `global_id`, and the ID it has in that shard."""
+        index = global_id.native // shard_id_range
+        assert index < self.no_of_shards.value.native, "No shard holds this ID"
+        return ShardLocation(
+            app_id=self.shards[UInt64(index)],
+            local_id=UInt64(global_id.native % shard_id_range),
+        )
@@ -0,0 +1,88 @@
+"""
+ProposalContract run in the algorand-python-testing emulator, with helpers to call it
+as any account. Nothing here needs LocalNet.
+"""
+
+import typing
+
+import pytest
+from algopy import Account, UInt64, arc4, gtxn
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.ff.contract import MilestoneInput, ProposalContract, ProposalInput
+from smart_contracts.ff.emulator import patch_static_struct_sizes
+
+PROPOSAL_DEPOSIT = 2_000_000
+START_TIME = 1_000
+
+
+class Emulated:
+    """A fresh ProposalContract and the context it runs in."""
+
+    def __init__(self, context: AlgopyTestContext) -> None:
+        self.context = context
+        self.contract = ProposalContract()
+        self.app = context.ledger.get_app(self.contract)
+        self.creator = context.default_sender
+        self.set_time(START_TIME)
+
+    def set_time(self, timestamp: int) -> None:
+        self.context.ledger.patch_global_fields(latest_timestamp=timestamp)
+
+    def payment(self, sender: Account, amount: int) -> gtxn.PaymentTransaction:
+        return self.context.any.txn.payment(sender=sender, receiver=self.app.address, amount=UInt64(amount))
+
+    def call(self, sender: Account, method: typing.Callable[..., typing.Any], *args: typing.Any) -> typing.Any:
+        with self.context.txn.create_group(active_txn_overrides={"sender": sender}):
+            return method(*args)
+
+    def create(self, milestones: typing.Sequence[int] = (1_000_000, 1_000_000), *, category: str = "testing") -> int:
+        """Creates a proposal as the creator, returning its ID."""
+        proposal_id = as_int(self.contract.no_of_proposals.value)
+        self.call(
+            self.creator,
+            self.contract.create_proposal,
+            arc4.String("Proposal"),
+            arc4.String("Title"),
+            arc4.String("Description"),
+            arc4.String(category),
+            arc4.UInt64(sum(milestones)),
+            milestone_inputs(milestones),
+            self.payment(self.creator, PROPOSAL_DEPOSIT),
+        )
+        return proposal_id
+
+    def donate(self, donor: Account, proposal_id: int, amount: int) -> None:
+        self.call(donor, self.contract.donate_proposal, arc4.UInt64(proposal_id), self.payment(donor, amount))
+
+    def milestone(self, proposal_id: int) -> typing.Any:
+        proposal = self.contract.proposals[arc4.UInt64(proposal_id)]
+        return proposal.milestones[proposal.current_milestone.native]
+
+
+def as_int(value: arc4.UInt64) -> int:
+    return int.from_bytes(value.bytes.value)
+
+
+def milestone_inputs(milestones: typing.Sequence[int]) -> arc4.DynamicArray[MilestoneInput]:
+    return arc4.DynamicArray[MilestoneInput](
+        *(MilestoneInput(arc4.String(f"Milestone {index}"), arc4.UInt64(amount)) for index, amount in enumerate(milestones))
+    )
+
+
+def proposal_input(milestones: typing.Sequence[int], name: str = "Proposal") -> ProposalInput:
+    return ProposalInput(
+        arc4.String(name),
+        arc4.String("Title"),
+        arc4.String("Description"),
+        arc4.String("testing"),
+        arc4.UInt64(sum(milestones)),
+        milestone_inputs(milestones),
+    )
+
+
+@pytest.fixture()
+def emulated() -> typing.Iterator[Emulated]:
+    patch_static_struct_sizes()
+    with algopy_testing_context() as context:
+        yield Emulated(context)
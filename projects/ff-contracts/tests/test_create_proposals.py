@@ -0,0 +1,43 @@
+import pytest
+from algopy import arc4
+
+from smart_contracts.ff.boxes import create_proposals_box_names
+from smart_contracts.ff.contract import ProposalInput
+from tests.conftest import PROPOSAL_DEPOSIT, Emulated, as_int, proposal_input
+
+_NAMES = ("First", "Second", "Third")
+
+
+def _create_batch(emulated: Emulated, names: tuple[str, ...], deposit: int = PROPOSAL_DEPOSIT) -> None:
+    emulated.call(
+        emulated.creator,
+        emulated.contract.create_proposals,
+        arc4.DynamicArray[ProposalInput](*(proposal_input((1_000_000,), name) for name in names)),
+        emulated.payment(emulated.creator, deposit * len(names)),
+    )
+
+
+def test_batch_takes_the_next_consecutive_ids(emulated: Emulated) -> None:
+    assert emulated.create() == 0
+
+    _create_batch(emulated, _NAMES)
+
+    assert as_int(emulated.contract.no_of_proposals.value) == 1 + len(_NAMES)
+    for proposal_id, name in enumerate(_NAMES, start=1):
+        assert emulated.contract.proposals[arc4.UInt64(proposal_id)].name.native == name
+    assert emulated.create() == 1 + len(_NAMES)
+
+
+def test_batch_writes_the_boxes_the_client_references(emulated: Emulated) -> None:
+    emulated.create()
+
+    _create_batch(emulated, _NAMES)
+
+    names = create_proposals_box_names([(name, "Title", "Description", "testing") for name in _NAMES], first_id=1)
+    assert all(emulated.context.ledger.box_exists(emulated.app, name) for name in names)
+
+
+def test_batch_must_pay_the_deposit_for_every_proposal(emulated: Emulated) -> None:
+    with pytest.raises(AssertionError, match="Must pay exactly 2 Algos per proposal"):
+        _create_batch(emulated, _NAMES, deposit=PROPOSAL_DEPOSIT - 1)
+    assert as_int(emulated.contract.no_of_proposals.value) == 0
@@ -0,0 +1,64 @@
+import pytest
+from algopy import Account, arc4
+
+from tests.conftest import Emulated, as_int
+
+
+def _current(emulated: Emulated, proposal_id: int, voter: Account) -> tuple[int, bool, int]:
+    current = emulated.call(
+        voter, emulated.contract.get_current_milestone, arc4.UInt64(proposal_id), arc4.Address(voter)
+    )
+    return as_int(current.index), current.has_voted.native, as_int(current.vote_weight)
+
+
+def _submit_proof(emulated: Emulated, proposal_id: int) -> None:
+    emulated.call(emulated.creator, emulated.contract.submit_proof, arc4.UInt64(proposal_id), arc4.String("proof"))
+
+
+def _vote(emulated: Emulated, voter: Account, proposal_id: int) -> None:
+    emulated.call(voter, emulated.contract.vote_milestone, arc4.UInt64(proposal_id), arc4.Bool(True))
+
+
+def test_weight_is_the_square_root_of_whole_algos_donated(emulated: Emulated) -> None:
+    proposal_id = emulated.create(milestones=(20_000_000,))
+    donor, small_donor, stranger = (emulated.context.any.account() for _ in range(3))
+    emulated.donate(donor, proposal_id, 9_500_000)
+    emulated.donate(small_donor, proposal_id, 999_999)
+    emulated.donate(emulated.creator, proposal_id, 4_000_000)
+
+    assert _current(emulated, proposal_id, donor) == (0, False, 3)
+    assert _current(emulated, proposal_id, small_donor) == (0, False, 0)
+    assert _current(emulated, proposal_id, stranger) == (0, False, 0)
+    # The creator can't vote on their own proposal
+    assert _current(emulated, proposal_id, emulated.creator) == (0, False, 0)
+
+
+def test_has_voted_covers_the_current_milestone_only(emulated: Emulated) -> None:
+    proposal_id = emulated.create(milestones=(3_000_000, 2_000_000))
+    voter, other = emulated.context.any.account(), emulated.context.any.account()
+    emulated.donate(voter, proposal_id, 4_000_000)
+    emulated.donate(other, proposal_id, 1_000_000)
+    _submit_proof(emulated, proposal_id)
+
+    _vote(emulated, voter, proposal_id)
+    assert _current(emulated, proposal_id, voter) == (0, True, 2)
+    assert _current(emulated, proposal_id, other) == (0, False, 1)
+
+    # 2 for with 1 outstanding is decided, so the milestone can be claimed at once
+    emulated.call(emulated.creator, emulated.contract.claim_milestone, arc4.UInt64(proposal_id))
+    _submit_proof(emulated, proposal_id)
+    assert _current(emulated, proposal_id, voter) == (1, False, 2)
+
+
+def test_no_current_milestone_once_all_are_claimed(emulated: Emulated) -> None:
+    proposal_id = emulated.create(milestones=(1_000_000,))
+    donor = emulated.context.any.account()
+    emulated.donate(donor, proposal_id, 1_000_000)
+    _submit_proof(emulated, proposal_id)
+    _vote(emulated, donor, proposal_id)
+    emulated.call(emulated.creator, emulated.contract.claim_milestone, arc4.UInt64(proposal_id))
+
+    with pytest.raises(AssertionError, match="All milestones already completed"):
+        _current(emulated, proposal_id, donor)
+    with pytest.raises(AssertionError, match="Proposal doesn't exist"):
+        _current(emulated, proposal_id + 1, donor)
@@ -0,0 +1,59 @@
+import asyncio
+import base64
+import typing
+
+import httpx
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner
+
+from smart_contracts.ff.async_client import ConfirmationWatcher
+from smart_contracts.ff.donation_pipeline import Donation, DonationPipeline, _Attempt
+
+
+class _UnreachableAfterSendAlgod:
+    """Accepts every group, then fails while the watcher follows the chain."""
+
+    async def status(self) -> dict[str, typing.Any]:
+        return {"last-round": 10}
+
+    async def pending_transaction_count(self) -> int:
+        return 0
+
+    async def send_raw_transaction(self, txn_bytes: bytes) -> str:
+        return "sent"
+
+    async def block_txids(self, round_num: int) -> list[str]:
+        raise httpx.ConnectError("algod unreachable")
+
+
+class _Client:
+    def __init__(self, algod: _UnreachableAfterSendAlgod) -> None:
+        self.algod = algod
+        self.watcher = ConfirmationWatcher(algod)  # type: ignore[arg-type]
+
+
+async def _build_payment(self: DonationPipeline, batch: list[_Attempt]) -> None:
+    """Builds each donation as a lone signed payment, standing in for the generated composer."""
+    for attempt in batch:
+        private_key, sender = account.generate_account()
+        params = transaction.SuggestedParams(
+            fee=1_000, first=5, last=15, gh=base64.b64encode(bytes(32)).decode(), flat_fee=True
+        )
+        payment = transaction.PaymentTxn(sender, params, sender, attempt.donation.amount)
+        attempt.txns = [TransactionWithSigner(payment, AccountTransactionSigner(private_key))]
+        attempt.attempts += 1
+
+
+def test_watcher_failure_fails_the_donation_instead_of_hanging(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(DonationPipeline, "_build", _build_payment)
+    donation = Donation(proposal_id=0, donor="", amount=1_000_000, reference="payment-1")
+
+    async def run() -> list[typing.Any]:
+        async with DonationPipeline(_Client(_UnreachableAfterSendAlgod())) as pipeline:  # type: ignore[arg-type]
+            return await asyncio.wait_for(pipeline.run([donation]), timeout=5)
+
+    [result] = asyncio.run(run())
+
+    assert result.status == "failed"
+    assert result.error == "algod unreachable"
@@ -0,0 +1,55 @@
+import pytest
+from algopy import Account, arc4
+
+from smart_contracts.ff import contract
+from smart_contracts.ff.read_only import EXPIRATION_TIME, VOTING_TIME
+from tests.conftest import START_TIME, Emulated, as_int
+
+
+def _voting(emulated: Emulated) -> tuple[int, list[Account]]:
+    """A funded proposal in voting, with donors of vote weight 2, 1 and 1."""
+    proposal_id = emulated.create(milestones=(3_000_000, 3_000_000))
+    donors = [emulated.context.any.account() for _ in range(3)]
+    for donor, amount in zip(donors, (4_000_000, 1_000_000, 1_000_000), strict=True):
+        emulated.donate(donor, proposal_id, amount)
+    emulated.call(emulated.creator, emulated.contract.submit_proof, arc4.UInt64(proposal_id), arc4.String("proof"))
+    return proposal_id, donors
+
+
+def _vote(emulated: Emulated, donor: Account, proposal_id: int, vote: bool) -> None:
+    emulated.call(donor, emulated.contract.vote_milestone, arc4.UInt64(proposal_id), arc4.Bool(vote))
+
+
+def test_deciding_vote_closes_voting_and_the_milestone_can_be_claimed_at_once(emulated: Emulated) -> None:
+    proposal_id, donors = _voting(emulated)
+    voting_end_time = as_int(emulated.milestone(proposal_id).voting_end_time)
+
+    _vote(emulated, donors[0], proposal_id, True)
+    # 2 for, with 2 outstanding that could still tie it
+    assert as_int(emulated.milestone(proposal_id).voting_end_time) == voting_end_time
+
+    _vote(emulated, donors[1], proposal_id, True)
+    assert as_int(emulated.milestone(proposal_id).voting_end_time) == START_TIME
+    with pytest.raises(AssertionError, match="Voting period has ended"):
+        _vote(emulated, donors[2], proposal_id, False)
+
+    emulated.call(emulated.creator, emulated.contract.claim_milestone, arc4.UInt64(proposal_id))
+    assert as_int(emulated.contract.proposals[arc4.UInt64(proposal_id)].current_milestone) == 1
+
+
+def test_deciding_vote_against_closes_voting_without_a_claim(emulated: Emulated) -> None:
+    proposal_id, donors = _voting(emulated)
+
+    # 2 against can't be outvoted by the 2 outstanding
+    _vote(emulated, donors[0], proposal_id, False)
+
+    assert as_int(emulated.milestone(proposal_id).voting_end_time) == START_TIME
+    with pytest.raises(AssertionError, match="Milestone not approved"):
+        emulated.call(emulated.creator, emulated.contract.claim_milestone, arc4.UInt64(proposal_id))
+
+
+def test_off_chain_timings_match_the_contract(emulated: Emulated) -> None:
+    proposal_id, _ = _voting(emulated)
+
+    assert as_int(emulated.milestone(proposal_id).voting_end_time) == START_TIME + VOTING_TIME
+    assert (VOTING_TIME, EXPIRATION_TIME) == (contract.voting_time, contract.expiration_time)
@@ -0,0 +1,136 @@
+import typing
+
+import pytest
+from algopy import arc4
+
+from smart_contracts.ff.boxes import method_box_references
+from smart_contracts.ff.contract import BoxChunk, ProposalInput, SignedVote
+from smart_contracts.ff.migrate import pack_import_calls
+from tests.conftest import PROPOSAL_DEPOSIT, Emulated, as_int, proposal_input
+
+
+_NO_PROPOSAL = arc4.UInt64(0)
+
+# Arguments for each state-changing method other than the import and create methods
+_STATE_CHANGING_CALLS: dict[str, typing.Callable[[Emulated], tuple]] = {
+    "donate_proposal": lambda emulated: (_NO_PROPOSAL, emulated.payment(emulated.creator, 1_000_000)),
+    "submit_proof": lambda _: (_NO_PROPOSAL, arc4.String("proof")),
+    "vote_milestone": lambda _: (_NO_PROPOSAL, arc4.Bool(True)),
+    "vote_milestone_batch": lambda _: (_NO_PROPOSAL, arc4.UInt64(0), arc4.DynamicArray[SignedVote]()),
+    "claim_milestone": lambda _: (_NO_PROPOSAL,),
+    "refund_if_inactive": lambda _: (_NO_PROPOSAL,),
+    "claim_future_self": lambda _: (arc4.UInt64(0),),
+}
+
+
+@pytest.fixture(autouse=True)
+def _decodable_box_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # algorand-python-testing 0.4 decodes BoxChunk's byte[] fields as DynamicArray[Byte],
+    # which lacks the `native` of the DynamicBytes they are declared as
+    monkeypatch.setattr(arc4.DynamicArray[arc4.Byte], "native", arc4.DynamicBytes.native, raising=False)
+
+
+def _import_boxes(target: Emulated, boxes: dict[bytes, bytes]) -> None:
+    """Writes the boxes in chunked import_boxes calls, the way migrate packs them."""
+    for chunks in pack_import_calls(boxes.items(), chunks_per_call=4):
+        target.call(
+            target.creator,
+            target.contract.import_boxes,
+            arc4.DynamicArray[BoxChunk](
+                *(
+                    BoxChunk(arc4.DynamicBytes(name), arc4.UInt64(size), arc4.UInt64(offset), arc4.DynamicBytes(data))
+                    for name, size, offset, data in chunks
+                )
+            ),
+        )
+
+
+def _import(target: Emulated, boxes: dict[bytes, bytes], no_of_proposals: int) -> None:
+    """Imports the boxes the way migrate does: begin, import_boxes calls, then end."""
+    target.call(target.creator, target.contract.begin_import)
+    _import_boxes(target, boxes)
+    target.call(target.creator, target.contract.end_import, arc4.UInt64(no_of_proposals), arc4.UInt64(0))
+
+
+def _created_boxes(emulated: Emulated, proposal_id: int) -> dict[bytes, bytes]:
+    """The boxes create_proposal wrote for the proposal, as the client references them."""
+    names = [
+        reference.name
+        for reference in method_box_references(
+            "create_proposal", ("Proposal", "Title", "Description", "testing"), "", next_id=proposal_id
+        )
+        if reference.name
+    ]
+    return {name: emulated.context.ledger.get_box(emulated.app, name) for name in names}
+
+
+def test_imported_proposal_carries_on_in_the_new_app(emulated: Emulated) -> None:
+    proposal_id = emulated.create(milestones=(1_000_000, 1_000_000))
+    boxes = _created_boxes(emulated, proposal_id)
+    assert all(boxes.values())
+    imported = {
+        reference.name
+        for chunks in pack_import_calls(boxes.items(), chunks_per_call=4)
+        for reference in method_box_references("import_boxes", (chunks,), "")
+    }
+    assert imported == set(boxes)
+
+    target = Emulated(emulated.context)
+    _import(target, boxes, no_of_proposals=1)
+
+    assert {name: target.context.ledger.get_box(target.app, name) for name in boxes} == boxes
+    donor = target.context.any.account()
+    target.donate(donor, proposal_id, 2_000_000)
+    assert as_int(target.contract.proposals[arc4.UInt64(proposal_id)].amount_raised) == 2_000_000
+    assert target.create() == 1
+
+
+def test_import_only_runs_once_on_an_empty_app(emulated: Emulated) -> None:
+    _import(emulated, {}, no_of_proposals=0)
+
+    with pytest.raises(AssertionError, match="State was already imported"):
+        emulated.call(emulated.creator, emulated.contract.begin_import)
+
+    populated = Emulated(emulated.context)
+    populated.create()
+    with pytest.raises(AssertionError, match="App already has state"):
+        populated.call(populated.creator, populated.contract.begin_import)
+
+
+def test_import_is_creator_only(emulated: Emulated) -> None:
+    with pytest.raises(AssertionError, match="Only the creator can import state"):
+        emulated.call(emulated.context.any.account(), emulated.contract.begin_import)
+
+
+def test_new_ids_are_refused_while_an_import_is_open(emulated: Emulated) -> None:
+    emulated.call(emulated.creator, emulated.contract.begin_import)
+
+    with pytest.raises(AssertionError, match="State import in progress"):
+        emulated.create()
+    with pytest.raises(AssertionError, match="State import in progress"):
+        emulated.call(
+            emulated.creator,
+            emulated.contract.create_proposals,
+            arc4.DynamicArray[ProposalInput](proposal_input((1_000_000,))),
+            emulated.payment(emulated.creator, PROPOSAL_DEPOSIT),
+        )
+    with pytest.raises(AssertionError, match="State import in progress"):
+        emulated.call(
+            emulated.creator,
+            emulated.contract.fund_future_self,
+            arc4.Address(emulated.creator),
+            arc4.Address(emulated.creator),
+            arc4.UInt64(2_000),
+            emulated.payment(emulated.creator, PROPOSAL_DEPOSIT),
+        )
+
+    emulated.call(emulated.creator, emulated.contract.end_import, arc4.UInt64(0), arc4.UInt64(0))
+    assert emulated.create() == 0
+
+
+@pytest.mark.parametrize("method", sorted(_STATE_CHANGING_CALLS))
+def test_state_changes_are_refused_while_an_import_is_open(emulated: Emulated, method: str) -> None:
+    emulated.call(emulated.creator, emulated.contract.begin_import)
+
+    with pytest.raises(AssertionError, match="State import in progress"):
+        emulated.call(emulated.creator, getattr(emulated.contract, method), *_STATE_CHANGING_CALLS[method](emulated))
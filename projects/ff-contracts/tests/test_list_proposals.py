@@ -0,0 +1,77 @@
+import pytest
+from algopy import arc4
+
+from smart_contracts.ff.contract import max_list_limit, status_fundraising, status_in_voting
+from tests.conftest import Emulated, as_int
+
+
+def _list(
+    emulated: Emulated, cursor: int, limit: int, *, category: str = "", status: int = 0
+) -> tuple[list[int], int, bool]:
+    page = emulated.call(
+        emulated.creator,
+        emulated.contract.list_proposals,
+        arc4.String(category),
+        arc4.UInt64(status),
+        arc4.UInt64(cursor),
+        arc4.UInt64(limit),
+    )
+    return [as_int(proposal_id) for proposal_id in page.ids], as_int(page.next_cursor), page.done.native
+
+
+def _list_all(emulated: Emulated, limit: int, *, category: str = "", status: int = 0) -> list[list[int]]:
+    """The pages of IDs a caller gets passing each cursor back in until done."""
+    pages = []
+    cursor, done = 0, False
+    while not done:
+        ids, cursor, done = _list(emulated, cursor, limit, category=category, status=status)
+        pages.append(ids)
+    return pages
+
+
+def test_pages_follow_the_cursor_to_the_last_proposal(emulated: Emulated) -> None:
+    for _ in range(5):
+        emulated.create()
+
+    assert _list(emulated, 0, 2) == ([0, 1], 2, False)
+    assert _list(emulated, 2, 2) == ([2, 3], 4, False)
+    assert _list(emulated, 4, 2) == ([4], 5, True)
+    assert _list(emulated, 5, 2) == ([], 5, True)
+    assert _list(emulated, 9, 2) == ([], 5, True)
+
+
+def test_a_full_last_page_is_done_once_the_cursor_reaches_the_end(emulated: Emulated) -> None:
+    for _ in range(4):
+        emulated.create()
+
+    assert _list_all(emulated, 2) == [[0, 1], [2, 3]]
+
+
+def test_category_filter_matches_the_exact_text(emulated: Emulated) -> None:
+    for category in ("art", "music", "art", "Art", "music", "art"):
+        emulated.create(category=category)
+
+    assert _list_all(emulated, 2, category="art") == [[0, 2], [5]]
+    assert _list_all(emulated, 64, category="Art") == [[3]]
+    assert _list_all(emulated, 64, category="film") == [[]]
+
+
+def test_status_filter_follows_funding(emulated: Emulated) -> None:
+    for category in ("art", "music", "art"):
+        emulated.create(milestones=(1_000_000,), category=category)
+    donor = emulated.context.any.account()
+    emulated.donate(donor, 2, 1_000_000)
+    emulated.donate(donor, 1, 1_000_000)
+
+    assert _list_all(emulated, 64, status=status_fundraising) == [[0]]
+    assert _list_all(emulated, 64, status=status_in_voting) == [[1, 2]]
+    assert _list_all(emulated, 64, category="art", status=status_in_voting) == [[2]]
+    assert _list_all(emulated, 64, category="music", status=status_fundraising) == [[]]
+
+
+def test_limit_is_capped(emulated: Emulated) -> None:
+    emulated.create()
+
+    assert _list(emulated, 0, max_list_limit) == ([0], 1, True)
+    with pytest.raises(AssertionError, match="Limit is too large"):
+        _list(emulated, 0, max_list_limit + 1)
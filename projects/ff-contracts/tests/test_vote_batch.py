@@ -0,0 +1,114 @@
+import typing
+
+import pytest
+from algopy import arc4
+from algosdk import account, encoding
+
+from smart_contracts.ff.contract import SignedVote
+from smart_contracts.ff.relayer import SignedVote as RelayedVote
+from smart_contracts.ff.relayer import VoteRelayer, VoteTally, sign_vote
+from tests.conftest import START_TIME, Emulated, as_int
+
+
+def _funded_proposal(emulated: Emulated, donors: int) -> tuple[int, list[str]]:
+    """A proposal with its proof submitted and donors who can vote on it, as their private keys."""
+    keys = []
+    proposal_id = emulated.create(milestones=(donors * 1_000_000,))
+    for _ in range(donors):
+        private_key, address = account.generate_account()
+        emulated.donate(emulated.context.any.account(address=address), proposal_id, 1_000_000)
+        keys.append(private_key)
+    emulated.call(emulated.creator, emulated.contract.submit_proof, arc4.UInt64(proposal_id), arc4.String("proof"))
+    return proposal_id, keys
+
+
+def _sign(emulated: Emulated, private_key: str, proposal_id: int, vote: bool) -> RelayedVote:
+    """A vote signed for the proposal's current milestone and proof, as the `sign` command makes them."""
+    return sign_vote(
+        private_key,
+        emulated.app.id.value,
+        proposal_id,
+        as_int(emulated.contract.proposals[arc4.UInt64(proposal_id)].current_milestone),
+        as_int(emulated.milestone(proposal_id).proof_submitted_time),
+        vote,
+    )
+
+
+def _relay(emulated: Emulated, votes: list[RelayedVote], *, ordered: bool = True) -> None:
+    """Sends the votes in one vote_milestone_batch call, in voter order as the relayer does."""
+    if ordered:
+        votes = sorted(votes, key=lambda vote: encoding.decode_address(vote.voter))
+    emulated.call(
+        emulated.creator,
+        emulated.contract.vote_milestone_batch,
+        arc4.UInt64(votes[0].proposal_id),
+        arc4.UInt64(votes[0].milestone_index),
+        arc4.DynamicArray[SignedVote](
+            *(
+                SignedVote(
+                    arc4.Address(vote.voter),
+                    arc4.Bool(vote.vote),
+                    arc4.StaticArray[arc4.Byte, typing.Literal[64]].from_bytes(vote.signature),
+                )
+                for vote in votes
+            )
+        ),
+    )
+
+
+def test_signed_votes_are_tallied(emulated: Emulated) -> None:
+    proposal_id, keys = _funded_proposal(emulated, donors=3)
+
+    _relay(emulated, [_sign(emulated, keys[0], proposal_id, True), _sign(emulated, keys[1], proposal_id, False)])
+
+    milestone = emulated.milestone(proposal_id)
+    assert (as_int(milestone.votes_for), as_int(milestone.votes_against)) == (1, 1)
+    assert as_int(milestone.total_voters) == 2
+
+
+def test_batch_rejects_voters_out_of_order(emulated: Emulated) -> None:
+    proposal_id, keys = _funded_proposal(emulated, donors=2)
+    votes = sorted(
+        (_sign(emulated, key, proposal_id, True) for key in keys),
+        key=lambda vote: encoding.decode_address(vote.voter),
+        reverse=True,
+    )
+
+    with pytest.raises(AssertionError, match="Voters must be in increasing order"):
+        _relay(emulated, votes, ordered=False)
+    assert as_int(emulated.milestone(proposal_id).total_voters) == 0
+
+
+def test_signed_vote_cannot_be_replayed_after_the_proof_is_resubmitted(emulated: Emulated) -> None:
+    proposal_id, keys = _funded_proposal(emulated, donors=3)
+    against = _sign(emulated, keys[0], proposal_id, False)
+    _relay(emulated, [against])
+
+    # A new proof opens a new voting round, with the earlier votes cleared
+    emulated.set_time(as_int(emulated.milestone(proposal_id).voting_end_time) + 1)
+    emulated.call(emulated.creator, emulated.contract.submit_proof, arc4.UInt64(proposal_id), arc4.String("new proof"))
+
+    with pytest.raises(AssertionError, match="Invalid vote signature"):
+        _relay(emulated, [against])
+    _relay(emulated, [_sign(emulated, keys[0], proposal_id, True)])
+    milestone = emulated.milestone(proposal_id)
+    assert (as_int(milestone.votes_for), as_int(milestone.votes_against)) == (1, 0)
+
+
+def test_relayer_stops_at_the_call_that_decides_the_outcome(emulated: Emulated) -> None:
+    proposal_id, keys = _funded_proposal(emulated, donors=3)
+    votes = [_sign(emulated, key, proposal_id, True) for key in keys]
+    relayer = VoteRelayer(None, "", votes_per_call=1)  # type: ignore[arg-type]
+    eligible_weight = as_int(emulated.contract.eligibleWeight[arc4.UInt64(proposal_id)])
+    tally = VoteTally(0, 0, eligible_weight, {vote.voter: 1 for vote in votes})
+
+    groups = list(relayer.pack(proposal_id, votes, earlier_voters=0, proposal_size=0, tally=tally))
+
+    # Two of the three votes for decide it; a third call in the group would fail it
+    assert [len(group.calls) for group in groups] == [2]
+    assert relayer.metrics.rejected["voting closed early"] == 1
+    for call in groups[0].calls:
+        _relay(emulated, list(call))
+    milestone = emulated.milestone(proposal_id)
+    assert as_int(milestone.votes_for) == 2
+    assert as_int(milestone.voting_end_time) == START_TIME